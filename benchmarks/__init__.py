@@ -0,0 +1,4 @@
+import os
+
+# Benchmarks run offline, use the model cost map bundled with litellm instead of fetching it on import
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
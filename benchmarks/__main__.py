@@ -0,0 +1,68 @@
+"""
+Runs all benchmarks with their default parameters and prints a JSON report.
+
+The report holds the environment (commit, Python and platform) and the results of every benchmark. Save reports of two
+commits and compare them with `python -m benchmarks.compare`.
+
+Usage:
+    python -m benchmarks --output report.json
+    python -m benchmarks --only rag agent_loop
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+from benchmarks import agent_loop, cache_codec, callback_serialization, flow_scheduling, rag
+from fiboaitech.utils.logger import logger
+
+BENCHMARKS = {
+    "flow_scheduling": flow_scheduling.run,
+    "callback_serialization": callback_serialization.run,
+    "agent_loop": agent_loop.run,
+    "rag": rag.run,
+    "cache_codec": cache_codec.run,
+}
+
+
+def get_commit() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names: list[str]) -> dict:
+    return {
+        "environment": {
+            "commit": get_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": [result for name in names for result in BENCHMARKS[name]()],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS), help="Benchmarks to run."
+    )
+    parser.add_argument("--output", help="File to write the report to. Printed to stdout by default.")
+    args = parser.parse_args()
+
+    logger.disabled = True
+    report = json.dumps(run(args.only), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
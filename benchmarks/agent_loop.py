@@ -0,0 +1,126 @@
+"""
+ReAct agent loop benchmark.
+
+Runs a ReAct agent backed by the fake LLM that calls a fake HTTP tool a fixed number of times before answering, so
+the measured time is the agent overhead per reasoning loop: prompt rendering, LLM response handling, action parsing,
+tool runs and callbacks. Latencies of the fake services are configurable to model remote calls.
+
+Usage:
+    python -m benchmarks.agent_loop --tool-calls 5 --repeats 10 --llm-latency-ms 0 --tool-latency-ms 0
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from benchmarks.fakes import FakeHttp, FakeLLM, FakeLLMConnection, get_messages_text
+from fiboaitech.callbacks import TracingCallbackHandler
+from fiboaitech.nodes.agents.react import ReActAgent
+from fiboaitech.nodes.tools.http_api_call import HttpApiCall
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+from fiboaitech.types.streaming import StreamingConfig
+from fiboaitech.utils.logger import logger
+
+OBSERVATION_MARKER = "benchmark-observation"
+TOOL_NAME = "search"
+
+
+def get_react_responder(tool_calls: int):
+    """Returns an LLM responder calling the tool until `tool_calls` observations are in the prompt, then answering."""
+
+    def respond(messages: list[dict]) -> str:
+        observations = get_messages_text(messages).count(OBSERVATION_MARKER)
+        if observations < tool_calls:
+            return (
+                f"Thought: I need more information, step {observations + 1}.\n"
+                f"Action: {TOOL_NAME}\n"
+                f'Action Input: {{"params": {{"query": "step {observations + 1}"}}}}'
+            )
+        return f"Thought: I have enough information.\nAnswer: Collected {observations} observations."
+
+    return respond
+
+
+def respond_to_search(params: dict | None = None, **kwargs) -> dict:
+    return {"result": OBSERVATION_MARKER, "query": (params or {}).get("query")}
+
+
+def build_agent(tool_calls: int, llm_latency: float, tool_latency: float, streaming: bool) -> ReActAgent:
+    llm = FakeLLM(
+        connection=FakeLLMConnection(responder=get_react_responder(tool_calls), time_to_first_token=llm_latency),
+        streaming=StreamingConfig(enabled=streaming),
+    )
+    tool = HttpApiCall(
+        name=TOOL_NAME,
+        description="Searches the knowledge base.",
+        connection=FakeHttp(responder=respond_to_search, latency=tool_latency),
+    )
+    return ReActAgent(llm=llm, tools=[tool], max_loops=tool_calls + 2)
+
+
+def measure(agent: ReActAgent, tool_calls: int, repeats: int) -> dict[str, float]:
+    """Runs the agent `repeats` times after a warm-up run and returns timings in milliseconds."""
+    expected_answer = f"Collected {tool_calls} observations."
+    agent.run(input_data={"input": "Warm up"})
+
+    durations = []
+    for _ in range(repeats):
+        config = RunnableConfig(callbacks=[TracingCallbackHandler()])
+        time_start = time.perf_counter()
+        result = agent.run(input_data={"input": "What is in the knowledge base?"}, config=config)
+        durations.append((time.perf_counter() - time_start) * 1000)
+        if result.status != RunnableStatus.SUCCESS or result.output["content"] != expected_answer:
+            raise RuntimeError("Benchmark agent run failed")
+
+    return {
+        "median_ms": statistics.median(durations),
+        "min_ms": min(durations),
+        "per_loop_ms": statistics.median(durations) / (tool_calls + 1),
+    }
+
+
+def run(
+    tool_calls: int = 5, repeats: int = 10, llm_latency_ms: float = 0, tool_latency_ms: float = 0
+) -> list[dict]:
+    results = []
+    for scenario, streaming in {"react": False, "react_streaming": True}.items():
+        agent = build_agent(tool_calls, llm_latency_ms / 1000, tool_latency_ms / 1000, streaming=streaming)
+        results.append(
+            {
+                "benchmark": "agent_loop",
+                "scenario": scenario,
+                "tool_calls": tool_calls,
+                "llm_latency_ms": llm_latency_ms,
+                "tool_latency_ms": tool_latency_ms,
+                "repeats": repeats,
+                **measure(agent, tool_calls, repeats),
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tool-calls", type=int, default=5, help="Number of tool calls before the final answer.")
+    parser.add_argument("--repeats", type=int, default=10, help="Number of measured runs per scenario.")
+    parser.add_argument("--llm-latency-ms", type=float, default=0, help="Latency of every fake LLM call.")
+    parser.add_argument("--tool-latency-ms", type=float, default=0, help="Latency of every fake tool call.")
+    args = parser.parse_args()
+
+    logger.disabled = True
+    print(
+        json.dumps(
+            run(
+                tool_calls=args.tool_calls,
+                repeats=args.repeats,
+                llm_latency_ms=args.llm_latency_ms,
+                tool_latency_ms=args.tool_latency_ms,
+            ),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Cache codec benchmark.
+
+Encodes and decodes a retriever-like output, a list of documents with embeddings, with the Base64 codec and the binary
+codec with every available compression, and reports encoded size, compression ratio and encode/decode timings.
+
+Usage:
+    python -m benchmarks.cache_codec --documents 20 --dimensions 1536 --repeats 20
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+
+from fiboaitech.cache.codecs import Base64Codec, BaseCodec, BinaryCodec
+from fiboaitech.cache.config import CacheCompression
+from fiboaitech.components.serializers import JsonSerializer
+from fiboaitech.utils.logger import logger
+
+
+def get_codecs() -> dict[str, BaseCodec]:
+    """Returns the Base64 codec and binary codecs of the compressions with installed packages."""
+    codecs = {"base64": Base64Codec()}
+    for compression in CacheCompression:
+        try:
+            codecs[f"binary_{compression.value}"] = BinaryCodec(compression=compression)
+        except ImportError:
+            logger.info(f"Compression {compression.value} skipped: package is not installed.")
+    return codecs
+
+
+def get_output(documents: int, dimensions: int) -> dict:
+    rng = random.Random(0)  # nosec B311
+    return {
+        "documents": [
+            {
+                "id": f"doc-{i}",
+                "content": f"Document {i}. " + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 10,
+                "metadata": {"source": f"file-{i}.pdf", "page": i},
+                "embedding": [rng.uniform(-1, 1) for _ in range(dimensions)],
+                "score": rng.random(),
+            }
+            for i in range(documents)
+        ]
+    }
+
+
+def measure(codec: BaseCodec, value: str, repeats: int) -> dict[str, float]:
+    encode_durations, decode_durations = [], []
+    for _ in range(repeats):
+        time_start = time.perf_counter()
+        encoded = codec.encode(value)
+        encode_durations.append(time.perf_counter() - time_start)
+
+        time_start = time.perf_counter()
+        decoded = codec.decode(encoded)
+        decode_durations.append(time.perf_counter() - time_start)
+        if decoded != value:
+            raise RuntimeError("Benchmark codec round trip failed")
+
+    encode_ms = statistics.median(encode_durations) * 1000
+    decode_ms = statistics.median(decode_durations) * 1000
+    return {
+        "median_ms": encode_ms + decode_ms,
+        "encode_median_ms": encode_ms,
+        "decode_median_ms": decode_ms,
+        "encoded_kb": len(encoded) / 1024,
+        "compression_ratio": len(value.encode()) / len(encoded),
+    }
+
+
+def run(documents: int = 20, dimensions: int = 1536, repeats: int = 20) -> list[dict]:
+    value = JsonSerializer().dumps(get_output(documents, dimensions))
+    return [
+        {
+            "benchmark": "cache_codec",
+            "codec": name,
+            "documents": documents,
+            "dimensions": dimensions,
+            "repeats": repeats,
+            **measure(codec, value, repeats),
+        }
+        for name, codec in get_codecs().items()
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=20, help="Number of documents in the cached output.")
+    parser.add_argument("--dimensions", type=int, default=1536, help="Number of embedding dimensions.")
+    parser.add_argument("--repeats", type=int, default=20, help="Number of measured round trips per codec.")
+    args = parser.parse_args()
+
+    logger.disabled = True
+    print(json.dumps(run(documents=args.documents, dimensions=args.dimensions, repeats=args.repeats), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Streaming callback throughput benchmark.
+
+Streams chunks from a node with a large prompt through a tracing callback and a streaming queue callback, and compares
+the cached serialized node view with serializing the node for every callback event.
+
+Usage:
+    python -m benchmarks.callback_serialization --chunks 1000 --messages 200 --repeats 5
+"""
+
+import argparse
+import json
+import statistics
+import time
+from queue import Queue
+from typing import Any, Literal
+
+from fiboaitech.callbacks import NodeCallbackHandler, TracingCallbackHandler
+from fiboaitech.callbacks.streaming import StreamingQueueCallbackHandler
+from fiboaitech.nodes import NodeGroup
+from fiboaitech.nodes.node import Node
+from fiboaitech.prompts import Message, Prompt
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+from fiboaitech.types.streaming import StreamingConfig
+from fiboaitech.utils.logger import logger
+
+
+class StreamingNode(Node):
+    group: Literal[NodeGroup.LLMS] = NodeGroup.LLMS
+    prompt: Prompt
+    chunks: int
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        for _ in range(self.chunks):
+            self.run_on_node_execute_stream(config.callbacks, {"choices": [{"delta": {"content": "token"}}]}, **kwargs)
+        return {"content": "token" * self.chunks}
+
+
+class UncachedStreamingNode(StreamingNode):
+    """Serializes the node for every callback event."""
+
+    def get_callback_serialized(self, callback: NodeCallbackHandler) -> dict:
+        return self.to_dict()
+
+
+def measure(node: StreamingNode, repeats: int) -> dict[str, float]:
+    """Runs the node `repeats` times and returns streamed chunks per second."""
+    durations = []
+    for _ in range(repeats):
+        callbacks = [TracingCallbackHandler(), StreamingQueueCallbackHandler(queue=Queue())]
+        time_start = time.perf_counter()
+        result = node.run(input_data={}, config=RunnableConfig(callbacks=callbacks))
+        durations.append(time.perf_counter() - time_start)
+        if result.status != RunnableStatus.SUCCESS:
+            raise RuntimeError("Benchmark node run failed")
+
+    return {
+        "median_ms": statistics.median(durations) * 1000,
+        "chunks_per_second": node.chunks / statistics.median(durations),
+    }
+
+
+def run(chunks: int = 1000, messages: int = 200, repeats: int = 5) -> list[dict]:
+    prompt = Prompt(
+        messages=[Message(role="user", content=f"Message {i}: " + "context " * 50) for i in range(messages)]
+    )
+    nodes = {
+        "cached": StreamingNode,
+        "uncached": UncachedStreamingNode,
+    }
+
+    results = []
+    for serialization, node_cls in nodes.items():
+        node = node_cls(prompt=prompt, chunks=chunks, streaming=StreamingConfig(enabled=True))
+        results.append(
+            {
+                "benchmark": "callback_serialization",
+                "serialization": serialization,
+                "chunks": chunks,
+                "prompt_messages": messages,
+                "repeats": repeats,
+                **measure(node, repeats),
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=1000, help="Number of streamed chunks per run.")
+    parser.add_argument("--messages", type=int, default=200, help="Number of prompt messages of the node.")
+    parser.add_argument("--repeats", type=int, default=5, help="Number of measured runs per scenario.")
+    args = parser.parse_args()
+
+    logger.disabled = True
+    print(json.dumps(run(chunks=args.chunks, messages=args.messages, repeats=args.repeats), indent=2))
+
+
+if __name__ == "__main__":
+    main()
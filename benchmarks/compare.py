@@ -0,0 +1,71 @@
+"""
+Compares two benchmark reports.
+
+Matches results by benchmark, scenario and parameters, and prints the change of their median time. Results with a
+median slowdown above the threshold are reported as regressions and make the command exit with status 1.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json --threshold 0.1
+"""
+
+import argparse
+import json
+import sys
+
+METRIC = "median_ms"
+
+
+def load_results(path: str) -> list[dict]:
+    """Loads results of a report of `python -m benchmarks` or a result list of a single benchmark."""
+    with open(path) as f:
+        report = json.load(f)
+    return report["results"] if isinstance(report, dict) else report
+
+
+def get_key(result: dict) -> tuple:
+    """Identifies the result by its parameters, e.g. benchmark, scenario and sizes, excluding measured metrics."""
+    return tuple(
+        sorted(
+            (name, value)
+            for name, value in result.items()
+            if not isinstance(value, float) or name.endswith("latency_ms")
+        )
+    )
+
+
+def compare(baseline: list[dict], candidate: list[dict], threshold: float) -> list[dict]:
+    baseline_by_key = {get_key(result): result for result in baseline}
+    rows = []
+    for result in candidate:
+        key = get_key(result)
+        if (previous := baseline_by_key.get(key)) is None:
+            continue
+        change = result[METRIC] / previous[METRIC] - 1
+        rows.append(
+            {
+                "benchmark": result["benchmark"],
+                "params": {name: value for name, value in key if name != "benchmark"},
+                "baseline_ms": previous[METRIC],
+                "candidate_ms": result[METRIC],
+                "change": change,
+                "regression": change > threshold,
+            }
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", help="Report of the baseline commit.")
+    parser.add_argument("candidate", help="Report of the candidate commit.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative median slowdown to report.")
+    args = parser.parse_args()
+
+    rows = compare(load_results(args.baseline), load_results(args.candidate), args.threshold)
+    print(json.dumps(rows, indent=2))
+    if any(row["regression"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,506 @@
+"""
+Deterministic offline fakes of the services used by the benchmarks.
+
+Connections return in-process clients, so nodes run their real code paths (prompt formatting, litellm response
+handling, input transformers, vector store conversions) without network access:
+
+- `FakeLLMConnection` and `FakeLLM` return litellm `ModelResponse` objects, streamed in chunks when the node has
+  streaming enabled, with configurable time to first token and per-chunk latency.
+- `FakeEmbedderConnection`, `FakeDocumentEmbedder` and `FakeTextEmbedder` return litellm `EmbeddingResponse` objects
+  with hashed bag-of-words vectors, so texts sharing words are close to each other.
+- `FakeHttp` returns `requests.Response` objects for `HttpApiCall` tools.
+- `InMemoryChroma` returns a Chroma compatible in-memory client for the Chroma writer and retriever nodes.
+"""
+
+import asyncio
+import json
+import re
+import time
+import zlib
+from typing import Any, AsyncIterator, Callable, Iterator
+
+import litellm
+import numpy as np
+import requests
+from litellm import ModelResponse
+from litellm.types.utils import EmbeddingResponse, Usage
+from pydantic import Field
+from requests.structures import CaseInsensitiveDict
+
+from fiboaitech.components.embedders.base import BaseEmbedder
+from fiboaitech.connections import BaseConnection, Chroma, Http, HTTPMethod
+from fiboaitech.connections.managers import ConnectionManager
+from fiboaitech.nodes.embedders.base import DocumentEmbedder, TextEmbedder
+from fiboaitech.nodes.llms.base import BaseLLM
+
+# Fake model names are unknown to litellm, keep its provider hints out of the JSON output
+litellm.suppress_debug_info = True
+
+DEFAULT_LLM_RESPONSE = "This is a deterministic response of the fake language model used for offline benchmarks."
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def count_tokens(text: str) -> int:
+    """Approximates the number of tokens of the text by the number of words."""
+    return len(text.split())
+
+
+def get_messages_text(messages: list[dict]) -> str:
+    """Joins text contents of the prompt messages."""
+    return "\n".join(message["content"] for message in messages if isinstance(message.get("content"), str))
+
+
+class FakeLLMClient:
+    """litellm compatible completion client returning deterministic responses.
+
+    Attributes:
+        responder (Callable[[list[dict]], str]): Returns the response text for the prompt messages.
+        time_to_first_token (float): Delay before the first chunk in seconds.
+        chunk_latency (float): Delay between chunks in seconds.
+        chunk_size (int): Number of words per streamed chunk.
+    """
+
+    def __init__(
+        self,
+        responder: Callable[[list[dict]], str],
+        time_to_first_token: float = 0,
+        chunk_latency: float = 0,
+        chunk_size: int = 4,
+    ):
+        self.responder = responder
+        self.time_to_first_token = time_to_first_token
+        self.chunk_latency = chunk_latency
+        self.chunk_size = chunk_size
+
+    def _split(self, content: str) -> list[str]:
+        """Splits the response into chunks of `chunk_size` words keeping whitespace."""
+        words = re.findall(r"\S+\s*", content)
+        return ["".join(words[i: i + self.chunk_size]) for i in range(0, len(words), self.chunk_size)] or [""]
+
+    def _get_delays(self, chunks: list[str]) -> list[float]:
+        """Delays before each chunk."""
+        return [self.time_to_first_token] + [self.chunk_latency] * (len(chunks) - 1)
+
+    @staticmethod
+    def _get_response(model: str, messages: list[dict], content: str) -> ModelResponse:
+        prompt_tokens = count_tokens(get_messages_text(messages))
+        completion_tokens = count_tokens(content)
+        return ModelResponse(
+            model=model,
+            choices=[{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+            usage=Usage(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            ),
+        )
+
+    @staticmethod
+    def _get_chunk(response_id: str, model: str, content: str, is_last: bool) -> ModelResponse:
+        return ModelResponse(
+            id=response_id,
+            model=model,
+            stream=True,
+            choices=[
+                {
+                    "index": 0,
+                    "finish_reason": "stop" if is_last else None,
+                    "delta": {"role": "assistant", "content": content},
+                }
+            ],
+        )
+
+    def _stream(self, model: str, chunks: list[str]) -> Iterator[ModelResponse]:
+        response_id = f"fake-{zlib.crc32(''.join(chunks).encode())}"
+        for i, (chunk, delay) in enumerate(zip(chunks, self._get_delays(chunks))):
+            if delay:
+                time.sleep(delay)
+            yield self._get_chunk(response_id, model, chunk, is_last=i == len(chunks) - 1)
+
+    async def _astream(self, model: str, chunks: list[str]) -> AsyncIterator[ModelResponse]:
+        response_id = f"fake-{zlib.crc32(''.join(chunks).encode())}"
+        for i, (chunk, delay) in enumerate(zip(chunks, self._get_delays(chunks))):
+            if delay:
+                await asyncio.sleep(delay)
+            yield self._get_chunk(response_id, model, chunk, is_last=i == len(chunks) - 1)
+
+    def completion(
+        self, model: str, messages: list[dict], stream: bool = False, **kwargs
+    ) -> ModelResponse | Iterator[ModelResponse]:
+        """Returns the response or a stream of response chunks for the messages.
+
+        Args:
+            model (str): Model name.
+            messages (list[dict]): Prompt messages.
+            stream (bool): Whether to stream the response.
+            **kwargs: Other litellm completion params, ignored.
+
+        Returns:
+            ModelResponse | Iterator[ModelResponse]: Response or stream of response chunks.
+        """
+        content = self.responder(messages)
+        chunks = self._split(content)
+        if stream:
+            return self._stream(model, chunks)
+
+        time.sleep(sum(self._get_delays(chunks)))
+        return self._get_response(model, messages, content)
+
+    async def acompletion(
+        self, model: str, messages: list[dict], stream: bool = False, **kwargs
+    ) -> ModelResponse | AsyncIterator[ModelResponse]:
+        """Async version of `completion`."""
+        content = self.responder(messages)
+        chunks = self._split(content)
+        if stream:
+            return self._astream(model, chunks)
+
+        await asyncio.sleep(sum(self._get_delays(chunks)))
+        return self._get_response(model, messages, content)
+
+
+class FakeLLMConnection(BaseConnection):
+    """Connection to the fake language model.
+
+    Attributes:
+        response (str): Response text used when `responder` is not set.
+        responder (Callable[[list[dict]], str] | None): Returns the response text for the prompt messages.
+        time_to_first_token (float): Delay before the first chunk in seconds.
+        chunk_latency (float): Delay between chunks in seconds.
+        chunk_size (int): Number of words per streamed chunk.
+    """
+
+    response: str = DEFAULT_LLM_RESPONSE
+    responder: Callable[[list[dict]], str] | None = Field(default=None, exclude=True)
+    time_to_first_token: float = 0
+    chunk_latency: float = 0
+    chunk_size: int = 4
+
+    def connect(self) -> FakeLLMClient:
+        return FakeLLMClient(
+            responder=self.responder or (lambda messages: self.response),
+            time_to_first_token=self.time_to_first_token,
+            chunk_latency=self.chunk_latency,
+            chunk_size=self.chunk_size,
+        )
+
+    def connect_async(self) -> FakeLLMClient:
+        return self.connect()
+
+
+class FakeLLM(BaseLLM):
+    """LLM node completing prompts with the client of `FakeLLMConnection` instead of litellm."""
+
+    name: str | None = "FakeLLM"
+    model: str = "fake-llm"
+    connection: FakeLLMConnection = Field(default_factory=FakeLLMConnection)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._completion = self._client_completion
+        self._acompletion = self._aclient_completion
+
+    def _client_completion(self, client: FakeLLMClient | None = None, **params):
+        return (client or self.client).completion(**params)
+
+    async def _aclient_completion(self, client: FakeLLMClient | None = None, **params):
+        return await (client or self.async_client).acompletion(**params)
+
+
+def embed_text(text: str, dimensions: int) -> list[float]:
+    """Hashes words of the text into a normalized vector. Texts sharing words get a higher cosine similarity.
+
+    Args:
+        text (str): Text to embed.
+        dimensions (int): Vector size.
+
+    Returns:
+        list[float]: Embedding vector.
+    """
+    vector = np.zeros(dimensions)
+    for word in WORD_PATTERN.findall(text.lower()):
+        word_hash = zlib.crc32(word.encode())
+        vector[word_hash % dimensions] += 1 if word_hash & 1 << 31 else -1
+    norm = np.linalg.norm(vector)
+    return (vector / norm if norm else vector).tolist()
+
+
+class FakeEmbedderClient:
+    """litellm compatible embedding client returning deterministic vectors.
+
+    Attributes:
+        dimensions (int): Vector size.
+        latency (float): Delay of every request in seconds.
+    """
+
+    def __init__(self, dimensions: int = 256, latency: float = 0):
+        self.dimensions = dimensions
+        self.latency = latency
+
+    def embedding(self, model: str, input: list[str], **kwargs) -> EmbeddingResponse:
+        """Embeds the input texts.
+
+        Args:
+            model (str): Model name.
+            input (list[str]): Texts to embed.
+            **kwargs: Other litellm embedding params, ignored.
+
+        Returns:
+            EmbeddingResponse: Embeddings of the texts.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        tokens = sum(count_tokens(text) for text in input)
+        return EmbeddingResponse(
+            model=model,
+            data=[
+                {"object": "embedding", "index": i, "embedding": embed_text(text, self.dimensions)}
+                for i, text in enumerate(input)
+            ],
+            usage=Usage(prompt_tokens=tokens, total_tokens=tokens),
+        )
+
+
+class FakeEmbedderConnection(BaseConnection):
+    """Connection to the fake embedding model.
+
+    Attributes:
+        dimensions (int): Vector size.
+        latency (float): Delay of every request in seconds.
+    """
+
+    dimensions: int = 256
+    latency: float = 0
+
+    def connect(self) -> FakeEmbedderClient:
+        return FakeEmbedderClient(dimensions=self.dimensions, latency=self.latency)
+
+
+class FakeEmbedder(BaseEmbedder):
+    """Embedder component calling the client of `FakeEmbedderConnection` instead of litellm."""
+
+    model: str = "fake-embedding"
+    connection: FakeEmbedderConnection
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._embedding = self._client_embedding
+
+    def _client_embedding(self, client: FakeEmbedderClient | None = None, **params) -> EmbeddingResponse:
+        return (client or self.connection.connect()).embedding(**params)
+
+
+class FakeDocumentEmbedder(DocumentEmbedder):
+    name: str = "FakeDocumentEmbedder"
+    model: str = "fake-embedding"
+    connection: FakeEmbedderConnection = Field(default_factory=FakeEmbedderConnection)
+    document_embedder: FakeEmbedder | None = None
+
+    def init_components(self, connection_manager: ConnectionManager | None = None):
+        connection_manager = connection_manager or ConnectionManager()
+        super().init_components(connection_manager)
+        if self.document_embedder is None:
+            self.document_embedder = FakeEmbedder(connection=self.connection, model=self.model, client=self.client)
+
+
+class FakeTextEmbedder(TextEmbedder):
+    name: str = "FakeTextEmbedder"
+    model: str = "fake-embedding"
+    connection: FakeEmbedderConnection = Field(default_factory=FakeEmbedderConnection)
+    text_embedder: FakeEmbedder | None = None
+
+    def init_components(self, connection_manager: ConnectionManager | None = None):
+        connection_manager = connection_manager or ConnectionManager()
+        super().init_components(connection_manager)
+        if self.text_embedder is None:
+            self.text_embedder = FakeEmbedder(connection=self.connection, model=self.model, client=self.client)
+
+
+class FakeHttpClient:
+    """`requests` compatible client returning JSON responses without network access.
+
+    Attributes:
+        responder (Callable[..., Any]): Returns the JSON body for the request params.
+        status_code (int): Status code of responses.
+        latency (float): Delay of every request in seconds.
+    """
+
+    def __init__(self, responder: Callable[..., Any], status_code: int = 200, latency: float = 0):
+        self.responder = responder
+        self.status_code = status_code
+        self.latency = latency
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Returns the response to the request.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            **kwargs: Request params, e.g. `headers`, `params`, `data`, `json` and `timeout`.
+
+        Returns:
+            requests.Response: Response with the JSON body returned by the responder.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.url = url
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict({"content-type": "application/json"})
+        response._content = json.dumps(self.responder(method=method, url=url, **kwargs)).encode()
+        return response
+
+
+def echo_http_request(method: str, url: str, params: dict | None = None, data: Any = None, json: Any = None, **kwargs):
+    """Default fake HTTP responder echoing the request."""
+    return {"method": method, "url": url, "params": params, "data": json if data is None else data}
+
+
+class FakeHttp(Http):
+    """HTTP connection returning a `FakeHttpClient`.
+
+    Attributes:
+        responder (Callable[..., Any] | None): Returns the JSON body for the request params. Echoes the request
+            by default.
+        status_code (int): Status code of responses.
+        latency (float): Delay of every request in seconds.
+    """
+
+    url: str = "https://benchmarks.local/api"
+    method: HTTPMethod = HTTPMethod.GET
+    responder: Callable[..., Any] | None = Field(default=None, exclude=True)
+    status_code: int = 200
+    latency: float = 0
+
+    def connect(self) -> FakeHttpClient:
+        return FakeHttpClient(
+            responder=self.responder or echo_http_request, status_code=self.status_code, latency=self.latency
+        )
+
+
+class InMemoryChromaCollection:
+    """Chroma compatible collection keeping documents in memory and searching by cosine distance.
+
+    Metadata filters are not supported.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._records: dict[str, dict[str, Any]] = {}
+        self._matrix: tuple[list[str], np.ndarray] | None = None
+
+    @staticmethod
+    def _check_filters(where: dict | None, where_document: dict | None) -> None:
+        if where or where_document:
+            raise NotImplementedError("In-memory Chroma collection does not support filters")
+
+    def add(
+        self,
+        ids: list[str],
+        documents: list[str] | None = None,
+        metadatas: list[dict] | None = None,
+        embeddings: list[list[float]] | None = None,
+    ) -> None:
+        for i, doc_id in enumerate(ids):
+            self._records[doc_id] = {
+                "document": documents[i] if documents else None,
+                "metadata": metadatas[i] if metadatas else None,
+                "embedding": embeddings[i] if embeddings else None,
+            }
+        self._matrix = None
+
+    def count(self) -> int:
+        return len(self._records)
+
+    def _get_matrix(self) -> tuple[list[str], np.ndarray]:
+        """Normalized embeddings of the collection, rebuilt after writes."""
+        if self._matrix is None:
+            ids = [doc_id for doc_id, record in self._records.items() if record["embedding"] is not None]
+            matrix = np.array([self._records[doc_id]["embedding"] for doc_id in ids], dtype=float)
+            if ids:
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                matrix = matrix / np.where(norms == 0, 1, norms)
+            self._matrix = ids, matrix
+        return self._matrix
+
+    def _get_fields(self, ids: list[str], include: list[str]) -> dict[str, list]:
+        records = [self._records[doc_id] for doc_id in ids]
+        return {
+            field: [record[field[:-1]] for record in records] if field in include else None
+            for field in ("documents", "metadatas", "embeddings")
+        }
+
+    def query(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int = 10,
+        where: dict | None = None,
+        where_document: dict | None = None,
+        include: list[str] = ("metadatas", "documents", "distances"),
+    ) -> dict[str, list | None]:
+        self._check_filters(where, where_document)
+        ids, matrix = self._get_matrix()
+        result = {"ids": [], "documents": [], "metadatas": [], "embeddings": [], "distances": []}
+        for query_embedding in query_embeddings:
+            distances = np.zeros(0)
+            if ids:
+                query = np.asarray(query_embedding, dtype=float)
+                distances = 1 - matrix @ (query / (np.linalg.norm(query) or 1))
+            top = np.argsort(distances, kind="stable")[:n_results]
+            top_ids = [ids[i] for i in top]
+            result["ids"].append(top_ids)
+            result["distances"].append(distances[top].tolist())
+            for field, values in self._get_fields(top_ids, include).items():
+                result[field].append(values)
+        return {field: values if field == "ids" or field in include else None for field, values in result.items()}
+
+    def get(
+        self,
+        ids: list[str] | None = None,
+        where: dict | None = None,
+        where_document: dict | None = None,
+        include: list[str] = ("metadatas", "documents"),
+    ) -> dict[str, list | None]:
+        self._check_filters(where, where_document)
+        ids = [doc_id for doc_id in ids if doc_id in self._records] if ids is not None else list(self._records)
+        return {"ids": ids, **self._get_fields(ids, include)}
+
+    def delete(self, ids: list[str] | None = None, where: dict | None = None, where_document: dict | None = None):
+        self._check_filters(where, where_document)
+        for doc_id in ids or []:
+            self._records.pop(doc_id, None)
+        self._matrix = None
+
+
+class InMemoryChromaClient:
+    """Chroma compatible client keeping collections in memory."""
+
+    def __init__(self):
+        self.collections: dict[str, InMemoryChromaCollection] = {}
+
+    def get_or_create_collection(self, name: str, **kwargs) -> InMemoryChromaCollection:
+        if name not in self.collections:
+            self.collections[name] = InMemoryChromaCollection(name)
+        return self.collections[name]
+
+    def get_collection(self, name: str, **kwargs) -> InMemoryChromaCollection:
+        if name not in self.collections:
+            raise ValueError(f"Collection {name} does not exist.")
+        return self.collections[name]
+
+    def delete_collection(self, name: str) -> None:
+        self.collections.pop(name, None)
+
+
+class InMemoryChroma(Chroma):
+    """Chroma connection returning an `InMemoryChromaClient`.
+
+    Pass the same client to writer and retriever nodes with `client=` to share the stored documents.
+    """
+
+    host: str = "localhost"
+    port: int = 8000
+
+    def connect(self) -> InMemoryChromaClient:
+        return InMemoryChromaClient()
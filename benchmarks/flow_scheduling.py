@@ -0,0 +1,106 @@
+"""
+Flow scheduling overhead benchmark.
+
+Compares the event-driven scheduler with the lock-step loop (wait for the first completed node, rescan the graph,
+submit) on wide and deep DAGs of no-op nodes, so the measured time is dominated by scheduling.
+
+Usage:
+    python -m benchmarks.flow_scheduling --width 50 --depth 50 --repeats 20
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Literal
+
+from fiboaitech import flows
+from fiboaitech.executors.pool import ThreadExecutor
+from fiboaitech.nodes import NodeGroup
+from fiboaitech.nodes.node import Node, NodeDependency
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+from fiboaitech.utils.logger import logger
+
+
+class NoopNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        return {}
+
+
+class LockStepThreadExecutor(ThreadExecutor):
+    """Thread executor driven by the flow loop instead of completion callbacks."""
+
+    dispatch_on_completion = False
+
+
+def build_wide_dag(width: int) -> list[Node]:
+    """Root node fanned out to `width` nodes joined by a single sink node."""
+    root = NoopNode()
+    layer = [NoopNode(depends=[NodeDependency(root)]) for _ in range(width)]
+    sink = NoopNode(depends=[NodeDependency(node) for node in layer])
+    return [root, *layer, sink]
+
+
+def build_deep_dag(depth: int) -> list[Node]:
+    """Chain of `depth` nodes."""
+    nodes = [NoopNode()]
+    for _ in range(depth - 1):
+        nodes.append(NoopNode(depends=[NodeDependency(nodes[-1])]))
+    return nodes
+
+
+def measure(nodes: list[Node], executor: type[ThreadExecutor], repeats: int) -> dict[str, float]:
+    """Runs the flow `repeats` times after a warm-up run and returns timings in milliseconds."""
+    flow = flows.Flow(nodes=nodes, executor=executor)
+    flow.run(input_data={})
+
+    durations = []
+    for _ in range(repeats):
+        time_start = time.perf_counter()
+        result = flow.run(input_data={})
+        durations.append((time.perf_counter() - time_start) * 1000)
+        if result.status != RunnableStatus.SUCCESS:
+            raise RuntimeError("Benchmark flow run failed")
+
+    return {
+        "median_ms": statistics.median(durations),
+        "min_ms": min(durations),
+        "per_node_us": statistics.median(durations) * 1000 / len(nodes),
+    }
+
+
+def run(width: int = 50, depth: int = 50, repeats: int = 20) -> list[dict]:
+    scenarios = {"wide": build_wide_dag(width), "deep": build_deep_dag(depth)}
+    executors = {"event_driven": ThreadExecutor, "lock_step": LockStepThreadExecutor}
+
+    results = []
+    for scenario, nodes in scenarios.items():
+        for scheduler, executor in executors.items():
+            results.append(
+                {
+                    "benchmark": "flow_scheduling",
+                    "scenario": scenario,
+                    "scheduler": scheduler,
+                    "nodes": len(nodes),
+                    "repeats": repeats,
+                    **measure(nodes, executor, repeats),
+                }
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=50, help="Number of parallel nodes in the wide DAG.")
+    parser.add_argument("--depth", type=int, default=50, help="Number of chained nodes in the deep DAG.")
+    parser.add_argument("--repeats", type=int, default=20, help="Number of measured runs per scenario.")
+    args = parser.parse_args()
+
+    logger.disabled = True
+    print(json.dumps(run(width=args.width, depth=args.depth, repeats=args.repeats), indent=2))
+
+
+if __name__ == "__main__":
+    main()
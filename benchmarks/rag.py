@@ -0,0 +1,201 @@
+"""
+RAG pipeline benchmark.
+
+Runs the ingestion flow (CSV converter -> document splitter -> document embedder -> Chroma writer) over a generated
+corpus and the retrieval flow (text embedder -> Chroma retriever -> LLM answer) over the ingested chunks. Embedder,
+vector store and LLM are offline fakes, so the measured time is the pipeline overhead: document conversions,
+input transformers, embedding batching and vector store result handling.
+
+Usage:
+    python -m benchmarks.rag --documents 100 --words 500 --split-length 100 --queries 50 --repeats 5
+"""
+
+import argparse
+import csv
+import io
+import json
+import random
+import statistics
+import time
+
+from benchmarks.fakes import FakeDocumentEmbedder, FakeEmbedderConnection, FakeLLM, FakeTextEmbedder, InMemoryChroma
+from benchmarks.fakes import InMemoryChromaClient
+from fiboaitech import flows
+from fiboaitech.nodes import InputTransformer
+from fiboaitech.nodes.converters import CSVConverter
+from fiboaitech.nodes.node import NodeDependency
+from fiboaitech.nodes.retrievers import ChromaDocumentRetriever
+from fiboaitech.nodes.splitters.document import DocumentSplitter
+from fiboaitech.nodes.writers import ChromaDocumentWriter
+from fiboaitech.prompts import Message, Prompt
+from fiboaitech.runnables import RunnableStatus
+from fiboaitech.utils.logger import logger
+
+VOCABULARY = [f"word{i}" for i in range(2000)]
+ANSWER_PROMPT = """Answer the question using the context.
+Question: {{query}}
+Context:
+{% for document in documents %}
+- {{ document.content }}
+{% endfor %}
+"""
+
+
+def generate_corpus(documents: int, words: int, seed: int = 0) -> bytes:
+    """Generates a CSV file with `documents` rows of `words` random words in sentences of ten words."""
+    rng = random.Random(seed)
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=["title", "content"])
+    writer.writeheader()
+    for i in range(documents):
+        content = rng.choices(VOCABULARY, k=words)
+        sentences = [" ".join(content[j: j + 10]) + "." for j in range(0, words, 10)]
+        writer.writerow({"title": f"Document {i}", "content": " ".join(sentences)})
+    return output.getvalue().encode()
+
+
+def generate_queries(queries: int, seed: int = 1) -> list[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(VOCABULARY, k=8)) for _ in range(queries)]
+
+
+def build_ingestion_flow(client: InMemoryChromaClient, embedder_connection, split_length: int) -> flows.Flow:
+    converter = CSVConverter(content_column="content", metadata_columns=["title"])
+    splitter = DocumentSplitter(
+        split_by="word",
+        split_length=split_length,
+        depends=[NodeDependency(converter)],
+        input_transformer=InputTransformer(selector={"documents": f"${[converter.id]}.output.documents"}),
+    )
+    embedder = FakeDocumentEmbedder(
+        connection=embedder_connection,
+        depends=[NodeDependency(splitter)],
+        input_transformer=InputTransformer(selector={"documents": f"${[splitter.id]}.output.documents"}),
+    )
+    writer = ChromaDocumentWriter(
+        connection=InMemoryChroma(),
+        client=client,
+        create_if_not_exist=True,
+        depends=[NodeDependency(embedder)],
+        input_transformer=InputTransformer(selector={"documents": f"${[embedder.id]}.output.documents"}),
+    )
+    return flows.Flow(nodes=[converter, splitter, embedder, writer])
+
+
+def build_retrieval_flow(client: InMemoryChromaClient, embedder_connection, top_k: int) -> flows.Flow:
+    embedder = FakeTextEmbedder(connection=embedder_connection)
+    retriever = ChromaDocumentRetriever(
+        connection=InMemoryChroma(),
+        client=client,
+        top_k=top_k,
+        depends=[NodeDependency(embedder)],
+        input_transformer=InputTransformer(selector={"embedding": f"${[embedder.id]}.output.embedding"}),
+    )
+    llm = FakeLLM(
+        prompt=Prompt(messages=[Message(role="user", content=ANSWER_PROMPT)]),
+        depends=[NodeDependency(retriever)],
+        input_transformer=InputTransformer(
+            selector={"query": "$.query", "documents": f"${[retriever.id]}.output.documents"}
+        ),
+    )
+    return flows.Flow(nodes=[embedder, retriever, llm])
+
+
+def check_run(result, message: str):
+    if result.status != RunnableStatus.SUCCESS:
+        raise RuntimeError(message)
+
+
+def run(
+    documents: int = 100,
+    words: int = 500,
+    split_length: int = 100,
+    queries: int = 50,
+    top_k: int = 5,
+    repeats: int = 5,
+    embedding_latency_ms: float = 0,
+) -> list[dict]:
+    corpus = generate_corpus(documents, words)
+    client = InMemoryChromaClient()
+    embedder_connection = FakeEmbedderConnection(latency=embedding_latency_ms / 1000)
+    ingestion_flow = build_ingestion_flow(client, embedder_connection, split_length)
+    writer = ingestion_flow.nodes[-1]
+
+    durations = []
+    for _ in range(repeats + 1):
+        writer.vector_store.delete_documents(delete_all=True)
+        time_start = time.perf_counter()
+        result = ingestion_flow.run(input_data={"files": [corpus]})
+        durations.append(time.perf_counter() - time_start)
+        check_run(result, "Benchmark ingestion flow run failed")
+    # The first run is a warm-up
+    durations = durations[1:]
+    chunks = writer.vector_store.count_documents()
+
+    retrieval_flow = build_retrieval_flow(client, embedder_connection, top_k)
+    query_durations = []
+    for query in ["warm up", *generate_queries(queries)]:
+        time_start = time.perf_counter()
+        result = retrieval_flow.run(input_data={"query": query})
+        query_durations.append(time.perf_counter() - time_start)
+        check_run(result, "Benchmark retrieval flow run failed")
+    query_durations = query_durations[1:]
+
+    params = {"documents": documents, "words": words, "split_length": split_length}
+    return [
+        {
+            "benchmark": "rag",
+            "scenario": "ingestion",
+            **params,
+            "chunks": chunks,
+            "embedding_latency_ms": embedding_latency_ms,
+            "repeats": repeats,
+            "median_ms": statistics.median(durations) * 1000,
+            "min_ms": min(durations) * 1000,
+            "chunks_per_second": chunks / statistics.median(durations),
+        },
+        {
+            "benchmark": "rag",
+            "scenario": "retrieval",
+            **params,
+            "chunks": chunks,
+            "embedding_latency_ms": embedding_latency_ms,
+            "queries": queries,
+            "top_k": top_k,
+            "median_ms": statistics.median(query_durations) * 1000,
+            "min_ms": min(query_durations) * 1000,
+            "queries_per_second": queries / sum(query_durations),
+        },
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=100, help="Number of documents in the corpus.")
+    parser.add_argument("--words", type=int, default=500, help="Number of words per document.")
+    parser.add_argument("--split-length", type=int, default=100, help="Number of words per chunk.")
+    parser.add_argument("--queries", type=int, default=50, help="Number of measured retrieval queries.")
+    parser.add_argument("--top-k", type=int, default=5, help="Number of retrieved chunks per query.")
+    parser.add_argument("--repeats", type=int, default=5, help="Number of measured ingestion runs.")
+    parser.add_argument("--embedding-latency-ms", type=float, default=0, help="Latency of every embedding request.")
+    args = parser.parse_args()
+
+    logger.disabled = True
+    print(
+        json.dumps(
+            run(
+                documents=args.documents,
+                words=args.words,
+                split_length=args.split_length,
+                queries=args.queries,
+                top_k=args.top_k,
+                repeats=args.repeats,
+                embedding_latency_ms=args.embedding_latency_ms,
+            ),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -48,5 +48,5 @@ if __name__ == "__main__":
     logger.info("Trace logs serialized successfully.")
 
     logger.info(f"Workflow {wf.id} finished. Results:")
-    for node_id, result in wf.flow._results.items():
-        logger.info(f"Node {node_id}-{wf.flow._node_by_id[node_id].name}: \n{result}")
+    for node_id, node_result in result_2.output.items():
+        logger.info(f"Node {node_id}-{wf.flow._node_by_id[node_id].name}: \n{node_result}")
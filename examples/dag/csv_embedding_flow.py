@@ -28,7 +28,7 @@ def run_csv_embedding_workflow(csv_file_path: str, yaml_file_path: str):
         trace_logs = json.dumps({"runs": [run.to_dict() for run in tracer.runs.values()]}, cls=JsonWorkflowEncoder)
 
         logger.info(f"Workflow {workflow.id} finished. Results:")
-        for node_id, node_result in workflow.flow._results.items():
+        for node_id, node_result in result.output.items():
             logger.info(f"Node {node_id}-{workflow.flow._node_by_id[node_id].name}:")
             logger.info(f"Result: {node_result}")
 
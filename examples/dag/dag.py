@@ -186,10 +186,10 @@ WF = Workflow(id="wf", flow=Flow(id="wf", nodes=NODES, connection_manager=CM))
 
 
 if __name__ == "__main__":
-    WF.run(
+    result = WF.run(
         input_data={"date": "4 May 2024", "next_date": "6 May 2024"},
         config=runnables.RunnableConfig(callbacks=[]),
     )
     logger.info(f"Workflow {WF.id} finished. Results: ")
-    for node_id, result in WF.flow._results.items():
-        logger.info(f"Node {node_id}-{WF.flow._node_by_id[node_id].name}: {result}")
+    for node_id, node_result in result.output.items():
+        logger.info(f"Node {node_id}-{WF.flow._node_by_id[node_id].name}: {node_result}")
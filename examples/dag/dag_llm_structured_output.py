@@ -15,7 +15,7 @@ if __name__ == "__main__":
     tracing = TracingCallbackHandler()
     with get_connection_manager() as cm:
         wf = Workflow.from_yaml_file(file_path=dag_yaml_file_path, connection_manager=cm, init_components=True)
-        wf.run(
+        result = wf.run(
             input_data={},
             config=runnables.RunnableConfig(callbacks=[tracing]),
         )
@@ -25,5 +25,5 @@ if __name__ == "__main__":
     )
 
     logger.info(f"Workflow {wf.id} finished. Results:")
-    for node_id, result in wf.flow._results.items():
-        logger.info(f"Node {node_id}-{wf.flow._node_by_id[node_id].name}: \n{result}")
+    for node_id, node_result in result.output.items():
+        logger.info(f"Node {node_id}-{wf.flow._node_by_id[node_id].name}: \n{node_result}")
@@ -14,10 +14,10 @@ if __name__ == "__main__":
         wf = Workflow.from_yaml_file(
             file_path=dag_yaml_file_path, connection_manager=cm, init_components=True
         )
-        wf.run(
+        result = wf.run(
             input_data={"date": "4 May 2024", "next_date": "6 May 2024"},
             config=runnables.RunnableConfig(callbacks=[]),
         )
     logger.info(f"Workflow {wf.id} finished. Results: ")
-    for node_id, result in wf.flow._results.items():
-        logger.info(f"Node {node_id}-{wf.flow._node_by_id[node_id].name}: {result}")
+    for node_id, node_result in result.output.items():
+        logger.info(f"Node {node_id}-{wf.flow._node_by_id[node_id].name}: {node_result}")
@@ -27,7 +27,7 @@ if __name__ == "__main__":
     with get_connection_manager() as cm:
         # Load the workflow from the YAML file, parse and init components during parsing
         wf = Workflow.from_yaml_file(file_path=dag_yaml_file_path, connection_manager=cm, init_components=True)
-        wf.run(
+        result = wf.run(
             input_data={"input": INPUT_DATA},
             config=runnables.RunnableConfig(callbacks=[tracing]),
         )
@@ -38,5 +38,5 @@ if __name__ == "__main__":
     )
 
     logger.info(f"Workflow {wf.id} finished. Results:")
-    for node_id, result in wf.flow._results.items():
-        logger.info(f"Node {node_id}-{wf.flow._node_by_id[node_id].name}: \n{result}")
+    for node_id, node_result in result.output.items():
+        logger.info(f"Node {node_id}-{wf.flow._node_by_id[node_id].name}: \n{node_result}")
@@ -187,9 +187,9 @@ with Workflow() as wf:
     )
     wf.flow.add_nodes(openai_5_node)
 
-    wf.run(input_data={"date": "4 May 2024", "next_date": "6 May 2024"})
+    result = wf.run(input_data={"date": "4 May 2024", "next_date": "6 May 2024"})
 
     logger.info(f"Workflow {wf.id} finished. Results: ")
 
-    for node_id, result in wf.flow._results.items():
-        logger.info(f"Node {node_id} - {wf.flow._node_by_id[node_id].name}: {result}")
+    for node_id, node_result in result.output.items():
+        logger.info(f"Node {node_id} - {wf.flow._node_by_id[node_id].name}: {node_result}")
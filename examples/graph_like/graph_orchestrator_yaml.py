@@ -23,7 +23,7 @@ def run_workflow():
         wf = Workflow.from_yaml_file(
             file_path=graph_orchestrator_yaml_file_path, connection_manager=cm, init_components=True
         )
-        wf.run(
+        result = wf.run(
             input_data={"input": INPUT_DATA},
             config=runnables.RunnableConfig(callbacks=[tracing]),
         )
@@ -34,8 +34,8 @@ def run_workflow():
     )
 
     logger.info(f"Workflow {wf.id} finished. Results:")
-    for node_id, result in wf.flow._results.items():
-        logger.info(f"Node {node_id}-{wf.flow._node_by_id[node_id].name}: \n{result}")
+    for node_id, node_result in result.output.items():
+        logger.info(f"Node {node_id}-{wf.flow._node_by_id[node_id].name}: \n{node_result}")
 
     return tracing.runs
 
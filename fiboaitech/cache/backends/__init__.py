@@ -1,2 +1,5 @@
 from .base import BaseCache
 from .redis import RedisCache
+from .memory import InMemoryCache
+from .sqlite import SQLiteCache
+from .tiered import TieredCache
@@ -11,8 +11,12 @@ class BaseCache(ABC):
 
     Attributes:
         client (CacheClient): Cache client instance.
+        evictions (int): Number of entries evicted to make room for new ones. Backends that don't track
+            evictions report 0.
     """
 
+    evictions: int = 0
+
     def __init__(self, client: CacheClient):
         """Initialize BaseCache.
 
@@ -82,3 +86,26 @@ class BaseCache(ABC):
             NotImplementedError: If not implemented.
         """
         raise NotImplementedError
+
+    def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        """Acquire a lock shared between processes using the cache.
+
+        Backends without shared locks always grant the lock, so only in-process callers are coordinated.
+
+        Args:
+            key (str): Lock key.
+            token (str): Unique token of the lock owner.
+            ttl (float): Time-to-live of the lock in seconds.
+
+        Returns:
+            bool: Whether the lock was acquired.
+        """
+        return True
+
+    def release_lock(self, key: str, token: str) -> None:
+        """Release the lock if it is still owned by the token.
+
+        Args:
+            key (str): Lock key.
+            token (str): Unique token of the lock owner.
+        """
@@ -0,0 +1,222 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from fiboaitech.cache.backends import BaseCache
+from fiboaitech.cache.config import CacheEvictionPolicy, InMemoryCacheConfig
+
+# Odd 64-bit multipliers hashing the key independently for each sketch row
+FREQUENCY_SKETCH_SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5)
+HASH_MASK = (1 << 64) - 1
+FREQUENCY_SKETCH_MAX_COUNT = 15
+FREQUENCY_SKETCH_SAMPLE_FACTOR = 10
+FREQUENCY_SKETCH_MIN_WIDTH = 64
+
+
+class FrequencySketch:
+    """Count-min sketch estimating how often keys are used, with counts halved periodically so they age.
+
+    Args:
+        capacity (int): Expected number of distinct hot keys.
+    """
+
+    def __init__(self, capacity: int):
+        self._width_bits = (max(capacity * 2, FREQUENCY_SKETCH_MIN_WIDTH) - 1).bit_length()
+        self.width = 1 << self._width_bits
+        self.sample_size = capacity * FREQUENCY_SKETCH_SAMPLE_FACTOR
+        self._table = [[0] * self.width for _ in FREQUENCY_SKETCH_SEEDS]
+        self._additions = 0
+
+    def _get_indexes(self, key: str) -> list[int]:
+        key_hash = hash(key) & HASH_MASK
+        return [((key_hash * seed) & HASH_MASK) >> (64 - self._width_bits) for seed in FREQUENCY_SKETCH_SEEDS]
+
+    def increment(self, key: str) -> None:
+        """Records a use of the key."""
+        for row, index in enumerate(self._get_indexes(key)):
+            if self._table[row][index] < FREQUENCY_SKETCH_MAX_COUNT:
+                self._table[row][index] += 1
+
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._table = [[count >> 1 for count in row] for row in self._table]
+            self._additions //= 2
+
+    def estimate(self, key: str) -> int:
+        """Returns the estimated number of recent uses of the key."""
+        return min(self._table[row][index] for row, index in enumerate(self._get_indexes(key)))
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    size: int
+    expires_at: float | None
+
+
+class InMemoryCache(BaseCache):
+    """In-process cache backend with bounded size.
+
+    Entries are kept in least recently used order and evicted when the number of entries or their total size
+    exceeds the limits. With the TinyLFU policy a new entry replaces the least recently used one only if it is
+    estimated to be used more often.
+
+    Attributes:
+        max_entries (int): Maximum number of cached entries.
+        max_size_bytes (int | None): Maximum total size of cached values in bytes.
+        eviction_policy (CacheEvictionPolicy): Eviction policy.
+        hits (int): Number of lookups that found a value.
+        misses (int): Number of lookups that found no value.
+        evictions (int): Number of entries evicted to make room for new ones.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        max_entries: int = 1024,
+        max_size_bytes: int | None = None,
+        eviction_policy: CacheEvictionPolicy = CacheEvictionPolicy.LRU,
+    ):
+        """Initialize InMemoryCache.
+
+        Args:
+            client (Any): Unused, the cache keeps entries itself.
+            max_entries (int): Maximum number of cached entries.
+            max_size_bytes (int | None): Maximum total size of cached values in bytes.
+            eviction_policy (CacheEvictionPolicy): Eviction policy.
+        """
+        super().__init__(client=client)
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        self.eviction_policy = eviction_policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._sketch = FrequencySketch(max_entries) if eviction_policy == CacheEvictionPolicy.TINY_LFU else None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: InMemoryCacheConfig):
+        """Create InMemoryCache instance from configuration.
+
+        Args:
+            config (InMemoryCacheConfig): In-memory cache configuration.
+
+        Returns:
+            InMemoryCache: In-memory cache instance.
+        """
+        return cls(
+            max_entries=config.max_entries,
+            max_size_bytes=config.max_size_bytes,
+            eviction_policy=config.eviction_policy,
+        )
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of cached values in bytes."""
+        with self._lock:
+            return self._size
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def _get_size(value: Any) -> int:
+        """Returns the size of the value, its length for encoded payloads."""
+        if isinstance(value, (str, bytes, bytearray)):
+            return len(value)
+        return sys.getsizeof(value)
+
+    def _remove(self, key: str) -> None:
+        """Removes the entry. Must be called under the lock."""
+        if (entry := self._entries.pop(key, None)) is not None:
+            self._size -= entry.size
+
+    def _is_full(self, extra_size: int = 0) -> bool:
+        """Checks whether an entry of the size doesn't fit without evictions. Must be called under the lock."""
+        return len(self._entries) >= self.max_entries or (
+            self.max_size_bytes is not None and self._size + extra_size > self.max_size_bytes
+        )
+
+    def get(self, key: str) -> Any:
+        """Retrieve value from cache.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any: Cached value, or None if it is missing or expired.
+        """
+        with self._lock:
+            if self._sketch:
+                self._sketch.increment(key)
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Set value in cache, evicting entries if the cache is full.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Value to cache.
+            ttl (int | None): Time-to-live for cache entry.
+
+        Returns:
+            bool: Whether the value was cached. TinyLFU rejects values used less often than the evicted ones.
+        """
+        size = self._get_size(value)
+        if self.max_size_bytes is not None and size > self.max_size_bytes:
+            return False
+
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            is_new = key not in self._entries
+            self._remove(key)
+            if self._sketch:
+                self._sketch.increment(key)
+                if is_new and self._entries and self._is_full(size):
+                    victim = next(iter(self._entries))
+                    if self._sketch.estimate(key) <= self._sketch.estimate(victim):
+                        return False
+
+            while self._entries and self._is_full(size):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+            self._entries[key] = CacheEntry(value=value, size=size, expires_at=expires_at)
+            self._size += size
+            return True
+
+    def delete(self, key: str) -> int:
+        """Delete value from cache.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            int: Number of deleted entries.
+        """
+        with self._lock:
+            deleted = key in self._entries
+            self._remove(key)
+            return int(deleted)
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
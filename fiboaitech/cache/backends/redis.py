@@ -19,7 +19,15 @@ class RedisCache(BaseCache):
         """
         from redis import Redis
 
-        return cls(client=Redis(**config.to_dict()))
+        return cls(
+            client=Redis(
+                host=config.host,
+                port=config.port,
+                db=config.db,
+                username=config.username,
+                password=config.password,
+            )
+        )
 
     def get(self, key: str) -> Any:
         """Retrieve value from Redis cache.
@@ -57,3 +65,36 @@ class RedisCache(BaseCache):
             Any: Result of cache delete operation.
         """
         return self.client.delete(key)
+
+    def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        """Acquire the lock with a single `SET NX PX` command.
+
+        Args:
+            key (str): Lock key.
+            token (str): Unique token of the lock owner.
+            ttl (float): Time-to-live of the lock in seconds.
+
+        Returns:
+            bool: Whether the lock was acquired.
+        """
+        return bool(self.client.set(key, token, nx=True, px=max(int(ttl * 1000), 1)))
+
+    def release_lock(self, key: str, token: str) -> None:
+        """Delete the lock in a transaction if it is still owned by the token.
+
+        Args:
+            key (str): Lock key.
+            token (str): Unique token of the lock owner.
+        """
+        from redis import WatchError
+
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                if pipe.get(key) in (token, token.encode()):
+                    pipe.multi()
+                    pipe.delete(key)
+                    pipe.execute()
+            except WatchError:
+                # Lock has expired and been taken over by another owner
+                pass
@@ -0,0 +1,148 @@
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from fiboaitech.cache.backends import BaseCache
+from fiboaitech.cache.config import SQLiteCacheConfig
+
+
+class SQLiteCache(BaseCache):
+    """Cache backend persisted in a local SQLite database.
+
+    Entries survive restarts and are shared by processes on the same host. Expired entries are removed on lookup
+    and on writes, so the database doesn't grow with stale values.
+
+    Attributes:
+        max_entries (int | None): Maximum number of cached entries, the least recently used ones are evicted.
+        evictions (int): Number of entries evicted to make room for new ones.
+    """
+
+    def __init__(self, client: sqlite3.Connection, max_entries: int | None = None):
+        """Initialize SQLiteCache.
+
+        Args:
+            client (sqlite3.Connection): Database connection, shared by threads.
+            max_entries (int | None): Maximum number of cached entries.
+        """
+        super().__init__(client=client)
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._lock = threading.Lock()
+        with self._lock, self.client:
+            self.client.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+            self.client.execute("CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)")
+            self.client.execute(
+                "CREATE TABLE IF NOT EXISTS cache_locks (key TEXT PRIMARY KEY, token TEXT NOT NULL, expires_at REAL)"
+            )
+
+    @classmethod
+    def from_config(cls, config: SQLiteCacheConfig):
+        """Create SQLiteCache instance from configuration.
+
+        Args:
+            config (SQLiteCacheConfig): SQLite cache configuration.
+
+        Returns:
+            SQLiteCache: SQLite cache instance.
+        """
+        client = sqlite3.connect(config.path, check_same_thread=False)
+        if config.path != ":memory:":
+            client.execute("PRAGMA journal_mode=WAL")
+        return cls(client=client, max_entries=config.max_entries)
+
+    def get(self, key: str) -> Any:
+        """Retrieve value from cache and mark it as recently used.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any: Cached value, or None if it is missing or expired.
+        """
+        now = time.time()
+        with self._lock, self.client:
+            row = self.client.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self.client.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+            if self.max_entries is not None:
+                self.client.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            return value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Set value in cache, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Value to cache.
+            ttl (int | None): Time-to-live for cache entry.
+
+        Returns:
+            bool: Whether the value was cached.
+        """
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock, self.client:
+            self.client.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            self.client.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            if self.max_entries is not None:
+                evicted = self.client.execute(
+                    "DELETE FROM cache WHERE key IN "
+                    "(SELECT key FROM cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+                self.evictions += max(evicted, 0)
+        return True
+
+    def delete(self, key: str) -> int:
+        """Delete value from cache.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            int: Number of deleted entries.
+        """
+        with self._lock, self.client:
+            return self.client.execute("DELETE FROM cache WHERE key = ?", (key,)).rowcount
+
+    def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        """Acquire a lock shared by processes using the database.
+
+        Args:
+            key (str): Lock key.
+            token (str): Unique token of the lock owner.
+            ttl (float): Time-to-live of the lock in seconds.
+
+        Returns:
+            bool: Whether the lock was acquired.
+        """
+        now = time.time()
+        with self._lock, self.client:
+            self.client.execute("DELETE FROM cache_locks WHERE key = ? AND expires_at <= ?", (key, now))
+            return bool(
+                self.client.execute(
+                    "INSERT OR IGNORE INTO cache_locks (key, token, expires_at) VALUES (?, ?, ?)",
+                    (key, token, now + ttl),
+                ).rowcount
+            )
+
+    def release_lock(self, key: str, token: str) -> None:
+        """Release the lock if it is still owned by the token.
+
+        Args:
+            key (str): Lock key.
+            token (str): Unique token of the lock owner.
+        """
+        with self._lock, self.client:
+            self.client.execute("DELETE FROM cache_locks WHERE key = ? AND token = ?", (key, token))
@@ -0,0 +1,145 @@
+import threading
+from typing import Any
+
+from fiboaitech.cache.backends import BaseCache
+from fiboaitech.cache.backends.memory import InMemoryCache
+from fiboaitech.cache.backends.redis import RedisCache
+from fiboaitech.cache.backends.sqlite import SQLiteCache
+from fiboaitech.cache.config import CacheBackend, TieredCacheConfig
+
+
+class TieredCache(BaseCache):
+    """Cache backend with an in-memory tier in front of a shared or persistent one.
+
+    Lookups check the local tier first and copy values found in the remote tier to it, so hot keys skip the
+    remote round-trip. Writes and deletes go to both tiers, locks to the remote one. Local entries expire no later
+    than their time-to-live in the remote tier, copies of remote entries live at most the default time-to-live.
+
+    Attributes:
+        local (InMemoryCache): Local tier.
+        remote (BaseCache): Remote tier.
+        local_ttl (int | None): Time-to-live of local entries.
+        ttl (int | None): Default time-to-live of entries, bounds copies of remote entries in the local tier.
+        local_hits (int): Number of lookups answered by the local tier.
+        remote_hits (int): Number of lookups answered by the remote tier.
+    """
+
+    REMOTE_BACKENDS_BY_TYPE: dict[CacheBackend, type[BaseCache]] = {
+        CacheBackend.Redis: RedisCache,
+        CacheBackend.SQLite: SQLiteCache,
+    }
+
+    def __init__(
+        self, local: InMemoryCache, remote: BaseCache, local_ttl: int | None = None, ttl: int | None = None
+    ):
+        """Initialize TieredCache.
+
+        Args:
+            local (InMemoryCache): Local tier.
+            remote (BaseCache): Remote tier.
+            local_ttl (int | None): Time-to-live of local entries.
+            ttl (int | None): Default time-to-live of entries.
+        """
+        super().__init__(client=remote.client)
+        self.local = local
+        self.remote = remote
+        self.local_ttl = local_ttl
+        self.ttl = ttl
+        self.local_hits = 0
+        self.remote_hits = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: TieredCacheConfig):
+        """Create TieredCache instance from configuration.
+
+        Args:
+            config (TieredCacheConfig): Tiered cache configuration.
+
+        Returns:
+            TieredCache: Tiered cache instance.
+        """
+        return cls(
+            local=InMemoryCache.from_config(config.local),
+            remote=cls.REMOTE_BACKENDS_BY_TYPE[config.remote.backend].from_config(config.remote),
+            local_ttl=config.local_ttl,
+            ttl=config.ttl,
+        )
+
+    @property
+    def evictions(self) -> int:
+        """Number of entries evicted from both tiers."""
+        return self.local.evictions + getattr(self.remote, "evictions", 0)
+
+    def _get_local_ttl(self, ttl: int | None) -> int | None:
+        return min((value for value in (ttl, self.local_ttl) if value is not None), default=None)
+
+    def get(self, key: str) -> Any:
+        """Retrieve value from the local tier, or from the remote tier and cache it locally.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any: Cached value.
+        """
+        if (value := self.local.get(key)) is not None:
+            with self._lock:
+                self.local_hits += 1
+            return value
+
+        if (value := self.remote.get(key)) is not None:
+            with self._lock:
+                self.remote_hits += 1
+            # Remaining time-to-live of the remote entry is unknown, it is at most the default one
+            self.local.set(key, value, ttl=self._get_local_ttl(self.ttl))
+        return value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> Any:
+        """Set value in both tiers.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Value to cache.
+            ttl (int | None): Time-to-live for cache entry.
+
+        Returns:
+            Any: Result of the remote cache set operation.
+        """
+        res = self.remote.set(key, value, ttl=ttl)
+        self.local.set(key, value, ttl=self._get_local_ttl(ttl))
+        return res
+
+    def delete(self, key: str) -> Any:
+        """Delete value from both tiers.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any: Result of the remote cache delete operation.
+        """
+        self.local.delete(key)
+        return self.remote.delete(key)
+
+    def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        """Acquire the lock of the remote tier.
+
+        Args:
+            key (str): Lock key.
+            token (str): Unique token of the lock owner.
+            ttl (float): Time-to-live of the lock in seconds.
+
+        Returns:
+            bool: Whether the lock was acquired.
+        """
+        return self.remote.acquire_lock(key, token, ttl)
+
+    def release_lock(self, key: str, token: str) -> None:
+        """Release the lock of the remote tier.
+
+        Args:
+            key (str): Lock key.
+            token (str): Unique token of the lock owner.
+        """
+        self.remote.release_lock(key, token)
@@ -1,4 +1,23 @@
 import base64
+import threading
+import zlib
+from functools import partial
+from typing import Callable
+
+from fiboaitech.cache.config import CacheCompression
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    from lz4 import frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+# Fastest zlib level, higher levels are several times slower for a few percent smaller payloads
+ZLIB_COMPRESSION_LEVEL = 1
 
 
 class BaseCodec:
@@ -51,3 +70,112 @@ class Base64Codec(BaseCodec):
             str: The decoded string.
         """
         return base64.b64decode(value).decode()
+
+
+class BinaryCodec(BaseCodec):
+    """Raw bytes encoding with optional compression.
+
+    Encoded values start with a header of the magic bytes, the format version and the compression, so the
+    compression can change without invalidating cached entries. Values without the header are decoded as Base64,
+    which keeps entries written by `Base64Codec` readable. Compressor objects, e.g. zstd ones, are not thread-safe,
+    so each thread creates its own on first use and reuses them for later values.
+
+    Attributes:
+        compression (CacheCompression): Compression of encoded values.
+        min_compress_size (int): Size in bytes below which values are stored uncompressed.
+    """
+
+    MAGIC = b"\x00FC"
+    VERSION = 1
+    COMPRESSION_IDS = {
+        CacheCompression.NONE: 0,
+        CacheCompression.ZLIB: 1,
+        CacheCompression.ZSTD: 2,
+        CacheCompression.LZ4: 3,
+    }
+
+    def __init__(self, compression: CacheCompression = CacheCompression.NONE, min_compress_size: int = 512):
+        """Initialize BinaryCodec.
+
+        Args:
+            compression (CacheCompression): Compression of encoded values.
+            min_compress_size (int): Size in bytes below which values are stored uncompressed.
+
+        Raises:
+            ImportError: If the package of the compression is not installed.
+        """
+        self.compression = CacheCompression(compression)
+        self.min_compress_size = min_compress_size
+        # Fails early if the package of the compression is not installed
+        self._get_compressor(self.compression)
+        self._compression_by_id = {value: key for key, value in self.COMPRESSION_IDS.items()}
+        self._legacy_codec = Base64Codec()
+        self._local = threading.local()
+
+    @staticmethod
+    def _get_compressor(compression: CacheCompression) -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+        """Returns compress and decompress functions of the compression."""
+        match compression:
+            case CacheCompression.NONE:
+                return bytes, bytes
+            case CacheCompression.ZLIB:
+                return partial(zlib.compress, level=ZLIB_COMPRESSION_LEVEL), zlib.decompress
+            case CacheCompression.ZSTD:
+                if zstandard is None:
+                    raise ImportError("zstd compression requires the 'zstandard' package.")
+                return zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress
+            case CacheCompression.LZ4:
+                if lz4_frame is None:
+                    raise ImportError("lz4 compression requires the 'lz4' package.")
+                return lz4_frame.compress, lz4_frame.decompress
+
+    def _get_thread_compressor(
+        self, compression: CacheCompression
+    ) -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+        """Returns compress and decompress functions of the compression owned by the current thread."""
+        if (compressors := getattr(self._local, "compressors", None)) is None:
+            compressors = self._local.compressors = {}
+        if (functions := compressors.get(compression)) is None:
+            functions = compressors[compression] = self._get_compressor(compression)
+        return functions
+
+    def encode(self, value: str) -> bytes:
+        """Encode a string as bytes, compressed if it is large enough.
+
+        Args:
+            value (str): The string to encode.
+
+        Returns:
+            bytes: The header followed by the encoded string.
+        """
+        data = value.encode()
+        compression = CacheCompression.NONE
+        if self.compression != CacheCompression.NONE and len(data) >= self.min_compress_size:
+            compress, _ = self._get_thread_compressor(self.compression)
+            data = compress(data)
+            compression = self.compression
+
+        return self.MAGIC + bytes((self.VERSION, self.COMPRESSION_IDS[compression])) + data
+
+    def decode(self, value: str | bytes) -> str:
+        """Decode bytes written by this codec, or a Base64 value written by `Base64Codec`.
+
+        Args:
+            value (str | bytes): The value to decode.
+
+        Returns:
+            str: The decoded string.
+
+        Raises:
+            ValueError: If the value has an unsupported format version or compression.
+        """
+        if isinstance(value, str) or not value.startswith(self.MAGIC):
+            return self._legacy_codec.decode(value)
+
+        header_size = len(self.MAGIC) + 2
+        version, compression_id = value[len(self.MAGIC):header_size]
+        if version > self.VERSION or compression_id not in self._compression_by_id:
+            raise ValueError(f"Unsupported cache value format: version {version}, compression {compression_id}.")
+
+        _, decompress = self._get_thread_compressor(self._compression_by_id[compression_id])
+        return decompress(value[header_size:]).decode()
@@ -1,6 +1,6 @@
 import enum
 from typing import Literal
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from fiboaitech.connections import RedisConnection
 
@@ -8,6 +8,40 @@ from fiboaitech.connections import RedisConnection
 class CacheBackend(str, enum.Enum):
     """Enumeration for cache backends."""
     Redis = "Redis"
+    InMemory = "InMemory"
+    SQLite = "SQLite"
+    Tiered = "Tiered"
+
+
+class CacheEvictionPolicy(str, enum.Enum):
+    """Enumeration for eviction policies of the in-memory cache.
+
+    Attributes:
+        LRU: Evicts the least recently used entry.
+        TINY_LFU: Evicts the least recently used entry, but admits a new entry only if it is used more often than
+            the entry it would evict, so one-off keys don't flush frequently used ones.
+    """
+    LRU = "lru"
+    TINY_LFU = "tiny_lfu"
+
+
+class CacheCodecType(str, enum.Enum):
+    """Enumeration for encodings of cached values.
+
+    Attributes:
+        BASE64: Base64 encoded text.
+        BINARY: Raw bytes with a versioned header and optional compression. Reads Base64 entries as well.
+    """
+    BASE64 = "base64"
+    BINARY = "binary"
+
+
+class CacheCompression(str, enum.Enum):
+    """Enumeration for compressions of binary encoded values. zstd and lz4 need the `zstandard` and `lz4` packages."""
+    NONE = "none"
+    ZLIB = "zlib"
+    ZSTD = "zstd"
+    LZ4 = "lz4"
 
 
 class CacheConfig(BaseModel):
@@ -17,10 +51,24 @@ class CacheConfig(BaseModel):
         backend (CacheBackend): The cache backend to use.
         namespace (str | None): Optional namespace for cache keys.
         ttl (int | None): Optional time-to-live for cache entries.
+        single_flight (bool): Whether concurrent misses of the same key are computed once, with other callers
+            waiting for the result. Defaults to True.
+        lock_timeout (float): Time-to-live in seconds of the lock that holds off other processes while the value
+            is computed, it also bounds how long they wait. Defaults to 60.
+        lock_poll_interval (float): Interval in seconds between cache checks while another process computes
+            the value. Defaults to 0.05.
+        codec (CacheCodecType): Encoding of cached values. Defaults to binary.
+        compression (CacheCompression): Compression of binary encoded values. Compression trades encoding time
+            for payload size, so it pays off for large values in a remote cache. Defaults to none.
     """
     backend: CacheBackend
     namespace: str | None = None
     ttl: int | None = None
+    single_flight: bool = True
+    lock_timeout: float = 60
+    lock_poll_interval: float = 0.05
+    codec: CacheCodecType = CacheCodecType.BINARY
+    compression: CacheCompression = CacheCompression.NONE
 
     def to_dict(self, **kwargs) -> dict:
         """Convert config to dictionary.
@@ -41,3 +89,49 @@ class RedisCacheConfig(CacheConfig, RedisConnection):
         backend (Literal[CacheBackend.Redis]): The Redis cache backend.
     """
     backend: Literal[CacheBackend.Redis] = CacheBackend.Redis
+
+
+class InMemoryCacheConfig(CacheConfig):
+    """Configuration for the in-process cache.
+
+    Attributes:
+        backend (Literal[CacheBackend.InMemory]): The in-memory cache backend.
+        max_entries (int): Maximum number of cached entries.
+        max_size_bytes (int | None): Maximum total size of cached values in bytes.
+        eviction_policy (CacheEvictionPolicy): Policy choosing entries to evict when the cache is full.
+    """
+    backend: Literal[CacheBackend.InMemory] = CacheBackend.InMemory
+    max_entries: int = Field(default=1024, gt=0)
+    max_size_bytes: int | None = Field(default=None, gt=0)
+    eviction_policy: CacheEvictionPolicy = CacheEvictionPolicy.LRU
+
+
+class SQLiteCacheConfig(CacheConfig):
+    """Configuration for the SQLite cache persisted in a local file.
+
+    Attributes:
+        backend (Literal[CacheBackend.SQLite]): The SQLite cache backend.
+        path (str): Path of the database file.
+        max_entries (int | None): Maximum number of cached entries, the least recently used ones are evicted.
+    """
+    backend: Literal[CacheBackend.SQLite] = CacheBackend.SQLite
+    path: str = "fiboaitech_cache.db"
+    max_entries: int | None = Field(default=None, gt=0)
+
+
+class TieredCacheConfig(CacheConfig):
+    """Configuration for the in-memory cache in front of a shared or persistent cache.
+
+    Lookups check the local tier first, values found in the remote tier are copied to the local one.
+
+    Attributes:
+        backend (Literal[CacheBackend.Tiered]): The tiered cache backend.
+        local (InMemoryCacheConfig): Configuration of the local tier.
+        remote (RedisCacheConfig | SQLiteCacheConfig): Configuration of the remote tier.
+        local_ttl (int | None): Time-to-live of local entries, bounds how long updates of the remote tier by
+            other processes stay unnoticed.
+    """
+    backend: Literal[CacheBackend.Tiered] = CacheBackend.Tiered
+    local: InMemoryCacheConfig = Field(default_factory=InMemoryCacheConfig)
+    remote: RedisCacheConfig | SQLiteCacheConfig
+    local_ttl: int | None = Field(default=None, gt=0)
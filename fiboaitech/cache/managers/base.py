@@ -1,14 +1,61 @@
-from typing import Any, Callable
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
 
-from fiboaitech.cache.backends import BaseCache, RedisCache
-from fiboaitech.cache.codecs import Base64Codec
-from fiboaitech.cache.config import CacheBackend, CacheConfig
+from pydantic import BaseModel
+
+from fiboaitech.cache.backends import BaseCache, InMemoryCache, RedisCache, SQLiteCache, TieredCache
+from fiboaitech.cache.codecs import Base64Codec, BaseCodec, BinaryCodec
+from fiboaitech.cache.config import CacheBackend, CacheCodecType, CacheConfig
 from fiboaitech.components.serializers import JsonSerializer
 
 
+class CacheMetrics(BaseModel):
+    """Snapshot of the cache manager counters.
+
+    Attributes:
+        hits (int): Number of lookups that found a value, including values received from concurrent computations.
+            A `get_or_set` call is counted once, as a hit or a miss, however many cache reads it takes.
+        misses (int): Number of lookups that found no value.
+        waits (int): Number of times a caller waited for the value computed by another caller.
+        sets (int): Number of stored values.
+        lookup_seconds (float): Total time spent in cache reads of the lookups.
+        wait_seconds (float): Total time spent waiting for values computed by other callers.
+        set_seconds (float): Total time spent storing values.
+        evictions (int): Number of entries the cache backend evicted to make room for new ones.
+    """
+    hits: int = 0
+    misses: int = 0
+    waits: int = 0
+    sets: int = 0
+    lookup_seconds: float = 0
+    wait_seconds: float = 0
+    set_seconds: float = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that found a value."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+    @property
+    def avg_lookup_seconds(self) -> float:
+        """Average latency of the cache lookup."""
+        lookups = self.hits + self.misses
+        return self.lookup_seconds / lookups if lookups else 0
+
+
 class CacheManager:
     """Manager for handling cache operations.
 
+    With `single_flight` enabled, `get_or_set` computes a missing value once for concurrent callers of the same
+    key: callers in the process wait for the in-flight computation, other processes wait on a lock in the cache
+    backend and poll for the value.
+
     Attributes:
         CACHE_BACKENDS_BY_TYPE (dict[CacheBackend, BaseCache]): Mapping of backends.
         cache_backend (BaseCache): Selected cache backend.
@@ -17,9 +64,15 @@ class CacheManager:
         codec (Any): Codec instance.
         namespace (str | None): Cache namespace.
         ttl (int | None): Time-to-live for cache entries.
+        single_flight (bool): Whether concurrent misses of the same key are computed once.
+        lock_timeout (float): Time-to-live of the cross-process lock in seconds.
+        lock_poll_interval (float): Interval between cache checks while another process computes the value.
     """
     CACHE_BACKENDS_BY_TYPE: dict[CacheBackend, BaseCache] = {
         CacheBackend.Redis: RedisCache,
+        CacheBackend.InMemory: InMemoryCache,
+        CacheBackend.SQLite: SQLiteCache,
+        CacheBackend.Tiered: TieredCache,
     }
 
     def __init__(
@@ -38,9 +91,42 @@ class CacheManager:
         self.cache_backend = self.CACHE_BACKENDS_BY_TYPE.get(config.backend)
         self.cache = self.cache_backend.from_config(config)
         self.serializer = serializer or JsonSerializer()
-        self.codec = codec or Base64Codec()
+        self.codec = codec or self.init_codec(config)
         self.namespace = config.namespace
         self.ttl = config.ttl
+        self.single_flight = config.single_flight
+        self.lock_timeout = config.lock_timeout
+        self.lock_poll_interval = config.lock_poll_interval
+
+        self._metrics = CacheMetrics()
+        self._flights: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def init_codec(config: CacheConfig) -> BaseCodec:
+        """Create the codec of cached values from configuration.
+
+        Args:
+            config (CacheConfig): Cache configuration.
+
+        Returns:
+            BaseCodec: Codec instance.
+        """
+        if config.codec == CacheCodecType.BASE64:
+            return Base64Codec()
+        return BinaryCodec(compression=config.compression)
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return self._metrics.model_copy(update={"evictions": self.cache.evictions})
+
+    def _record(self, **increments: float) -> None:
+        """Increments metrics counters."""
+        with self._lock:
+            for name, increment in increments.items():
+                setattr(self._metrics, name, getattr(self._metrics, name) + increment)
 
     def get(
         self,
@@ -60,14 +146,10 @@ class CacheManager:
         Returns:
             Any: Cached value.
         """
-        loads = loads_func or self.serializer.loads
-        decode = decode_func or self.codec.decode
         ns_key = self._get_key(key, namespace=self._get_namespace(namespace))
-
-        if (res := self.cache.get(ns_key)) is not None:
-            res = loads(decode(self.cache.get(key=ns_key)))
-
-        return res
+        if (payload := self._get_payload(ns_key)) is not None:
+            return self._load(payload, loads_func=loads_func, decode_func=decode_func)
+        return None
 
     def set(
         self,
@@ -96,10 +178,268 @@ class CacheManager:
         ns_key = self._get_key(key, namespace=self._get_namespace(namespace))
         ttl = ttl or self.ttl
 
+        time_start = time.perf_counter()
         res = self.cache.set(key=ns_key, value=encode(dumps(value)), ttl=ttl)
+        self._record(sets=1, set_seconds=time.perf_counter() - time_start)
 
         return res
 
+    def get_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        namespace: str | None = None,
+        max_wait_seconds: float | None = None,
+    ) -> tuple[Any, bool]:
+        """Retrieve value from cache, or compute and cache it.
+
+        Each call is counted as one hit or one miss, however many cache reads it takes.
+
+        Args:
+            key (str): Cache key.
+            compute (Callable[[], Any]): Function that computes the value on a miss.
+            namespace (str | None): Cache namespace.
+            max_wait_seconds (float | None): Limit of waiting for another process computing the value, e.g. the
+                time left before the run deadline. The wait is limited by `lock_timeout` as well.
+
+        Returns:
+            tuple[Any, bool]: Value and whether it was not computed by this call.
+        """
+        ns_key = self._get_key(key, namespace=self._get_namespace(namespace))
+        lookup_seconds = 0
+        while True:
+            payload, seconds = self._read_payload(ns_key)
+            lookup_seconds += seconds
+            if payload is not None:
+                self._record(hits=1, lookup_seconds=lookup_seconds)
+                return self._load(payload), True
+            if not self.single_flight:
+                self._record(misses=1, lookup_seconds=lookup_seconds)
+                return self._compute_and_set(key, compute, namespace=namespace), False
+
+            flight, is_leader = self._join_flight(ns_key)
+            if not is_leader:
+                time_start = time.perf_counter()
+                payload = flight.result()
+                self._record(waits=1, wait_seconds=time.perf_counter() - time_start)
+                if payload is not None:
+                    self._record(hits=1, lookup_seconds=lookup_seconds)
+                    return self._load(payload), True
+                # Computation failed, retry as a new leader
+                continue
+
+            payload = None
+            try:
+                token, payload, seconds = self._acquire_lock_or_wait(ns_key, max_wait_seconds)
+                lookup_seconds += seconds
+                try:
+                    if token is not None:
+                        # The value may have been cached between the miss and the lock
+                        payload, seconds = self._read_payload(ns_key)
+                        lookup_seconds += seconds
+                    if payload is not None:
+                        self._record(hits=1, lookup_seconds=lookup_seconds)
+                        return self._load(payload), True
+
+                    self._record(misses=1, lookup_seconds=lookup_seconds)
+                    value = compute()
+                    payload = self._set_payload(ns_key, value)
+                finally:
+                    if token is not None:
+                        self.cache.release_lock(self._get_lock_key(ns_key), token)
+                return value, False
+            finally:
+                self._finish_flight(ns_key, flight, payload)
+
+    async def aget_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        namespace: str | None = None,
+        max_wait_seconds: float | None = None,
+    ) -> tuple[Any, bool]:
+        """Asynchronously retrieve value from cache, or compute and cache it. Cache calls run in a worker thread.
+
+        Args:
+            key (str): Cache key.
+            compute (Callable[[], Awaitable[Any]]): Coroutine function that computes the value on a miss.
+            namespace (str | None): Cache namespace.
+            max_wait_seconds (float | None): Limit of waiting for another process computing the value.
+
+        Returns:
+            tuple[Any, bool]: Value and whether it was not computed by this call.
+        """
+        ns_key = self._get_key(key, namespace=self._get_namespace(namespace))
+        lookup_seconds = 0
+        while True:
+            payload, seconds = await asyncio.to_thread(self._read_payload, ns_key)
+            lookup_seconds += seconds
+            if payload is not None:
+                self._record(hits=1, lookup_seconds=lookup_seconds)
+                return self._load(payload), True
+            if not self.single_flight:
+                self._record(misses=1, lookup_seconds=lookup_seconds)
+                value = await compute()
+                await asyncio.to_thread(self.set, key, value, namespace=namespace)
+                return value, False
+
+            flight, is_leader = self._join_flight(ns_key)
+            if not is_leader:
+                time_start = time.perf_counter()
+                payload = await asyncio.wrap_future(flight)
+                self._record(waits=1, wait_seconds=time.perf_counter() - time_start)
+                if payload is not None:
+                    self._record(hits=1, lookup_seconds=lookup_seconds)
+                    return self._load(payload), True
+                continue
+
+            payload = None
+            try:
+                token, payload, seconds = await self._aacquire_lock_or_wait(ns_key, max_wait_seconds)
+                lookup_seconds += seconds
+                try:
+                    if token is not None:
+                        payload, seconds = await asyncio.to_thread(self._read_payload, ns_key)
+                        lookup_seconds += seconds
+                    if payload is not None:
+                        self._record(hits=1, lookup_seconds=lookup_seconds)
+                        return self._load(payload), True
+
+                    self._record(misses=1, lookup_seconds=lookup_seconds)
+                    value = await compute()
+                    payload = await asyncio.to_thread(self._set_payload, ns_key, value)
+                finally:
+                    if token is not None:
+                        await asyncio.to_thread(self.cache.release_lock, self._get_lock_key(ns_key), token)
+                return value, False
+            finally:
+                self._finish_flight(ns_key, flight, payload)
+
+    def _compute_and_set(self, key: str, compute: Callable[[], Any], namespace: str | None = None) -> Any:
+        """Computes the value and caches it."""
+        value = compute()
+        self.set(key, value, namespace=namespace)
+        return value
+
+    def _read_payload(self, ns_key: str) -> tuple[Any, float]:
+        """Reads the encoded value with a single cache call. Returns it with the duration of the call."""
+        time_start = time.perf_counter()
+        payload = self.cache.get(ns_key)
+        return payload, time.perf_counter() - time_start
+
+    def _get_payload(self, ns_key: str) -> Any:
+        """Reads the encoded value with a single cache call, counting the lookup as a hit or a miss."""
+        payload, seconds = self._read_payload(ns_key)
+        if payload is None:
+            self._record(misses=1, lookup_seconds=seconds)
+        else:
+            self._record(hits=1, lookup_seconds=seconds)
+        return payload
+
+    def _set_payload(self, ns_key: str, value: Any) -> Any:
+        """Stores the value and returns its encoded payload."""
+        payload = self.codec.encode(self.serializer.dumps(value))
+        time_start = time.perf_counter()
+        self.cache.set(key=ns_key, value=payload, ttl=self.ttl)
+        self._record(sets=1, set_seconds=time.perf_counter() - time_start)
+        return payload
+
+    def _load(
+        self,
+        payload: Any,
+        loads_func: Callable[[Any], Any] | None = None,
+        decode_func: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """Decodes and deserializes the payload."""
+        loads = loads_func or self.serializer.loads
+        decode = decode_func or self.codec.decode
+        return loads(decode(payload))
+
+    def _join_flight(self, ns_key: str) -> tuple[Future, bool]:
+        """Returns the in-flight computation of the key and whether the caller has to run it."""
+        with self._lock:
+            if (flight := self._flights.get(ns_key)) is not None:
+                return flight, False
+            flight = self._flights[ns_key] = Future()
+            return flight, True
+
+    def _finish_flight(self, ns_key: str, flight: Future, payload: Any) -> None:
+        """Publishes the encoded value to waiting callers. None makes them retry."""
+        with self._lock:
+            self._flights.pop(ns_key, None)
+        flight.set_result(payload)
+
+    @staticmethod
+    def _get_lock_key(ns_key: str) -> str:
+        """Construct the key of the cross-process lock."""
+        return f"{ns_key}:lock"
+
+    def _get_max_wait_seconds(self, max_wait_seconds: float | None) -> float:
+        """Returns the limit of waiting for the lock, at most `lock_timeout`."""
+        if max_wait_seconds is None:
+            return self.lock_timeout
+        return max(min(self.lock_timeout, max_wait_seconds), 0)
+
+    def _acquire_lock_or_wait(
+        self, ns_key: str, max_wait_seconds: float | None = None
+    ) -> tuple[str | None, Any, float]:
+        """
+        Acquires the cross-process lock of the key, waiting while another process computes the value.
+
+        Args:
+            ns_key (str): Namespaced cache key.
+            max_wait_seconds (float | None): Limit of the wait, in addition to `lock_timeout`.
+
+        Returns:
+            tuple[str | None, Any, float]: Lock token, or None if waiting timed out, the payload if another process
+                cached it meanwhile, and the time spent in cache reads.
+        """
+        lock_key = self._get_lock_key(ns_key)
+        token = uuid4().hex
+        if self.cache.acquire_lock(lock_key, token, self.lock_timeout):
+            return token, None, 0
+
+        max_wait_seconds = self._get_max_wait_seconds(max_wait_seconds)
+        lookup_seconds = 0
+        time_start = time.perf_counter()
+        try:
+            while (remaining := max_wait_seconds - (time.perf_counter() - time_start)) > 0:
+                time.sleep(min(self.lock_poll_interval, remaining))
+                payload, seconds = self._read_payload(ns_key)
+                lookup_seconds += seconds
+                if payload is not None:
+                    return None, payload, lookup_seconds
+                if self.cache.acquire_lock(lock_key, token, self.lock_timeout):
+                    return token, None, lookup_seconds
+        finally:
+            self._record(waits=1, wait_seconds=time.perf_counter() - time_start)
+        return None, None, lookup_seconds
+
+    async def _aacquire_lock_or_wait(
+        self, ns_key: str, max_wait_seconds: float | None = None
+    ) -> tuple[str | None, Any, float]:
+        """Asynchronous version of `_acquire_lock_or_wait`."""
+        lock_key = self._get_lock_key(ns_key)
+        token = uuid4().hex
+        if await asyncio.to_thread(self.cache.acquire_lock, lock_key, token, self.lock_timeout):
+            return token, None, 0
+
+        max_wait_seconds = self._get_max_wait_seconds(max_wait_seconds)
+        lookup_seconds = 0
+        time_start = time.perf_counter()
+        try:
+            while (remaining := max_wait_seconds - (time.perf_counter() - time_start)) > 0:
+                await asyncio.sleep(min(self.lock_poll_interval, remaining))
+                payload, seconds = await asyncio.to_thread(self._read_payload, ns_key)
+                lookup_seconds += seconds
+                if payload is not None:
+                    return None, payload, lookup_seconds
+                if await asyncio.to_thread(self.cache.acquire_lock, lock_key, token, self.lock_timeout):
+                    return token, None, lookup_seconds
+        finally:
+            self._record(waits=1, wait_seconds=time.perf_counter() - time_start)
+        return None, None, lookup_seconds
+
     def delete(
         self,
         key: str,
@@ -1,5 +1,5 @@
 import hashlib
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from fiboaitech.cache.config import CacheConfig
 from fiboaitech.cache.managers import CacheManager
@@ -59,6 +59,52 @@ class WorkflowCacheManager(CacheManager):
         key = self.get_key(entity_id=entity_id, input_data=input_data, **kwargs)
         return super().set(key=key, value=output_data)
 
+    def get_or_set_entity_output(
+        self,
+        entity_id: str,
+        input_data: dict,
+        compute: Callable[[], Any],
+        max_wait_seconds: float | None = None,
+        **kwargs,
+    ) -> tuple[Any, bool]:
+        """Retrieve cached entity output, or compute and cache it once for concurrent callers.
+
+        Args:
+            entity_id (str): Entity identifier.
+            input_data (dict): Input data for the entity.
+            compute (Callable[[], Any]): Function that computes the output on a miss.
+            max_wait_seconds (float | None): Limit of waiting for another process computing the output.
+            kwargs (Any): Additional keyword arguments.
+
+        Returns:
+            tuple[Any, bool]: Output data and whether it was not computed by this call.
+        """
+        key = self.get_key(entity_id=entity_id, input_data=input_data, **kwargs)
+        return super().get_or_set(key=key, compute=compute, max_wait_seconds=max_wait_seconds)
+
+    async def aget_or_set_entity_output(
+        self,
+        entity_id: str,
+        input_data: dict,
+        compute: Callable[[], Awaitable[Any]],
+        max_wait_seconds: float | None = None,
+        **kwargs,
+    ) -> tuple[Any, bool]:
+        """Asynchronously retrieve cached entity output, or compute and cache it once for concurrent callers.
+
+        Args:
+            entity_id (str): Entity identifier.
+            input_data (dict): Input data for the entity.
+            compute (Callable[[], Awaitable[Any]]): Coroutine function that computes the output on a miss.
+            max_wait_seconds (float | None): Limit of waiting for another process computing the output.
+            kwargs (Any): Additional keyword arguments.
+
+        Returns:
+            tuple[Any, bool]: Output data and whether it was not computed by this call.
+        """
+        key = self.get_key(entity_id=entity_id, input_data=input_data, **kwargs)
+        return await super().aget_or_set(key=key, compute=compute, max_wait_seconds=max_wait_seconds)
+
     def delete_entity_output(self, entity_id: str, input_data: dict, **kwargs) -> Any:
         """Delete cached entity output.
 
@@ -0,0 +1,307 @@
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from fiboaitech.components.embedders.base import BaseEmbedder
+from fiboaitech.types import Document
+from fiboaitech.utils.logger import logger
+
+# Completion params that change what the model answers, so they split the cache scope
+SEMANTIC_CACHE_SCOPE_PARAMS = ("tools", "tool_choice", "response_format", "stop")
+SEMANTIC_CACHE_SCOPE_FIELD = "semantic_cache_scope"
+SEMANTIC_CACHE_EXPIRES_AT_FIELD = "semantic_cache_expires_at"
+
+
+class SemanticCacheMatch(NamedTuple):
+    value: dict
+    similarity: float
+
+
+class SemanticCacheLookup(NamedTuple):
+    scope: str
+    embedding: list[float]
+    match: SemanticCacheMatch | None
+
+    @property
+    def hit(self) -> bool:
+        return self.match is not None
+
+
+def _normalize(embedding: list[float]) -> np.ndarray:
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def _get_expires_at(ttl: int | None) -> float | None:
+    return time.time() + ttl if ttl is not None else None
+
+
+def _is_expired(expires_at: float | None) -> bool:
+    return expires_at is not None and expires_at <= time.time()
+
+
+class BaseSemanticCacheIndex(ABC):
+    """Base class for indexes of cached completions searched by prompt embedding."""
+
+    @abstractmethod
+    def add(self, scope: str, embedding: list[float], value: dict, ttl: int | None = None) -> None:
+        """Add a completion to the index.
+
+        Args:
+            scope (str): Scope of the entry, only lookups of the same scope can match it.
+            embedding (list[float]): Embedding of the prompt.
+            value (dict): Completion output.
+            ttl (int | None): Time-to-live of the entry in seconds.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def search(self, scope: str, embedding: list[float]) -> SemanticCacheMatch | None:
+        """Find the most similar unexpired completion of the scope.
+
+        Args:
+            scope (str): Scope of the lookup.
+            embedding (list[float]): Embedding of the prompt.
+
+        Returns:
+            SemanticCacheMatch | None: Completion with its cosine similarity to the prompt, None if the scope is empty.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete all entries."""
+        raise NotImplementedError
+
+
+class InMemorySemanticCacheIndex(BaseSemanticCacheIndex):
+    """In-process index searching all entries of the scope by exact cosine similarity.
+
+    Entries are evicted in least recently used order once the index holds `max_entries` of them.
+
+    Attributes:
+        max_entries (int): Maximum number of entries across all scopes.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, tuple[str, np.ndarray, dict, float | None]] = OrderedDict()
+        self._matrices: dict[str, tuple[list[int], np.ndarray]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, entry_id: int) -> None:
+        """Removes the entry and its scope matrix. Must be called under the lock."""
+        if (entry := self._entries.pop(entry_id, None)) is not None:
+            self._matrices.pop(entry[0], None)
+
+    def _get_matrix(self, scope: str) -> tuple[list[int], np.ndarray] | None:
+        """Returns the ids and stacked embeddings of the scope entries. Must be called under the lock."""
+        if scope not in self._matrices:
+            ids = [entry_id for entry_id, entry in self._entries.items() if entry[0] == scope]
+            if not ids:
+                return None
+            self._matrices[scope] = (ids, np.vstack([self._entries[entry_id][1] for entry_id in ids]))
+        return self._matrices[scope]
+
+    def add(self, scope: str, embedding: list[float], value: dict, ttl: int | None = None) -> None:
+        with self._lock:
+            while len(self._entries) >= self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+            self._entries[self._next_id] = (scope, _normalize(embedding), value, _get_expires_at(ttl))
+            self._matrices.pop(scope, None)
+            self._next_id += 1
+
+    def search(self, scope: str, embedding: list[float]) -> SemanticCacheMatch | None:
+        with self._lock:
+            if (matrix := self._get_matrix(scope)) is None:
+                return None
+
+            ids, embeddings = matrix
+            similarities = embeddings @ _normalize(embedding)
+            for position in np.argsort(-similarities):
+                entry_id = ids[position]
+                _, _, value, expires_at = self._entries[entry_id]
+                if _is_expired(expires_at):
+                    continue
+
+                self._entries.move_to_end(entry_id)
+                return SemanticCacheMatch(value=value, similarity=float(similarities[position]))
+
+            for entry_id in ids:
+                self._remove(entry_id)
+            return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._matrices.clear()
+
+
+class VectorStoreSemanticCacheIndex(BaseSemanticCacheIndex):
+    """Index keeping cached completions in a vector store, so they are shared between processes.
+
+    The store must support `write_documents` and `search_embeddings` with metadata filters and return the
+    embeddings of found documents, as the Chroma and Milvus stores do. Similarity is computed from the returned
+    embeddings, so it doesn't depend on the distance metric of the store.
+
+    Attributes:
+        vector_store (Any): Vector store keeping the entries.
+        top_k (int): Number of nearest documents checked for unexpired entries.
+    """
+
+    def __init__(self, vector_store: Any, top_k: int = 4):
+        self.vector_store = vector_store
+        self.top_k = top_k
+
+    def add(self, scope: str, embedding: list[float], value: dict, ttl: int | None = None) -> None:
+        document = Document(
+            content=json.dumps(value, default=str),
+            metadata={SEMANTIC_CACHE_SCOPE_FIELD: scope, SEMANTIC_CACHE_EXPIRES_AT_FIELD: _get_expires_at(ttl) or 0},
+            embedding=list(embedding),
+        )
+        self.vector_store.write_documents([document])
+
+    def search(self, scope: str, embedding: list[float]) -> SemanticCacheMatch | None:
+        filters = {
+            "operator": "AND",
+            "conditions": [{"field": SEMANTIC_CACHE_SCOPE_FIELD, "operator": "==", "value": scope}],
+        }
+        documents = self.vector_store.search_embeddings(query_embeddings=[embedding], top_k=self.top_k, filters=filters)
+        if documents and isinstance(documents[0], list):
+            documents = documents[0]
+
+        query = _normalize(embedding)
+        best_match = None
+        for document in documents:
+            metadata = document.metadata or {}
+            if document.embedding is None or _is_expired(metadata.get(SEMANTIC_CACHE_EXPIRES_AT_FIELD) or None):
+                continue
+
+            similarity = float(_normalize(document.embedding) @ query)
+            if best_match is None or similarity > best_match.similarity:
+                best_match = SemanticCacheMatch(value=json.loads(document.content), similarity=similarity)
+        return best_match
+
+    def clear(self) -> None:
+        self.vector_store.delete_documents(delete_all=True)
+
+
+class SemanticCache(BaseModel):
+    """Cache of LLM completions matched by the meaning of the prompt instead of its exact text.
+
+    The rendered prompt messages are embedded and the most similar cached prompt of the same scope is looked up.
+    Its completion is returned if the cosine similarity reaches the threshold. Scopes isolate namespaces, models
+    and the completion params that change the output format, e.g. tools and response format.
+
+    Attributes:
+        embedder (BaseEmbedder): Embedder of the rendered prompts.
+        index (BaseSemanticCacheIndex): Index of cached completions. Defaults to an in-process index.
+        similarity_threshold (float): Minimum cosine similarity of a cached prompt to reuse its completion.
+        namespace (str): Namespace of the entries, nodes with different namespaces don't share completions.
+        ttl (int | None): Time-to-live of the entries in seconds.
+    """
+
+    embedder: BaseEmbedder
+    index: BaseSemanticCacheIndex = Field(default_factory=InMemorySemanticCacheIndex)
+    similarity_threshold: float = Field(default=0.95, ge=-1, le=1)
+    namespace: str = "default"
+    ttl: int | None = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _hits: int = PrivateAttr(default=0)
+    _misses: int = PrivateAttr(default=0)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups that reused a cached completion."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that found no similar prompt."""
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that reused a cached completion."""
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def get_scope(self, params: dict[str, Any]) -> str:
+        """Build the scope of a completion request.
+
+        Args:
+            params (dict[str, Any]): Completion params.
+
+        Returns:
+            str: Scope of the namespace, model and output-affecting params.
+        """
+        scope_params = {key: params.get(key) for key in SEMANTIC_CACHE_SCOPE_PARAMS}
+        scope_hash = hashlib.sha256(json.dumps(scope_params, sort_keys=True, default=str).encode()).hexdigest()
+        return f"{self.namespace}:{params.get('model')}:{scope_hash[:16]}"
+
+    @staticmethod
+    def get_text(messages: list[dict]) -> str:
+        """Render prompt messages to the text that is embedded.
+
+        Args:
+            messages (list[dict]): Formatted prompt messages.
+
+        Returns:
+            str: Messages joined with their roles.
+        """
+        return "\n".join(
+            f"{message.get('role')}: "
+            f"{content if isinstance(content := message.get('content'), str) else json.dumps(content, default=str)}"
+            for message in messages
+        )
+
+    def lookup(self, params: dict[str, Any]) -> SemanticCacheLookup:
+        """Look up a completion for the request.
+
+        Args:
+            params (dict[str, Any]): Completion params with the formatted messages.
+
+        Returns:
+            SemanticCacheLookup: Scope and prompt embedding of the request, and the match if it is similar enough.
+        """
+        scope = self.get_scope(params)
+        embedding = self.embedder.embed_text(self.get_text(params["messages"]))["embedding"]
+        match = self.index.search(scope, embedding)
+        if match is not None and match.similarity < self.similarity_threshold:
+            match = None
+
+        with self._lock:
+            if match is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return SemanticCacheLookup(scope=scope, embedding=embedding, match=match)
+
+    def store(self, lookup: SemanticCacheLookup, value: dict) -> None:
+        """Cache the completion of a missed lookup.
+
+        Args:
+            lookup (SemanticCacheLookup): Lookup of the request.
+            value (dict): Completion output.
+        """
+        try:
+            self.index.add(lookup.scope, lookup.embedding, value, ttl=self.ttl)
+        except Exception as e:
+            logger.warning(f"Semantic cache: failed to store completion: {e}")
@@ -1,3 +1,5 @@
+import inspect
+import threading
 from functools import wraps
 from typing import Any, Callable
 
@@ -13,8 +15,40 @@ FUNC_KWARGS_TO_REMOVE = (
     "run_id",
     "parent_run_id",
     "wf_run_id",
+    "token_callback",
 )
 
+_cache_managers: dict[tuple, WorkflowCacheManager] = {}
+_cache_managers_lock = threading.Lock()
+
+
+def get_cache_manager(
+    cache_manager_cls: type[WorkflowCacheManager], config: CacheConfig
+) -> WorkflowCacheManager:
+    """Get the long-lived cache manager for the configuration.
+
+    Managers are shared by equal configurations, so backend connections, metrics and in-flight computations are
+    reused across runs.
+
+    Args:
+        cache_manager_cls (type[WorkflowCacheManager]): Cache manager class.
+        config (CacheConfig): Cache configuration.
+
+    Returns:
+        WorkflowCacheManager: Cache manager instance.
+    """
+    key = (cache_manager_cls, type(config), config.model_dump_json(exclude={"id"}))
+    with _cache_managers_lock:
+        if (cache_manager := _cache_managers.get(key)) is None:
+            cache_manager = _cache_managers[key] = cache_manager_cls(config=config)
+    return cache_manager
+
+
+def clear_cache_managers() -> None:
+    """Drop all pooled cache managers."""
+    with _cache_managers_lock:
+        _cache_managers.clear()
+
 
 def cache_wf_entity(
     entity_id: str,
@@ -35,6 +69,42 @@ def cache_wf_entity(
     Returns:
         Callable: Wrapped function with caching.
     """
+    def _get_cache_params(args: tuple, kwargs: dict) -> tuple[WorkflowCacheManager | None, Any, dict]:
+        """Get cache manager, input data and cache kwargs for the call.
+
+        Args:
+            args (tuple): Positional arguments.
+            kwargs (dict): Keyword arguments.
+
+        Returns:
+            tuple[WorkflowCacheManager | None, Any, dict]: Cache manager, input data and cleaned kwargs.
+        """
+        cache_manager = None
+        input_data = kwargs.pop("input_data", args[0] if args else {})
+        input_data = dict(input_data) if isinstance(input_data, BaseModel) else input_data
+
+        cleaned_kwargs = {k: v for k, v in kwargs.items() if k not in func_kwargs_to_remove}
+        if cache_enabled and cache_config:
+            logger.debug(f"Entity_id {entity_id}: cache used")
+            cache_manager = get_cache_manager(cache_manager_cls, cache_config)
+
+        return cache_manager, input_data, cleaned_kwargs
+
+    def _get_max_wait_seconds(args: tuple, kwargs: dict) -> float | None:
+        """Get the time left until the deadline of the run config passed to the call, if any.
+
+        Args:
+            args (tuple): Positional arguments.
+            kwargs (dict): Keyword arguments.
+
+        Returns:
+            float | None: Seconds left, or None if the run has no deadline.
+        """
+        config = kwargs.get("config", args[1] if len(args) > 1 else None)
+        if (get_remaining_seconds := getattr(config, "get_remaining_seconds", None)) is None:
+            return None
+        return get_remaining_seconds()
+
     def _cache(func: Callable) -> Callable:
         """Inner cache decorator.
 
@@ -55,30 +125,41 @@ def cache_wf_entity(
             Returns:
                 tuple[Any, bool]: Function output and cache status.
             """
-            cache_manager = None
-            from_cache = False
-            input_data = kwargs.pop("input_data", args[0] if args else {})
-            input_data = dict(input_data) if isinstance(input_data, BaseModel) else input_data
-
-            cleaned_kwargs = {k: v for k, v in kwargs.items() if k not in func_kwargs_to_remove}
-            if cache_enabled and cache_config:
-                logger.debug(f"Entity_id {entity_id}: cache used")
-                cache_manager = cache_manager_cls(config=cache_config)
-                if output := cache_manager.get_entity_output(
-                    entity_id=entity_id, input_data=input_data, **cleaned_kwargs
-                ):
-                    from_cache = True
-                    return output, from_cache
-
-            output = func(*args, **kwargs)
-
-            if cache_manager:
-                cache_manager.set_entity_output(
-                    entity_id=entity_id, input_data=input_data, output_data=output, **cleaned_kwargs
-                )
-
-            return output, from_cache
-
-        return wrapper
+            cache_manager, input_data, cleaned_kwargs = _get_cache_params(args, kwargs)
+            if not cache_manager:
+                return func(*args, **kwargs), False
+
+            return cache_manager.get_or_set_entity_output(
+                entity_id=entity_id,
+                input_data=input_data,
+                compute=lambda: func(*args, **kwargs),
+                max_wait_seconds=_get_max_wait_seconds(args, kwargs),
+                **cleaned_kwargs,
+            )
+
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> tuple[Any, bool]:
+            """Async wrapper function to handle caching. Cache backend calls run in a worker thread.
+
+            Args:
+                *args (Any): Positional arguments.
+                **kwargs (Any): Keyword arguments.
+
+            Returns:
+                tuple[Any, bool]: Function output and cache status.
+            """
+            cache_manager, input_data, cleaned_kwargs = _get_cache_params(args, kwargs)
+            if not cache_manager:
+                return await func(*args, **kwargs), False
+
+            return await cache_manager.aget_or_set_entity_output(
+                entity_id=entity_id,
+                input_data=input_data,
+                compute=lambda: func(*args, **kwargs),
+                max_wait_seconds=_get_max_wait_seconds(args, kwargs),
+                **cleaned_kwargs,
+            )
+
+        return async_wrapper if inspect.iscoroutinefunction(func) else wrapper
 
     return _cache
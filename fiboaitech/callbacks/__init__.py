@@ -1,3 +1,17 @@
 from .base import BaseCallbackHandler, NodeCallbackHandler
-from .streaming import AsyncStreamingIteratorCallbackHandler, StreamingQueueCallbackHandler
+from .dispatch import (
+    CallbackDispatcher,
+    CallbackDispatchMode,
+    CallbackMetrics,
+    CallbackOverflowPolicy,
+    dispatch_callback,
+    get_default_callback_dispatcher,
+    set_default_callback_dispatcher,
+)
+from .streaming import (
+    AsyncStreamingIteratorCallbackHandler,
+    StreamingFrameCallbackHandler,
+    StreamingQueueCallbackHandler,
+)
 from .tracing import TracingCallbackHandler
+from .profiling import ProfilingCallbackHandler
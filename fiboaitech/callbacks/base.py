@@ -1,10 +1,28 @@
 from abc import ABC
-from typing import Any
+from typing import Any, ClassVar
 from uuid import UUID
 
+from fiboaitech.callbacks.dispatch import CallbackDispatchMode
+
 
 class NodeCallbackHandler(ABC):
-    """Abstract class for node callback handlers."""
+    """Abstract class for node callback handlers.
+
+    The serialized node passed to node events is shared by all handlers and must not be mutated.
+
+    Attributes:
+        requires_serialized_node (bool): Whether node events get the full serialized node. Handlers that only use
+            the node id, name, type, group and streaming config can disable it to skip node serialization.
+        requires_stream_chunk (bool): Whether stream events get the full provider chunk. Handlers that only use the
+            delta text passed as the `delta` argument can disable it to skip chunk serialization on every token.
+        dispatch_mode (CallbackDispatchMode): Whether events are delivered on the thread of the run or queued to a
+            worker thread of the handler. Handlers that are slow and don't need to be ordered with the run, e.g.
+            remote loggers, can set it to ASYNC. Defaults to SYNC.
+    """
+
+    requires_serialized_node: ClassVar[bool] = True
+    requires_stream_chunk: ClassVar[bool] = True
+    dispatch_mode: ClassVar[CallbackDispatchMode] = CallbackDispatchMode.SYNC
 
     def on_node_start(self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any):
         """Called when the node starts.
@@ -80,8 +98,8 @@ class NodeCallbackHandler(ABC):
 
         Args:
             serialized (dict[str, Any]): Serialized node data.
-            chunk (dict[str, Any] | None): Stream chunk data.
-            **kwargs (Any): Additional arguments.
+            chunk (dict[str, Any] | None): Stream chunk data. None if no handler requires it.
+            **kwargs (Any): Additional arguments, with the delta text of LLM tokens as `delta`.
         """
         pass
 
@@ -174,6 +192,46 @@ class BaseCallbackHandler(NodeCallbackHandler, ABC):
         """
         pass
 
+    def on_batch_start(self, serialized: dict[str, Any], **kwargs: Any):
+        """Called when the batch of workflow or flow runs starts.
+
+        Args:
+            serialized (dict[str, Any]): Serialized workflow or flow data.
+            **kwargs (Any): Additional arguments, e.g. batch `run_id`, `total` and `max_concurrency`.
+        """
+        pass
+
+    def on_batch_item_end(self, serialized: dict[str, Any], index: int, result: Any, **kwargs: Any):
+        """Called when a run of the batch succeeds.
+
+        Args:
+            serialized (dict[str, Any]): Serialized workflow or flow data.
+            index (int): Index of the run input.
+            result (Any): Result of the run.
+            **kwargs (Any): Additional arguments, e.g. number of `completed` and `failed` runs.
+        """
+        pass
+
+    def on_batch_item_error(self, serialized: dict[str, Any], index: int, result: Any, **kwargs: Any):
+        """Called when a run of the batch fails.
+
+        Args:
+            serialized (dict[str, Any]): Serialized workflow or flow data.
+            index (int): Index of the run input.
+            result (Any): Failed result of the run.
+            **kwargs (Any): Additional arguments, e.g. number of `completed` and `failed` runs.
+        """
+        pass
+
+    def on_batch_end(self, serialized: dict[str, Any], **kwargs: Any):
+        """Called when the batch of workflow or flow runs ends.
+
+        Args:
+            serialized (dict[str, Any]): Serialized workflow or flow data.
+            **kwargs (Any): Additional arguments, e.g. number of `completed` and `failed` runs.
+        """
+        pass
+
 
 def get_entity_id(entity_name: str, kwargs: dict) -> UUID:
     """Retrieve entity ID from kwargs.
@@ -0,0 +1,378 @@
+import atexit
+import enum
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from pydantic import BaseModel
+
+from fiboaitech.utils.env import get_env_var
+from fiboaitech.utils.logger import logger
+
+if TYPE_CHECKING:
+    from fiboaitech.callbacks.base import NodeCallbackHandler
+
+CALLBACK_DISPATCHER_MAX_QUEUE_SIZE = int(get_env_var("FIBOAITECH_CALLBACK_DISPATCHER_MAX_QUEUE_SIZE", 1024))
+# Seconds a worker of an asynchronous handler waits for new events before it stops
+CALLBACK_DISPATCHER_IDLE_TIMEOUT = 5
+# Measuring adds two timer reads per handler to every dispatch
+CALLBACK_DISPATCHER_MEASURE_LATENCY = get_env_var("FIBOAITECH_CALLBACK_DISPATCHER_MEASURE_LATENCY", "0") in (
+    "1",
+    "true",
+)
+
+
+class CallbackDispatchMode(str, enum.Enum):
+    """Enumeration for the ways callback handlers receive events.
+
+    Attributes:
+        SYNC: Called on the thread of the node, flow or workflow before it continues. Needed by handlers whose
+            events must be ordered with the run itself, e.g. streaming.
+        ASYNC: Queued and called on a dedicated worker thread of the handler, in the order the events were
+            dispatched. Event arguments are passed by reference and must not be mutated by the handler.
+    """
+    SYNC = "sync"
+    ASYNC = "async"
+
+
+class CallbackOverflowPolicy(str, enum.Enum):
+    """Enumeration for policies applied to new events when the queue of an asynchronous handler is full.
+
+    Attributes:
+        BLOCK: Blocks the dispatching thread until the queue has room, up to `block_timeout`, then drops the event.
+        DROP_NEW: Drops the new event.
+        DROP_OLDEST: Drops the oldest queued event to make room for the new one.
+    """
+    BLOCK = "block"
+    DROP_NEW = "drop_new"
+    DROP_OLDEST = "drop_oldest"
+
+
+class CallbackMetrics(BaseModel):
+    """Snapshot of the dispatch counters of a callback handler class.
+
+    Attributes:
+        events (int): Number of dispatched events.
+        dropped (int): Number of events dropped because the queue was full.
+        failed (int): Number of queued events the handler failed to process.
+        queued (int): Number of events waiting in the queues.
+        dispatch_seconds (float): Total time the dispatching threads spent on the events, the latency the handler
+            adds to runs. Measured only if the dispatcher measures latency.
+        max_dispatch_seconds (float): Longest time a dispatching thread spent on an event. Measured only if the
+            dispatcher measures latency.
+        handler_seconds (float): Total time spent in the handler. Measured on the dispatching threads only if the
+            dispatcher measures latency, always on the worker threads of asynchronous handlers.
+    """
+    events: int = 0
+    dropped: int = 0
+    failed: int = 0
+    queued: int = 0
+    dispatch_seconds: float = 0
+    max_dispatch_seconds: float = 0
+    handler_seconds: float = 0
+
+    @property
+    def avg_dispatch_seconds(self) -> float:
+        """Average latency the handler adds to a run per event."""
+        return self.dispatch_seconds / self.events if self.events else 0
+
+
+class CallbackCounters:
+    """Dispatch counters of one handler class, updated under their own lock.
+
+    Dispatching threads of different handler classes don't contend for the counters.
+    """
+
+    __slots__ = ("metrics", "lock")
+
+    def __init__(self):
+        self.metrics = CallbackMetrics()
+        self.lock = threading.Lock()
+
+
+class CallbackEvent(NamedTuple):
+    name: str
+    args: tuple
+    kwargs: dict[str, Any]
+
+
+class CallbackWorker:
+    """Worker thread delivering the queued events of one asynchronous handler in order.
+
+    The worker stops once it has been idle for the idle timeout of the dispatcher, a new one is started for the next
+    event.
+
+    Args:
+        dispatcher (CallbackDispatcher): Dispatcher owning the worker.
+        callback (NodeCallbackHandler): Handler receiving the events.
+    """
+
+    def __init__(self, dispatcher: "CallbackDispatcher", callback: "NodeCallbackHandler"):
+        self.dispatcher = dispatcher
+        self.callback = callback
+        self.closed = False
+
+        self._queue: deque[CallbackEvent] = deque()
+        self._condition = threading.Condition()
+        self._in_flight = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"{dispatcher.name}-{callback.__class__.__name__}", daemon=True
+        )
+        self._thread.start()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._queue)
+
+    def _has_room(self) -> bool:
+        return len(self._queue) < self.dispatcher.max_queue_size
+
+    def put(self, event: CallbackEvent) -> bool | None:
+        """Queue the event, applying the overflow policy if the queue is full.
+
+        Args:
+            event (CallbackEvent): Event to queue.
+
+        Returns:
+            bool | None: Whether the event was queued, None if the worker is stopped and can't take it.
+        """
+        with self._condition:
+            if self.closed:
+                return None
+
+            if not self._has_room():
+                match self.dispatcher.overflow_policy:
+                    case CallbackOverflowPolicy.DROP_OLDEST:
+                        self._queue.popleft()
+                        self.dispatcher._record(self.callback, dropped=1)
+                    case CallbackOverflowPolicy.DROP_NEW:
+                        return False
+                    case CallbackOverflowPolicy.BLOCK:
+                        if not self._condition.wait_for(self._has_room, timeout=self.dispatcher.block_timeout):
+                            return False
+
+            self._queue.append(event)
+            self._condition.notify_all()
+            return True
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Wait until all queued events are delivered.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait. Defaults to None (wait forever).
+
+        Returns:
+            bool: Whether the queue was drained.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._queue and not self._in_flight, timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._condition.wait_for(lambda: self._queue, timeout=self.dispatcher.idle_timeout):
+                    self.closed = True
+                    self.dispatcher._remove_worker(self)
+                    return
+                event = self._queue.popleft()
+                self._in_flight = True
+                self._condition.notify_all()
+
+            time_start = time.perf_counter()
+            failed = 0
+            try:
+                getattr(self.callback, event.name)(*event.args, **event.kwargs)
+            except Exception as e:
+                failed = 1
+                logger.error(f"Error running callback {self.callback.__class__.__name__}: {e}")
+            self.dispatcher._record(self.callback, handler_seconds=time.perf_counter() - time_start, failed=failed)
+
+            with self._condition:
+                self._in_flight = False
+                self._condition.notify_all()
+
+
+class CallbackDispatcher:
+    """Delivers callback events to handlers according to their dispatch mode.
+
+    Synchronous handlers are called on the dispatching thread. Events of asynchronous handlers are put into a bounded
+    queue of the handler and delivered by its dedicated worker thread, so events of a run arrive in the order they
+    were dispatched while slow handlers don't delay the run. The time every handler adds to the dispatching threads
+    is measured per handler class when `measure_latency` is enabled, otherwise only events are counted.
+
+    Args:
+        max_queue_size (int, optional): Maximum number of queued events per asynchronous handler.
+            Defaults to CALLBACK_DISPATCHER_MAX_QUEUE_SIZE.
+        overflow_policy (CallbackOverflowPolicy, optional): Policy for new events when a queue is full.
+            Defaults to CallbackOverflowPolicy.BLOCK.
+        block_timeout (float, optional): Seconds the BLOCK policy waits for room in the queue. Defaults to 1.
+        idle_timeout (float, optional): Seconds a worker waits for new events before it stops.
+            Defaults to CALLBACK_DISPATCHER_IDLE_TIMEOUT.
+        name (str, optional): Prefix of the worker thread names.
+        measure_latency (bool, optional): Whether to measure the time dispatching threads spend on the events.
+            Defaults to CALLBACK_DISPATCHER_MEASURE_LATENCY.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int | None = None,
+        overflow_policy: CallbackOverflowPolicy = CallbackOverflowPolicy.BLOCK,
+        block_timeout: float = 1,
+        idle_timeout: float = CALLBACK_DISPATCHER_IDLE_TIMEOUT,
+        name: str = "fiboaitech-callbacks",
+        measure_latency: bool | None = None,
+    ):
+        self.max_queue_size = max_queue_size or CALLBACK_DISPATCHER_MAX_QUEUE_SIZE
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.idle_timeout = idle_timeout
+        self.name = name
+        self.measure_latency = CALLBACK_DISPATCHER_MEASURE_LATENCY if measure_latency is None else measure_latency
+
+        self._workers: dict[int, CallbackWorker] = {}
+        self._counters: dict[str, CallbackCounters] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def metrics(self) -> dict[str, CallbackMetrics]:
+        """Snapshot of the dispatch counters by handler class name."""
+        with self._lock:
+            counters = dict(self._counters)
+            workers = list(self._workers.values())
+
+        metrics = {}
+        for name, handler_counters in counters.items():
+            with handler_counters.lock:
+                metrics[name] = handler_counters.metrics.model_copy()
+
+        for worker in workers:
+            if queued := len(worker):
+                metrics.setdefault(worker.callback.__class__.__name__, CallbackMetrics()).queued += queued
+        return metrics
+
+    def _record(
+        self,
+        callback: "NodeCallbackHandler",
+        dispatch_seconds: float | None = None,
+        handler_seconds: float = 0,
+        dropped: int = 0,
+        failed: int = 0,
+    ) -> None:
+        """Updates the counters of the handler class, `dispatch_seconds` counts a dispatched event."""
+        name = callback.__class__.__name__
+        if (counters := self._counters.get(name)) is None:
+            with self._lock:
+                counters = self._counters.setdefault(name, CallbackCounters())
+        with counters.lock:
+            metrics = counters.metrics
+            if dispatch_seconds is not None:
+                metrics.events += 1
+                metrics.dispatch_seconds += dispatch_seconds
+                metrics.max_dispatch_seconds = max(metrics.max_dispatch_seconds, dispatch_seconds)
+            metrics.handler_seconds += handler_seconds
+            metrics.dropped += dropped
+            metrics.failed += failed
+
+    def _remove_worker(self, worker: CallbackWorker) -> None:
+        with self._lock:
+            if self._workers.get(id(worker.callback)) is worker:
+                del self._workers[id(worker.callback)]
+
+    def _put(self, callback: "NodeCallbackHandler", event: CallbackEvent) -> bool:
+        """Queues the event to the worker of the handler, starting the worker if needed."""
+        while True:
+            with self._lock:
+                if (worker := self._workers.get(id(callback))) is None:
+                    worker = self._workers[id(callback)] = CallbackWorker(self, callback)
+            if (queued := worker.put(event)) is not None:
+                return queued
+
+    def dispatch(self, callback: "NodeCallbackHandler", event: str, *args: Any, **kwargs: Any) -> None:
+        """Deliver the event to the handler.
+
+        Args:
+            callback (NodeCallbackHandler): Handler receiving the event.
+            event (str): Name of the handler method, e.g. `on_node_start`.
+            *args (Any): Positional arguments of the event.
+            **kwargs (Any): Keyword arguments of the event.
+
+        Raises:
+            Exception: Errors of synchronous handlers are propagated to the dispatching code.
+        """
+        time_start = time.perf_counter() if self.measure_latency else None
+        if callback.dispatch_mode == CallbackDispatchMode.ASYNC:
+            queued = self._put(callback, CallbackEvent(name=event, args=args, kwargs=kwargs))
+            duration = time.perf_counter() - time_start if time_start is not None else 0
+            self._record(callback, dispatch_seconds=duration, dropped=int(not queued))
+            return
+
+        try:
+            getattr(callback, event)(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - time_start if time_start is not None else 0
+            self._record(callback, dispatch_seconds=duration, handler_seconds=duration)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until the queued events of all asynchronous handlers are delivered.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait. Defaults to None (wait forever).
+
+        Returns:
+            bool: Whether all queues were drained.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._lock:
+            workers = list(self._workers.values())
+
+        for worker in workers:
+            remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            if not worker.wait_idle(remaining):
+                return False
+        return True
+
+
+_default_callback_dispatcher: CallbackDispatcher | None = None
+_default_callback_dispatcher_lock = threading.Lock()
+
+
+def get_default_callback_dispatcher() -> CallbackDispatcher:
+    """
+    Returns the process-wide callback dispatcher, creating it on first use.
+
+    Returns:
+        CallbackDispatcher: Default callback dispatcher.
+    """
+    global _default_callback_dispatcher
+    if _default_callback_dispatcher is None:
+        with _default_callback_dispatcher_lock:
+            if _default_callback_dispatcher is None:
+                _default_callback_dispatcher = CallbackDispatcher()
+                atexit.register(_default_callback_dispatcher.flush, timeout=CALLBACK_DISPATCHER_IDLE_TIMEOUT)
+    return _default_callback_dispatcher
+
+
+def set_default_callback_dispatcher(dispatcher: CallbackDispatcher | None) -> None:
+    """
+    Replaces the process-wide callback dispatcher. Events queued by the previous dispatcher are still delivered.
+
+    Args:
+        dispatcher (CallbackDispatcher | None): New default dispatcher. None recreates the dispatcher with defaults
+            on next use.
+    """
+    global _default_callback_dispatcher
+    with _default_callback_dispatcher_lock:
+        _default_callback_dispatcher = dispatcher
+
+
+def dispatch_callback(callback: "NodeCallbackHandler", event: str, *args: Any, **kwargs: Any) -> None:
+    """Deliver the event to the handler with the default callback dispatcher.
+
+    Args:
+        callback (NodeCallbackHandler): Handler receiving the event.
+        event (str): Name of the handler method, e.g. `on_node_start`.
+        *args (Any): Positional arguments of the event.
+        **kwargs (Any): Keyword arguments of the event.
+    """
+    get_default_callback_dispatcher().dispatch(callback, event, *args, **kwargs)
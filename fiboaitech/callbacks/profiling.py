@@ -0,0 +1,253 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from fiboaitech.callbacks import BaseCallbackHandler
+from fiboaitech.callbacks.base import get_parent_run_id, get_run_id
+from fiboaitech.callbacks.tracing import RunStatus
+from fiboaitech.utils.env import get_env_var
+from fiboaitech.utils.profiling import NodePhase, NodeRunProfile
+
+PROFILE_DELAYS = ("start_delay", "scheduler_wait", "queue_time")
+PROFILING_MAX_RECORDS = int(get_env_var("FIBOAITECH_PROFILING_MAX_RECORDS", 10000))
+
+
+@dataclass
+class NodeRunRecord:
+    """Profile of a finished node run.
+
+    Attributes:
+        run_id (UUID): Node run ID.
+        parent_run_id (UUID): Parent run ID.
+        node_id (str): Node ID.
+        node_name (str | None): Node name.
+        status (RunStatus): Status of the run.
+        profile (NodeRunProfile): Timings of the run.
+    """
+    run_id: UUID
+    parent_run_id: UUID
+    node_id: str
+    node_name: str | None
+    status: RunStatus
+    profile: NodeRunProfile
+
+
+class ProfilingCallbackHandler(BaseCallbackHandler):
+    """Callback handler collecting per-phase latencies of node runs.
+
+    Nodes measure their run phases, execution attempts and scheduling delays with monotonic timers and pass the
+    profile to node end, error and skip events. The handler only keeps references to the latest profiles, so it
+    is cheap enough to stay enabled in production. Use `get_summary` or `format_summary` to aggregate them by node,
+    and `clear` to drop the profiles once they are reported.
+
+    Args:
+        max_records (int | None): Number of the latest node runs kept. Defaults to PROFILING_MAX_RECORDS.
+
+    Attributes:
+        records (deque[NodeRunRecord]): Profiles of finished node runs, oldest are dropped first.
+    """
+
+    requires_serialized_node = False
+
+    def __init__(self, max_records: int | None = None):
+        """Initialize ProfilingCallbackHandler."""
+        self.max_records = max_records or PROFILING_MAX_RECORDS
+        self.records: deque[NodeRunRecord] = deque(maxlen=self.max_records)
+        # Workflow and flow runs are parents of node runs, so twice as many runs are tracked as records kept
+        self._max_runs = 2 * self.max_records
+        self._parent_run_ids: dict[UUID, UUID] = {}
+        self._lock = threading.Lock()
+
+    def _set_parent_run_id(self, run_id: UUID, parent_run_id: UUID) -> None:
+        """Remembers the parent of the run as the latest one, forgetting the oldest runs over the limit.
+
+        Must be called under the lock.
+        """
+        self._parent_run_ids.pop(run_id, None)
+        self._parent_run_ids[run_id] = parent_run_id
+        while len(self._parent_run_ids) > self._max_runs:
+            del self._parent_run_ids[next(iter(self._parent_run_ids))]
+
+    def _add_run(self, kwargs: dict) -> None:
+        """Remembers the parent of the run to group node runs by flow and workflow runs."""
+        with self._lock:
+            self._set_parent_run_id(get_run_id(kwargs), get_parent_run_id(kwargs))
+
+    def _add_record(self, serialized: dict[str, Any], status: RunStatus, kwargs: dict) -> None:
+        """Stores the profile of the finished node run."""
+        if (profile := kwargs.get("run_profile")) is None:
+            return
+
+        run_id, parent_run_id = get_run_id(kwargs), get_parent_run_id(kwargs)
+        record = NodeRunRecord(
+            run_id=run_id,
+            parent_run_id=parent_run_id,
+            node_id=serialized.get("id"),
+            node_name=serialized.get("name"),
+            status=status,
+            profile=profile,
+        )
+        with self._lock:
+            # Ancestors of the record are refreshed so they are forgotten after it
+            ancestor_run_id = parent_run_id
+            while (grandparent_run_id := self._parent_run_ids.get(ancestor_run_id)) not in (None, ancestor_run_id):
+                self._set_parent_run_id(ancestor_run_id, grandparent_run_id)
+                ancestor_run_id = grandparent_run_id
+            self._set_parent_run_id(run_id, parent_run_id)
+            self.records.append(record)
+
+    def clear(self) -> None:
+        """Drop the collected profiles, e.g. after the summary is reported."""
+        with self._lock:
+            self.records.clear()
+            self._parent_run_ids.clear()
+
+    def on_workflow_start(self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any):
+        """Called when the workflow starts.
+
+        Args:
+            serialized (dict[str, Any]): Serialized workflow data.
+            input_data (dict[str, Any]): Input data for the workflow.
+            **kwargs (Any): Additional arguments.
+        """
+        self._add_run(kwargs)
+
+    def on_flow_start(self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any):
+        """Called when the flow starts.
+
+        Args:
+            serialized (dict[str, Any]): Serialized flow data.
+            input_data (dict[str, Any]): Input data for the flow.
+            **kwargs (Any): Additional arguments.
+        """
+        self._add_run(kwargs)
+
+    def on_node_start(self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any):
+        """Called when the node starts.
+
+        Args:
+            serialized (dict[str, Any]): Serialized node data.
+            input_data (dict[str, Any]): Input data for the node.
+            **kwargs (Any): Additional arguments.
+        """
+        self._add_run(kwargs)
+
+    def on_node_end(self, serialized: dict[str, Any], output_data: dict[str, Any], **kwargs: Any):
+        """Called when the node ends.
+
+        Args:
+            serialized (dict[str, Any]): Serialized node data.
+            output_data (dict[str, Any]): Output data from the node.
+            **kwargs (Any): Additional arguments, `run_profile` holds the node run profile.
+        """
+        self._add_record(serialized, RunStatus.SUCCEEDED, kwargs)
+
+    def on_node_error(self, serialized: dict[str, Any], error: BaseException, **kwargs: Any):
+        """Called when the node errors.
+
+        Args:
+            serialized (dict[str, Any]): Serialized node data.
+            error (BaseException): Error encountered.
+            **kwargs (Any): Additional arguments, `run_profile` holds the node run profile.
+        """
+        self._add_record(serialized, RunStatus.FAILED, kwargs)
+
+    def on_node_skip(
+        self, serialized: dict[str, Any], skip_data: dict[str, Any], input_data: dict[str, Any], **kwargs: Any
+    ):
+        """Called when the node skips.
+
+        Args:
+            serialized (dict[str, Any]): Serialized node data.
+            skip_data (dict[str, Any]): Data related to the skip.
+            input_data (dict[str, Any]): Input data for the node.
+            **kwargs (Any): Additional arguments, `run_profile` holds the node run profile.
+        """
+        self._add_record(serialized, RunStatus.SKIPPED, kwargs)
+
+    def _is_descendant(self, run_id: UUID, ancestor_run_id: UUID) -> bool:
+        """Checks whether the run is nested in the ancestor run. Must be called under the lock."""
+        while run_id != ancestor_run_id:
+            parent_run_id = self._parent_run_ids.get(run_id)
+            if parent_run_id is None or parent_run_id == run_id:
+                return False
+            run_id = parent_run_id
+        return True
+
+    def get_records(self, run_id: UUID | str | None = None) -> list[NodeRunRecord]:
+        """Get profiles of node runs.
+
+        Args:
+            run_id (UUID | str | None): Workflow, flow or node run ID to get nested node runs of. Defaults to all runs.
+
+        Returns:
+            list[NodeRunRecord]: Profiles of node runs in completion order.
+        """
+        with self._lock:
+            if run_id is None:
+                return list(self.records)
+            run_id = UUID(run_id) if isinstance(run_id, str) else run_id
+            return [record for record in self.records if self._is_descendant(record.run_id, run_id)]
+
+    def get_summary(self, run_id: UUID | str | None = None) -> list[dict[str, Any]]:
+        """Aggregate node run profiles by node.
+
+        Args:
+            run_id (UUID | str | None): Workflow, flow or node run ID to summarize. Defaults to all runs.
+
+        Returns:
+            list[dict[str, Any]]: Rows with the number of runs, attempts and failures of the node, and total
+                duration, scheduling delays and phase timings in seconds, slowest nodes first.
+        """
+        rows = {}
+        for record in self.get_records(run_id):
+            profile = record.profile
+            if (row := rows.get(record.node_id)) is None:
+                row = rows[record.node_id] = {
+                    "node_id": record.node_id,
+                    "node_name": record.node_name,
+                    "runs": 0,
+                    "failures": 0,
+                    "attempts": 0,
+                    "duration": 0.0,
+                    **dict.fromkeys(PROFILE_DELAYS, 0.0),
+                    **{phase.value: 0.0 for phase in NodePhase},
+                }
+            row["runs"] += 1
+            row["failures"] += record.status == RunStatus.FAILED
+            row["attempts"] += len(profile.attempts)
+            row["duration"] += profile.duration or 0
+            for name in PROFILE_DELAYS:
+                row[name] += getattr(profile, name) or 0
+            for phase, seconds in profile.phases.items():
+                row[phase.value] += seconds
+        return sorted(rows.values(), key=lambda row: row["duration"], reverse=True)
+
+    def format_summary(self, run_id: UUID | str | None = None) -> str:
+        """Format the node summary as a text table with timings in milliseconds.
+
+        Args:
+            run_id (UUID | str | None): Workflow, flow or node run ID to summarize. Defaults to all runs.
+
+        Returns:
+            str: Summary table.
+        """
+        columns = ["node", "runs", "attempts", "duration", *PROFILE_DELAYS, *(phase.value for phase in NodePhase)]
+        lines = [columns]
+        for row in self.get_summary(run_id):
+            lines.append(
+                [
+                    row["node_name"] or row["node_id"],
+                    str(row["runs"]),
+                    str(row["attempts"]),
+                    *(f"{row[column] * 1000:.2f}" for column in columns[3:]),
+                ]
+            )
+
+        widths = [max(len(line[i]) for line in lines) for i in range(len(columns))]
+        return "\n".join(
+            "  ".join([line[0].ljust(widths[0]), *(value.rjust(width) for value, width in zip(line[1:], widths[1:]))])
+            for line in lines
+        )
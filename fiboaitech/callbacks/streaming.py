@@ -1,12 +1,15 @@
 import asyncio
 import threading
-from queue import Queue
+import time
+from queue import Empty, Full, Queue
 from typing import Any, AsyncIterator, Iterator
 
 from fiboaitech.callbacks import BaseCallbackHandler
 from fiboaitech.callbacks.base import get_run_id
-from fiboaitech.types.streaming import StreamingEventMessage
-from fiboaitech.utils import format_value
+from fiboaitech.callbacks.dispatch import CallbackOverflowPolicy
+from fiboaitech.executors.worker_pool import get_default_delayed_calls
+from fiboaitech.types.streaming import STREAMING_EVENT, StreamingEventMessage, StreamingFrame
+from fiboaitech.utils import format_value, format_value_json
 from fiboaitech.utils.logger import logger
 
 
@@ -18,6 +21,8 @@ class StreamingQueueCallbackHandler(BaseCallbackHandler):
         done_event (asyncio.Event | threading.Event | None): Event to signal completion.
     """
 
+    requires_serialized_node = False
+
     def __init__(
         self,
         queue: asyncio.Queue | Queue | None = None,
@@ -197,3 +202,336 @@ class AsyncStreamingIteratorCallbackHandler(StreamingQueueCallbackHandler):
         """
         async for item in self._iterator:
             yield item
+
+
+# Marks the end of the stream in the frame queue
+STREAMING_FRAME_END = object()
+
+
+class _FrameBuffer:
+    """Delta text of a node run waiting to be emitted as a frame."""
+
+    __slots__ = ("run_id", "entity_id", "event", "parts", "size", "started_at")
+
+    def __init__(self, run_id: str, entity_id: str, event: str):
+        self.run_id = run_id
+        self.entity_id = entity_id
+        self.event = event
+        self.parts: list[str] = []
+        self.size = 0
+        self.started_at = time.monotonic()
+
+
+def _get_chunk_delta(chunk: dict[str, Any] | None) -> str | None:
+    """Returns the content of the first choice delta of a serialized chunk."""
+    try:
+        content = chunk["choices"][0]["delta"]["content"]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return content if isinstance(content, str) else None
+
+
+class StreamingFrameCallbackHandler(BaseCallbackHandler):
+    """Callback handler for the low-overhead streaming path.
+
+    Tokens are taken as the raw delta text passed by LLM nodes instead of serialized provider chunks, coalesced
+    into frames per node run and serialized to JSON once. A frame is emitted once it has been open for
+    `coalesce_interval` seconds or holds `max_frame_size` characters, and pending text is emitted when the node
+    execution ends. Frames whose interval passes while the LLM stalls are emitted by a timer. Frames are put into
+    a bounded queue; when the consumer falls behind, `overflow_policy` decides whether producers wait or frames are
+    dropped. The end of the stream is always delivered.
+
+    Iterate the handler, synchronously or asynchronously, to consume the frames until the workflow ends. Async
+    consumers are woken up on their event loop, so cancelling them leaves no thread waiting for frames.
+
+    Attributes:
+        queue (Queue): Bounded queue of frames.
+        overflow_policy (CallbackOverflowPolicy): Policy for new frames when the queue is full.
+        block_timeout (float): Seconds the BLOCK policy waits for room in the queue.
+        coalesce_interval (float): Maximum seconds a token waits for the frame to fill. 0 emits every token.
+        max_frame_size (int): Number of characters that completes a frame.
+        frames (int): Number of frames put into the queue.
+        dropped (int): Number of frames dropped because the queue was full.
+    """
+
+    requires_serialized_node = False
+    requires_stream_chunk = False
+
+    def __init__(
+        self,
+        max_queue_size: int = 1024,
+        overflow_policy: CallbackOverflowPolicy = CallbackOverflowPolicy.BLOCK,
+        block_timeout: float = 1,
+        coalesce_interval: float = 0.02,
+        max_frame_size: int = 1024,
+    ) -> None:
+        """Initialize StreamingFrameCallbackHandler.
+
+        Args:
+            max_queue_size (int): Maximum number of frames waiting for the consumer. Defaults to 1024.
+            overflow_policy (CallbackOverflowPolicy): Policy for new frames when the queue is full.
+                Defaults to CallbackOverflowPolicy.BLOCK.
+            block_timeout (float): Seconds the BLOCK policy waits for room in the queue. Defaults to 1.
+            coalesce_interval (float): Maximum seconds a token waits for the frame to fill. Defaults to 0.02.
+            max_frame_size (int): Number of characters that completes a frame. Defaults to 1024.
+        """
+        self.queue: Queue = Queue(maxsize=max_queue_size)
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.coalesce_interval = coalesce_interval
+        self.max_frame_size = max_frame_size
+        self.frames = 0
+        self.dropped = 0
+
+        self._buffers: dict[str, _FrameBuffer] = {}
+        self._lock = threading.Lock()
+        # Held while frames are taken from the buffers and put into the queue, so frames of a run stay in order
+        self._emit_lock = threading.RLock()
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    @staticmethod
+    def _build_frame(
+        run_id: str | None, entity_id: str, event: str, content: str | None = None, data: Any = None
+    ) -> StreamingFrame:
+        """Builds the frame with its JSON payload."""
+        payload = {"run_id": run_id, "entity_id": entity_id, "event": event}
+        if content is not None:
+            payload["content"] = content
+        else:
+            payload["data"] = data
+        return StreamingFrame(
+            run_id=run_id,
+            entity_id=entity_id,
+            event=event,
+            content=content,
+            data=data,
+            payload=format_value_json(payload).decode(),
+        )
+
+    def _put(self, frame: Any, force: bool = False) -> None:
+        """Puts the frame into the queue, applying the overflow policy if it is full.
+
+        Args:
+            frame (Any): Frame to put.
+            force (bool): Whether to drop the oldest frames until the frame fits, whatever the policy.
+        """
+        dropped = 0
+        if self.overflow_policy == CallbackOverflowPolicy.BLOCK and not force:
+            try:
+                self.queue.put(frame, timeout=self.block_timeout)
+            except Full:
+                dropped = 1
+        elif self.overflow_policy == CallbackOverflowPolicy.DROP_NEW and not force:
+            try:
+                self.queue.put_nowait(frame)
+            except Full:
+                dropped = 1
+        else:
+            while True:
+                try:
+                    self.queue.put_nowait(frame)
+                    break
+                except Full:
+                    try:
+                        self.queue.get_nowait()
+                        dropped += 1
+                    except Empty:
+                        pass
+
+        with self._lock:
+            self.dropped += dropped
+            if frame is not STREAMING_FRAME_END and not dropped:
+                self.frames += 1
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, wakeup in waiters:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                # Event loop of the consumer is closed
+                pass
+
+    def _emit(self, buffer: _FrameBuffer) -> None:
+        """Puts the buffered text as a frame."""
+        self._put(self._build_frame(buffer.run_id, buffer.entity_id, buffer.event, content="".join(buffer.parts)))
+
+    def _flush_run(self, run_id: str) -> None:
+        """Emits the pending text of the node run."""
+        with self._emit_lock:
+            with self._lock:
+                buffer = self._buffers.pop(run_id, None)
+            if buffer is not None:
+                self._emit(buffer)
+
+    def _flush_all(self) -> None:
+        """Emits the pending text of all node runs."""
+        with self._emit_lock:
+            with self._lock:
+                buffers = list(self._buffers.values())
+                self._buffers.clear()
+            for buffer in buffers:
+                self._emit(buffer)
+
+    def _schedule_flush(self, run_id: str, buffer: _FrameBuffer, delay: float) -> None:
+        """Emits the frame after the delay unless tokens complete it before."""
+        get_default_delayed_calls().call_later(delay, self._flush_expired, run_id, buffer)
+
+    def _flush_expired(self, run_id: str, buffer: _FrameBuffer) -> None:
+        """Emits the frame open for the coalesce interval, unless tokens completed it meanwhile."""
+        # Runs on the timer thread, so it never waits: the flush is retried while producers emit or the queue is full
+        if not self._emit_lock.acquire(blocking=False):
+            self._schedule_flush(run_id, buffer, self.coalesce_interval)
+            return
+        try:
+            with self._lock:
+                if self._buffers.get(run_id) is not buffer:
+                    return
+                if self.queue.full():
+                    self._schedule_flush(run_id, buffer, self.coalesce_interval)
+                    return
+                del self._buffers[run_id]
+            self._emit(buffer)
+        finally:
+            self._emit_lock.release()
+
+    def on_node_execute_stream(
+        self, serialized: dict[str, Any], chunk: dict[str, Any] | None = None, **kwargs: Any
+    ) -> None:
+        """Called when the node execute streams.
+
+        Args:
+            serialized (dict[str, Any]): Serialized node data.
+            chunk (dict[str, Any] | None): Stream chunk data, used if the node passed no delta text.
+            **kwargs (Any): Additional arguments.
+        """
+        run_id = str(get_run_id(kwargs))
+        event = serialized.get("streaming", {}).get("event") or STREAMING_EVENT
+        if (delta := kwargs.get("delta")) is None:
+            delta = _get_chunk_delta(chunk)
+
+        if delta is None:
+            # Not a token, e.g. an approval request, so it is sent as is after the pending text
+            with self._emit_lock:
+                self._flush_run(run_id)
+                if (message := kwargs.get("event")) is not None:
+                    frame = self._build_frame(
+                        message.run_id, message.entity_id, message.event, data=format_value(message.data)
+                    )
+                else:
+                    frame = self._build_frame(run_id, serialized.get("id"), event, data=format_value(chunk))
+                self._put(frame)
+            return
+
+        with self._lock:
+            if is_new := (buffer := self._buffers.get(run_id)) is None:
+                buffer = self._buffers[run_id] = _FrameBuffer(run_id, serialized.get("id"), event)
+            buffer.parts.append(delta)
+            buffer.size += len(delta)
+            is_complete = (
+                buffer.size >= self.max_frame_size or time.monotonic() - buffer.started_at >= self.coalesce_interval
+            )
+        if not is_complete:
+            if is_new:
+                self._schedule_flush(run_id, buffer, self.coalesce_interval)
+            return
+
+        with self._emit_lock:
+            with self._lock:
+                if self._buffers.get(run_id) is not buffer:
+                    # Emitted by the timer meanwhile
+                    return
+                del self._buffers[run_id]
+            self._emit(buffer)
+
+    def on_node_execute_end(self, serialized: dict[str, Any], output_data: dict[str, Any], **kwargs: Any) -> None:
+        """Called when the node execute ends.
+
+        Args:
+            serialized (dict[str, Any]): Serialized node data.
+            output_data (dict[str, Any]): Output data from the node.
+            **kwargs (Any): Additional arguments.
+        """
+        self._flush_run(str(get_run_id(kwargs)))
+
+    def on_node_execute_error(self, serialized: dict[str, Any], error: BaseException, **kwargs: Any) -> None:
+        """Called when the node execute errors.
+
+        Args:
+            serialized (dict[str, Any]): Serialized node data.
+            error (BaseException): Error encountered.
+            **kwargs (Any): Additional arguments.
+        """
+        self._flush_run(str(get_run_id(kwargs)))
+
+    def on_workflow_end(self, serialized: dict[str, Any], output_data: dict[str, Any], **kwargs: Any) -> None:
+        """Called when the workflow ends.
+
+        Args:
+            serialized (dict[str, Any]): Serialized workflow data.
+            output_data (dict[str, Any]): Output data from the workflow.
+            **kwargs (Any): Additional arguments.
+        """
+        with self._emit_lock:
+            self._flush_all()
+            self._put(
+                self._build_frame(
+                    str(get_run_id(kwargs)),
+                    serialized.get("id"),
+                    serialized.get("streaming", {}).get("event") or STREAMING_EVENT,
+                    data=format_value(output_data),
+                )
+            )
+            self._put(STREAMING_FRAME_END, force=True)
+
+    def on_workflow_error(self, serialized: dict[str, Any], error: BaseException, **kwargs: Any) -> None:
+        """Called when the workflow errors.
+
+        Args:
+            serialized (dict[str, Any]): Serialized workflow data.
+            error (BaseException): Error encountered.
+            **kwargs (Any): Additional arguments.
+        """
+        with self._emit_lock:
+            self._flush_all()
+            self._put(STREAMING_FRAME_END, force=True)
+
+    def __iter__(self) -> Iterator[StreamingFrame]:
+        """Iterate over frames until the end of the stream.
+
+        Returns:
+            Iterator[StreamingFrame]: Iterator for frames.
+        """
+        while (frame := self.queue.get()) is not STREAMING_FRAME_END:
+            yield frame
+
+    async def _aget(self) -> Any:
+        """Waits for the next frame on the event loop, woken up by the producers."""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                return self.queue.get_nowait()
+            except Empty:
+                pass
+
+            wakeup = asyncio.Event()
+            waiter = (loop, wakeup)
+            with self._lock:
+                self._async_waiters.append(waiter)
+            try:
+                # A frame put before the waiter was added does not wake it up
+                try:
+                    return self.queue.get_nowait()
+                except Empty:
+                    await wakeup.wait()
+            finally:
+                with self._lock:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+    async def __aiter__(self) -> AsyncIterator[StreamingFrame]:
+        """Async iterate over frames until the end of the stream without blocking the event loop.
+
+        Returns:
+            AsyncIterator[StreamingFrame]: Async iterator for frames.
+        """
+        while (frame := await self._aget()) is not STREAMING_FRAME_END:
+            yield frame
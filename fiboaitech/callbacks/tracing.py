@@ -1,22 +1,29 @@
+import hashlib
 import json
+import random
+import threading
 import traceback
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from functools import cached_property
 from importlib.metadata import distributions
+from io import BytesIO
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from fiboaitech.callbacks import BaseCallbackHandler
 from fiboaitech.callbacks.base import get_execution_run_id, get_parent_run_id, get_run_id
-from fiboaitech.clients import BaseTracingClient
+from fiboaitech.clients import BaseTracingClient, BatchTracingClient
 from fiboaitech.utils import JsonWorkflowEncoder, format_value, generate_uuid
 
 UTC = timezone.utc
 
+# Keys of embedding vectors in inputs and outputs, e.g. of documents and embedders
+TRACING_EMBEDDING_KEYS = frozenset({"embedding", "embeddings", "query_embedding"})
+
 
 class RunStatus(str, Enum):
     """Enumeration for run statuses."""
@@ -120,6 +127,142 @@ class Run:
         return json.dumps(self.to_dict(), cls=JsonWorkflowEncoder)
 
 
+class TracingSampling(BaseModel):
+    """Sampling of traces, decided for all runs of a trace, e.g. a workflow run with its flows and nodes.
+
+    Head sampling decides when the trace starts, so runs of dropped traces are not recorded at all. Tail sampling
+    decides when the trace ends, keeping failed and slow traces and a share of the others, so runs of the trace
+    are kept in memory until it ends.
+
+    Attributes:
+        head_rate (float): Share of traces that are recorded. Defaults to 1.
+        tail_rate (float): Share of recorded successful traces that are kept. Defaults to 1.
+        tail_latency_threshold_seconds (float | None): Traces taking longer are always kept. Defaults to None.
+        workflow_head_rates (dict[str, float]): Head rates of workflows by workflow ID, overriding `head_rate`.
+        workflow_tail_rates (dict[str, float]): Tail rates of workflows by workflow ID, overriding `tail_rate`.
+    """
+    head_rate: float = Field(default=1, ge=0, le=1)
+    tail_rate: float = Field(default=1, ge=0, le=1)
+    tail_latency_threshold_seconds: float | None = None
+    workflow_head_rates: dict[str, float] = Field(default_factory=dict)
+    workflow_tail_rates: dict[str, float] = Field(default_factory=dict)
+
+    @property
+    def is_tail_sampling(self) -> bool:
+        """Whether traces may be dropped when they end."""
+        return self.tail_rate < 1 or any(rate < 1 for rate in self.workflow_tail_rates.values())
+
+    def sample_head(self, workflow_id: str | None = None) -> bool:
+        """Decide whether a starting trace is recorded.
+
+        Args:
+            workflow_id (str | None): ID of the workflow starting the trace.
+
+        Returns:
+            bool: Whether the trace is recorded.
+        """
+        rate = self.workflow_head_rates.get(workflow_id, self.head_rate)
+        return random.random() < rate  # nosec B311
+
+    def sample_tail(self, run: "Run") -> bool:
+        """Decide whether a recorded trace is kept.
+
+        Args:
+            run (Run): Root run of the finished trace.
+
+        Returns:
+            bool: Whether the trace is kept.
+        """
+        if run.status == RunStatus.FAILED:
+            return True
+        if (
+            self.tail_latency_threshold_seconds is not None
+            and run.end_time is not None
+            and (run.end_time - run.start_time).total_seconds() >= self.tail_latency_threshold_seconds
+        ):
+            return True
+
+        workflow_id = (run.metadata or {}).get("workflow", {}).get("id")
+        rate = self.workflow_tail_rates.get(workflow_id, self.tail_rate)
+        return random.random() < rate  # nosec B311
+
+
+class TracingPayloadBudget(BaseModel):
+    """Limits of inputs and outputs recorded in traces.
+
+    Values are formatted as by `format_value`, except that long strings are truncated, long lists are cut with a
+    note of the number of omitted items, embedding vectors are replaced with their sizes and large binary values
+    are referenced by hash and size instead of being encoded.
+
+    Attributes:
+        max_string_length (int | None): Maximum number of characters of strings. Defaults to 10000.
+        max_list_items (int | None): Maximum number of items of lists, tuples and sets. Defaults to 100.
+        max_binary_size (int | None): Maximum size of bytes and files recorded as content. Defaults to 1024.
+        drop_embeddings (bool): Whether to replace embedding vectors with their sizes. Defaults to True.
+    """
+    max_string_length: int | None = 10_000
+    max_list_items: int | None = 100
+    max_binary_size: int | None = 1024
+    drop_embeddings: bool = True
+
+    def format(self, value: Any) -> Any:
+        """Format the value within the budget.
+
+        Args:
+            value (Any): Value to format.
+
+        Returns:
+            Any: Formatted value.
+        """
+        value_type = type(value)
+        if value_type is str:
+            return self._format_string(value)
+        if value_type is int or value_type is float or value_type is bool or value is None:
+            return value
+        if isinstance(value, dict):
+            return {
+                k: self._format_embedding(v) if self._is_embedding(k, v) else self.format(v)
+                for k, v in value.items()
+            }
+        if isinstance(value, (list, tuple, set)):
+            if self.max_list_items is not None and len(value) > self.max_list_items:
+                items = [self.format(v) for _, v in zip(range(self.max_list_items), value)]
+                return items + [f"... {len(value) - self.max_list_items} more items"]
+            return type(value)(self.format(v) for v in value)
+        if isinstance(value, (bytes, bytearray)) and self._is_large_binary(len(value)):
+            return self._format_binary(value)
+        if isinstance(value, BytesIO):
+            with value.getbuffer() as buffer:
+                if self._is_large_binary(buffer.nbytes):
+                    return {"name": getattr(value, "name", None), **self._format_binary(buffer)}
+
+        formatted = format_value(value)
+        return formatted if formatted is value else self.format(formatted)
+
+    def _format_string(self, value: str) -> str:
+        if self.max_string_length is None or len(value) <= self.max_string_length:
+            return value
+        return f"{value[:self.max_string_length]}... [{len(value) - self.max_string_length} more characters]"
+
+    def _is_embedding(self, key: Any, value: Any) -> bool:
+        return (
+            self.drop_embeddings and key in TRACING_EMBEDDING_KEYS and isinstance(value, (list, tuple)) and bool(value)
+        )
+
+    @staticmethod
+    def _format_embedding(value: list | tuple) -> str:
+        if isinstance(value[0], (list, tuple)):
+            return f"[{len(value)} embeddings of {len(value[0])} dimensions]"
+        return f"[embedding of {len(value)} dimensions]"
+
+    def _is_large_binary(self, size: int) -> bool:
+        return self.max_binary_size is not None and size > self.max_binary_size
+
+    @staticmethod
+    def _format_binary(value: bytes | bytearray | memoryview) -> dict:
+        return {"sha256": hashlib.sha256(value).hexdigest(), "size": len(value)}
+
+
 class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
     """Callback handler for tracing workflow events.
 
@@ -127,17 +270,23 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
         source_id (str | None): Source ID.
         trace_id (str | None): Trace ID.
         session_id (str | None): Session ID.
-        client (BaseTracingClient | None): Tracing client.
+        client (BaseTracingClient | None): Tracing client. With a BatchTracingClient, runs are exported as soon as
+            they finish and removed from `runs`, otherwise all runs are kept and exported when the workflow ends.
         runs (dict[UUID, Run]): Dictionary of runs.
         tags (list[str]): List of tags.
+        sampling (TracingSampling | None): Head and tail sampling of traces. Defaults to None (record all).
+        payload_budget (TracingPayloadBudget | None): Limits of recorded inputs and outputs.
+            Defaults to None (record in full).
         installed_pkgs (list[str]): List of installed packages.
     """
     source_id: str | None = Field(default_factory=generate_uuid)
     trace_id: str | None = Field(default_factory=generate_uuid)
     session_id: str | None = Field(default_factory=generate_uuid)
     client: BaseTracingClient | None = None
-    runs: dict[UUID, Run] = {}
-    tags: list[str] = []
+    runs: dict[UUID, Run] = Field(default_factory=dict)
+    tags: list[str] = Field(default_factory=list)
+    sampling: TracingSampling | None = None
+    payload_budget: TracingPayloadBudget | None = None
 
     installed_pkgs: list[str] = Field(
         ["fiboaitech"],
@@ -146,6 +295,11 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    _root_run_ids: dict[UUID, UUID] = PrivateAttr(default_factory=dict)
+    _trace_run_ids: dict[UUID, list[UUID]] = PrivateAttr(default_factory=dict)
+    _dropped_root_run_ids: set[UUID] = PrivateAttr(default_factory=set)
+    _sampling_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
     @cached_property
     def host(self) -> dict:
         """Get host information.
@@ -176,11 +330,15 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
 
         from fiboaitech.nodes import NodeGroup
 
+        # Serialized node is shared with other callbacks, so changes are made on a copy
+        serialized = dict(serialized)
         # Handle runtime LLM prompt override
         if serialized.get("group") == NodeGroup.LLMS:
             prompt = kwargs.get("prompt") or serialized.get("prompt")
             if isinstance(prompt, BaseModel):
                 prompt = prompt.model_dump()
+            elif isinstance(prompt, dict):
+                prompt = dict(prompt)
             serialized["prompt"] = prompt
 
         run = Run(
@@ -194,7 +352,7 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             parent_run_id=parent_run_id,
             metadata={"node": serialized, "run_depends": kwargs.get("run_depends", []), "host": self.host},
             tags=self.tags,
-            input=format_value(kwargs.get("input_data")),
+            input=self._format_payload(kwargs.get("input_data")),
         )
         return run
 
@@ -208,6 +366,8 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             input_data (dict[str, Any]): Input data for the workflow.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs, workflow_id=serialized.get("id")):
+            return
         run_id = get_run_id(kwargs)
         self.runs[run_id] = Run(
             id=run_id,
@@ -217,7 +377,7 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             source_id=self.source_id,
             session_id=self.session_id,
             start_time=datetime.now(UTC),
-            input=format_value(input_data),
+            input=self._format_payload(input_data),
             metadata={
                 "workflow": {"id": serialized.get("id"), "version": serialized.get("version")},
                 "host": self.host,
@@ -235,10 +395,14 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             output_data (dict[str, Any]): Output data from the workflow.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs):
+            self._finish_run(get_run_id(kwargs))
+            return
         run = ensure_run(get_run_id(kwargs), self.runs)
         run.end_time = datetime.now(UTC)
-        run.output = format_value(output_data)
+        run.output = self._format_payload(output_data)
         run.status = RunStatus.SUCCEEDED
+        self._finish_run(run.id)
 
         self.flush()
 
@@ -252,6 +416,9 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             error (BaseException): Error encountered.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs):
+            self._finish_run(get_run_id(kwargs))
+            return
         run = ensure_run(get_run_id(kwargs), self.runs)
         run.end_time = datetime.now(UTC)
         run.status = RunStatus.FAILED
@@ -259,6 +426,7 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             "message": str(error),
             "traceback": traceback.format_exc(),
         }
+        self._finish_run(run.id)
 
     def on_flow_start(
         self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any
@@ -270,6 +438,8 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             input_data (dict[str, Any]): Input data for the flow.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs):
+            return
         run_id = get_run_id(kwargs)
         parent_run_id = get_parent_run_id(kwargs)
 
@@ -282,7 +452,7 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             session_id=self.session_id,
             start_time=datetime.now(UTC),
             parent_run_id=parent_run_id,
-            input=format_value(input_data),
+            input=self._format_payload(input_data),
             metadata={"flow": {"id": serialized.get("id")}, "host": self.host},
             tags=self.tags,
         )
@@ -297,10 +467,14 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             output_data (dict[str, Any]): Output data from the flow.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs):
+            self._finish_run(get_run_id(kwargs))
+            return
         run = ensure_run(get_run_id(kwargs), self.runs)
         run.end_time = datetime.now(UTC)
-        run.output = format_value(output_data)
+        run.output = self._format_payload(output_data)
         run.status = RunStatus.SUCCEEDED
+        self._finish_run(run.id)
 
     def on_flow_error(
         self, serialized: dict[str, Any], error: BaseException, **kwargs: Any
@@ -312,6 +486,9 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             error (BaseException): Error encountered.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs):
+            self._finish_run(get_run_id(kwargs))
+            return
         run = ensure_run(get_run_id(kwargs), self.runs)
         run.end_time = datetime.now(UTC)
         run.status = RunStatus.FAILED
@@ -319,6 +496,7 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             "message": str(error),
             "traceback": traceback.format_exc(),
         }
+        self._finish_run(run.id)
 
     def on_node_start(
         self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any
@@ -330,9 +508,11 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             input_data (dict[str, Any]): Input data for the node.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs):
+            return
         run_id = get_run_id(kwargs)
         run = self._get_node_base_run(serialized, **kwargs)
-        run.input = format_value(input_data)
+        run.input = self._format_payload(input_data)
         self.runs[run_id] = run
 
     def on_node_end(
@@ -345,11 +525,15 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             output_data (dict[str, Any]): Output data from the node.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs):
+            self._finish_run(get_run_id(kwargs))
+            return
         run = ensure_run(get_run_id(kwargs), self.runs)
         run.end_time = datetime.now(UTC)
-        run.output = format_value(output_data)
+        run.output = self._format_payload(output_data)
         run.status = RunStatus.SUCCEEDED
         run.metadata["is_output_from_cache"] = kwargs.get("is_output_from_cache", False)
+        self._finish_run(run.id)
 
     def on_node_error(
         self, serialized: dict[str, Any], error: BaseException, **kwargs: Any
@@ -361,6 +545,9 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             error (BaseException): Error encountered.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs):
+            self._finish_run(get_run_id(kwargs))
+            return
         run_id = get_run_id(kwargs)
         if (run := self.runs.get(run_id)) is None:
             run = self._get_node_base_run(serialized, **kwargs)
@@ -372,6 +559,7 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             "message": str(error),
             "traceback": traceback.format_exc(),
         }
+        self._finish_run(run.id)
 
     def on_node_skip(
         self,
@@ -388,15 +576,19 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             input_data (dict[str, Any]): Input data for the node.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs):
+            self._finish_run(get_run_id(kwargs))
+            return
         run_id = get_run_id(kwargs)
         if (run := self.runs.get(run_id)) is None:
             run = self._get_node_base_run(serialized, **kwargs)
             self.runs[run_id] = run
 
-        run.input = format_value(input_data)
+        run.input = self._format_payload(input_data)
         run.end_time = run.start_time
         run.status = RunStatus.SKIPPED
         run.metadata["skip"] = format_value(skip_data)
+        self._finish_run(run.id)
 
     def on_node_execute_start(
         self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any
@@ -408,14 +600,17 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             input_data (dict[str, Any]): Input data for the node.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs):
+            return
         run = ensure_run(get_run_id(kwargs), self.runs)
         execution_run_id = get_execution_run_id(kwargs)
         execution = ExecutionRun(
             id=execution_run_id,
             start_time=datetime.now(UTC),
-            input=format_value(input_data),
+            input=self._format_payload(input_data),
         )
         run.executions.append(execution)
+        self._set_circuit_breaker_metadata(execution, **kwargs)
 
     def on_node_execute_end(
         self, serialized: dict[str, Any], output_data: dict[str, Any], **kwargs: Any
@@ -427,11 +622,14 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             output_data (dict[str, Any]): Output data from the node.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs):
+            return
         run = ensure_run(get_run_id(kwargs), self.runs)
         execution = ensure_execution_run(get_execution_run_id(kwargs), run.executions)
         execution.end_time = datetime.now(UTC)
-        execution.output = format_value(output_data)
+        execution.output = self._format_payload(output_data)
         execution.status = RunStatus.SUCCEEDED
+        self._set_circuit_breaker_metadata(execution, **kwargs)
 
     def on_node_execute_error(
         self, serialized: dict[str, Any], error: BaseException, **kwargs: Any
@@ -443,6 +641,8 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             error (BaseException): Error encountered.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs):
+            return
         run = ensure_run(get_run_id(kwargs), self.runs)
         execution = ensure_execution_run(get_execution_run_id(kwargs), run.executions)
         execution.end_time = datetime.now(UTC)
@@ -451,6 +651,14 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             "message": str(error),
             "traceback": traceback.format_exc(),
         }
+        self._set_circuit_breaker_metadata(execution, **kwargs)
+
+    @staticmethod
+    def _set_circuit_breaker_metadata(execution: ExecutionRun, **kwargs: Any):
+        """Records the retry attempt and the circuit breaker state of nodes with a circuit breaker."""
+        if circuit_breaker_state := kwargs.get("circuit_breaker_state"):
+            execution.metadata["attempt"] = kwargs.get("attempt")
+            execution.metadata["circuit_breaker_state"] = circuit_breaker_state
 
     def on_node_execute_run(self, serialized: dict[str, Any], **kwargs: Any):
         """Called when the node execute runs.
@@ -459,16 +667,110 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             serialized (dict[str, Any]): Serialized node data.
             **kwargs (Any): Additional arguments.
         """
+        if not self._is_sampled(kwargs):
+            return
         run = ensure_run(get_run_id(kwargs), self.runs)
         if usage := kwargs.get("usage_data"):
             run.metadata["usage"] = usage
 
+        if semantic_cache := kwargs.get("semantic_cache"):
+            run.metadata["semantic_cache"] = semantic_cache
+
         if prompt_messages := kwargs.get("prompt_messages"):
             run.metadata["node"]["prompt"]["messages"] = prompt_messages
 
+    def _format_payload(self, value: Any) -> Any:
+        """Format the input or output of a run, within the payload budget if it is set."""
+        if self.payload_budget is None:
+            return format_value(value)
+        return self.payload_budget.format(value)
+
+    def _is_sampled(self, kwargs: dict[str, Any], workflow_id: str | None = None) -> bool:
+        """Check whether the run belongs to a sampled trace.
+
+        Runs are assigned to the trace of their parent run when first seen. Runs without a known parent start a
+        trace that is head sampled.
+
+        Args:
+            kwargs (dict[str, Any]): Callback arguments.
+            workflow_id (str | None): ID of the workflow starting the trace.
+
+        Returns:
+            bool: Whether the run is recorded.
+        """
+        if self.sampling is None:
+            return True
+
+        run_id = get_run_id(kwargs)
+        with self._sampling_lock:
+            if (root_run_id := self._root_run_ids.get(run_id)) is None:
+                parent_run_id = get_parent_run_id(kwargs) if kwargs.get("parent_run_id") else None
+                root_run_id = self._root_run_ids.get(parent_run_id, run_id)
+                self._root_run_ids[run_id] = root_run_id
+                if root_run_id == run_id and not self.sampling.sample_head(workflow_id):
+                    self._dropped_root_run_ids.add(run_id)
+                if root_run_id not in self._dropped_root_run_ids:
+                    self._trace_run_ids.setdefault(root_run_id, []).append(run_id)
+            return root_run_id not in self._dropped_root_run_ids
+
+    def _finish_run(self, run_id: UUID):
+        """Handle the end of the run.
+
+        Without tail sampling the run is exported. With tail sampling, runs are kept until their trace ends and
+        then exported or dropped together.
+
+        Args:
+            run_id (UUID): ID of the finished run.
+        """
+        if self.sampling is None:
+            if (run := self.runs.get(run_id)) is not None:
+                self._export_run(run)
+            return
+
+        with self._sampling_lock:
+            root_run_id = self._root_run_ids.pop(run_id, run_id)
+            is_root = root_run_id == run_id
+            trace_run_ids = self._trace_run_ids.pop(root_run_id, []) if is_root else []
+            if root_run_id in self._dropped_root_run_ids:
+                if is_root:
+                    self._dropped_root_run_ids.discard(root_run_id)
+                return
+
+        if not self.sampling.is_tail_sampling:
+            if (run := self.runs.get(run_id)) is not None:
+                self._export_run(run)
+            return
+
+        if not is_root or (root_run := self.runs.get(root_run_id)) is None:
+            return
+        if not self.sampling.sample_tail(root_run):
+            for trace_run_id in trace_run_ids:
+                self.runs.pop(trace_run_id, None)
+            return
+        for trace_run_id in trace_run_ids:
+            if (run := self.runs.get(trace_run_id)) is not None:
+                self._export_run(run)
+
+    def _export_run(self, run: Run):
+        """Export the finished run and drop it from memory if the client exports runs incrementally.
+
+        Args:
+            run (Run): Finished run.
+        """
+        if isinstance(self.client, BatchTracingClient) and self.runs.pop(run.id, None) is not None:
+            self.client.trace([run])
+
     def flush(self):
-        """Flush the runs to the tracing client."""
-        if self.client:
+        """Flush the runs to the tracing client.
+
+        A BatchTracingClient receives the finished runs that are not exported yet, which are then dropped from memory.
+        Unfinished runs, e.g. of other workflows traced by the handler, are kept.
+        """
+        if isinstance(self.client, BatchTracingClient):
+            finished_run_ids = [run_id for run_id, run in list(self.runs.items()) if run.end_time is not None]
+            runs = [run for run_id in finished_run_ids if (run := self.runs.pop(run_id, None)) is not None]
+            self.client.trace(runs)
+        elif self.client:
             self.client.trace([run for run in self.runs.values()])
 
 
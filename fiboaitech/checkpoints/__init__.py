@@ -0,0 +1,4 @@
+from .base import BaseCheckpointStore, InMemoryCheckpointStore
+from .file import FileCheckpointStore
+from .redis import RedisCheckpointStore
+from .sqlite import SQLiteCheckpointStore
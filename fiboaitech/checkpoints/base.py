@@ -0,0 +1,127 @@
+import pickle  # nosec B403
+import threading
+from abc import ABC, abstractmethod
+from typing import Any
+
+from fiboaitech.utils.logger import logger
+
+
+class BaseCheckpointStore(ABC):
+    """Abstract base class for checkpoint stores.
+
+    A checkpoint store keeps the state of completed steps of a run, e.g. node results of a flow or loops of an agent,
+    so a failed or interrupted run can be resumed instead of started over. States are grouped by run id and stored
+    pickled, so stores must only be shared with trusted processes.
+    """
+
+    def save(self, run_id: str, key: str, value: Any) -> bool:
+        """Save the state of a step of the run.
+
+        States that cannot be pickled are skipped with a warning, so checkpointing never fails the run.
+
+        Args:
+            run_id (str): Run id.
+            key (str): Step key.
+            value (Any): Step state.
+
+        Returns:
+            bool: Whether the state was saved.
+        """
+        try:
+            data = pickle.dumps(value)
+        except Exception as e:
+            logger.warning(f"Checkpoint '{key}' of run {run_id} skipped: state is not serializable. Error: {e}")
+            return False
+
+        self._put(run_id, key, data)
+        return True
+
+    def load(self, run_id: str, key: str) -> Any | None:
+        """Load the state of a step of the run.
+
+        Args:
+            run_id (str): Run id.
+            key (str): Step key.
+
+        Returns:
+            Any | None: Step state, or None if it was not saved.
+        """
+        data = self._get(run_id, key)
+        if data is None:
+            return None
+        return pickle.loads(data)  # nosec B301
+
+    def load_all(self, run_id: str, prefix: str = "") -> dict[str, Any]:
+        """Load the states of all steps of the run.
+
+        Args:
+            run_id (str): Run id.
+            prefix (str): Prefix of step keys to load.
+
+        Returns:
+            dict[str, Any]: Step states by step key.
+        """
+        return {
+            key: pickle.loads(data)  # nosec B301
+            for key, data in self._get_all(run_id).items()
+            if key.startswith(prefix)
+        }
+
+    def delete(self, run_id: str, key: str | None = None) -> None:
+        """Delete the state of a step, or all states of the run if no key is given.
+
+        Args:
+            run_id (str): Run id.
+            key (str | None): Step key.
+        """
+        self._delete(run_id, key)
+
+    @abstractmethod
+    def _put(self, run_id: str, key: str, data: bytes) -> None:
+        """Store serialized step state."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _get(self, run_id: str, key: str) -> bytes | None:
+        """Return serialized step state, or None if missing."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _get_all(self, run_id: str) -> dict[str, bytes]:
+        """Return serialized states of all steps of the run."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, run_id: str, key: str | None) -> None:
+        """Delete serialized step state, or all states of the run."""
+        raise NotImplementedError
+
+
+class InMemoryCheckpointStore(BaseCheckpointStore):
+    """Checkpoint store keeping states in process memory.
+
+    Resumes runs within the same process, e.g. after a failed node was fixed or its service recovered.
+    """
+
+    def __init__(self):
+        self._runs: dict[str, dict[str, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def _put(self, run_id: str, key: str, data: bytes) -> None:
+        with self._lock:
+            self._runs.setdefault(run_id, {})[key] = data
+
+    def _get(self, run_id: str, key: str) -> bytes | None:
+        with self._lock:
+            return self._runs.get(run_id, {}).get(key)
+
+    def _get_all(self, run_id: str) -> dict[str, bytes]:
+        with self._lock:
+            return dict(self._runs.get(run_id, {}))
+
+    def _delete(self, run_id: str, key: str | None) -> None:
+        with self._lock:
+            if key is None:
+                self._runs.pop(run_id, None)
+            else:
+                self._runs.get(run_id, {}).pop(key, None)
@@ -0,0 +1,63 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+from fiboaitech.checkpoints.base import BaseCheckpointStore
+
+CHECKPOINT_FILE_SUFFIX = ".pkl"
+
+
+class FileCheckpointStore(BaseCheckpointStore):
+    """Checkpoint store keeping states as files in a directory.
+
+    Each run has its own subdirectory with a file per step. Files are written to a temporary file first and then
+    renamed, so a run interrupted mid-write never leaves a partial checkpoint.
+
+    Args:
+        directory (str | Path): Directory of the checkpoints.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _get_run_dir(self, run_id: str) -> Path:
+        return self.directory / quote(run_id, safe="")
+
+    def _get_path(self, run_id: str, key: str) -> Path:
+        return self._get_run_dir(run_id) / f"{quote(key, safe='')}{CHECKPOINT_FILE_SUFFIX}"
+
+    def _put(self, run_id: str, key: str, data: bytes) -> None:
+        run_dir = self._get_run_dir(run_id)
+        run_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=run_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._get_path(run_id, key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _get(self, run_id: str, key: str) -> bytes | None:
+        try:
+            return self._get_path(run_id, key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _get_all(self, run_id: str) -> dict[str, bytes]:
+        run_dir = self._get_run_dir(run_id)
+        if not run_dir.is_dir():
+            return {}
+        return {
+            unquote(path.name.removesuffix(CHECKPOINT_FILE_SUFFIX)): path.read_bytes()
+            for path in run_dir.glob(f"*{CHECKPOINT_FILE_SUFFIX}")
+        }
+
+    def _delete(self, run_id: str, key: str | None) -> None:
+        if key is None:
+            shutil.rmtree(self._get_run_dir(run_id), ignore_errors=True)
+        else:
+            self._get_path(run_id, key).unlink(missing_ok=True)
@@ -0,0 +1,44 @@
+from typing import Any
+
+from fiboaitech.checkpoints.base import BaseCheckpointStore
+
+
+class RedisCheckpointStore(BaseCheckpointStore):
+    """Checkpoint store keeping states of a run in a Redis hash.
+
+    Args:
+        client (Any): Redis client, e.g. `redis.Redis`.
+        ttl (int | None): Time-to-live of run checkpoints in seconds, refreshed on every save.
+        key_prefix (str): Prefix of run hash keys.
+    """
+
+    def __init__(self, client: Any, ttl: int | None = None, key_prefix: str = "checkpoint"):
+        self.client = client
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+
+    def _get_run_key(self, run_id: str) -> str:
+        return f"{self.key_prefix}:{run_id}"
+
+    def _put(self, run_id: str, key: str, data: bytes) -> None:
+        run_key = self._get_run_key(run_id)
+        with self.client.pipeline() as pipe:
+            pipe.hset(run_key, key, data)
+            if self.ttl is not None:
+                pipe.expire(run_key, self.ttl)
+            pipe.execute()
+
+    def _get(self, run_id: str, key: str) -> bytes | None:
+        return self.client.hget(self._get_run_key(run_id), key)
+
+    def _get_all(self, run_id: str) -> dict[str, bytes]:
+        return {
+            key.decode() if isinstance(key, bytes) else key: data
+            for key, data in self.client.hgetall(self._get_run_key(run_id)).items()
+        }
+
+    def _delete(self, run_id: str, key: str | None) -> None:
+        if key is None:
+            self.client.delete(self._get_run_key(run_id))
+        else:
+            self.client.hdel(self._get_run_key(run_id), key)
@@ -0,0 +1,63 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+from fiboaitech.checkpoints.base import BaseCheckpointStore
+
+
+class SQLiteCheckpointStore(BaseCheckpointStore):
+    """Checkpoint store keeping states in a SQLite database.
+
+    Args:
+        path (str | Path): Path of the database file, or ":memory:" for an in-memory database.
+        table_name (str): Name of the checkpoints table.
+    """
+
+    def __init__(self, path: str | Path = ":memory:", table_name: str = "checkpoints"):
+        if not table_name.isidentifier():
+            raise ValueError(f"Invalid checkpoints table name '{table_name}'.")
+
+        self.path = str(path)
+        self.table_name = table_name
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table_name} "  # nosec B608
+                "(run_id TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, PRIMARY KEY (run_id, key))"
+            )
+
+    def _put(self, run_id: str, key: str, data: bytes) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (run_id, key, value) VALUES (?, ?, ?)",  # nosec B608
+                (run_id, key, data),
+            )
+
+    def _get(self, run_id: str, key: str) -> bytes | None:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value FROM {self.table_name} WHERE run_id = ? AND key = ?", (run_id, key)  # nosec B608
+            ).fetchone()
+        return row[0] if row else None
+
+    def _get_all(self, run_id: str) -> dict[str, bytes]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT key, value FROM {self.table_name} WHERE run_id = ?", (run_id,)  # nosec B608
+            ).fetchall()
+        return dict(rows)
+
+    def _delete(self, run_id: str, key: str | None) -> None:
+        with self._lock, self._connection:
+            if key is None:
+                self._connection.execute(f"DELETE FROM {self.table_name} WHERE run_id = ?", (run_id,))  # nosec B608
+            else:
+                self._connection.execute(
+                    f"DELETE FROM {self.table_name} WHERE run_id = ? AND key = ?", (run_id, key)  # nosec B608
+                )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -1 +1,2 @@
 from .base import BaseTracingClient
+from .batch import BatchTracingClient, BatchTracingClientMetrics, TraceDropPolicy
@@ -0,0 +1,222 @@
+import atexit
+import enum
+import threading
+from collections import deque
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+
+from fiboaitech.clients.base import BaseTracingClient
+from fiboaitech.utils.logger import logger
+
+if TYPE_CHECKING:
+    from fiboaitech.callbacks.tracing import Run
+
+
+class TraceDropPolicy(str, enum.Enum):
+    """Enumeration for policies applied to new runs when the export queue is full.
+
+    Attributes:
+        BLOCK: Blocks the caller until the queue has room, up to `block_timeout`, then drops the new run.
+        DROP_NEW: Drops the new run.
+        DROP_OLDEST: Drops the oldest queued run to make room for the new one.
+    """
+    BLOCK = "block"
+    DROP_NEW = "drop_new"
+    DROP_OLDEST = "drop_oldest"
+
+
+class BatchTracingClientMetrics(BaseModel):
+    """Snapshot of the trace exporter counters.
+
+    Attributes:
+        max_queue_size (int): Maximum number of runs waiting for export.
+        queued (int): Number of runs waiting for export.
+        in_flight (int): Number of runs of the batch being exported.
+        exported (int): Total number of runs passed to the tracing client.
+        dropped (int): Total number of runs dropped because the queue was full.
+        failed (int): Total number of runs in batches the tracing client failed to export.
+        batches (int): Total number of exported batches.
+    """
+    max_queue_size: int
+    queued: int = 0
+    in_flight: int = 0
+    exported: int = 0
+    dropped: int = 0
+    failed: int = 0
+    batches: int = 0
+
+
+class BatchTracingClient(BaseTracingClient):
+    """Tracing client exporting runs in batches on a background thread.
+
+    Runs passed to `trace` are queued and sent to the wrapped client in batches of up to `max_batch_size` runs,
+    or every `flush_interval` seconds, whichever comes first. The queue is bounded by `max_queue_size`; when the
+    wrapped client can't keep up, `drop_policy` decides whether callers wait or runs are dropped. Queued runs are
+    exported on `shutdown`, which is also registered to run at interpreter exit.
+
+    Used as the client of `TracingCallbackHandler`, it makes the handler export finished runs as they complete and
+    drop them from memory.
+
+    Args:
+        client (BaseTracingClient): Tracing client receiving the batches.
+        max_batch_size (int, optional): Maximum number of runs in a batch. Defaults to 100.
+        max_queue_size (int, optional): Maximum number of runs waiting for export. Defaults to 2048.
+        flush_interval (float, optional): Maximum seconds a run waits for a batch to fill. Defaults to 1.
+        drop_policy (TraceDropPolicy, optional): Policy for new runs when the queue is full.
+            Defaults to TraceDropPolicy.BLOCK.
+        block_timeout (float, optional): Seconds the BLOCK policy waits for room in the queue. Defaults to 1.
+        name (str, optional): Name of the export thread.
+    """
+
+    def __init__(
+        self,
+        client: BaseTracingClient,
+        max_batch_size: int = 100,
+        max_queue_size: int = 2048,
+        flush_interval: float = 1,
+        drop_policy: TraceDropPolicy = TraceDropPolicy.BLOCK,
+        block_timeout: float = 1,
+        name: str = "fiboaitech-trace-exporter",
+    ):
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_queue_size = max_queue_size
+        self.flush_interval = flush_interval
+        self.drop_policy = drop_policy
+        self.block_timeout = block_timeout
+
+        self._queue: deque["Run"] = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._flush_waiters = 0
+        self._in_flight = 0
+        self._exported = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    @property
+    def metrics(self) -> BatchTracingClientMetrics:
+        """Snapshot of the exporter counters."""
+        with self._condition:
+            return BatchTracingClientMetrics(
+                max_queue_size=self.max_queue_size,
+                queued=len(self._queue),
+                in_flight=self._in_flight,
+                exported=self._exported,
+                dropped=self._dropped,
+                failed=self._failed,
+                batches=self._batches,
+            )
+
+    def _has_room(self) -> bool:
+        return len(self._queue) < self.max_queue_size
+
+    def _is_batch_ready(self) -> bool:
+        return (
+            len(self._queue) >= self.max_batch_size
+            or not self._has_room()
+            or self._closed
+            or (self._flush_waiters > 0 and len(self._queue) > 0)
+        )
+
+    def _enqueue(self, run: "Run") -> None:
+        """Adds the run to the queue, applying the drop policy if it is full. Must be called under the lock."""
+        if not self._has_room():
+            match self.drop_policy:
+                case TraceDropPolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self._dropped += 1
+                case TraceDropPolicy.DROP_NEW:
+                    self._dropped += 1
+                    return
+                case TraceDropPolicy.BLOCK:
+                    if not self._condition.wait_for(
+                        lambda: self._has_room() or self._closed, timeout=self.block_timeout
+                    ) or not self._has_room():
+                        self._dropped += 1
+                        return
+
+        self._queue.append(run)
+
+    def trace(self, runs: list["Run"]) -> None:
+        """Queue the runs for export. After shutdown, runs are sent to the wrapped client directly.
+
+        Args:
+            runs (list[Run]): Runs to export.
+        """
+        with self._condition:
+            if not self._closed:
+                for run in runs:
+                    self._enqueue(run)
+                self._condition.notify_all()
+                return
+
+        self._export(list(runs))
+
+    def _export(self, batch: list["Run"]) -> None:
+        try:
+            self.client.trace(batch)
+        except Exception as e:
+            logger.error(f"Tracing client {self.client.__class__.__name__} failed to export {len(batch)} runs: {e}")
+            with self._condition:
+                self._failed += len(batch)
+        else:
+            with self._condition:
+                self._exported += len(batch)
+                self._batches += 1
+
+    def _run(self) -> None:
+        """Exports batches until the client is shut down and the queue is drained."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(self._is_batch_ready, timeout=self.flush_interval)
+                batch = [self._queue.popleft() for _ in range(min(self.max_batch_size, len(self._queue)))]
+                if not batch and self._closed:
+                    return
+                self._in_flight = len(batch)
+                # Wake up callers blocked on a full queue
+                self._condition.notify_all()
+
+            if batch:
+                self._export(batch)
+
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Export queued runs without waiting for the batch to fill.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait for the export. Defaults to None (wait forever).
+
+        Returns:
+            bool: Whether all runs queued before the call were exported.
+        """
+        with self._condition:
+            self._flush_waiters += 1
+            self._condition.notify_all()
+            try:
+                return self._condition.wait_for(
+                    lambda: (not self._queue and not self._in_flight) or not self._thread.is_alive(), timeout=timeout
+                ) and not self._queue
+            finally:
+                self._flush_waiters -= 1
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Export queued runs and stop the export thread.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait for the export. Defaults to None (wait forever).
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        atexit.unregister(self.shutdown)
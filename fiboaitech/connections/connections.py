@@ -12,6 +12,7 @@ from fiboaitech.utils.logger import logger
 
 if TYPE_CHECKING:
     from chromadb import ClientAPI as ChromaClient
+    from openai import AsyncOpenAI as AsyncOpenAIClient
     from openai import OpenAI as OpenAIClient
     from pinecone import Pinecone as PineconeClient
     from qdrant_client import QdrantClient
@@ -205,6 +206,19 @@ class OpenAI(BaseApiKeyConnection):
         logger.debug("Connected to OpenAI")
         return openai_client
 
+    def connect_async(self) -> "AsyncOpenAIClient":
+        """
+        Connects to the OpenAI service with an asyncio compatible client.
+
+        Returns:
+            AsyncOpenAIClient: An instance of the AsyncOpenAIClient connected with the specified API key.
+        """
+        # Import in runtime to save memory
+        from openai import AsyncOpenAI as AsyncOpenAIClient
+        openai_client = AsyncOpenAIClient(api_key=self.api_key)
+        logger.debug("Connected to OpenAI with async client")
+        return openai_client
+
 
 class Anthropic(BaseApiKeyConnection):
     api_key: str = Field(default_factory=partial(get_env_var, "ANTHROPIC_API_KEY"))
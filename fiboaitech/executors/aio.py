@@ -0,0 +1,150 @@
+import asyncio
+import time
+
+from fiboaitech.executors.base import BaseExecutor
+from fiboaitech.nodes.node import NodeReadyToRun
+from fiboaitech.runnables import RunnableConfig, RunnableResult, RunnableStatus
+from fiboaitech.utils.logger import logger
+from fiboaitech.utils.profiling import NodeRunProfile
+
+
+class AsyncExecutor(BaseExecutor):
+    """
+    An asyncio executor that runs ready nodes as tasks in the current event loop.
+
+    Nodes with native async support are awaited directly, sync-only nodes run in worker threads.
+
+    Args:
+        max_workers (int, optional): The maximum number of concurrently running nodes. Defaults to None (no limit).
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        super().__init__(max_workers=max_workers)
+        self.semaphore = asyncio.Semaphore(max_workers) if max_workers else None
+        self.node_by_task = {}
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shuts down the executor.
+
+        Args:
+            wait (bool, optional): Whether to wait for pending tasks to complete. If False, pending tasks
+                are cancelled. Defaults to True.
+        """
+        if not wait:
+            for task in self.node_by_task:
+                task.cancel()
+            self.node_by_task = {}
+
+    def execute(
+        self,
+        ready_nodes: list[NodeReadyToRun],
+        config: RunnableConfig = None,
+        **kwargs,
+    ) -> dict[str, RunnableResult]:
+        """
+        Synchronous execution is not supported by the async executor.
+
+        Raises:
+            NotImplementedError: Always. Use `aexecute` instead.
+        """
+        raise NotImplementedError("AsyncExecutor supports only asynchronous execution. Use 'aexecute' instead.")
+
+    async def aexecute(
+        self,
+        ready_nodes: list[NodeReadyToRun],
+        config: RunnableConfig = None,
+        **kwargs,
+    ) -> dict[str, RunnableResult]:
+        """
+        Schedules the given ready nodes and returns results of the first completed ones.
+
+        Args:
+            ready_nodes (list[NodeReadyToRun]): List of nodes ready to run.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict[str, RunnableResult]: A dictionary of node IDs and their execution results.
+        """
+        self.run_nodes(ready_nodes=ready_nodes, config=config, **kwargs)
+        if not self.node_by_task:
+            return {}
+
+        completed_node_tasks, _ = await asyncio.wait(
+            self.node_by_task.keys(), return_when=asyncio.FIRST_COMPLETED
+        )
+        return self.complete_nodes(completed_node_tasks=completed_node_tasks)
+
+    def run_nodes(
+        self,
+        ready_nodes: list[NodeReadyToRun],
+        config: RunnableConfig = None,
+        **kwargs,
+    ):
+        """
+        Creates tasks for ready nodes.
+
+        Args:
+            ready_nodes (list[NodeReadyToRun]): List of nodes ready to run.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+        """
+        for ready_node in ready_nodes:
+            if ready_node.is_ready:
+                task = asyncio.create_task(self.run_node(ready_node=ready_node, config=config, **kwargs))
+                self.node_by_task[task] = ready_node.node
+            else:
+                logger.error(
+                    f"Node {ready_node.node.name} - {ready_node.node.id}: not ready to run."
+                )
+
+    def complete_nodes(self, completed_node_tasks: set[asyncio.Task]) -> dict[str, RunnableResult]:
+        """
+        Processes completed node tasks and returns their results.
+
+        Args:
+            completed_node_tasks (set[asyncio.Task]): Set of completed node tasks.
+
+        Returns:
+            dict[str, RunnableResult]: A dictionary of node IDs and their execution results.
+        """
+        results = {}
+        for task in completed_node_tasks:
+            node = self.node_by_task.pop(task)
+            try:
+                node_result: RunnableResult = task.result()
+            except Exception as e:
+                logger.error(
+                    f"Node {node.name} - {node.id}: execution failed due the unexpected error. Error: {e}"
+                )
+                node_result = RunnableResult(status=RunnableStatus.FAILURE)
+
+            results[node.id] = node_result
+
+        return results
+
+    async def run_node(self, ready_node: NodeReadyToRun, config: RunnableConfig = None, **kwargs) -> RunnableResult:
+        """
+        Runs ready node respecting the concurrency limit.
+
+        Args:
+            ready_node (NodeReadyToRun): node ready to run.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the node execution.
+        """
+        node_run = ready_node.node.arun(
+            input_data=ready_node.input_data,
+            config=config,
+            depends_result=ready_node.depends_result,
+            run_profile=NodeRunProfile(ready_at=ready_node.ready_at, submitted_at=time.perf_counter()),
+            **kwargs,
+        )
+        if self.semaphore is None:
+            return await node_run
+
+        async with self.semaphore:
+            return await node_run
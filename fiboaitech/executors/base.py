@@ -10,8 +10,12 @@ class BaseExecutor(ABC):
 
     Attributes:
         max_workers (int | None): Maximum number of concurrent workers. None means no limit.
+        dispatch_on_completion (bool): Whether nodes can be submitted from completion callbacks of other nodes
+            with `run_node`, allowing the flow to use the event-driven scheduler.
     """
 
+    dispatch_on_completion: bool = False
+
     def __init__(self, max_workers: int | None = None):
         """
         Initialize the BaseExecutor.
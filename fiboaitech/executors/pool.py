@@ -1,38 +1,56 @@
 import os
+import time
+from collections import deque
 from concurrent import futures
-
-import jsonpickle
+from contextvars import Context, copy_context
+from functools import partial
+from typing import Any, Generator
 
 from fiboaitech.executors.base import BaseExecutor
-from fiboaitech.nodes.node import Node, NodeReadyToRun
+from fiboaitech.executors.process_pool import NodeProcessPool, get_default_node_process_pool
+from fiboaitech.executors.worker_pool import (
+    WorkerPool,
+    WorkerPoolSaturatedError,
+    get_default_delayed_calls,
+    get_default_worker_pool,
+)
+from fiboaitech.nodes.node import NodeReadyToRun
 from fiboaitech.runnables import RunnableConfig, RunnableResult, RunnableStatus
 from fiboaitech.utils.logger import logger
+from fiboaitech.utils.profiling import NodeRunProfile
 
 MAX_WORKERS_THREAD_POOL_EXECUTOR = 8
 MAX_WORKERS_PROCESS_POOL_EXECUTOR = os.cpu_count()
+RESUBMIT_RUN_STEP_INTERVAL_SECONDS = 0.05
 
 
 class PoolExecutor(BaseExecutor):
     """
-    A pool executor that manages concurrent execution of nodes using either ThreadPoolExecutor or
-    ProcessPoolExecutor.
+    A pool executor that manages concurrent execution of nodes using either ThreadPoolExecutor,
+    ProcessPoolExecutor or a shared pool.
+
+    Nodes above the `max_workers` limit wait in the executor until running nodes complete. In thread pools, nodes
+    waiting to retry their execution release the thread and are submitted again when the retry delay passes.
 
     Args:
-        pool_executor (type): The type of pool executor to use (ThreadPoolExecutor or
-            ProcessPoolExecutor).
-        max_workers (int, optional): The maximum number of workers in the pool. Defaults to None.
+        pool_executor (type | WorkerPool | NodeProcessPool): The type of pool executor to create
+            (ThreadPoolExecutor or ProcessPoolExecutor) or a shared pool to submit nodes to. Shared pool is not
+            shut down with the executor.
+        max_workers (int, optional): The maximum number of concurrently running nodes. Defaults to None.
     """
 
     def __init__(
         self,
         pool_executor: (
-            type[futures.ThreadPoolExecutor] | type[futures.ProcessPoolExecutor]
+            type[futures.ThreadPoolExecutor] | type[futures.ProcessPoolExecutor] | WorkerPool | NodeProcessPool
         ),
         max_workers: int | None = None,
     ):
         super().__init__(max_workers=max_workers)
-        self.executor = pool_executor(max_workers=max_workers)
+        self.is_shared_executor = isinstance(pool_executor, (WorkerPool, NodeProcessPool))
+        self.executor = pool_executor if self.is_shared_executor else pool_executor(max_workers=max_workers)
         self.node_by_future = {}
+        self.pending_nodes = deque()
 
     def shutdown(self, wait: bool = True):
         """
@@ -41,7 +59,14 @@ class PoolExecutor(BaseExecutor):
         Args:
             wait (bool, optional): Whether to wait for pending futures to complete. Defaults to True.
         """
-        self.executor.shutdown(wait=wait)
+        self.pending_nodes.clear()
+        if not self.is_shared_executor:
+            self.executor.shutdown(wait=wait)
+        elif wait:
+            futures.wait(self.node_by_future.keys())
+        else:
+            for future in self.node_by_future:
+                future.cancel()
 
     def execute(
         self,
@@ -84,13 +109,17 @@ class PoolExecutor(BaseExecutor):
         """
         for ready_node in ready_nodes:
             if ready_node.is_ready:
-                future = self.run_node(ready_node=ready_node, config=config, **kwargs)
-                self.node_by_future[future] = ready_node.node
+                self.pending_nodes.append(ready_node)
             else:
                 logger.error(
                     f"Node {ready_node.node.name} - {ready_node.node.id}: not ready to run."
                 )
 
+        while self.pending_nodes and (not self.max_workers or len(self.node_by_future) < self.max_workers):
+            ready_node = self.pending_nodes.popleft()
+            future = self.run_node(ready_node=ready_node, config=config, **kwargs)
+            self.node_by_future[future] = ready_node.node
+
     def complete_nodes(
         self, completed_node_futures: list[futures.Future]
     ) -> dict[str, RunnableResult]:
@@ -127,82 +156,148 @@ class PoolExecutor(BaseExecutor):
             config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
             **kwargs: Additional keyword arguments.
         """
-        return self.executor.submit(
-            ready_node.node.run,
+        run_kwargs = dict(
             input_data=ready_node.input_data,
             config=config,
             depends_result=ready_node.depends_result,
+            run_profile=NodeRunProfile(ready_at=ready_node.ready_at, submitted_at=time.perf_counter()),
             **kwargs,
         )
+        if isinstance(self.executor, futures.ProcessPoolExecutor):
+            return self.executor.submit(ready_node.node.run, **run_kwargs)
+
+        future = futures.Future()
+        # Run the node in a copy of the flow context, so its run state does not outlive it in the worker thread
+        self._submit_run_step(future, copy_context(), ready_node.node.iter_run(**run_kwargs))
+        return future
+
+    def _submit_run_step(self, future: futures.Future, context: Context, steps: Generator) -> None:
+        """Submits the first step of the node run, failing the run if the pool rejects it."""
+        try:
+            step_future = self.executor.submit(self._run_step, future, context, steps)
+        except Exception as e:
+            self._stop_run(future, context, steps, e)
+        else:
+            step_future.add_done_callback(partial(self._complete_run_step, future, context, steps))
+
+    def _resubmit_run_step(
+        self, future: futures.Future, context: Context, steps: Generator, waiting_since: float | None = None
+    ) -> None:
+        """
+        Submits the next step of the node run once its retry delay has passed.
+
+        Runs in the delayed calls thread, so it never blocks on a saturated pool: while no slot is free, the
+        submission is scheduled again, failing the run once the pool `submit_timeout` is exceeded.
+        """
+        try:
+            if isinstance(self.executor, WorkerPool):
+                step_future = self.executor.try_submit(self._run_step, future, context, steps)
+            else:
+                step_future = self.executor.submit(self._run_step, future, context, steps)
+        except Exception as e:
+            self._stop_run(future, context, steps, e)
+            return
+
+        if step_future is not None:
+            step_future.add_done_callback(partial(self._complete_run_step, future, context, steps))
+            return
+
+        waiting_since = waiting_since or time.monotonic()
+        submit_timeout = self.executor.submit_timeout
+        if submit_timeout is not None and time.monotonic() - waiting_since >= submit_timeout:
+            error = WorkerPoolSaturatedError(f"Worker pool '{self.executor.name}' is saturated.")
+            self._stop_run(future, context, steps, error)
+            return
+        get_default_delayed_calls().call_later(
+            RESUBMIT_RUN_STEP_INTERVAL_SECONDS, self._resubmit_run_step, future, context, steps, waiting_since
+        )
+
+    @staticmethod
+    def _run_step(future: futures.Future, context: Context, steps: Generator) -> tuple[bool, Any]:
+        """
+        Runs the node until it completes or waits to retry.
+
+        Returns:
+            tuple[bool, Any]: Whether the run completed, and its result or the retry delay.
+        """
+        if not future.running() and not future.set_running_or_notify_cancel():
+            return True, None
+        try:
+            return False, context.run(next, steps)
+        except StopIteration as e:
+            return True, e.value
+
+    def _complete_run_step(
+        self, future: futures.Future, context: Context, steps: Generator, step_future: futures.Future
+    ) -> None:
+        """
+        Completes the node run or schedules its next step after the retry delay.
+
+        Runs as a done callback of the step, after the pool task has finished, so nodes dispatched on the run
+        completion are submitted as regular pool tasks.
+        """
+        if future.cancelled():
+            return
+        if step_future.cancelled():
+            self._stop_run(future, context, steps, futures.CancelledError())
+            return
+        if (error := step_future.exception()) is not None:
+            future.set_exception(error)
+            return
+
+        completed, value = step_future.result()
+        if completed:
+            future.set_result(value)
+        else:
+            get_default_delayed_calls().call_later(value, self._resubmit_run_step, future, context, steps)
+
+    @staticmethod
+    def _stop_run(future: futures.Future, context: Context, steps: Generator, error: BaseException) -> None:
+        """Closes the paused node run in its context and fails its future."""
+        try:
+            context.run(steps.close)
+        except Exception as close_error:
+            logger.error(f"Failed to stop the node run: {close_error}")
+        if future.running() or future.set_running_or_notify_cancel():
+            future.set_exception(error)
 
 
 class ThreadExecutor(PoolExecutor):
     """
-    A thread-based pool executor.
+    A thread-based pool executor running nodes in a long-lived worker pool.
 
     Args:
-        max_workers (int, optional): The maximum number of worker threads. Defaults to None.
+        max_workers (int, optional): The maximum number of concurrently running nodes. Defaults to None.
+        worker_pool (WorkerPool, optional): Worker pool to run nodes in. Defaults to the process-wide pool.
     """
 
-    def __init__(self, max_workers: int | None = None):
+    dispatch_on_completion = True
+
+    def __init__(self, max_workers: int | None = None, worker_pool: WorkerPool | None = None):
         max_workers = max_workers or MAX_WORKERS_THREAD_POOL_EXECUTOR
         super().__init__(
-            pool_executor=futures.ThreadPoolExecutor, max_workers=max_workers
+            pool_executor=worker_pool or get_default_worker_pool(), max_workers=max_workers
         )
 
 
 class ProcessExecutor(PoolExecutor):
     """
-    A process-based pool executor.
+    A process-based pool executor running nodes in long-lived worker processes.
+
+    Node definitions are registered with the workers once, per run only input data and dependency results
+    are sent. Nodes and run configuration must be picklable.
 
     Args:
-        max_workers (int, optional): The maximum number of worker processes. Defaults to None.
+        max_workers (int, optional): The maximum number of concurrently running nodes. Defaults to None.
+        process_pool (NodeProcessPool, optional): Process pool to run nodes in. Defaults to the process-wide pool.
     """
 
-    def __init__(self, max_workers: int | None = None):
+    def __init__(self, max_workers: int | None = None, process_pool: NodeProcessPool | None = None):
         max_workers = max_workers or MAX_WORKERS_PROCESS_POOL_EXECUTOR
         super().__init__(
-            pool_executor=futures.ProcessPoolExecutor, max_workers=max_workers
+            pool_executor=process_pool or get_default_node_process_pool(), max_workers=max_workers
         )
 
-    @staticmethod
-    def serialize_node(node: Node) -> str:
-        """
-        Serializes node data.
-
-        Args:
-            node (Node): Node instance.
-
-        Returns:
-            str: Serialized node data
-        """
-        return jsonpickle.encode(node)
-
-    @staticmethod
-    def deserialize_node(node_data: str) -> Node:
-        """
-        Deserializes node data.
-
-        Args:
-            node_data (str): Serialized node data.
-
-        Returns:
-            Node: Node instance.
-        """
-        return jsonpickle.decode(node_data)  # nosec
-
-    @classmethod
-    def _run_node(cls, node_data: str, **kwargs) -> RunnableResult:
-        """
-        Deserializes node data and runs the node.
-
-        Args:
-            node_data (str): Serialized node data.
-            **kwargs: Additional keyword arguments.
-        """
-        node_instance = cls.deserialize_node(node_data)
-        return node_instance.run(**kwargs)
-
     def run_node(self, ready_node: NodeReadyToRun, config: RunnableConfig = None, **kwargs):
         """
         Submits ready node for execution.
@@ -212,11 +307,11 @@ class ProcessExecutor(PoolExecutor):
             config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
             **kwargs: Additional keyword arguments.
         """
-        return self.executor.submit(
-            self._run_node,
-            node_data=self.serialize_node(ready_node.node),
+        return self.executor.submit_node(
+            ready_node.node,
             input_data=ready_node.input_data,
-            config=config,
             depends_result=ready_node.depends_result,
+            config=config,
+            run_profile=NodeRunProfile(ready_at=ready_node.ready_at, submitted_at=time.perf_counter()),
             **kwargs,
         )
@@ -0,0 +1,352 @@
+import atexit
+import hashlib
+import os
+import pickle  # nosec
+import threading
+from concurrent import futures
+from io import BytesIO
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from pydantic import BaseModel
+
+from fiboaitech.nodes.node import Node
+from fiboaitech.runnables import RunnableConfig, RunnableResult
+from fiboaitech.utils.env import get_env_var
+from fiboaitech.utils.logger import logger
+
+PROCESS_POOL_MAX_WORKERS = int(get_env_var("FIBOAITECH_PROCESS_POOL_MAX_WORKERS", os.cpu_count() or 1))
+PROCESS_POOL_START_METHOD = get_env_var("FIBOAITECH_PROCESS_POOL_START_METHOD", "spawn")
+SHARED_MEMORY_MIN_SIZE = int(get_env_var("FIBOAITECH_SHARED_MEMORY_MIN_SIZE", 1024 * 1024))
+
+# Node definitions loaded by the current worker process by node key
+_worker_nodes: dict[str, Node] = {}
+
+
+class SharedBytes(BaseModel):
+    """
+    Reference to a bytes payload placed in shared memory instead of being pickled to the worker process.
+
+    Attributes:
+        segment_name (str): Name of the shared memory segment.
+        size (int): Size of the payload in bytes.
+        is_io (bool): Whether the payload was a BytesIO object.
+        io_name (str | None): Name attribute of the BytesIO object.
+    """
+
+    segment_name: str
+    size: int
+    is_io: bool = False
+    io_name: str | None = None
+
+    def load(self) -> bytes | BytesIO:
+        """Reads the payload from shared memory."""
+        segment = SharedMemory(name=self.segment_name)
+        try:
+            data = bytes(segment.buf[: self.size])
+        finally:
+            segment.close()
+
+        if not self.is_io:
+            return data
+        data_io = BytesIO(data)
+        if self.io_name is not None:
+            data_io.name = self.io_name
+        return data_io
+
+
+def share_bytes(data: Any, segments: list[SharedMemory]) -> Any:
+    """
+    Replaces large bytes and BytesIO payloads in the data with shared memory references.
+
+    Args:
+        data (Any): Data to process. Dicts, lists and tuples are processed recursively.
+        segments (list[SharedMemory]): Collects created segments, owned by the caller.
+
+    Returns:
+        Any: Data with shared memory references.
+    """
+    if isinstance(data, dict):
+        return {key: share_bytes(value, segments) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return type(data)(share_bytes(value, segments) for value in data)
+
+    if isinstance(data, BytesIO):
+        with data.getbuffer() as payload:
+            return _share_payload(data, payload, segments)
+    if isinstance(data, (bytes, bytearray)):
+        with memoryview(data) as payload:
+            return _share_payload(data, payload, segments)
+    return data
+
+
+def _share_payload(data: bytes | bytearray | BytesIO, payload: memoryview, segments: list[SharedMemory]) -> Any:
+    """Copies the payload to a new shared memory segment if it is large enough."""
+    if payload.nbytes < SHARED_MEMORY_MIN_SIZE:
+        return data
+
+    segment = SharedMemory(create=True, size=payload.nbytes)
+    segment.buf[: payload.nbytes] = payload
+    segments.append(segment)
+    return SharedBytes(
+        segment_name=segment.name,
+        size=payload.nbytes,
+        is_io=isinstance(data, BytesIO),
+        io_name=getattr(data, "name", None),
+    )
+
+
+def load_shared_bytes(data: Any) -> Any:
+    """
+    Restores payloads replaced by `share_bytes`.
+
+    Args:
+        data (Any): Data with shared memory references.
+
+    Returns:
+        Any: Data with bytes and BytesIO payloads.
+    """
+    if isinstance(data, dict):
+        return {key: load_shared_bytes(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return type(data)(load_shared_bytes(value) for value in data)
+    if isinstance(data, SharedBytes):
+        return data.load()
+    return data
+
+
+def _get_node_id(node_key: str) -> str:
+    """Returns the node id part of the node key."""
+    return node_key.rsplit(":", 1)[0]
+
+
+def _get_worker_node(node_key: str, segment_name: str, size: int) -> Node:
+    """
+    Returns the registered node, loading it from shared memory on the first run in the worker process.
+
+    Previous definitions of the node are dropped when a changed definition is loaded.
+    """
+    if (node := _worker_nodes.get(node_key)) is None:
+        segment = SharedMemory(name=segment_name)
+        try:
+            node = pickle.loads(segment.buf[:size])  # nosec
+        finally:
+            segment.close()
+        node.init_components()
+
+        node_id = _get_node_id(node_key)
+        for stale_key in [key for key in _worker_nodes if _get_node_id(key) == node_id]:
+            del _worker_nodes[stale_key]
+        _worker_nodes[node_key] = node
+    return node
+
+
+def _run_worker_node(
+    node_key: str,
+    segment_name: str,
+    size: int,
+    input_data: Any,
+    depends_result: dict[str, RunnableResult],
+    config: RunnableConfig = None,
+    **kwargs,
+) -> RunnableResult:
+    """Runs the registered node in the worker process."""
+    node = _get_worker_node(node_key=node_key, segment_name=segment_name, size=size)
+    return node.run(
+        input_data=load_shared_bytes(input_data),
+        config=config,
+        depends_result=depends_result,
+        **kwargs,
+    )
+
+
+def _warm_up_worker() -> int:
+    """Starts the worker process and returns its pid."""
+    return os.getpid()
+
+
+class NodeProcessPool:
+    """
+    Long-lived process pool that runs nodes registered once per node definition.
+
+    A node is pickled once into shared memory, keyed by node id and a hash of its definition. Each worker
+    process loads it and initializes its components on the first run, so only input data and dependency results
+    are sent per run. Large bytes payloads are passed through shared memory.
+
+    Node definitions are expected to stay unchanged after the first run; call `register_node` to publish
+    a changed node. The shared memory of the previous definition is freed once runs submitted with it finish,
+    and workers drop the previous definition when they load the new one.
+
+    Args:
+        max_workers (int, optional): Number of worker processes. Defaults to PROCESS_POOL_MAX_WORKERS.
+        start_method (str, optional): Multiprocessing start method. Defaults to PROCESS_POOL_START_METHOD.
+    """
+
+    def __init__(self, max_workers: int | None = None, start_method: str | None = None):
+        self.max_workers = max_workers or PROCESS_POOL_MAX_WORKERS
+        self._executor = futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=get_context(start_method or PROCESS_POOL_START_METHOD),
+        )
+        self._segments_by_key: dict[str, tuple[SharedMemory, int]] = {}
+        self._registered_nodes: dict[str, tuple[Node, str]] = {}
+        self._runs_by_key: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def register_node(self, node: Node) -> str:
+        """
+        Publishes the node definition to the worker processes.
+
+        Args:
+            node (Node): Node to register.
+
+        Returns:
+            str: Key of the registered node definition.
+        """
+        data = pickle.dumps(node, protocol=pickle.HIGHEST_PROTOCOL)
+        node_key = f"{node.id}:{hashlib.sha256(data).hexdigest()[:16]}"
+
+        with self._lock:
+            if node_key not in self._segments_by_key:
+                segment = SharedMemory(create=True, size=len(data))
+                segment.buf[: len(data)] = data
+                self._segments_by_key[node_key] = (segment, len(data))
+            _, previous_key = self._registered_nodes.get(node.id, (None, None))
+            self._registered_nodes[node.id] = (node, node_key)
+            if previous_key is not None and previous_key != node_key:
+                self._release_stale_key(previous_key)
+
+        logger.debug(f"Node {node.name} - {node.id}: registered in process pool with key {node_key}.")
+        return node_key
+
+    def get_node_key(self, node: Node) -> str:
+        """
+        Returns the key of the node definition, registering the node on first use.
+
+        Args:
+            node (Node): Node instance.
+
+        Returns:
+            str: Key of the registered node definition.
+        """
+        with self._lock:
+            registered_node, node_key = self._registered_nodes.get(node.id, (None, None))
+        if registered_node is node:
+            return node_key
+        return self.register_node(node)
+
+    def submit_node(
+        self,
+        node: Node,
+        input_data: Any,
+        depends_result: dict[str, RunnableResult],
+        config: RunnableConfig = None,
+        **kwargs,
+    ) -> futures.Future:
+        """
+        Submits the node run to a worker process.
+
+        Args:
+            node (Node): Node to run.
+            input_data (Any): Input data for the node.
+            depends_result (dict[str, RunnableResult]): Results of the node dependencies.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            futures.Future: Future of the node result.
+        """
+        node_key = self.get_node_key(node)
+        with self._lock:
+            if node_key not in self._segments_by_key:
+                # The node was registered again by a concurrent caller
+                node_key = None
+            else:
+                segment, size = self._segments_by_key[node_key]
+                self._runs_by_key[node_key] = self._runs_by_key.get(node_key, 0) + 1
+        if node_key is None:
+            return self.submit_node(node, input_data, depends_result, config=config, **kwargs)
+
+        shared_segments = []
+        try:
+            future = self._executor.submit(
+                _run_worker_node,
+                node_key,
+                segment.name,
+                size,
+                input_data=share_bytes(input_data, shared_segments),
+                depends_result=depends_result,
+                config=config,
+                **kwargs,
+            )
+        except Exception:
+            self._release_segments(shared_segments)
+            self._finish_run(node_key)
+            raise
+
+        future.add_done_callback(lambda _: self._finish_run(node_key, shared_segments))
+        return future
+
+    def _finish_run(self, node_key: str, shared_segments: list[SharedMemory] | None = None) -> None:
+        """Frees the run payloads and the node definition if it was replaced and has no runs left."""
+        if shared_segments:
+            self._release_segments(shared_segments)
+        with self._lock:
+            self._runs_by_key[node_key] -= 1
+            if not self._runs_by_key[node_key]:
+                del self._runs_by_key[node_key]
+                _, registered_key = self._registered_nodes.get(_get_node_id(node_key), (None, None))
+                if registered_key != node_key:
+                    self._release_stale_key(node_key)
+
+    def _release_stale_key(self, node_key: str) -> None:
+        """Frees the replaced node definition unless its runs are pending. Must be called under the lock."""
+        if self._runs_by_key.get(node_key) or (entry := self._segments_by_key.pop(node_key, None)) is None:
+            return
+        self._release_segments([entry[0]])
+        logger.debug(f"Node definition {node_key}: released from process pool.")
+
+    @staticmethod
+    def _release_segments(segments: list[SharedMemory]) -> None:
+        """Frees shared memory segments of the finished run."""
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+    def warm_up(self) -> None:
+        """Starts all worker processes in advance."""
+        futures.wait([self._executor.submit(_warm_up_worker) for _ in range(self.max_workers)])
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the worker processes and frees registered node definitions.
+
+        Args:
+            wait (bool, optional): Whether to wait for running node runs to complete. Defaults to True.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        with self._lock:
+            self._release_segments([segment for segment, _ in self._segments_by_key.values()])
+            self._segments_by_key = {}
+            self._registered_nodes = {}
+
+
+_default_node_process_pool: NodeProcessPool | None = None
+_default_node_process_pool_lock = threading.Lock()
+
+
+def get_default_node_process_pool() -> NodeProcessPool:
+    """
+    Returns the process-wide node process pool, creating it on first use.
+
+    Returns:
+        NodeProcessPool: Default node process pool.
+    """
+    global _default_node_process_pool
+    if _default_node_process_pool is None:
+        with _default_node_process_pool_lock:
+            if _default_node_process_pool is None:
+                _default_node_process_pool = NodeProcessPool()
+                atexit.register(_default_node_process_pool.shutdown, wait=False)
+    return _default_node_process_pool
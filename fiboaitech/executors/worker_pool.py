@@ -0,0 +1,335 @@
+import heapq
+import itertools
+import os
+import threading
+import time
+from concurrent import futures
+from functools import partial
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from fiboaitech.utils.env import get_env_var
+from fiboaitech.utils.logger import logger
+
+WORKER_POOL_MAX_WORKERS = int(get_env_var("FIBOAITECH_WORKER_POOL_MAX_WORKERS", min(64, (os.cpu_count() or 1) * 8)))
+WORKER_POOL_MAX_QUEUE_SIZE = int(get_env_var("FIBOAITECH_WORKER_POOL_MAX_QUEUE_SIZE", 1024))
+
+
+class WorkerPoolSaturatedError(Exception):
+    """Raised when a task cannot be queued because the worker pool is saturated."""
+
+
+class WorkerPoolMetrics(BaseModel):
+    """
+    Snapshot of the worker pool load.
+
+    Attributes:
+        max_workers (int): Maximum number of worker threads.
+        max_queue_size (int): Maximum number of tasks waiting for a free worker.
+        active (int): Number of tasks being executed.
+        queued (int): Number of tasks waiting for a free worker.
+        submitted (int): Total number of accepted tasks.
+        completed (int): Total number of finished tasks.
+        rejected (int): Total number of tasks rejected due to saturation.
+        overflowed (int): Total number of nested tasks executed in a dedicated thread due to saturation.
+    """
+
+    max_workers: int
+    max_queue_size: int
+    active: int = 0
+    queued: int = 0
+    submitted: int = 0
+    completed: int = 0
+    rejected: int = 0
+    overflowed: int = 0
+
+    @property
+    def saturation(self) -> float:
+        """Share of the pool capacity (workers and queue) currently in use."""
+        return (self.active + self.queued) / (self.max_workers + self.max_queue_size)
+
+
+class WorkerPool:
+    """
+    Long-lived thread pool shared by flow runs and node timeouts.
+
+    The number of pending tasks is bounded by `max_workers + max_queue_size`. When the pool is full,
+    `submit` blocks up to `submit_timeout` seconds and then raises `WorkerPoolSaturatedError`.
+    Pool threads never block on submission, since that could deadlock nested runs: tasks submitted from running
+    tasks are accepted only when a worker is idle, otherwise they are executed in a dedicated thread.
+
+    Args:
+        max_workers (int, optional): Maximum number of worker threads. Defaults to WORKER_POOL_MAX_WORKERS.
+        max_queue_size (int, optional): Maximum number of tasks waiting for a free worker.
+            Defaults to WORKER_POOL_MAX_QUEUE_SIZE.
+        submit_timeout (float, optional): Seconds to wait for a free slot. Defaults to None (wait forever).
+        name (str, optional): Prefix of the worker thread names.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue_size: int | None = None,
+        submit_timeout: float | None = None,
+        name: str = "fiboaitech-worker",
+    ):
+        self.max_workers = max_workers or WORKER_POOL_MAX_WORKERS
+        self.max_queue_size = WORKER_POOL_MAX_QUEUE_SIZE if max_queue_size is None else max_queue_size
+        self.submit_timeout = submit_timeout
+        self.name = name
+
+        self._executor = futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=name)
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue_size)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._metrics = WorkerPoolMetrics(max_workers=self.max_workers, max_queue_size=self.max_queue_size)
+
+    @property
+    def metrics(self) -> WorkerPoolMetrics:
+        """Returns a snapshot of the pool metrics."""
+        with self._lock:
+            return self._metrics.model_copy()
+
+    @property
+    def is_running_task(self) -> bool:
+        """Whether the current thread is running a task of this pool."""
+        return getattr(self._local, "is_running_task", False)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> futures.Future:
+        """
+        Submits a callable for execution.
+
+        Args:
+            fn (Callable): Callable to execute.
+            *args: Positional arguments for the callable.
+            **kwargs: Keyword arguments for the callable.
+
+        Returns:
+            futures.Future: Future of the execution result.
+
+        Raises:
+            WorkerPoolSaturatedError: If no slot is freed within `submit_timeout`.
+        """
+        if getattr(self._local, "is_pool_thread", False):
+            # Pool threads never block on the pool: queued nested task would wait for its own parent
+            # to release a worker, and blocked completion callbacks hold workers needed by queued tasks.
+            if not self._reserve_slot(require_idle_worker=self.is_running_task):
+                return self._submit_overflow(fn, *args, **kwargs)
+        elif self._slots.acquire(timeout=self.submit_timeout):
+            with self._lock:
+                self._metrics.submitted += 1
+                self._metrics.queued += 1
+        else:
+            with self._lock:
+                self._metrics.rejected += 1
+            raise WorkerPoolSaturatedError(
+                f"Worker pool '{self.name}' is saturated: {self.max_workers} workers are busy "
+                f"and {self.max_queue_size} tasks are queued."
+            )
+
+        return self._submit_reserved(fn, *args, **kwargs)
+
+    def try_submit(self, fn: Callable, *args, **kwargs) -> futures.Future | None:
+        """
+        Submits a callable for execution only if the pool has a free slot, without blocking.
+
+        Args:
+            fn (Callable): Callable to execute.
+            *args: Positional arguments for the callable.
+            **kwargs: Keyword arguments for the callable.
+
+        Returns:
+            futures.Future | None: Future of the execution result, or None if the pool is full.
+        """
+        if not self._reserve_slot(require_idle_worker=False):
+            return None
+        return self._submit_reserved(fn, *args, **kwargs)
+
+    def _submit_reserved(self, fn: Callable, *args, **kwargs) -> futures.Future:
+        """Submits the task to the executor once its slot is taken."""
+        try:
+            future = self._executor.submit(self._run, fn, *args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._metrics.queued -= 1
+            self._release()
+            raise
+        future.add_done_callback(self._release_cancelled)
+        return future
+
+    def _reserve_slot(self, require_idle_worker: bool) -> bool:
+        """Takes a slot without blocking, optionally only if a worker can pick up the task immediately."""
+        with self._lock:
+            if require_idle_worker and self._metrics.active + self._metrics.queued >= self.max_workers:
+                return False
+            if not self._slots.acquire(blocking=False):
+                return False
+            self._metrics.submitted += 1
+            self._metrics.queued += 1
+            return True
+
+    def _release_cancelled(self, future: futures.Future) -> None:
+        """Frees the slot of a task cancelled before it started."""
+        if future.cancelled():
+            with self._lock:
+                self._metrics.queued -= 1
+            self._release()
+
+    def _run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Runs the task in a worker thread updating the metrics."""
+        with self._lock:
+            self._metrics.queued -= 1
+            self._metrics.active += 1
+        self._local.is_pool_thread = True
+        self._local.is_running_task = True
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            # Completion callbacks run after the task and may submit to the pool as regular callers
+            self._local.is_running_task = False
+            with self._lock:
+                self._metrics.active -= 1
+            self._release()
+
+    def _release(self) -> None:
+        """Frees the slot of a finished task."""
+        with self._lock:
+            self._metrics.completed += 1
+        self._slots.release()
+
+    def _submit_overflow(self, fn: Callable, *args, **kwargs) -> futures.Future:
+        """Runs a nested task in a dedicated thread when the pool is full."""
+        with self._lock:
+            self._metrics.overflowed += 1
+        logger.debug(f"Worker pool '{self.name}' is saturated, running nested task in a dedicated thread.")
+
+        future = futures.Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            self._local.is_pool_thread = True
+            self._local.is_running_task = True
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                self._local.is_running_task = False
+                future.set_exception(e)
+            else:
+                self._local.is_running_task = False
+                future.set_result(result)
+
+        threading.Thread(target=run, name=f"{self.name}-overflow", daemon=True).start()
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the pool.
+
+        Args:
+            wait (bool, optional): Whether to wait for running tasks to complete. Defaults to True.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+_default_worker_pool: WorkerPool | None = None
+_default_worker_pool_lock = threading.Lock()
+
+
+def get_default_worker_pool() -> WorkerPool:
+    """
+    Returns the process-wide worker pool, creating it on first use.
+
+    Returns:
+        WorkerPool: Default worker pool.
+    """
+    global _default_worker_pool
+    if _default_worker_pool is None:
+        with _default_worker_pool_lock:
+            if _default_worker_pool is None:
+                _default_worker_pool = WorkerPool()
+    return _default_worker_pool
+
+
+def set_default_worker_pool(worker_pool: WorkerPool | None) -> None:
+    """
+    Replaces the process-wide worker pool. The previous pool is not shut down.
+
+    Args:
+        worker_pool (WorkerPool | None): New default pool. None recreates the pool with defaults on next use.
+    """
+    global _default_worker_pool
+    with _default_worker_pool_lock:
+        _default_worker_pool = worker_pool
+
+
+class DelayedCalls:
+    """
+    Runs callables after a delay in a single daemon thread, in the order they are due.
+
+    Used to re-dispatch work, e.g. node retries, without holding a worker thread while waiting. Calls must be short:
+    they delay the calls due after them.
+
+    Args:
+        name (str, optional): Name of the thread running the calls.
+    """
+
+    def __init__(self, name: str = "fiboaitech-delayed-calls"):
+        self.name = name
+        self._calls: list[tuple[float, int, Callable]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def call_later(self, delay: float, fn: Callable, *args, **kwargs) -> None:
+        """
+        Schedules the callable to run after the delay.
+
+        Args:
+            delay (float): Seconds to wait before the call.
+            fn (Callable): Callable to run.
+            *args: Positional arguments for the callable.
+            **kwargs: Keyword arguments for the callable.
+        """
+        with self._condition:
+            heapq.heappush(
+                self._calls, (time.monotonic() + max(delay, 0), next(self._counter), partial(fn, *args, **kwargs))
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        """Runs the calls as they become due."""
+        while True:
+            with self._condition:
+                while True:
+                    timeout = self._calls[0][0] - time.monotonic() if self._calls else None
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                _, _, call = heapq.heappop(self._calls)
+            try:
+                call()
+            except Exception as e:
+                logger.error(f"Delayed call failed: {e}")
+
+
+_default_delayed_calls: DelayedCalls | None = None
+
+
+def get_default_delayed_calls() -> DelayedCalls:
+    """
+    Returns the process-wide delayed calls thread, creating it on first use.
+
+    Returns:
+        DelayedCalls: Default delayed calls.
+    """
+    global _default_delayed_calls
+    if _default_delayed_calls is None:
+        with _default_worker_pool_lock:
+            if _default_delayed_calls is None:
+                _default_delayed_calls = DelayedCalls()
+    return _default_delayed_calls
@@ -1,9 +1,10 @@
 from abc import ABC
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from fiboaitech.runnables import Runnable, RunnableConfig
+from fiboaitech.callbacks.dispatch import dispatch_callback
+from fiboaitech.runnables import Runnable, RunnableConfig, RunnableResult, run_batch
 from fiboaitech.utils import generate_uuid
 
 
@@ -28,11 +29,6 @@ class BaseFlow(BaseModel, Runnable, ABC):
             **kwargs: Additional keyword arguments to be passed to the parent constructor.
         """
         super().__init__(**kwargs)
-        self._results = {}
-
-    def reset_run_state(self):
-        """Reset the internal run state by clearing the results dictionary."""
-        self._results = {}
 
     @property
     def to_dict_exclude_params(self) -> dict:
@@ -52,6 +48,31 @@ class BaseFlow(BaseModel, Runnable, ABC):
         )
         return data
 
+    def run_batch(
+        self,
+        inputs: Iterable[Any],
+        config: RunnableConfig = None,
+        max_concurrency: int | None = None,
+        **kwargs,
+    ) -> Iterator[tuple[int, RunnableResult]]:
+        """
+        Run the flow over many inputs concurrently, sharing the initialized nodes and connections.
+
+        A failed run does not stop the batch. Progress is reported to the `on_batch_*` callbacks.
+
+        Args:
+            inputs (Iterable[Any]): Input data of the runs.
+            config (RunnableConfig, optional): Configuration for the runs.
+            max_concurrency (int, optional): Maximum number of concurrent runs. Defaults to BATCH_MAX_CONCURRENCY.
+            **kwargs: Additional keyword arguments to be passed to the runs.
+
+        Yields:
+            tuple[int, RunnableResult]: Index of the input and the result of its run, in completion order.
+        """
+        yield from run_batch(
+            self.run, inputs, self.model_dump(), config=config, max_concurrency=max_concurrency, **kwargs
+        )
+
     def run_on_flow_start(
         self, input_data: Any, config: RunnableConfig = None, **kwargs: Any
     ):
@@ -65,7 +86,7 @@ class BaseFlow(BaseModel, Runnable, ABC):
         """
         if config and config.callbacks:
             for callback in config.callbacks:
-                callback.on_flow_start(self.model_dump(), input_data, **kwargs)
+                dispatch_callback(callback, "on_flow_start", self.model_dump(), input_data, **kwargs)
 
     def run_on_flow_end(
         self, output_data: Any, config: RunnableConfig = None, **kwargs: Any
@@ -80,7 +101,7 @@ class BaseFlow(BaseModel, Runnable, ABC):
         """
         if config and config.callbacks:
             for callback in config.callbacks:
-                callback.on_flow_end(self.model_dump(), output_data, **kwargs)
+                dispatch_callback(callback, "on_flow_end", self.model_dump(), output_data, **kwargs)
 
     def run_on_flow_error(
         self, error: BaseException, config: RunnableConfig = None, **kwargs: Any
@@ -95,4 +116,4 @@ class BaseFlow(BaseModel, Runnable, ABC):
         """
         if config and config.callbacks:
             for callback in config.callbacks:
-                callback.on_flow_error(self.model_dump(), error, **kwargs)
+                dispatch_callback(callback, "on_flow_error", self.model_dump(), error, **kwargs)
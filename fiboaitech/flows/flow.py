@@ -1,21 +1,41 @@
+import time
 from datetime import datetime
 from graphlib import CycleError, TopologicalSorter
 from io import BytesIO
 from typing import Any
 from uuid import uuid4
 
-from pydantic import Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from fiboaitech.connections.managers import ConnectionManager
+from fiboaitech.executors.aio import AsyncExecutor
 from fiboaitech.executors.base import BaseExecutor
 from fiboaitech.executors.pool import ThreadExecutor
+from fiboaitech.executors.worker_pool import WorkerPool
 from fiboaitech.flows.base import BaseFlow
+from fiboaitech.flows.scheduler import AsyncFlowScheduler, FlowGraph, FlowScheduler
 from fiboaitech.nodes.node import Node, NodeReadyToRun
+from fiboaitech.nodes.types import NodeGroup
 from fiboaitech.runnables import RunnableConfig, RunnableResult, RunnableStatus
 from fiboaitech.utils.duration import format_duration
 from fiboaitech.utils.logger import logger
 
 
+class FlowRunState(BaseModel):
+    """
+    Execution context of a single flow run.
+
+    Attributes:
+        results (dict[str, RunnableResult]): Results of the nodes by node id.
+        ts (TopologicalSorter): Topological sorter of the nodes.
+    """
+
+    results: dict[str, RunnableResult]
+    ts: TopologicalSorter
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
 class Flow(BaseFlow):
     """
     A class for managing and executing a graph-like structure of nodes.
@@ -24,12 +44,17 @@ class Flow(BaseFlow):
         nodes (list[Node]): List of nodes in the flow.
         executor (type[BaseExecutor]): Executor class for running nodes. Defaults to ThreadExecutor.
         max_node_workers (int | None): Maximum number of concurrent node workers. Defaults to None.
+        max_node_workers_by_group (dict[NodeGroup, int]): Maximum number of concurrently running nodes by node
+            group, e.g. `{NodeGroup.LLMS: 4, NodeGroup.TOOLS: 16}`. Applied by the event-driven scheduler.
+        worker_pool (WorkerPool | None): Worker pool for the thread executor. Defaults to the process-wide pool.
         connection_manager (ConnectionManager): Manager for handling connections. Defaults to ConnectionManager().
     """
 
     nodes: list[Node] = []
     executor: type[BaseExecutor] = ThreadExecutor
     max_node_workers: int | None = None
+    max_node_workers_by_group: dict[NodeGroup, int] = {}
+    worker_pool: WorkerPool | None = None
     connection_manager: ConnectionManager = Field(default_factory=ConnectionManager)
 
     def __init__(self, **kwargs):
@@ -41,14 +66,13 @@ class Flow(BaseFlow):
         """
         super().__init__(**kwargs)
         self._node_by_id = {node.id: node for node in self.nodes}
-        self._ts = None
+        self._graph = FlowGraph(nodes=self.nodes)
 
         self._init_components()
-        self.reset_run_state()
 
     @property
     def to_dict_exclude_params(self):
-        return {"nodes": True, "connection_manager": True}
+        return {"nodes": True, "connection_manager": True, "worker_pool": True}
 
     def to_dict(self, include_secure_params: bool = True, **kwargs) -> dict:
         """Converts the instance to a dictionary.
@@ -73,7 +97,7 @@ class Flow(BaseFlow):
             list[Node]: Validated list of nodes.
 
         Raises:
-            ValueError: If there are duplicate node IDs or invalid dependencies.
+            ValueError: If there are duplicate node IDs, invalid dependencies or dependency cycles.
         """
         nodes_ids_unique = set()
         nodes_deps_ids_unique = set()
@@ -97,6 +121,11 @@ class Flow(BaseFlow):
                 "Flow nodes have dependencies that are not present in the flow."
             )
 
+        try:
+            cls.init_node_topological_sorter(nodes=nodes)
+        except CycleError as e:
+            raise ValueError(f"Flow nodes have a dependencies cycle: {e.args[1]}.")
+
         return nodes
 
     def _init_components(self):
@@ -105,17 +134,19 @@ class Flow(BaseFlow):
             if node.is_postponed_component_init:
                 node.init_components(self.connection_manager)
 
-    def _get_nodes_ready_to_run(self, input_data: Any) -> list[NodeReadyToRun]:
+    def _get_nodes_ready_to_run(self, input_data: Any, run_state: FlowRunState) -> list[NodeReadyToRun]:
         """
         Gets the list of nodes that are ready to run.
 
         Args:
             input_data (Any): Input data for the nodes.
+            run_state (FlowRunState): State of the current run.
 
         Returns:
             list[NodeReadyToRun]: List of nodes ready to run.
         """
-        ready_ts_nodes = self._ts.get_ready()
+        ready_ts_nodes = run_state.ts.get_ready()
+        ready_at = time.perf_counter()
         ready_nodes = []
         for node_id in ready_ts_nodes:
             node = self._node_by_id[node_id]
@@ -123,7 +154,7 @@ class Flow(BaseFlow):
             is_ready = True
             for dep in node.depends:
                 if (
-                    dep_result := self._results.get(dep.node.id)
+                    dep_result := run_state.results.get(dep.node.id)
                 ) and dep_result.status != RunnableStatus.UNDEFINED:
                     depends_result[dep.node.id] = dep_result
                 else:
@@ -134,29 +165,37 @@ class Flow(BaseFlow):
                 is_ready=is_ready,
                 input_data=input_data,
                 depends_result=depends_result,
+                ready_at=ready_at,
             )
             ready_nodes.append(ready_node)
 
         return ready_nodes
 
-    def _get_output(self) -> dict[str, dict]:
+    @staticmethod
+    def _get_output(run_state: FlowRunState) -> dict[str, dict]:
         """
         Gets the output of the flow.
 
+        Args:
+            run_state (FlowRunState): State of the current run.
+
         Returns:
             dict[str, dict]: Output of the flow.
         """
         return {
-            node_id: result.to_dict(skip_format_types={BytesIO, bytes}) for node_id, result in self._results.items()
+            node_id: result.to_dict(skip_format_types={BytesIO, bytes})
+            for node_id, result in run_state.results.items()
         }
 
     @staticmethod
-    def init_node_topological_sorter(nodes: list[Node]):
+    def init_node_topological_sorter(nodes: list[Node], completed_ids: set[str] | None = None):
         """
         Initializes a topological sorter for the given nodes.
 
         Args:
             nodes (list[Node]): List of nodes to sort.
+            completed_ids (set[str] | None): Ids of the nodes completed by a resumed run. These nodes and
+                dependencies on them are left out.
 
         Returns:
             TopologicalSorter: Initialized topological sorter.
@@ -164,9 +203,12 @@ class Flow(BaseFlow):
         Raises:
             CycleError: If a cycle is detected in node dependencies.
         """
+        completed_ids = completed_ids or set()
         topological_sorter = TopologicalSorter()
         for node in nodes:
-            topological_sorter.add(node.id, *[d.node.id for d in node.depends])
+            if node.id in completed_ids:
+                continue
+            topological_sorter.add(node.id, *[d.node.id for d in node.depends if d.node.id not in completed_ids])
 
         try:
             topological_sorter.prepare()
@@ -176,27 +218,129 @@ class Flow(BaseFlow):
 
         return topological_sorter
 
-    def reset_run_state(self):
-        """Resets the run state of the flow."""
-        self._results = {
-            node.id: RunnableResult(status=RunnableStatus.UNDEFINED)
-            for node in self.nodes
+    def init_executor(self, max_workers: int | None = None) -> BaseExecutor:
+        """
+        Creates the executor for a flow run.
+
+        Args:
+            max_workers (int | None): Maximum number of concurrently running nodes.
+
+        Returns:
+            BaseExecutor: Executor instance.
+        """
+        if issubclass(self.executor, ThreadExecutor):
+            return self.executor(max_workers=max_workers, worker_pool=self.worker_pool)
+        return self.executor(max_workers=max_workers)
+
+    def _init_scheduler(
+        self, scheduler_cls: type[FlowScheduler], executor: BaseExecutor, config: RunnableConfig | None
+    ) -> FlowScheduler:
+        """
+        Creates the event-driven scheduler for a flow run.
+
+        Results of the completed nodes are saved to the checkpoint store of the run as they finish.
+
+        Args:
+            scheduler_cls (type[FlowScheduler]): Scheduler class.
+            executor (BaseExecutor): Executor to run nodes with.
+            config (RunnableConfig | None): Configuration for the run.
+
+        Returns:
+            FlowScheduler: Scheduler instance.
+        """
+        return scheduler_cls(
+            graph=self._graph,
+            executor=executor,
+            max_workers_by_group=self.max_node_workers_by_group,
+            on_node_complete=lambda node_id, result: self._save_checkpoint(config, {node_id: result}),
+        )
+
+    def init_run_state(self, completed: dict[str, RunnableResult] | None = None) -> FlowRunState:
+        """
+        Creates the state for a new flow run.
+
+        Args:
+            completed (dict[str, RunnableResult] | None): Results of the nodes completed by a resumed run.
+
+        Returns:
+            FlowRunState: State of the new run.
+        """
+        completed = completed or {}
+        return FlowRunState(
+            results={node.id: RunnableResult(status=RunnableStatus.UNDEFINED) for node in self.nodes} | completed,
+            ts=self.init_node_topological_sorter(nodes=self.nodes, completed_ids=set(completed)),
+        )
+
+    def _get_checkpoint_key(self, node_id: str) -> str:
+        return f"flow:{self.id}:node:{node_id}"
+
+    def _init_checkpoint(
+        self, config: RunnableConfig | None, resume_from: str | None
+    ) -> tuple[RunnableConfig | None, dict[str, RunnableResult]]:
+        """
+        Sets the run to resume and loads results of the nodes it completed.
+
+        Results are saved again under the current run id, so the current run can be resumed as well.
+
+        Args:
+            config (RunnableConfig | None): Configuration for the run.
+            resume_from (str | None): Id of the run to resume.
+
+        Returns:
+            tuple[RunnableConfig | None, dict[str, RunnableResult]]: Configuration for the run and results of the
+                completed nodes by node id.
+
+        Raises:
+            ValueError: If a run to resume is given without a checkpoint store.
+        """
+        if resume_from:
+            if not config or not config.checkpoint_store:
+                raise ValueError("Checkpoint store must be configured to resume a run.")
+            config = config.model_copy(update={"resume_from": resume_from})
+
+        if not config or not config.checkpoint_store or not config.resume_from:
+            return config, {}
+
+        prefix = self._get_checkpoint_key("")
+        completed = {
+            node_id: result
+            for key, result in config.checkpoint_store.load_all(config.resume_from, prefix=prefix).items()
+            if (node_id := key.removeprefix(prefix)) in self._node_by_id
         }
-        self._ts = self.init_node_topological_sorter(nodes=self.nodes)
+        if config.resume_from != config.run_id:
+            for node_id, result in completed.items():
+                config.checkpoint_store.save(config.run_id, self._get_checkpoint_key(node_id), result)
 
-    def run(self, input_data: Any, config: RunnableConfig = None, **kwargs):
+        logger.info(f"Flow {self.id}: resumed {len(completed)} completed nodes of run {config.resume_from}.")
+        return config, completed
+
+    def _save_checkpoint(self, config: RunnableConfig | None, results: dict[str, RunnableResult]) -> None:
         """
-        Runs the flow with the given input data and configuration.
+        Saves results of the successfully completed nodes to the checkpoint store of the run.
+
+        Args:
+            config (RunnableConfig | None): Configuration for the run.
+            results (dict[str, RunnableResult]): Results of the nodes by node id.
+        """
+        if not config or not config.checkpoint_store:
+            return
+
+        for node_id, result in results.items():
+            if result.status == RunnableStatus.SUCCESS:
+                config.checkpoint_store.save(config.run_id, self._get_checkpoint_key(node_id), result)
+
+    def _start_run(self, input_data: Any, config: RunnableConfig | None, **kwargs) -> tuple[dict, datetime]:
+        """
+        Reports the start of the flow run shared by `run` and `arun`.
 
         Args:
             input_data (Any): Input data for the flow.
-            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            config (RunnableConfig | None): Configuration for the run.
             **kwargs: Additional keyword arguments.
 
         Returns:
-            RunnableResult: Result of the flow execution.
+            tuple[dict, datetime]: Keyword arguments of the run with its run id and the start time.
         """
-        self.reset_run_state()
         run_id = uuid4()
         merged_kwargs = kwargs | {
             "run_id": run_id,
@@ -205,45 +349,164 @@ class Flow(BaseFlow):
 
         logger.info(f"Flow {self.id}: execution started.")
         self.run_on_flow_start(input_data, config, **merged_kwargs)
-        time_start = datetime.now()
+        return merged_kwargs, datetime.now()
+
+    def _get_success_result(
+        self, run_state: FlowRunState, input_data: Any, config: RunnableConfig | None, time_start: datetime, **kwargs
+    ) -> RunnableResult:
+        """
+        Reports the successful flow run and returns its result.
+
+        Args:
+            run_state (FlowRunState): State of the run.
+            input_data (Any): Input data for the flow.
+            config (RunnableConfig | None): Configuration for the run.
+            time_start (datetime): Start time of the run.
+            **kwargs: Keyword arguments of the run.
+
+        Returns:
+            RunnableResult: Result of the flow execution.
+        """
+        output = self._get_output(run_state)
+        self.run_on_flow_end(output, config, **kwargs)
+        logger.info(
+            f"Flow {self.id}: execution succeeded in {format_duration(time_start, datetime.now())}."
+        )
+        return RunnableResult(
+            status=RunnableStatus.SUCCESS, input=input_data, output=output
+        )
+
+    def _get_failure_result(
+        self, error: Exception, input_data: Any, config: RunnableConfig | None, time_start: datetime, **kwargs
+    ) -> RunnableResult:
+        """
+        Reports the failed flow run and returns its result.
+
+        Args:
+            error (Exception): Error of the run.
+            input_data (Any): Input data for the flow.
+            config (RunnableConfig | None): Configuration for the run.
+            time_start (datetime): Start time of the run.
+            **kwargs: Keyword arguments of the run.
+
+        Returns:
+            RunnableResult: Result of the flow execution.
+        """
+        self.run_on_flow_error(error, config, **kwargs)
+        logger.error(
+            f"Flow {self.id}: execution failed in "
+            f"{format_duration(time_start, datetime.now())}."
+        )
+        return RunnableResult(
+            status=RunnableStatus.FAILURE,
+            input=input_data,
+        )
+
+    def run(self, input_data: Any, config: RunnableConfig = None, resume_from: str | None = None, **kwargs):
+        """
+        Runs the flow with the given input data and configuration.
+
+        With a checkpoint store in the configuration, results of the successfully completed nodes are saved
+        under the run id as they finish.
+
+        Args:
+            input_data (Any): Input data for the flow.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            resume_from (str | None): Id of a previous run to resume. Nodes it completed are not run again.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the flow execution.
+        """
+        if config:
+            config = config.start_deadline()
+        merged_kwargs, time_start = self._start_run(input_data, config, **kwargs)
+        run_id = merged_kwargs["run_id"]
 
         try:
+            config, completed = self._init_checkpoint(config, resume_from)
+            run_state = self.init_run_state(completed=completed)
             if self.nodes:
                 max_workers = (
                     config.max_node_workers if config else self.max_node_workers
                 )
-                run_executor = self.executor(max_workers=max_workers)
+                run_executor = self.init_executor(max_workers=max_workers)
+
+                try:
+                    if run_executor.dispatch_on_completion:
+                        scheduler = self._init_scheduler(FlowScheduler, run_executor, config)
+                        results = scheduler.run(
+                            input_data=input_data,
+                            config=config,
+                            completed=completed,
+                            **(merged_kwargs | {"parent_run_id": run_id}),
+                        )
+                        run_state.results.update(results)
+                    else:
+                        while run_state.ts.is_active():
+                            ready_nodes = self._get_nodes_ready_to_run(input_data=input_data, run_state=run_state)
+                            results = run_executor.execute(
+                                ready_nodes=ready_nodes,
+                                config=config,
+                                **(merged_kwargs | {"parent_run_id": run_id}),
+                            )
+                            run_state.results.update(results)
+                            self._save_checkpoint(config, results)
+                            run_state.ts.done(*results.keys())
+                finally:
+                    run_executor.shutdown()
+
+            return self._get_success_result(run_state, input_data, config, time_start, **merged_kwargs)
+        except Exception as e:
+            return self._get_failure_result(e, input_data, config, time_start, **merged_kwargs)
+
+    async def arun(
+        self, input_data: Any, config: RunnableConfig = None, resume_from: str | None = None, **kwargs
+    ):
+        """
+        Asynchronously runs the flow with the given input data and configuration.
+
+        Nodes run as asyncio tasks started by the event-driven scheduler as soon as their dependencies complete,
+        ranked and limited the same way as in `run`.
 
-                while self._ts.is_active():
-                    ready_nodes = self._get_nodes_ready_to_run(input_data=input_data)
-                    results = run_executor.execute(
-                        ready_nodes=ready_nodes,
+        Args:
+            input_data (Any): Input data for the flow.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            resume_from (str | None): Id of a previous run to resume. Nodes it completed are not run again.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the flow execution.
+        """
+        if config:
+            config = config.start_deadline()
+        merged_kwargs, time_start = self._start_run(input_data, config, **kwargs)
+        run_id = merged_kwargs["run_id"]
+
+        try:
+            config, completed = self._init_checkpoint(config, resume_from)
+            run_state = self.init_run_state(completed=completed)
+            if self.nodes:
+                max_workers = (
+                    config.max_node_workers if config else self.max_node_workers
+                )
+                run_executor = AsyncExecutor(max_workers=max_workers)
+
+                try:
+                    scheduler = self._init_scheduler(AsyncFlowScheduler, run_executor, config)
+                    results = await scheduler.arun(
+                        input_data=input_data,
                         config=config,
+                        completed=completed,
                         **(merged_kwargs | {"parent_run_id": run_id}),
                     )
-                    self._results.update(results)
-                    self._ts.done(*results.keys())
-
-                run_executor.shutdown()
+                    run_state.results.update(results)
+                finally:
+                    run_executor.shutdown(wait=False)
 
-            output = self._get_output()
-            self.run_on_flow_end(self._get_output(), config, **merged_kwargs)
-            logger.info(
-                f"Flow {self.id}: execution succeeded in {format_duration(time_start, datetime.now())}."
-            )
-            return RunnableResult(
-                status=RunnableStatus.SUCCESS, input=input_data, output=output
-            )
+            return self._get_success_result(run_state, input_data, config, time_start, **merged_kwargs)
         except Exception as e:
-            self.run_on_flow_error(e, config, **merged_kwargs)
-            logger.error(
-                f"Flow {self.id}: execution failed in "
-                f"{format_duration(time_start, datetime.now())}."
-            )
-            return RunnableResult(
-                status=RunnableStatus.FAILURE,
-                input=input_data,
-            )
+            return self._get_failure_result(e, input_data, config, time_start, **merged_kwargs)
 
     def get_dependant_nodes(
         self, nodes_types_to_skip: set[str] | None = None
@@ -301,7 +564,8 @@ class Flow(BaseFlow):
         Raises:
             TypeError: If 'nodes' is not a Node or a list of Node.
             ValueError: If 'nodes' is an empty list, if a node with the same id already exists in the flow,
-                        or if there are duplicate node ids in the input list.
+                        if there are duplicate node ids in the input list, or if dependencies of the nodes
+                        are missing or form a cycle.
         """
 
         if nodes is None:
@@ -322,11 +586,13 @@ class Flow(BaseFlow):
         for node in nodes:
             if node.id in self._node_by_id:
                 raise ValueError(f"Node with id {node.id} already exists in the flow.")
+        self.validate_nodes(self.nodes + nodes)
 
+        for node in nodes:
             self.nodes.append(node)
             self._node_by_id[node.id] = node
             if node.is_postponed_component_init:
                 node.init_components(self.connection_manager)
-        self.reset_run_state()
+        self._graph = FlowGraph(nodes=self.nodes)
 
         return self  # enable chaining
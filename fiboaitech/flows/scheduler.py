@@ -0,0 +1,394 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent import futures
+from functools import partial
+from typing import Any, Callable
+
+from fiboaitech.executors.aio import AsyncExecutor
+from fiboaitech.executors.pool import PoolExecutor
+from fiboaitech.nodes.node import Node, NodeReadyToRun
+from fiboaitech.nodes.types import NodeGroup
+from fiboaitech.runnables import RunnableConfig, RunnableResult, RunnableStatus
+from fiboaitech.utils.logger import logger
+
+LATENCY_SMOOTHING_FACTOR = 0.3
+
+
+class FlowGraph:
+    """
+    Dependency graph of the flow nodes precomputed for scheduling.
+
+    Keeps a moving average of node latencies across runs to estimate the critical path.
+
+    Attributes:
+        node_by_id (dict[str, Node]): Nodes by node id.
+        dependants (dict[str, list[str]]): Ids of the nodes that depend on the node by node id.
+        in_degree (dict[str, int]): Number of dependencies by node id.
+        roots (list[str]): Ids of the nodes without dependencies.
+        latency_by_id (dict[str, float]): Moving average of node latencies in seconds by node id.
+    """
+
+    def __init__(self, nodes: list[Node]):
+        self.node_by_id = {node.id: node for node in nodes}
+        self.dependants = {node.id: [] for node in nodes}
+        self.in_degree = {}
+        for node in nodes:
+            self.in_degree[node.id] = len(node.depends)
+            for dep in node.depends:
+                self.dependants[dep.node.id].append(node.id)
+        self.roots = [node_id for node_id, in_degree in self.in_degree.items() if in_degree == 0]
+        self.latency_by_id: dict[str, float] = {}
+
+        self._topological_order = self._get_topological_order()
+        self._lock = threading.Lock()
+
+    def _get_topological_order(self) -> list[str]:
+        """Returns node ids in topological order. Nodes in dependency cycles are omitted."""
+        in_degree = dict(self.in_degree)
+        order = list(self.roots)
+        for node_id in order:
+            for dependant_id in self.dependants[node_id]:
+                in_degree[dependant_id] -= 1
+                if in_degree[dependant_id] == 0:
+                    order.append(dependant_id)
+        return order
+
+    def record_latency(self, node_id: str, latency: float) -> None:
+        """
+        Updates the moving average of the node latency.
+
+        Args:
+            node_id (str): Node id.
+            latency (float): Latency of the latest node run in seconds.
+        """
+        with self._lock:
+            if (average := self.latency_by_id.get(node_id)) is None:
+                self.latency_by_id[node_id] = latency
+            else:
+                self.latency_by_id[node_id] = average + LATENCY_SMOOTHING_FACTOR * (latency - average)
+
+    def get_critical_path_latencies(self) -> dict[str, float]:
+        """
+        Estimates the latency of the longest path from each node to the end of the flow.
+
+        Nodes without latency history are weighted with the average latency of the known nodes.
+
+        Returns:
+            dict[str, float]: Estimated remaining latency in seconds by node id.
+        """
+        with self._lock:
+            latency_by_id = dict(self.latency_by_id)
+        default_latency = sum(latency_by_id.values()) / len(latency_by_id) if latency_by_id else 1.0
+
+        remaining = {}
+        for node_id in reversed(self._topological_order):
+            remaining[node_id] = latency_by_id.get(node_id, default_latency) + max(
+                (remaining[dependant_id] for dependant_id in self.dependants[node_id]), default=0
+            )
+        return remaining
+
+
+class FlowScheduler:
+    """
+    Event-driven scheduler that runs flow nodes in a pool executor.
+
+    Nodes are submitted from the completion callback of their last finished dependency, so dependants start
+    without waiting for the flow thread to rescan the graph. Each completion costs O(out-degree) of the node.
+
+    When more nodes are ready than the concurrency limits allow, nodes with higher `priority` start first,
+    then nodes with the longest estimated remaining path, so slow chains on the critical path are not delayed
+    by short branches.
+
+    Args:
+        graph (FlowGraph): Dependency graph of the flow.
+        executor (PoolExecutor): Executor to submit nodes to. Its `max_workers` limits concurrently running nodes.
+        max_workers_by_group (dict[NodeGroup, int], optional): Limits of concurrently running nodes by node group.
+        on_node_complete (Callable[[str, RunnableResult], None], optional): Called with the node id and result
+            when a node completes, before its dependants are dispatched.
+    """
+
+    def __init__(
+        self,
+        graph: FlowGraph,
+        executor: PoolExecutor,
+        max_workers_by_group: dict[NodeGroup, int] | None = None,
+        on_node_complete: Callable[[str, RunnableResult], None] | None = None,
+    ):
+        self.graph = graph
+        self.executor = executor
+        self.max_workers_by_group = max_workers_by_group or {}
+        self.on_node_complete = on_node_complete
+        self.results: dict[str, RunnableResult] = {}
+
+        self._in_degree = dict(graph.in_degree)
+        self._critical_path_latencies = graph.get_critical_path_latencies()
+        self._ready = []
+        self._ready_counter = itertools.count()
+        self._running = 0
+        self._running_by_group = dict.fromkeys(self.max_workers_by_group, 0)
+        self._started_at = {}
+        self._ready_at = {}
+        self._remaining = len(graph.node_by_id)
+        self._lock = threading.Lock()
+        self._completed = threading.Event()
+        self._local = threading.local()
+        self._input_data = None
+        self._config = None
+        self._kwargs = {}
+
+    def run(
+        self,
+        input_data: Any,
+        config: RunnableConfig = None,
+        completed: dict[str, RunnableResult] | None = None,
+        **kwargs,
+    ) -> dict[str, RunnableResult]:
+        """
+        Runs all nodes of the graph and waits for completion.
+
+        Args:
+            input_data (Any): Input data for the nodes.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            completed (dict[str, RunnableResult], optional): Results of the nodes completed by a resumed run.
+                These nodes are not run again.
+            **kwargs: Additional keyword arguments passed to node runs.
+
+        Returns:
+            dict[str, RunnableResult]: Results of the nodes by node id.
+        """
+        if self._start(input_data, config, completed, **kwargs):
+            self._completed.wait()
+        return self.results
+
+    def _start(
+        self, input_data: Any, config: RunnableConfig | None, completed: dict[str, RunnableResult] | None, **kwargs
+    ) -> bool:
+        """Dispatches the first ready nodes. Returns False if there are no nodes left to run."""
+        self._input_data = input_data
+        self._config = config
+        self._kwargs = kwargs
+
+        with self._lock:
+            ready_ids = self._restore(completed) if completed else self.graph.roots
+            if not self._remaining:
+                return False
+
+            for node_id in ready_ids:
+                self._push_ready(node_id)
+            node_ids = self._pop_ready()
+        self._dispatch(node_ids)
+        return True
+
+    def _restore(self, completed: dict[str, RunnableResult]) -> list[str]:
+        """Stores results of completed nodes and returns ids of the ready ones left. Must be called under the lock."""
+        for node_id, result in completed.items():
+            if node_id not in self.graph.node_by_id:
+                continue
+            self.results[node_id] = result
+            self._remaining -= 1
+            for dependant_id in self.graph.dependants[node_id]:
+                self._in_degree[dependant_id] -= 1
+
+        return [
+            node_id
+            for node_id, in_degree in self._in_degree.items()
+            if in_degree == 0 and node_id not in self.results
+        ]
+
+    def _push_ready(self, node_id: str) -> None:
+        """Adds the node to the ready queue ranked by priority and critical path. Must be called under the lock."""
+        self._ready_at[node_id] = time.perf_counter()
+        rank = (
+            -self.graph.node_by_id[node_id].priority,
+            -self._critical_path_latencies.get(node_id, 0),
+            next(self._ready_counter),
+        )
+        heapq.heappush(self._ready, (rank, node_id))
+
+    def _pop_ready(self) -> list[str]:
+        """Takes the best ranked ready nodes allowed by the concurrency limits. Must be called under the lock."""
+        node_ids = []
+        group_limited = []
+        max_workers = self.executor.max_workers
+        while self._ready and (not max_workers or self._running < max_workers):
+            rank, node_id = heapq.heappop(self._ready)
+            group = self.graph.node_by_id[node_id].group
+            if group in self.max_workers_by_group:
+                if self._running_by_group[group] >= self.max_workers_by_group[group]:
+                    group_limited.append((rank, node_id))
+                    continue
+                self._running_by_group[group] += 1
+
+            node_ids.append(node_id)
+            self._running += 1
+
+        for item in group_limited:
+            heapq.heappush(self._ready, item)
+        return node_ids
+
+    def _dispatch(self, node_ids: list[str]) -> None:
+        """Submits nodes iteratively, so chains of instantly completed futures don't grow the stack."""
+        if (queue := getattr(self._local, "queue", None)) is not None:
+            queue.extend(node_ids)
+            return
+
+        self._local.queue = queue = deque(node_ids)
+        try:
+            while queue:
+                self._submit(queue.popleft())
+        finally:
+            self._local.queue = None
+
+    def _run_node(self, ready_node: NodeReadyToRun) -> futures.Future:
+        """Submits the node to the executor and returns the future of its result."""
+        return self.executor.run_node(ready_node=ready_node, config=self._config, **self._kwargs)
+
+    def _submit(self, node_id: str) -> None:
+        """Submits node with results of its dependencies."""
+        node = self.graph.node_by_id[node_id]
+        try:
+            ready_node = NodeReadyToRun(
+                node=node,
+                is_ready=True,
+                input_data=self._input_data,
+                depends_result={dep.node.id: self.results[dep.node.id] for dep in node.depends},
+                ready_at=self._ready_at.get(node_id),
+            )
+            self._started_at[node_id] = time.perf_counter()
+            future = self._run_node(ready_node)
+        except Exception as e:
+            logger.error(f"Node {node.name} - {node.id}: submission failed. Error: {e}")
+            self._complete(node_id, RunnableResult(status=RunnableStatus.FAILURE))
+            return
+
+        future.add_done_callback(partial(self._on_done, node_id))
+
+    def _on_done(self, node_id: str, future: futures.Future | asyncio.Future) -> None:
+        """Completion callback of the node future."""
+        try:
+            result = future.result()
+        except Exception as e:
+            node = self.graph.node_by_id[node_id]
+            logger.error(f"Node {node.name} - {node.id}: execution failed due the unexpected error. Error: {e}")
+            result = RunnableResult(status=RunnableStatus.FAILURE)
+
+        if result.status == RunnableStatus.SUCCESS:
+            self.graph.record_latency(node_id, time.perf_counter() - self._started_at[node_id])
+        self._complete(node_id, result)
+
+    def _complete(self, node_id: str, result: RunnableResult) -> None:
+        """Stores the node result and dispatches dependants that became ready."""
+        if self.on_node_complete:
+            try:
+                self.on_node_complete(node_id, result)
+            except Exception as e:
+                logger.error(f"Node {node_id}: completion handler failed. Error: {e}")
+
+        with self._lock:
+            self.results[node_id] = result
+            self._running -= 1
+            if (group := self.graph.node_by_id[node_id].group) in self._running_by_group:
+                self._running_by_group[group] -= 1
+            self._remaining -= 1
+            for dependant_id in self.graph.dependants[node_id]:
+                self._in_degree[dependant_id] -= 1
+                if self._in_degree[dependant_id] == 0:
+                    self._push_ready(dependant_id)
+            node_ids = self._pop_ready()
+            is_completed = self._remaining == 0
+
+        if is_completed:
+            self._completed.set()
+        else:
+            self._dispatch(node_ids)
+
+
+class AsyncFlowScheduler(FlowScheduler):
+    """
+    Event-driven scheduler that runs flow nodes as tasks of the running event loop.
+
+    Ranks ready nodes and applies concurrency limits the same way as `FlowScheduler`. Dependants are started from
+    the completion callback of the task of their last finished dependency.
+
+    Args:
+        graph (FlowGraph): Dependency graph of the flow.
+        executor (AsyncExecutor): Executor to run nodes with. Its `max_workers` limits concurrently running nodes.
+        max_workers_by_group (dict[NodeGroup, int], optional): Limits of concurrently running nodes by node group.
+        on_node_complete (Callable[[str, RunnableResult], None], optional): Called with the node id and result
+            when a node completes, before its dependants are dispatched.
+    """
+
+    def __init__(
+        self,
+        graph: FlowGraph,
+        executor: AsyncExecutor,
+        max_workers_by_group: dict[NodeGroup, int] | None = None,
+        on_node_complete: Callable[[str, RunnableResult], None] | None = None,
+    ):
+        super().__init__(
+            graph=graph,
+            executor=executor,
+            max_workers_by_group=max_workers_by_group,
+            on_node_complete=on_node_complete,
+        )
+        self._completed = asyncio.Event()
+        self._tasks: set[asyncio.Task] = set()
+
+    def run(
+        self,
+        input_data: Any,
+        config: RunnableConfig = None,
+        completed: dict[str, RunnableResult] | None = None,
+        **kwargs,
+    ) -> dict[str, RunnableResult]:
+        """
+        Synchronous run is not supported by the async scheduler.
+
+        Raises:
+            NotImplementedError: Always. Use `arun` instead.
+        """
+        raise NotImplementedError("AsyncFlowScheduler supports only asynchronous runs. Use 'arun' instead.")
+
+    async def arun(
+        self,
+        input_data: Any,
+        config: RunnableConfig = None,
+        completed: dict[str, RunnableResult] | None = None,
+        **kwargs,
+    ) -> dict[str, RunnableResult]:
+        """
+        Runs all nodes of the graph and waits for completion. Running nodes are cancelled if the run is cancelled.
+
+        Args:
+            input_data (Any): Input data for the nodes.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            completed (dict[str, RunnableResult], optional): Results of the nodes completed by a resumed run.
+                These nodes are not run again.
+            **kwargs: Additional keyword arguments passed to node runs.
+
+        Returns:
+            dict[str, RunnableResult]: Results of the nodes by node id.
+        """
+        try:
+            if self._start(input_data, config, completed, **kwargs):
+                await self._completed.wait()
+        finally:
+            for task in self._tasks:
+                task.cancel()
+        return self.results
+
+    def _run_node(self, ready_node: NodeReadyToRun) -> asyncio.Task:
+        """Starts the node task and returns it."""
+        task = asyncio.create_task(self.executor.run_node(ready_node=ready_node, config=self._config, **self._kwargs))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _on_done(self, node_id: str, future: asyncio.Task) -> None:
+        """Completion callback of the node task. Tasks are cancelled only when the run is stopped."""
+        if not future.cancelled():
+            super()._on_done(node_id, future)
@@ -1,2 +1,10 @@
-from .node import CachingConfig, ErrorHandling, InputTransformer, Node, OutputTransformer
+from .node import (
+    CachingConfig,
+    CircuitBreakerConfig,
+    ErrorHandling,
+    InputTransformer,
+    Node,
+    OutputTransformer,
+    RetryBudgetConfig,
+)
 from .types import Behavior, NodeGroup
@@ -17,7 +17,8 @@ from fiboaitech.nodes.agents.exceptions import (
     InvalidActionException,
     ToolExecutionException,
 )
-from fiboaitech.nodes.node import NodeDependency, ensure_config
+from fiboaitech.nodes.agents.streaming import AgentTokenStream, AnswerStreamParser
+from fiboaitech.nodes.node import NodeDependency, NodeRunState, ensure_config
 from fiboaitech.prompts import Message, MessageRole, Prompt
 from fiboaitech.runnables import RunnableConfig, RunnableStatus
 from fiboaitech.types.streaming import StreamingMode
@@ -76,6 +77,20 @@ class AgentInputSchema(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+class AgentRunState(NodeRunState):
+    """
+    Per-run scratch state of the agent.
+
+    Attributes:
+        intermediate_steps (dict[int, dict]): Intermediate steps of the agent loop.
+        prompt_variables (dict[str, Any]): Prompt variables of the run.
+        files (list[io.BytesIO | bytes] | None): Files available to the agent during the run.
+    """
+    intermediate_steps: dict[int, Any] = {}
+    prompt_variables: dict[str, Any] = {}
+    files: list[io.BytesIO | bytes] | None = None
+
+
 class Agent(Node):
     """Base class for an AI Agent that interacts with a Language Model and tools."""
 
@@ -101,11 +116,10 @@ class Agent(Node):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
     input_schema: ClassVar[type[AgentInputSchema]] = AgentInputSchema
+    run_state_cls: ClassVar[type[AgentRunState]] = AgentRunState
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._intermediate_steps: dict[int, dict] = {}
-        self._run_depends: list[dict] = []
         self._init_prompt_blocks()
 
     @property
@@ -166,7 +180,7 @@ class Agent(Node):
         }
         self._prompt_variables = {
             "tool_description": self.tool_description,
-            "file_description": self.file_description,
+            "file_description": self.get_file_description(self.files),
             "user_input": "",
             "conversation_history": "",
             "relevant_memory": "",
@@ -227,7 +241,7 @@ class Agent(Node):
             try:
                 chat_history = TypeAdapter(list[Message]).validate_python(chat_history)
                 chat_history = self._retrieve_chat_history(chat_history)
-                self._prompt_variables["conversation_history"] = chat_history
+                self.run_state.prompt_variables["conversation_history"] = chat_history
 
             except ValidationError as e:
                 raise TypeError(f"Invalid chat history: {e}")
@@ -238,20 +252,21 @@ class Agent(Node):
 
         files = input_data.files
         if files:
-            self.files = files
-            self._prompt_variables["file_description"] = self.file_description
+            self.run_state.files = files
+            self.run_state.prompt_variables["file_description"] = self.file_description
 
-        self._prompt_variables.update(dict(input_data))
+        self.run_state.prompt_variables.update(dict(input_data))
         kwargs = kwargs | {"parent_run_id": kwargs.get("run_id")}
         kwargs.pop("run_depends", None)
 
         result = self._run_agent(config=config, **kwargs)
+        self.clear_checkpoint(config)
         if self.memory:
             self.memory.add(role=MessageRole.ASSISTANT, content=result, metadata=custom_metadata)
 
         execution_result = {
             "content": result,
-            "intermediate_steps": self._intermediate_steps,
+            "intermediate_steps": self.run_state.intermediate_steps,
         }
         logger.info(f"Node {self.name} - {self.id}: finished with RESULT:\n{str(result)[:200]}...")
 
@@ -282,36 +297,39 @@ class Agent(Node):
 
         if session_id:
             all_session_messages_str = self.memory.get_search_results_as_string(query=None, filters=user_filters)
-            self._prompt_variables["conversation_history"] = all_session_messages_str
+            self.run_state.prompt_variables["conversation_history"] = all_session_messages_str
 
         else:
             user_query = input_data.get("input", "")
 
             if self.memory_retrieval_strategy == MemoryRetrievalStrategy.RELEVANT:
                 relevant_memory = self.memory.get_search_results_as_string(query=user_query, filters=user_filters)
-                self._prompt_variables["relevant_memory"] = relevant_memory
+                self.run_state.prompt_variables["relevant_memory"] = relevant_memory
 
             elif self.memory_retrieval_strategy == MemoryRetrievalStrategy.ALL:
                 all_messages = self.memory.get_all_messages_as_string()
-                self._prompt_variables["conversation_history"] = all_messages
+                self.run_state.prompt_variables["conversation_history"] = all_messages
 
             elif self.memory_retrieval_strategy == MemoryRetrievalStrategy.BOTH:
                 relevant_memory = self.memory.get_search_results_as_string(query=user_query, filters=user_filters)
                 all_messages = self.memory.get_all_messages_as_string()
-                self._prompt_variables["relevant_memory"] = relevant_memory
-                self._prompt_variables["conversation_history"] = all_messages
+                self.run_state.prompt_variables["relevant_memory"] = relevant_memory
+                self.run_state.prompt_variables["conversation_history"] = all_messages
 
-    def _run_llm(self, prompt: str, config: RunnableConfig | None = None, **kwargs) -> str:
-        """Runs the LLM with a given prompt and handles streaming or full responses."""
+    def _run_llm(
+        self, prompt: str, config: RunnableConfig | None = None, token_stream: AgentTokenStream | None = None, **kwargs
+    ) -> str:
+        """Runs the LLM with a given prompt, forwarding its tokens to the token stream if it is given."""
         try:
             llm_result = self.llm.run(
                 input_data={},
                 config=config,
                 prompt=Prompt(messages=[Message(role="user", content=prompt)]),
-                run_depends=self._run_depends,
+                run_depends=self.run_state.run_depends,
+                token_callback=token_stream,
                 **kwargs,
             )
-            self._run_depends = [NodeDependency(node=self.llm).to_dict()]
+            self.run_state.run_depends = [NodeDependency(node=self.llm).to_dict()]
             if llm_result.status != RunnableStatus.SUCCESS:
                 error_message = f"LLM '{self.llm.name}' failed: {llm_result.output.get('content')}"
                 raise ValueError({error_message})
@@ -321,6 +339,41 @@ class Agent(Node):
         except Exception as e:
             raise e
 
+    def get_token_stream(
+        self,
+        config: RunnableConfig,
+        step: str | None = None,
+        answer_parser: AnswerStreamParser | None = None,
+        **kwargs,
+    ) -> AgentTokenStream | None:
+        """
+        Creates the stream forwarding LLM tokens to the agent stream as they are generated.
+
+        Args:
+            config (RunnableConfig): Configuration of the run.
+            step (str | None): Step streaming all tokens.
+            answer_parser (AnswerStreamParser | None): Parser finding the answer streamed as the answer step.
+            **kwargs: Additional keyword arguments of the stream events.
+
+        Returns:
+            AgentTokenStream | None: Token stream, None if streaming by tokens is disabled or nothing is streamed.
+        """
+        if not (self.streaming.enabled and self.streaming.by_tokens) or (step is None and answer_parser is None):
+            return None
+
+        def emit(content: str, stream_step: str) -> None:
+            self.stream_response(content=content, source=self.name, step=stream_step, config=config, **kwargs)
+
+        return AgentTokenStream(emit, step=step, answer_parser=answer_parser)
+
+    def _stream_llm(self, prompt: str, step: str, config: RunnableConfig, **kwargs) -> str:
+        """Runs the LLM streaming its output as the step, token by token as it is generated when possible."""
+        token_stream = self.get_token_stream(config, step=step, **kwargs)
+        llm_result = self._run_llm(prompt, config, token_stream=token_stream, **kwargs)
+        if token_stream is None or not token_stream.streamed_step:
+            return self.stream_content(content=llm_result, source=self.name, step=step, config=config, **kwargs)
+        return llm_result
+
     def stream_content(self, content: str, source: str, step: str, config: RunnableConfig | None = None, **kwargs):
         if self.streaming.by_tokens:
             return self.stream_by_tokens(content=content, source=source, step=step, config=config, **kwargs)
@@ -340,7 +393,8 @@ class Agent(Node):
             )
             self.run_on_node_execute_stream(
                 callbacks=config.callbacks,
-                chunk=token_for_stream.model_dump(),
+                chunk=token_for_stream.model_dump() if self.requires_stream_chunk(config.callbacks) else None,
+                delta=token_with_prefix,
                 **kwargs,
             )
         return " ".join(final_response)
@@ -352,7 +406,8 @@ class Agent(Node):
 
         self.run_on_node_execute_stream(
             callbacks=config.callbacks,
-            chunk=response_for_stream.model_dump(),
+            chunk=response_for_stream.model_dump() if self.requires_stream_chunk(config.callbacks) else None,
+            delta=content if isinstance(content, str) else None,
             **kwargs,
         )
         return content
@@ -361,16 +416,9 @@ class Agent(Node):
         """Runs the agent with the generated prompt and handles exceptions."""
         formatted_prompt = self.generate_prompt()
         try:
-            llm_result = self._run_llm(formatted_prompt, config=config, **kwargs)
             if self.streaming.enabled:
-                return self.stream_content(
-                    content=llm_result,
-                    source=self.name,
-                    step="answer",
-                    config=config,
-                    **kwargs,
-                )
-            return llm_result
+                return self._stream_llm(formatted_prompt, step="answer", config=config, **kwargs)
+            return self._run_llm(formatted_prompt, config=config, **kwargs)
 
         except Exception as e:
             raise e
@@ -423,17 +471,17 @@ class Agent(Node):
 
     def _run_tool(self, tool: Node, tool_input: str, config, **kwargs) -> Any:
         """Runs a specific tool with the given input."""
-        if self.files:
+        if files := self.run_state.files:
             if tool.is_files_allowed is True:
-                tool_input["files"] = self.files
+                tool_input["files"] = files
 
         tool_result = tool.run(
             input_data=tool_input,
             config=config,
-            run_depends=self._run_depends,
+            run_depends=self.run_state.run_depends,
             **(kwargs | {"recoverable_error": True}),
         )
-        self._run_depends = [NodeDependency(node=tool).to_dict()]
+        self.run_state.run_depends = [NodeDependency(node=tool).to_dict()]
         if tool_result.status != RunnableStatus.SUCCESS:
             error_message = f"Tool '{tool.name}' failed: {tool_result.output}"
             if tool_result.output["recoverable"]:
@@ -458,10 +506,15 @@ class Agent(Node):
 
     @property
     def file_description(self) -> str:
-        """Returns a description of the files available to the agent."""
-        if self.files:
+        """Returns a description of the files available to the agent in the current run."""
+        return self.get_file_description(self.run_state.files)
+
+    @staticmethod
+    def get_file_description(files: list[io.BytesIO | bytes] | None) -> str:
+        """Returns a description of the given files."""
+        if files:
             file_description = "You can work with the following files:\n"
-            for file in self.files:
+            for file in files:
                 name = getattr(file, "name", "Unnamed file")
                 description = getattr(file, "description", "No description")
                 file_description += f"<file>: {name} - {description} <\\file>\n"
@@ -478,14 +531,13 @@ class Agent(Node):
         """Returns a dictionary mapping tool names to their corresponding Node objects."""
         return {self.sanitize_tool_name(tool.name): tool for tool in self.tools}
 
-    def reset_run_state(self):
-        """Resets the agent's run state."""
-        self._intermediate_steps = {}
-        self._run_depends = []
+    def init_run_state(self) -> AgentRunState:
+        """Creates the agent's run state from the agent definition."""
+        return self.run_state_cls(prompt_variables=self._prompt_variables.copy(), files=self.files)
 
     def generate_prompt(self, block_names: list[str] | None = None, **kwargs) -> str:
         """Generates the prompt using specified blocks and variables."""
-        temp_variables = self._prompt_variables.copy()
+        temp_variables = self.run_state.prompt_variables.copy()
         temp_variables.update(kwargs)
         prompt = ""
         for block, content in self._prompt_blocks.items():
@@ -562,7 +614,7 @@ class AgentManager(Agent):
 
         action = input_data.action
 
-        self._prompt_variables.update(dict(input_data))
+        self.run_state.prompt_variables.update(dict(input_data))
 
         kwargs = kwargs | {"parent_run_id": kwargs.get("run_id")}
         kwargs.pop("run_depends", None)
@@ -571,7 +623,7 @@ class AgentManager(Agent):
 
         execution_result = {
             "content": result,
-            "intermediate_steps": self._intermediate_steps,
+            "intermediate_steps": self.run_state.intermediate_steps,
         }
         logger.info(f"Agent {self.name} - {self.id}: finished with RESULT:\n{str(result)[:200]}...")
 
@@ -580,23 +632,20 @@ class AgentManager(Agent):
     def _plan(self, config: RunnableConfig, **kwargs) -> str:
         """Executes the 'plan' action."""
         prompt = self.generate_prompt(block_names=["plan"])
-        llm_result = self._run_llm(prompt, config, **kwargs)
         if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
-            return self.stream_content(content=llm_result, step="reasoning", source=self.name, config=config, **kwargs)
-        return llm_result
+            return self._stream_llm(prompt, step="reasoning", config=config, **kwargs)
+        return self._run_llm(prompt, config, **kwargs)
 
     def _assign(self, config: RunnableConfig, **kwargs) -> str:
         """Executes the 'assign' action."""
         prompt = self.generate_prompt(block_names=["assign"])
-        llm_result = self._run_llm(prompt, config, **kwargs)
         if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
-            return self.stream_content(content=llm_result, step="reasoning", source=self.name, config=config, **kwargs)
-        return llm_result
+            return self._stream_llm(prompt, step="reasoning", config=config, **kwargs)
+        return self._run_llm(prompt, config, **kwargs)
 
     def _final(self, config: RunnableConfig, **kwargs) -> str:
         """Executes the 'final' action."""
         prompt = self.generate_prompt(block_names=["final"])
-        llm_result = self._run_llm(prompt, config, **kwargs)
         if self.streaming.enabled:
-            return self.stream_content(content=llm_result, step="answer", source=self.name, config=config, **kwargs)
-        return llm_result
+            return self._stream_llm(prompt, step="answer", config=config, **kwargs)
+        return self._run_llm(prompt, config, **kwargs)
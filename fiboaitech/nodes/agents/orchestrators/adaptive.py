@@ -72,10 +72,6 @@ class AdaptiveOrchestrator(Orchestrator):
         data["agents"] = [agent.to_dict(**kwargs) for agent in self.agents]
         return data
 
-    def reset_run_state(self):
-        self._chat_history = []
-        self._run_depends = []
-
     def init_components(self, connection_manager: ConnectionManager | None = None) -> None:
         """
         Initialize components of the orchestrator.
@@ -111,13 +107,13 @@ class AdaptiveOrchestrator(Orchestrator):
             input_data={
                 "action": "plan",
                 "agents": self.agents_descriptions,
-                "chat_history": format_chat_history(self._chat_history),
+                "chat_history": format_chat_history(self.run_state.chat_history),
             },
             config=config,
-            run_depends=self._run_depends,
+            run_depends=self.run_state.run_depends,
             **kwargs,
         )
-        self._run_depends = [NodeDependency(node=self.manager).to_dict()]
+        self.run_state.run_depends = [NodeDependency(node=self.manager).to_dict()]
 
         if manager_result.status != RunnableStatus.SUCCESS:
             error_message = f"Agent '{self.manager.name}' failed: {manager_result.output.get('content')}"
@@ -130,15 +126,15 @@ class AdaptiveOrchestrator(Orchestrator):
                 input_data={
                     "action": "reflect",
                     "agents": self.agents_descriptions,
-                    "chat_history": format_chat_history(self._chat_history),
+                    "chat_history": format_chat_history(self.run_state.chat_history),
                     "plan": manager_content,
                     "agent_output": "",
                 },
                 config=config,
-                run_depends=self._run_depends,
+                run_depends=self.run_state.run_depends,
                 **kwargs,
             )
-            self._run_depends = [NodeDependency(node=self.manager).to_dict()]
+            self.run_state.run_depends = [NodeDependency(node=self.manager).to_dict()]
 
             if reflect_result.status != RunnableStatus.SUCCESS:
                 error_message = (
@@ -159,6 +155,8 @@ class AdaptiveOrchestrator(Orchestrator):
         """
         Process the given task using the manager agent logic.
 
+        With a checkpoint store configured, a resumed run continues from the last completed loop.
+
         Args:
             input_task (str): The task to be processed.
             config (RunnableConfig): Configuration for the runnable.
@@ -166,9 +164,16 @@ class AdaptiveOrchestrator(Orchestrator):
         Returns:
             str: The final answer generated after processing the task.
         """
-        self._chat_history.append({"role": "user", "content": input_task})
+        start_loop = 0
+        if checkpoint := self.load_checkpoint(config):
+            start_loop = checkpoint["loop_num"]
+            self.run_state.chat_history = checkpoint["chat_history"]
+        else:
+            self.run_state.chat_history.append({"role": "user", "content": input_task})
 
-        for i in range(self.max_loops):
+        for i in range(start_loop, self.max_loops):
+            if i > start_loop:
+                self.save_checkpoint(config, {"loop_num": i, "chat_history": self.run_state.chat_history})
             action = self.get_next_action(config=config, **kwargs)
             logger.info(f"Orchestrator {self.name} - {self.id}: Loop {i + 1} - Action: {action.dict()}")
             if action.command == ActionCommand.DELEGATE:
@@ -183,7 +188,7 @@ class AdaptiveOrchestrator(Orchestrator):
                 manager_final_result = self.get_final_result(
                     {
                         "input_task": input_task,
-                        "chat_history": format_chat_history(self._chat_history),
+                        "chat_history": format_chat_history(self.run_state.chat_history),
                         "preliminary_answer": action.answer,
                     },
                     config=config,
@@ -204,15 +209,15 @@ class AdaptiveOrchestrator(Orchestrator):
             result = agent.run(
                 input_data={"input": action.task},
                 config=config,
-                run_depends=self._run_depends,
+                run_depends=self.run_state.run_depends,
                 **kwargs,
             )
-            self._run_depends = [NodeDependency(node=agent).to_dict()]
+            self.run_state.run_depends = [NodeDependency(node=agent).to_dict()]
             if result.status != RunnableStatus.SUCCESS:
                 error_message = f"Agent '{agent.name}' failed: {result.output.get('content')}"
                 raise OrchestratorError(f"Failed to execute Agent {agent.name}, due to error: {error_message}")
 
-            self._chat_history.append(
+            self.run_state.chat_history.append(
                 {
                     "role": "system",
                     "content": f"Agent {action.agent} result: {result.output.get('content')}",
@@ -224,13 +229,13 @@ class AdaptiveOrchestrator(Orchestrator):
                     "action": "respond",
                     "task": action.task,
                     "agents": self.agents_descriptions,
-                    "chat_history": format_chat_history(self._chat_history),
+                    "chat_history": format_chat_history(self.run_state.chat_history),
                 },
                 config=config,
-                run_depends=self._run_depends,
+                run_depends=self.run_state.run_depends,
                 **kwargs,
             )
-            self._run_depends = [NodeDependency(node=self.manager).to_dict()]
+            self.run_state.run_depends = [NodeDependency(node=self.manager).to_dict()]
             if result.status != RunnableStatus.SUCCESS:
                 logger.error(
                     f"Orchestrator {self.name} - {self.id}: "
@@ -238,7 +243,7 @@ class AdaptiveOrchestrator(Orchestrator):
                     f"{result.output.get('content')}"
                 )
 
-            self._chat_history.append(
+            self.run_state.chat_history.append(
                 {
                     "role": "system",
                     "content": f"LLM result: {result.output.get('content')}",
@@ -255,13 +260,13 @@ class AdaptiveOrchestrator(Orchestrator):
                 "action": "respond",
                 "task": action.task,
                 "agents": self.agents_descriptions,
-                "chat_history": format_chat_history(self._chat_history),
+                "chat_history": format_chat_history(self.run_state.chat_history),
             },
             config=config,
-            run_depends=self._run_depends,
+            run_depends=self.run_state.run_depends,
             **kwargs,
         )
-        self._run_depends = [NodeDependency(node=self.manager).to_dict()]
+        self.run_state.run_depends = [NodeDependency(node=self.manager).to_dict()]
 
         if manager_result.status != RunnableStatus.SUCCESS:
             error_message = f"Manager agent '{self.manager.name}' failed: {manager_result.output.get('content')}"
@@ -269,7 +274,7 @@ class AdaptiveOrchestrator(Orchestrator):
 
         manager_result_content = manager_result.output.get("content").get("result")
 
-        self._chat_history.append(
+        self.run_state.chat_history.append(
             {
                 "role": "system",
                 "content": f"[Manager agent '{self.manager.name} - quick response]: {manager_result_content}",
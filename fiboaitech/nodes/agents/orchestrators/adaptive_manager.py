@@ -402,15 +402,13 @@ class AdaptiveAgentManager(AgentManager):
     def _reflect(self, config: RunnableConfig, **kwargs) -> str:
         """Executes the 'reflect' action."""
         prompt = self.generate_prompt(block_names=["reflect"])
-        llm_result = self._run_llm(prompt, config, **kwargs)
         if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
-            return self.stream_content(content=llm_result, step="reasoning", source=self.name, config=config, **kwargs)
-        return llm_result
+            return self._stream_llm(prompt, step="reasoning", config=config, **kwargs)
+        return self._run_llm(prompt, config, **kwargs)
 
     def _respond(self, config: RunnableConfig, **kwargs) -> str:
         """Executes the 'respond' action."""
         prompt = self.generate_prompt(block_names=["respond"])
-        llm_result = self._run_llm(prompt, config, **kwargs)
         if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
-            return self.stream_content(content=llm_result, step="reasoning", source=self.name, config=config, **kwargs)
-        return llm_result
+            return self._stream_llm(prompt, step="reasoning", config=config, **kwargs)
+        return self._run_llm(prompt, config, **kwargs)
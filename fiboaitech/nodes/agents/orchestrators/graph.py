@@ -1,12 +1,12 @@
 import json
-from typing import Any, Callable
+from typing import Any, Callable, ClassVar
 
 from fiboaitech.callbacks import NodeCallbackHandler
 from fiboaitech.connections.managers import ConnectionManager
 from fiboaitech.nodes.agents.base import Agent
 from fiboaitech.nodes.agents.orchestrators.graph_manager import GraphAgentManager
 from fiboaitech.nodes.agents.orchestrators.graph_state import GraphState
-from fiboaitech.nodes.agents.orchestrators.orchestrator import Orchestrator, OrchestratorError
+from fiboaitech.nodes.agents.orchestrators.orchestrator import Orchestrator, OrchestratorError, OrchestratorRunState
 from fiboaitech.nodes.node import Node, NodeDependency
 from fiboaitech.nodes.tools import Python
 from fiboaitech.nodes.tools.function_tool import function_tool
@@ -23,6 +23,16 @@ START = "START"
 END = "END"
 
 
+class GraphOrchestratorRunState(OrchestratorRunState):
+    """
+    Per-run scratch state of the graph orchestrator.
+
+    Attributes:
+        context (dict[str, Any]): Context of the run, initialized from the orchestrator context.
+    """
+    context: dict[str, Any] = {}
+
+
 class GraphOrchestrator(Orchestrator):
     """
     Orchestrates the execution of complex tasks, interconnected within the graph structure.
@@ -32,7 +42,7 @@ class GraphOrchestrator(Orchestrator):
 
     Attributes:
         manager (ManagerAgent): The managing agent responsible for overseeing the orchestration process.
-        context (Dict[str, Any]): Context of the orchestrator.
+        context (Dict[str, Any]): Initial context of the orchestrator runs. Runs update their own copy.
         states (List[GraphState]): List of states within orchestrator.
         initial_state (str): State to start from.
         objective (Optional[str]): The main objective of the orchestration.
@@ -46,6 +56,8 @@ class GraphOrchestrator(Orchestrator):
     states: list[GraphState] = []
     max_loops: int = 15
 
+    run_state_cls: ClassVar[type[GraphOrchestratorRunState]] = GraphOrchestratorRunState
+
     def init_components(self, connection_manager: ConnectionManager | None = None) -> None:
         """
         Initialize components of the orchestrator.
@@ -62,6 +74,10 @@ class GraphOrchestrator(Orchestrator):
             if state.is_postponed_component_init:
                 state.init_components(connection_manager)
 
+    def init_run_state(self) -> GraphOrchestratorRunState:
+        """Creates the run state with the orchestrator context."""
+        return self.run_state_cls(context=self.context.copy())
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._state_by_id = {state.id: state for state in self.states}
@@ -227,13 +243,13 @@ class GraphOrchestrator(Orchestrator):
             input_data={
                 "action": "plan",
                 "states_description": self.states_descriptions(state.next_states),
-                "chat_history": self._chat_history,
+                "chat_history": self.run_state.chat_history,
             },
             config=config,
-            run_depends=self._run_depends,
+            run_depends=self.run_state.run_depends,
             **kwargs,
         )
-        self._run_depends = [NodeDependency(node=self.manager).to_dict()]
+        self.run_state.run_depends = [NodeDependency(node=self.manager).to_dict()]
 
         if manager_result.status != RunnableStatus.SUCCESS:
             logger.error(f"GraphOrchestrator {self.id}: Error generating final answer")
@@ -264,22 +280,22 @@ class GraphOrchestrator(Orchestrator):
             OrchestratorError: If there is an error parsing output of conditional edge.
             StateNotFoundError: If the state is invalid or not found.
         """
-        prompt = "\n".join([f"{msg['role']}: {msg['content']}" for msg in self._chat_history])
+        prompt = "\n".join([f"{msg['role']}: {msg['content']}" for msg in self.run_state.chat_history])
 
         logger.debug(f"GraphOrchestrator {self.id}: PROMPT {prompt}")
 
         if len(state.next_states) > 1:
             if condition := state.condition:
                 if isinstance(condition, Python):
-                    input_data = {**self.context, "history": self._chat_history}
+                    input_data = {**self.run_state.context, "history": self.run_state.chat_history}
                 else:
-                    input_data = {"context": self.context | {"history": self._chat_history}}
+                    input_data = {"context": self.run_state.context | {"history": self.run_state.chat_history}}
 
                 next_state = condition.run(
-                    input_data=input_data, config=config, run_depends=self._run_depends, **kwargs
+                    input_data=input_data, config=config, run_depends=self.run_state.run_depends, **kwargs
                 ).output.get("content")
 
-                self._run_depends = [NodeDependency(node=condition).to_dict()]
+                self.run_state.run_depends = [NodeDependency(node=condition).to_dict()]
 
                 if not isinstance(next_state, str):
                     raise OrchestratorError(
@@ -313,7 +329,7 @@ class GraphOrchestrator(Orchestrator):
             str: The final answer generated after processing the task.
         """
 
-        self._chat_history.append({"role": "user", "content": input_task})
+        self.run_state.chat_history.append({"role": "user", "content": input_task})
         state = self._state_by_id[self.initial_state]
 
         for _ in range(self.max_loops):
@@ -323,7 +339,7 @@ class GraphOrchestrator(Orchestrator):
                 return self.get_final_result(
                     {
                         "input_task": input_task,
-                        "chat_history": self._chat_history,
+                        "chat_history": self.run_state.chat_history,
                     },
                     config=config,
                     **kwargs,
@@ -332,15 +348,15 @@ class GraphOrchestrator(Orchestrator):
             elif state.id != START:
 
                 output = state.run(
-                    input_data={"context": self.context, "chat_history": self._chat_history},
+                    input_data={"context": self.run_state.context, "chat_history": self.run_state.chat_history},
                     config=config,
-                    run_depends=self._run_depends,
+                    run_depends=self.run_state.run_depends,
                     **kwargs,
                 ).output
 
-                self.context = self.context | output["context"]
-                self._run_depends = [NodeDependency(node=state).to_dict()]
-                self._chat_history = self._chat_history + output["history_messages"]
+                self.run_state.context = self.run_state.context | output["context"]
+                self.run_state.run_depends = [NodeDependency(node=state).to_dict()]
+                self.run_state.chat_history = self.run_state.chat_history + output["history_messages"]
 
             state = self._get_next_state(state, config=config, **kwargs)
 
@@ -2,7 +2,7 @@ import json
 import re
 from enum import Enum
 from functools import cached_property
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import BaseModel, Field, TypeAdapter
 
@@ -10,7 +10,12 @@ from fiboaitech.connections.managers import ConnectionManager
 from fiboaitech.nodes import NodeGroup
 from fiboaitech.nodes.agents.base import Agent
 from fiboaitech.nodes.agents.orchestrators.linear_manager import LinearAgentManager
-from fiboaitech.nodes.agents.orchestrators.orchestrator import ActionParseError, Orchestrator, OrchestratorError
+from fiboaitech.nodes.agents.orchestrators.orchestrator import (
+    ActionParseError,
+    Orchestrator,
+    OrchestratorError,
+    OrchestratorRunState,
+)
 from fiboaitech.nodes.node import NodeDependency
 from fiboaitech.runnables import RunnableConfig, RunnableStatus
 from fiboaitech.types.feedback import PlanApprovalConfig
@@ -58,6 +63,16 @@ class DecisionResult(BaseModel):
     message: str
 
 
+class LinearOrchestratorRunState(OrchestratorRunState):
+    """
+    Per-run scratch state of the linear orchestrator.
+
+    Attributes:
+        results (dict[int, dict]): Results of the completed tasks by task id.
+    """
+    results: dict[int, dict] = {}
+
+
 class LinearOrchestrator(Orchestrator):
     """
     Manages the execution of tasks by coordinating multiple agents and leveraging LLM (Large Language Model).
@@ -84,9 +99,7 @@ class LinearOrchestrator(Orchestrator):
     plan_approval: PlanApprovalConfig = Field(default_factory=PlanApprovalConfig)
     max_user_analyze_retries: int = 3
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self._results = {}
+    run_state_cls: ClassVar[type[LinearOrchestratorRunState]] = LinearOrchestratorRunState
 
     @property
     def to_dict_exclude_params(self):
@@ -103,11 +116,6 @@ class LinearOrchestrator(Orchestrator):
         data["agents"] = [agent.to_dict(**kwargs) for agent in self.agents]
         return data
 
-    def reset_run_state(self):
-        self._results = {}
-        self._run_depends = []
-        self._chat_history = []
-
     def init_components(self, connection_manager: ConnectionManager | None = None):
         """
         Initialize components for the manager and agents.
@@ -144,10 +152,10 @@ class LinearOrchestrator(Orchestrator):
                     "previous_plan": manager_result_content,
                 },
                 config=config,
-                run_depends=self._run_depends,
+                run_depends=self.run_state.run_depends,
                 **kwargs,
             )
-            self._run_depends = [NodeDependency(node=self.manager).to_dict()]
+            self.run_state.run_depends = [NodeDependency(node=self.manager).to_dict()]
 
             if manager_result.status != RunnableStatus.SUCCESS:
                 error_message = f"LLM '{self.manager.name}' failed: {manager_result.output.get('content')}"
@@ -212,17 +220,20 @@ class LinearOrchestrator(Orchestrator):
 
         dependencies_formatted = "**Here is the previously collected information:**\n"
         for dep in dependencies:
-            if dep in self._results:
-                task_name = self._results[dep]["name"]
-                task_result = str(self._results[dep]["result"])
+            if dep in self.run_state.results:
+                task_name = self.run_state.results[dep]["name"]
+                task_result = str(self.run_state.results[dep]["result"])
                 dependencies_formatted += f"**Task:** {task_name}\n**Result:** {task_result}\n\n"
 
         return dependencies_formatted.strip()
 
     def run_tasks(self, tasks: list[Task], input_task: str, config: RunnableConfig = None, **kwargs) -> None:
-        """Execute the tasks using appropriate agents."""
+        """Execute the tasks using appropriate agents, skipping tasks completed by a resumed run."""
 
         for count, task in enumerate(tasks, start=1):
+            if task.id in self.run_state.results:
+                continue
+
             task_per_llm = f"**{task.description}**\n**Required information for output**: {task.output}"
 
             dependency_outputs = self.get_dependency_outputs(task.dependencies)
@@ -239,10 +250,10 @@ class LinearOrchestrator(Orchestrator):
                         "agents": self.agents_descriptions,
                     },
                     config=config,
-                    run_depends=self._run_depends,
+                    run_depends=self.run_state.run_depends,
                     **kwargs,
                 )
-                self._run_depends = [NodeDependency(node=self.manager).to_dict()]
+                self.run_state.run_depends = [NodeDependency(node=self.manager).to_dict()]
 
                 if manager_result.status == RunnableStatus.SUCCESS:
                     try:
@@ -271,10 +282,10 @@ class LinearOrchestrator(Orchestrator):
                         result = assigned_agent.run(
                             input_data={"input": task_per_llm},
                             config=config,
-                            run_depends=self._run_depends,
+                            run_depends=self.run_state.run_depends,
                             **kwargs,
                         )
-                        self._run_depends = [NodeDependency(node=assigned_agent).to_dict()]
+                        self.run_state.run_depends = [NodeDependency(node=assigned_agent).to_dict()]
                         if result.status != RunnableStatus.SUCCESS:
                             raise ValueError(
                                 f"Failed to execute task {task.id}.{task.name} "
@@ -282,10 +293,11 @@ class LinearOrchestrator(Orchestrator):
                                 f"due to error: {result.output.get('content')}"
                             )
 
-                        self._results[task.id] = {
+                        self.run_state.results[task.id] = {
                             "name": task.name,
                             "result": result.output["content"],
                         }
+                        self.save_checkpoint(config, {"tasks": tasks, "results": self.run_state.results})
 
                         success_flag = True
                         break
@@ -313,20 +325,22 @@ class LinearOrchestrator(Orchestrator):
             str: The final answer generated after processing the task.
         """
         tasks_outputs = "\n\n".join(
-            f"**Task:** {result['name']}\n**Result:** {result['result']}" for result in self._results.values() if result
+            f"**Task:** {result['name']}\n**Result:** {result['result']}"
+            for result in self.run_state.results.values()
+            if result
         )
 
         if self.use_summarizer:
             if not self.summarize_all_answers:
-                final_task_id = max(self._results.keys(), default=None)
+                final_task_id = max(self.run_state.results.keys(), default=None)
 
                 if final_task_id is not None:
-                    final_task_output = self._results[final_task_id].get("result", "")
+                    final_task_output = self.run_state.results[final_task_id].get("result", "")
                     logger.debug(f"Orchestrator {self.name} - {self.id}: Final task output: {final_task_output}")
                     return final_task_output
 
             final_result_content = self.get_final_result(
-                {"input_task": task, "chat_history": self._chat_history, "tasks_outputs": tasks_outputs},
+                {"input_task": task, "chat_history": self.run_state.chat_history, "tasks_outputs": tasks_outputs},
                 config=config,
                 **kwargs,
             )
@@ -343,6 +357,8 @@ class LinearOrchestrator(Orchestrator):
         """
         Process the given task using the manager agent logic.
 
+        With a checkpoint store configured, a resumed run reuses the plan and the completed task results.
+
         Args:
             input_task (str): The task to be processed.
             config (RunnableConfig): Configuration for the runnable.
@@ -350,16 +366,19 @@ class LinearOrchestrator(Orchestrator):
         Returns:
             str: The final answer generated after processing the task.
         """
-        analysis = self._analyze_user_input(input_task, config=config, **kwargs)
-        decision = analysis.decision
-        message = analysis.message
-
-        if decision == Decision.RESPOND:
-            return message
+        if checkpoint := self.load_checkpoint(config):
+            tasks = checkpoint["tasks"]
+            self.run_state.results = checkpoint["results"]
         else:
+            analysis = self._analyze_user_input(input_task, config=config, **kwargs)
+            if analysis.decision == Decision.RESPOND:
+                return analysis.message
+
             tasks = self.get_tasks(input_task, config=config, **kwargs)
-            self.run_tasks(tasks=tasks, input_task=input_task, config=config, **kwargs)
-            return self.generate_final_answer(input_task, config, **kwargs)
+            self.save_checkpoint(config, {"tasks": tasks, "results": self.run_state.results})
+
+        self.run_tasks(tasks=tasks, input_task=input_task, config=config, **kwargs)
+        return self.generate_final_answer(input_task, config, **kwargs)
 
     def setup_streaming(self) -> None:
         """Setups streaming for orchestrator."""
@@ -372,12 +372,11 @@ class LinearAgentManager(AgentManager):
         Executes the single 'handle_input' action to either respond or plan
         based on user request complexity.
         """
-        temp_variables = self._prompt_variables.copy()
+        temp_variables = self.run_state.prompt_variables.copy()
         temp_variables.update(kwargs)
         _prompt = self._get_linear_handle_input_prompt()
         _prompt = _prompt.replace("task_placeholder", temp_variables.get("task"))
         _prompt = _prompt.replace("agents_placeholder", temp_variables.get("agents"))
-        llm_result = self._run_llm(_prompt, config, **kwargs)
         if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
-            return self.stream_content(content=llm_result, step="reasoning", source=self.name, config=config, **kwargs)
-        return llm_result
+            return self._stream_llm(_prompt, step="reasoning", config=config, **kwargs)
+        return self._run_llm(_prompt, config, **kwargs)
@@ -5,7 +5,7 @@ from pydantic import BaseModel, Field
 
 from fiboaitech.nodes import Node, NodeGroup
 from fiboaitech.nodes.agents.base import AgentManager
-from fiboaitech.nodes.node import NodeDependency, ensure_config
+from fiboaitech.nodes.node import NodeDependency, NodeRunState, ensure_config
 from fiboaitech.runnables import RunnableConfig, RunnableStatus
 from fiboaitech.utils.logger import logger
 
@@ -26,6 +26,16 @@ class OrchestratorInputSchema(BaseModel):
     input: str = Field(default="", description="The main objective of the orchestration.")
 
 
+class OrchestratorRunState(NodeRunState):
+    """
+    Per-run scratch state of the orchestrator.
+
+    Attributes:
+        chat_history (list[dict]): Chat history of the run.
+    """
+    chat_history: list[dict] = []
+
+
 class Orchestrator(Node, ABC):
     """
     Orchestrates the execution of complex tasks using multiple specialized agents.
@@ -38,6 +48,7 @@ class Orchestrator(Node, ABC):
     name: str | None = "Orchestrator"
     group: NodeGroup = NodeGroup.AGENTS
     input_schema: ClassVar[type[OrchestratorInputSchema]] = OrchestratorInputSchema
+    run_state_cls: ClassVar[type[OrchestratorRunState]] = OrchestratorRunState
     manager: AgentManager
     objective: str = ""
 
@@ -49,8 +60,6 @@ class Orchestrator(Node, ABC):
             **kwargs: Arbitrary keyword arguments.
         """
         super().__init__(**kwargs)
-        self._run_depends = []
-        self._chat_history = []
 
     def get_final_result(
         self,
@@ -76,10 +85,10 @@ class Orchestrator(Node, ABC):
         manager_result = self.manager.run(
             input_data={"action": "final", **input_data},
             config=config,
-            run_depends=self._run_depends,
+            run_depends=self.run_state.run_depends,
             **kwargs,
         )
-        self._run_depends = [NodeDependency(node=self.manager).to_dict()]
+        self.run_state.run_depends = [NodeDependency(node=self.manager).to_dict()]
 
         if manager_result.status != RunnableStatus.SUCCESS:
             error_message = f"Manager '{self.manager.name}' failed: {manager_result.output.get('content')}"
@@ -90,10 +99,6 @@ class Orchestrator(Node, ABC):
 
         return manager_result.output.get("content").get("result")
 
-    def reset_run_state(self):
-        self._run_depends = []
-        self._chat_history = []
-
     @abstractmethod
     def run_flow(self, input_task: str, config: RunnableConfig = None, **kwargs) -> str:
         """
@@ -143,6 +148,7 @@ class Orchestrator(Node, ABC):
             config=config,
             **kwargs,
         )
+        self.clear_checkpoint(config)
 
         logger.info(f"Orchestrator {self.name} - {self.id}: finished with RESULT:\n{str(result)[:200]}...")
         return {"content": result}
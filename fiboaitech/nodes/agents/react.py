@@ -8,6 +8,7 @@ from pydantic import Field, model_validator
 
 from fiboaitech.nodes.agents.base import Agent, AgentIntermediateStep, AgentIntermediateStepModelObservation
 from fiboaitech.nodes.agents.exceptions import ActionParsingException, MaxLoopsExceededException, RecoverableAgentException
+from fiboaitech.nodes.agents.streaming import AnswerStreamParser, JsonAnswerStreamParser, MarkerAnswerStreamParser
 from fiboaitech.nodes.node import Node, NodeDependency
 from fiboaitech.nodes.types import Behavior, InferenceMode
 from fiboaitech.prompts import Message, Prompt
@@ -281,11 +282,24 @@ class ReActAgent(Agent):
         answer = self.parse_xml_content(text, "answer")
         return {"output": output, "answer": answer}
 
+    def get_answer_stream_parser(self) -> AnswerStreamParser | None:
+        """Creates the parser finding the final answer in the LLM output streamed in the inference mode."""
+        match self.inference_mode:
+            case InferenceMode.DEFAULT:
+                return MarkerAnswerStreamParser(start="Answer:")
+            case InferenceMode.XML:
+                return MarkerAnswerStreamParser(start="<answer>", end="</answer>")
+            case InferenceMode.STRUCTURED_OUTPUT:
+                return JsonAnswerStreamParser(
+                    answer_field="action_input", condition_field="action", condition_value="finish"
+                )
+        return None
+
     def tracing_final(self, loop_num, final_answer, config, kwargs):
-        self._intermediate_steps[loop_num]["final_answer"] = final_answer
+        self.run_state.intermediate_steps[loop_num]["final_answer"] = final_answer
 
     def tracing_intermediate(self, loop_num, formatted_prompt, llm_generated_output):
-        self._intermediate_steps[loop_num] = AgentIntermediateStep(
+        self.run_state.intermediate_steps[loop_num] = AgentIntermediateStep(
             input_data={"prompt": formatted_prompt},
             model_observation=AgentIntermediateStepModelObservation(
                 initial=llm_generated_output,
@@ -295,6 +309,9 @@ class ReActAgent(Agent):
     def _run_agent(self, config: RunnableConfig | None = None, **kwargs) -> str:
         """
         Executes the ReAct strategy by iterating through thought, action, and observation cycles.
+
+        With a checkpoint store configured, the state of completed loops is saved, so a resumed run continues
+        from the last completed loop.
         Args:
             config (RunnableConfig | None): Configuration for the agent run.
             **kwargs: Additional parameters for running the agent.
@@ -307,7 +324,22 @@ class ReActAgent(Agent):
         if self.verbose:
             logger.info(f"Agent {self.name} - {self.id}: Running ReAct strategy")
         previous_responses = []
-        for loop_num in range(self.max_loops):
+        start_loop = 0
+        if checkpoint := self.load_checkpoint(config):
+            start_loop = checkpoint["loop_num"]
+            previous_responses = checkpoint["previous_responses"]
+            self.run_state.intermediate_steps = checkpoint["intermediate_steps"]
+
+        for loop_num in range(start_loop, self.max_loops):
+            if loop_num > start_loop:
+                self.save_checkpoint(
+                    config,
+                    {
+                        "loop_num": loop_num,
+                        "previous_responses": previous_responses,
+                        "intermediate_steps": self.run_state.intermediate_steps,
+                    },
+                )
             formatted_prompt = self.generate_prompt(
                 user_request=kwargs.get("input", ""),
                 tools_desc=self.tool_description,
@@ -315,17 +347,34 @@ class ReActAgent(Agent):
                 context="\n".join(previous_responses),
                 input_formats=self.generate_input_formats(self.tools),
             )
+            token_stream = None
+            # Function calling outputs come in tool call arguments, so they are streamed from the full output
+            if self.inference_mode != InferenceMode.FUNCTION_CALLING:
+                token_stream = self.get_token_stream(
+                    config,
+                    step=f"reasoning_{loop_num + 1}" if self.streaming.mode == StreamingMode.ALL else None,
+                    answer_parser=self.get_answer_stream_parser(),
+                    **kwargs,
+                )
             try:
                 llm_result = self.llm.run(
                     input_data={},
                     config=config,
                     prompt=Prompt(messages=[Message(role="user", content=formatted_prompt)]),
-                    run_depends=self._run_depends,
+                    run_depends=self.run_state.run_depends,
                     schema=self.format_schema,
                     inference_mode=self.inference_mode,
+                    token_callback=token_stream,
                     **kwargs,
                 )
-                self._run_depends = [NodeDependency(node=self.llm).to_dict()]
+                self.run_state.run_depends = [NodeDependency(node=self.llm).to_dict()]
+                # Parts already streamed token by token aren't streamed again from the full output
+                stream_reasoning = (
+                    self.streaming.enabled
+                    and self.streaming.mode == StreamingMode.ALL
+                    and not (token_stream and token_stream.streamed_step)
+                )
+                stream_answer = self.streaming.enabled and not (token_stream and token_stream.streamed_answer)
 
                 if llm_result.status != RunnableStatus.SUCCESS:
                     previous_responses.append(llm_result.output["content"])
@@ -340,7 +389,7 @@ class ReActAgent(Agent):
                     case InferenceMode.DEFAULT:
                         llm_generated_output = llm_result.output["content"]
                         self.tracing_intermediate(loop_num, formatted_prompt, llm_generated_output)
-                        if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
+                        if stream_reasoning:
                             self.stream_content(
                                 content=llm_generated_output,
                                 source=self.name,
@@ -351,7 +400,7 @@ class ReActAgent(Agent):
                         if "Answer:" in llm_generated_output:
                             final_answer = self._extract_final_answer(llm_generated_output)
                             self.tracing_final(loop_num, final_answer, config, kwargs)
-                            if self.streaming.enabled:
+                            if stream_answer:
                                 self.stream_content(
                                     content=final_answer,
                                     source=self.name,
@@ -370,7 +419,7 @@ class ReActAgent(Agent):
 
                         llm_generated_output = json.dumps(llm_generated_output_json)
                         self.tracing_intermediate(loop_num, formatted_prompt, llm_generated_output)
-                        if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
+                        if stream_reasoning:
                             self.stream_content(
                                 content=llm_generated_output,
                                 source=self.name,
@@ -381,7 +430,7 @@ class ReActAgent(Agent):
                         if action == "provide_final_answer":
                             final_answer = llm_generated_output_json["answer"]
                             self.tracing_final(loop_num, final_answer, config, kwargs)
-                            if self.streaming.enabled:
+                            if stream_answer:
                                 self.stream_content(
                                     content=final_answer,
                                     source=self.name,
@@ -398,7 +447,7 @@ class ReActAgent(Agent):
                         llm_generated_output_json = json.loads(llm_result.output["content"])
                         action = llm_generated_output_json["action"]
                         self.tracing_intermediate(loop_num, formatted_prompt, llm_generated_output)
-                        if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
+                        if stream_reasoning:
                             self.stream_content(
                                 content=llm_generated_output,
                                 source=self.name,
@@ -409,7 +458,7 @@ class ReActAgent(Agent):
                         if action == "finish":
                             final_answer = llm_generated_output_json["action_input"]
                             self.tracing_final(loop_num, final_answer, config, kwargs)
-                            if self.streaming.enabled:
+                            if stream_answer:
                                 self.stream_content(
                                     content=final_answer,
                                     source=self.name,
@@ -426,7 +475,7 @@ class ReActAgent(Agent):
                             logger.info(f"Agent {self.name} - {self.id}: using XML inference mode")
                         llm_generated_output = llm_result.output["content"]
                         self.tracing_intermediate(loop_num, formatted_prompt, llm_generated_output)
-                        if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
+                        if stream_reasoning:
                             self.stream_content(
                                 content=llm_generated_output,
                                 source=self.name,
@@ -437,7 +486,7 @@ class ReActAgent(Agent):
                         if "<answer>" in llm_generated_output:
                             final_answer = self._extract_final_answer_xml(llm_generated_output)
                             self.tracing_final(loop_num, final_answer, config, kwargs)
-                            if self.streaming.enabled:
+                            if stream_answer:
                                 self.stream_content(
                                     content=final_answer,
                                     source=self.name,
@@ -467,7 +516,7 @@ class ReActAgent(Agent):
                                 **kwargs,
                             )
 
-                        self._intermediate_steps[loop_num]["model_observation"].update(
+                        self.run_state.intermediate_steps[loop_num]["model_observation"].update(
                             AgentIntermediateStepModelObservation(
                                 tool_using=action,
                                 tool_input=action_input,
@@ -508,7 +557,7 @@ class ReActAgent(Agent):
         """
         final_attempt_prompt = REACT_MAX_LOOPS_PROMPT.format(context="\n".join(previous_responses))
         llm_final_attempt = self._run_llm(final_attempt_prompt, config=config, **kwargs)
-        self._run_depends = [NodeDependency(node=self.llm).to_dict()]
+        self.run_state.run_depends = [NodeDependency(node=self.llm).to_dict()]
         final_answer = self.parse_xml_content(llm_final_attempt, "answer")
 
         return f"{final_answer}"
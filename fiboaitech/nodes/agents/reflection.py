@@ -74,7 +74,10 @@ class ReflectionAgent(Agent):
             formatted_prompt = self.generate_prompt(
                 block_names=["introduction", "role", "date", "instructions", "request"]
             )
-            result = self._run_llm(formatted_prompt, config=config, **kwargs)
+            token_stream = None
+            if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
+                token_stream = self.get_token_stream(config, step="reasoning", **kwargs)
+            result = self._run_llm(formatted_prompt, config=config, token_stream=token_stream, **kwargs)
             output_content = self.extract_output_content(result)
             if self.verbose:
                 logger.info(f"Agent {self.name} - {self.id}: LLM output by REFLECTION prompt:\n{result[:200]}...")
@@ -90,6 +93,8 @@ class ReflectionAgent(Agent):
                         **kwargs,
                     )
                 elif self.streaming.mode == StreamingMode.ALL:
+                    if token_stream and token_stream.streamed_step:
+                        return result
                     return self.stream_content(
                         content=result, step="reasoning", source=self.name, config=config, **kwargs
                     )
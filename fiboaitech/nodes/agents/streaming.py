@@ -0,0 +1,182 @@
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import Callable
+
+ANSWER_STEP = "answer"
+
+
+class AnswerStreamParser(ABC):
+    """Base class for parsers finding the final answer in the LLM output while it is generated."""
+
+    @abstractmethod
+    def feed(self, delta: str) -> str:
+        """Parse the next token of the output.
+
+        Args:
+            delta (str): Text of the token.
+
+        Returns:
+            str: Answer text that became available, empty if there is none yet.
+        """
+        raise NotImplementedError
+
+
+class MarkerAnswerStreamParser(AnswerStreamParser):
+    """Parser of answers following a start marker, e.g. "Answer:", up to an optional end marker, e.g. "</answer>".
+
+    Surrounding whitespace is stripped like the agents do with the full output, so trailing whitespace and text
+    that may start the end marker are held back until the next tokens show what they are.
+
+    Args:
+        start (str): Marker the answer follows.
+        end (str | None): Marker ending the answer. Defaults to None, the answer lasts to the end of the output.
+    """
+
+    def __init__(self, start: str, end: str | None = None):
+        self.start = start
+        self.end = end
+        self._buffer = ""
+        self._pending = ""
+        self._started = False
+        self._finished = False
+        self._emitted = False
+
+    def _get_held_back_size(self) -> int:
+        """Returns the size of the pending suffix that may be the beginning of the end marker."""
+        if not self.end:
+            return 0
+        for size in range(min(len(self.end) - 1, len(self._pending)), 0, -1):
+            if self._pending.endswith(self.end[:size]):
+                return size
+        return 0
+
+    def feed(self, delta: str) -> str:
+        if self._finished:
+            return ""
+
+        if not self._started:
+            self._buffer += delta
+            if (position := self._buffer.find(self.start)) == -1:
+                # Keep only the tail that may contain the beginning of the marker
+                self._buffer = self._buffer[-(len(self.start) - 1):] if len(self.start) > 1 else ""
+                return ""
+            self._started = True
+            delta = self._buffer[position + len(self.start):]
+            self._buffer = ""
+
+        self._pending += delta if self._emitted or self._pending else delta.lstrip()
+        if self.end and (position := self._pending.find(self.end)) != -1:
+            self._finished = True
+            answer, self._pending = self._pending[:position].rstrip(), ""
+            return answer
+
+        ready = self._pending[:len(self._pending) - self._get_held_back_size()].rstrip()
+        self._pending = self._pending[len(ready):]
+        self._emitted = self._emitted or bool(ready)
+        return ready
+
+
+class JsonAnswerStreamParser(AnswerStreamParser):
+    """Parser of answers in a string field of JSON output, e.g. structured output of the ReAct agent.
+
+    The answer is streamed once another field shows that the output is final, e.g. `"action": "finish"`. If that
+    field comes after the answer, the answer is returned at once when the field is generated.
+
+    Args:
+        answer_field (str): Field holding the answer.
+        condition_field (str): Field showing that the output is final.
+        condition_value (str): Value of the condition field for final outputs.
+    """
+
+    def __init__(self, answer_field: str, condition_field: str, condition_value: str):
+        self._answer_pattern = re.compile(rf'"{re.escape(answer_field)}"\s*:\s*"')
+        self._condition_pattern = re.compile(rf'"{re.escape(condition_field)}"\s*:\s*"((?:[^"\\]|\\.)*)"')
+        self.condition_value = condition_value
+        self._text = ""
+        self._position: int | None = None
+        self._is_final: bool | None = None
+        self._finished = False
+
+    def _decode(self) -> str:
+        """Decodes the complete characters of the answer string, stopping at the closing quote."""
+        chars = []
+        text = self._text
+        while self._position < len(text):
+            char = text[self._position]
+            if char == '"':
+                self._finished = True
+                break
+            if char != "\\":
+                chars.append(char)
+                self._position += 1
+                continue
+
+            size = 6 if text[self._position + 1:self._position + 2] == "u" else 2
+            # A high surrogate is decoded together with the low one following it
+            if size == 6 and text[self._position + 2:self._position + 4].lower() in ("d8", "d9", "da", "db"):
+                size = 12
+            if self._position + size > len(text):
+                break
+            chars.append(json.loads(f'"{text[self._position:self._position + size]}"'))
+            self._position += size
+        return "".join(chars)
+
+    def feed(self, delta: str) -> str:
+        if self._finished:
+            return ""
+
+        self._text += delta
+        if self._is_final is None and (match := self._condition_pattern.search(self._text)):
+            self._is_final = json.loads(f'"{match.group(1)}"') == self.condition_value
+        if self._is_final is False:
+            self._finished = True
+            return ""
+
+        if self._position is None and (match := self._answer_pattern.search(self._text)):
+            self._position = match.end()
+        if not self._is_final or self._position is None:
+            return ""
+        return self._decode()
+
+
+class AgentTokenStream:
+    """Forwards the tokens of the agent LLM to the stream of the agent as they are generated.
+
+    Used as the token callback of the LLM run. All tokens can be streamed as a step, e.g. reasoning, and the
+    answer found by the parser is streamed as the answer step.
+
+    Args:
+        emit (Callable[[str, str], None]): Streams the content of the step.
+        step (str | None): Step streaming all tokens. Defaults to None.
+        answer_parser (AnswerStreamParser | None): Parser finding the answer. Defaults to None.
+
+    Attributes:
+        streamed_step (bool): Whether tokens of the step were streamed.
+        streamed_answer (bool): Whether answer text was streamed.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[str, str], None],
+        step: str | None = None,
+        answer_parser: AnswerStreamParser | None = None,
+    ):
+        self.emit = emit
+        self.step = step
+        self.answer_parser = answer_parser
+        self.streamed_step = False
+        self.streamed_answer = False
+
+    def __call__(self, delta: str) -> None:
+        """Stream the token.
+
+        Args:
+            delta (str): Text of the token.
+        """
+        if self.step is not None:
+            self.emit(delta, self.step)
+            self.streamed_step = True
+        if self.answer_parser is not None and (answer := self.answer_parser.feed(delta)):
+            self.emit(answer, ANSWER_STEP)
+            self.streamed_answer = True
@@ -121,13 +121,6 @@ class LLMImageConverter(Node):
             **kwargs: Additional keyword arguments to be passed to the parent class constructor.
         """
         super().__init__(**kwargs)
-        self._run_depends = []
-
-    def reset_run_state(self):
-        """
-        Reset the intermediate steps (run_depends) of the node.
-        """
-        self._run_depends = []
 
     @property
     def to_dict_exclude_params(self):
@@ -377,10 +370,10 @@ class LLMImageConverter(Node):
             input_data=input_data,
             prompt=prompt,
             config=config,
-            run_depends=self._run_depends,
+            run_depends=self.run_state.run_depends,
             **run_kwargs,
         )
-        self._run_depends = [NodeDependency(node=self.llm).to_dict()]
+        self.run_state.run_depends = [NodeDependency(node=self.llm).to_dict()]
 
         if llm_result.status != RunnableStatus.SUCCESS:
             logger.error(f"Node {self.name} - {self.id}: LLM execution failed")
@@ -1,14 +1,18 @@
+import asyncio
+import copy
 import json
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, Literal, Union
 
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
+from fiboaitech.cache.semantic import SemanticCache, SemanticCacheLookup
 from fiboaitech.connections import BaseConnection, HttpApiKey
 from fiboaitech.nodes import ErrorHandling, NodeGroup
 from fiboaitech.nodes.node import ConnectionNode, ensure_config
 from fiboaitech.nodes.types import InferenceMode
 from fiboaitech.prompts import Prompt
 from fiboaitech.runnables import RunnableConfig
+from fiboaitech.utils.logger import logger
 
 if TYPE_CHECKING:
     from litellm import CustomStreamWrapper, ModelResponse
@@ -77,6 +81,7 @@ class BaseLLM(ConnectionNode):
         - InferenceMode.STRUCTURED_OUTPUT: Produces structured JSON output.
         - InferenceMode.FUNCTION_CALLING: Structured output for tools (functions) to be called.
         dict[str, Any] | type[BaseModel] | None: schema_ for structured output. Defaults to empty dict.
+        semantic_cache (SemanticCache | None): Cache reusing completions of similar prompts. Disabled by default.
     """
 
     MODEL_PREFIX: ClassVar[str | None] = None
@@ -98,8 +103,10 @@ class BaseLLM(ConnectionNode):
     schema_: dict[str, Any] | type[BaseModel] | None = Field(
         None, description="Schema for structured output or function calling.", alias="schema"
     )
+    semantic_cache: SemanticCache | None = None
 
     _completion: Callable = PrivateAttr()
+    _acompletion: Callable = PrivateAttr()
     _stream_chunk_builder: Callable = PrivateAttr()
     input_schema: ClassVar[type[BaseLLMInputSchema]] = BaseLLMInputSchema
 
@@ -127,12 +134,17 @@ class BaseLLM(ConnectionNode):
         super().__init__(**kwargs)
 
         # Save a bit of loading time as litellm is slow
-        from litellm import completion, stream_chunk_builder
+        from litellm import acompletion, completion, stream_chunk_builder
 
         # Avoid the same imports multiple times and for future usage in execute
         self._completion = completion
+        self._acompletion = acompletion
         self._stream_chunk_builder = stream_chunk_builder
 
+    @property
+    def to_dict_exclude_params(self):
+        return super().to_dict_exclude_params | {"semantic_cache": True}
+
     def get_context_for_input_schema(self) -> dict:
         """Provides context for input schema that is required for proper validation."""
         return {"instance_prompt": self.prompt}
@@ -209,11 +221,26 @@ class BaseLLM(ConnectionNode):
 
         return result
 
+    @staticmethod
+    def _get_stream_delta(chunk: Any) -> str | None:
+        """Get the text delta of a streaming chunk.
+
+        Args:
+            chunk (Any): Streaming chunk of the LLM response.
+
+        Returns:
+            str | None: Content of the first choice delta, None if the chunk has no content.
+        """
+        if not (choices := getattr(chunk, "choices", None)):
+            return None
+        return getattr(getattr(choices[0], "delta", None), "content", None)
+
     def _handle_streaming_completion_response(
         self,
         response: Union["ModelResponse", "CustomStreamWrapper"],
         messages: list[dict],
         config: RunnableConfig = None,
+        token_callback: Callable[[str], None] | None = None,
         **kwargs,
     ):
         """Handle streaming completion response.
@@ -222,20 +249,66 @@ class BaseLLM(ConnectionNode):
             response (ModelResponse | CustomStreamWrapper): The response from the LLM.
             messages (list[dict]): The messages used for the LLM.
             config (RunnableConfig, optional): The configuration for the execution. Defaults to None.
+            token_callback (Callable[[str], None], optional): Called with the text of every token.
             **kwargs: Additional keyword arguments.
 
         Returns:
             dict: A dictionary containing the generated content and tool calls.
         """
+        requires_stream_chunk = self.streaming.enabled and self.requires_stream_chunk(config.callbacks)
         chunks = []
         for chunk in response:
             chunks.append(chunk)
 
-            self.run_on_node_execute_stream(
-                config.callbacks,
-                chunk.model_dump(),
-                **kwargs,
-            )
+            delta = self._get_stream_delta(chunk)
+            if token_callback is not None and delta:
+                token_callback(delta)
+            if self.streaming.enabled:
+                self.run_on_node_execute_stream(
+                    config.callbacks,
+                    chunk.model_dump() if requires_stream_chunk else None,
+                    delta=delta,
+                    **kwargs,
+                )
+
+        full_response = self._stream_chunk_builder(chunks=chunks, messages=messages)
+        return self._handle_completion_response(response=full_response, config=config, **kwargs)
+
+    async def _ahandle_streaming_completion_response(
+        self,
+        response: "CustomStreamWrapper",
+        messages: list[dict],
+        config: RunnableConfig = None,
+        token_callback: Callable[[str], None] | None = None,
+        **kwargs,
+    ):
+        """Handle asynchronous streaming completion response.
+
+        Args:
+            response (CustomStreamWrapper): The async streaming response from the LLM.
+            messages (list[dict]): The messages used for the LLM.
+            config (RunnableConfig, optional): The configuration for the execution. Defaults to None.
+            token_callback (Callable[[str], None], optional): Called with the text of every token.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict: A dictionary containing the generated content and tool calls.
+        """
+        requires_stream_chunk = self.streaming.enabled and self.requires_stream_chunk(config.callbacks)
+        chunks = []
+        async for chunk in response:
+            chunks.append(chunk)
+
+            delta = self._get_stream_delta(chunk)
+            if token_callback is not None and delta:
+                token_callback(delta)
+            if self.streaming.enabled:
+                self.run_on_node_execute_stream(
+                    config.callbacks,
+                    chunk.model_dump() if requires_stream_chunk else None,
+                    delta=delta,
+                    **kwargs,
+                )
 
         full_response = self._stream_chunk_builder(chunks=chunks, messages=messages)
         return self._handle_completion_response(response=full_response, config=config, **kwargs)
@@ -278,34 +351,39 @@ class BaseLLM(ConnectionNode):
         """
         return params
 
-    def execute(
+    def get_service_key(self) -> str:
+        """
+        Get the key of the service called by the node. Nodes calling the same model of a connection share the key.
+
+        Returns:
+            str: Key of the service.
+        """
+        return f"{super().get_service_key()}:{self.model}"
+
+    def get_completion_params(
         self,
         input_data: BaseLLMInputSchema,
-        config: RunnableConfig = None,
+        config: RunnableConfig,
         prompt: Prompt | None = None,
         schema: dict | None = None,
         inference_mode: InferenceMode | None = None,
+        client: Any | None = None,
         **kwargs,
-    ):
-        """Execute the LLM node.
-
-        This method processes the input data, formats the prompt, and generates a response using
-        the configured LLM.
+    ) -> tuple[dict[str, Any], list[dict]]:
+        """Build the completion params and formatted messages for the LLM call.
 
         Args:
             input_data (BaseLLMInputSchema): The input data for the LLM.
-            config (RunnableConfig, optional): The configuration for the execution. Defaults to None.
+            config (RunnableConfig): The configuration for the execution.
             prompt (Prompt, optional): The prompt to use for this execution. Defaults to None.
             schema (Dict[str, Any], optional): schema_ for structured output or function calling.
-                Overrides instance schema_ if provided.
             inference_mode (InferenceMode, optional): Mode of inference.
-                Overrides instance inference_mode if provided.
+            client (Any, optional): Initialized client to pass to the completion. Defaults to None.
             **kwargs: Additional keyword arguments.
 
         Returns:
-            dict: A dictionary containing the generated content and tool calls.
+            tuple[dict[str, Any], list[dict]]: Completion params and formatted messages.
         """
-        config = ensure_config(config)
         prompt = prompt or self.prompt or Prompt(messages=[], tools=None)
         messages = prompt.format_messages(**dict(input_data))
         base_tools = prompt.format_tools(**dict(input_data))
@@ -313,8 +391,8 @@ class BaseLLM(ConnectionNode):
 
         # Use initialized client if it possible
         params = self.connection.conn_params.copy()
-        if self.client and not isinstance(self.connection, HttpApiKey):
-            params.update({"client": self.client})
+        if client and not isinstance(self.connection, HttpApiKey):
+            params.update({"client": client})
 
         current_inference_mode = inference_mode or self.inference_mode
         current_schema = schema or self.schema_
@@ -340,15 +418,192 @@ class BaseLLM(ConnectionNode):
             "drop_params": True,
             **params,
         }
+        # Bound the request by the run deadline
+        if (timeout := config.get_remaining_seconds()) is not None:
+            common_params["timeout"] = timeout
 
-        common_params = self.update_completion_params(common_params)
+        return self.update_completion_params(common_params), messages
 
-        response = self._completion(**common_params)
+    def _lookup_semantic_cache(
+        self, params: dict[str, Any], config: RunnableConfig, **kwargs
+    ) -> SemanticCacheLookup | None:
+        """Look up the completion in the semantic cache and report the result to callbacks.
+
+        Args:
+            params (dict[str, Any]): Completion params.
+            config (RunnableConfig): The configuration for the execution.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            SemanticCacheLookup | None: The lookup, or None if the cache is disabled or failed.
+        """
+        if self.semantic_cache is None:
+            return None
+
+        try:
+            lookup = self.semantic_cache.lookup(params)
+        except Exception as e:
+            logger.warning(f"Node {self.name} - {self.id}: semantic cache lookup failed: {e}")
+            return None
+
+        semantic_cache_data = {
+            "hit": lookup.hit,
+            "similarity": lookup.match.similarity if lookup.hit else None,
+            "namespace": self.semantic_cache.namespace,
+        }
+        self.run_on_node_execute_run(callbacks=config.callbacks, semantic_cache=semantic_cache_data, **kwargs)
+        return lookup
+
+    def _handle_semantic_cache_hit(self, lookup: SemanticCacheLookup, config: RunnableConfig, **kwargs) -> dict:
+        """Return the cached completion, streamed as a single chunk if streaming is enabled.
+
+        Args:
+            lookup (SemanticCacheLookup): The lookup that found the completion.
+            config (RunnableConfig): The configuration for the execution.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict: A dictionary containing the cached content and tool calls if present.
+        """
+        result = copy.deepcopy(lookup.match.value)
+        if self.streaming.enabled:
+            chunk = {
+                "model": self.model,
+                "choices": [{"index": 0, "delta": {"role": "assistant", "content": result.get("content")}}],
+            }
+            self.run_on_node_execute_stream(config.callbacks, chunk, delta=result.get("content"), **kwargs)
+        return result
 
-        handle_completion = (
-            self._handle_streaming_completion_response if self.streaming.enabled else self._handle_completion_response
+    def execute(
+        self,
+        input_data: BaseLLMInputSchema,
+        config: RunnableConfig = None,
+        prompt: Prompt | None = None,
+        schema: dict | None = None,
+        inference_mode: InferenceMode | None = None,
+        token_callback: Callable[[str], None] | None = None,
+        **kwargs,
+    ):
+        """Execute the LLM node.
+
+        This method processes the input data, formats the prompt, and generates a response using
+        the configured LLM.
+
+        Args:
+            input_data (BaseLLMInputSchema): The input data for the LLM.
+            config (RunnableConfig, optional): The configuration for the execution. Defaults to None.
+            prompt (Prompt, optional): The prompt to use for this execution. Defaults to None.
+            schema (Dict[str, Any], optional): schema_ for structured output or function calling.
+                Overrides instance schema_ if provided.
+            inference_mode (InferenceMode, optional): Mode of inference.
+                Overrides instance inference_mode if provided.
+            token_callback (Callable[[str], None], optional): Called with the text of every token as it is
+                generated. The response is streamed even if streaming of the node is disabled.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict: A dictionary containing the generated content and tool calls.
+        """
+        config = ensure_config(config)
+        common_params, messages = self.get_completion_params(
+            input_data,
+            config,
+            prompt=prompt,
+            schema=schema,
+            inference_mode=inference_mode,
+            client=self.client,
+            **kwargs,
         )
 
-        return handle_completion(
-            response=response, messages=messages, config=config, input_data=dict(input_data), **kwargs
+        semantic_lookup = self._lookup_semantic_cache(common_params, config, **kwargs)
+        if semantic_lookup is not None and semantic_lookup.hit:
+            return self._handle_semantic_cache_hit(semantic_lookup, config, **kwargs)
+
+        if token_callback is not None:
+            common_params["stream"] = True
+        response = self._completion(**common_params)
+
+        if common_params["stream"]:
+            result = self._handle_streaming_completion_response(
+                response=response,
+                messages=messages,
+                config=config,
+                token_callback=token_callback,
+                input_data=dict(input_data),
+                **kwargs,
+            )
+        else:
+            result = self._handle_completion_response(
+                response=response, messages=messages, config=config, input_data=dict(input_data), **kwargs
+            )
+        if semantic_lookup is not None:
+            self.semantic_cache.store(semantic_lookup, result)
+        return result
+
+    async def aexecute(
+        self,
+        input_data: BaseLLMInputSchema,
+        config: RunnableConfig = None,
+        prompt: Prompt | None = None,
+        schema: dict | None = None,
+        inference_mode: InferenceMode | None = None,
+        token_callback: Callable[[str], None] | None = None,
+        **kwargs,
+    ):
+        """Asynchronously execute the LLM node.
+
+        Uses the async client of the connection if it is supported, otherwise litellm initializes its own.
+
+        Args:
+            input_data (BaseLLMInputSchema): The input data for the LLM.
+            config (RunnableConfig, optional): The configuration for the execution. Defaults to None.
+            prompt (Prompt, optional): The prompt to use for this execution. Defaults to None.
+            schema (Dict[str, Any], optional): schema_ for structured output or function calling.
+                Overrides instance schema_ if provided.
+            inference_mode (InferenceMode, optional): Mode of inference.
+                Overrides instance inference_mode if provided.
+            token_callback (Callable[[str], None], optional): Called with the text of every token as it is
+                generated. The response is streamed even if streaming of the node is disabled.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict: A dictionary containing the generated content and tool calls.
+        """
+        config = ensure_config(config)
+        common_params, messages = self.get_completion_params(
+            input_data,
+            config,
+            prompt=prompt,
+            schema=schema,
+            inference_mode=inference_mode,
+            client=self.async_client,
+            **kwargs,
         )
+
+        semantic_lookup = None
+        if self.semantic_cache is not None:
+            semantic_lookup = await asyncio.to_thread(self._lookup_semantic_cache, common_params, config, **kwargs)
+            if semantic_lookup is not None and semantic_lookup.hit:
+                return self._handle_semantic_cache_hit(semantic_lookup, config, **kwargs)
+
+        if token_callback is not None:
+            common_params["stream"] = True
+        response = await self._acompletion(**common_params)
+
+        if common_params["stream"]:
+            result = await self._ahandle_streaming_completion_response(
+                response=response,
+                messages=messages,
+                config=config,
+                token_callback=token_callback,
+                input_data=dict(input_data),
+                **kwargs,
+            )
+        else:
+            result = self._handle_completion_response(
+                response=response, messages=messages, config=config, input_data=dict(input_data), **kwargs
+            )
+
+        if semantic_lookup is not None:
+            await asyncio.to_thread(self.semantic_cache.store, semantic_lookup, result)
+        return result
@@ -1,11 +1,15 @@
+import asyncio
+import hashlib
 import inspect
+import random
 import time
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from concurrent.futures import TimeoutError
+from contextvars import ContextVar, copy_context
 from datetime import datetime
 from functools import cached_property
 from queue import Empty
-from typing import Any, Callable, ClassVar, Union
+from typing import Any, Callable, ClassVar, Generator, TypeVar, Union
 from uuid import uuid4
 
 from jinja2 import Template
@@ -13,8 +17,10 @@ from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field,
 
 from fiboaitech.cache.utils import cache_wf_entity
 from fiboaitech.callbacks import BaseCallbackHandler, NodeCallbackHandler
+from fiboaitech.callbacks.dispatch import dispatch_callback
 from fiboaitech.connections import BaseConnection
-from fiboaitech.connections.managers import ConnectionManager
+from fiboaitech.connections.managers import ConnectionClientInitType, ConnectionManager
+from fiboaitech.executors.worker_pool import get_default_worker_pool
 from fiboaitech.nodes.exceptions import (
     NodeConditionFailedException,
     NodeConditionSkippedException,
@@ -33,11 +39,26 @@ from fiboaitech.types.feedback import (
     FeedbackMethod,
 )
 from fiboaitech.types.streaming import STREAMING_EVENT, StreamingConfig, StreamingEventMessage
-from fiboaitech.utils import format_value, generate_uuid, merge
+from fiboaitech.utils import format_value, format_value_json, generate_uuid, merge
 from fiboaitech.utils.duration import format_duration
+from fiboaitech.utils.jsonpath import JsonPath, compile_jsonpath, compile_selector
 from fiboaitech.utils.jsonpath import filter as jsonpath_filter
 from fiboaitech.utils.jsonpath import mapper as jsonpath_mapper
 from fiboaitech.utils.logger import logger
+from fiboaitech.utils.profiling import (
+    NodePhase,
+    NodeRunProfile,
+    get_node_run_profile,
+    reset_node_run_profile,
+    set_node_run_profile,
+)
+from fiboaitech.utils.resilience import (
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    RetryBudget,
+    get_circuit_breaker,
+    get_retry_budget,
+)
 
 
 def ensure_config(config: RunnableConfig = None) -> RunnableConfig:
@@ -56,6 +77,30 @@ def ensure_config(config: RunnableConfig = None) -> RunnableConfig:
     return config
 
 
+class RetryBudgetConfig(BaseModel):
+    """
+    Configuration of the retry budget shared by nodes calling the same service.
+
+    Attributes:
+        ratio (float): Allowed share of retries per execution, e.g. 0.1 for at most 10% extra load.
+        min_retries (int): Number of retries allowed regardless of the number of executions.
+    """
+    ratio: float = Field(default=0.1, ge=0)
+    min_retries: int = Field(default=10, ge=0)
+
+
+class CircuitBreakerConfig(BaseModel):
+    """
+    Configuration of the circuit breaker shared by nodes calling the same service.
+
+    Attributes:
+        failure_threshold (int): Number of consecutive failed executions that opens the breaker.
+        recovery_timeout_seconds (float): Seconds to fail fast before a trial execution.
+    """
+    failure_threshold: int = Field(default=5, ge=1)
+    recovery_timeout_seconds: float = Field(default=30, ge=0)
+
+
 class ErrorHandling(BaseModel):
     """
     Configuration for error handling in nodes.
@@ -65,11 +110,18 @@ class ErrorHandling(BaseModel):
         retry_interval_seconds (float): Interval between retries in seconds.
         max_retries (int): Maximum number of retries.
         backoff_rate (float): Rate of increase for retry intervals.
+        jitter (bool): Whether to wait a random time up to the retry interval (full jitter), so nodes failing
+            together do not retry in lock-step.
+        retry_budget (RetryBudgetConfig | None): Retry budget shared by nodes calling the same service.
+        circuit_breaker (CircuitBreakerConfig | None): Circuit breaker shared by nodes calling the same service.
     """
     timeout_seconds: float | None = None
     retry_interval_seconds: float = 1
     max_retries: int = 0
     backoff_rate: float = 1
+    jitter: bool = False
+    retry_budget: RetryBudgetConfig | None = None
+    circuit_breaker: CircuitBreakerConfig | None = None
 
 
 class Transformer(BaseModel):
@@ -83,6 +135,36 @@ class Transformer(BaseModel):
     path: str | None = None
     selector: dict[str, str] | None = None
 
+    _compiled_path: JsonPath | str | None = PrivateAttr(default=None)
+    _compiled_selector: dict[str, JsonPath | str] | None = PrivateAttr(default=None)
+    _compiled_from: tuple[str | None, dict[str, str] | None] = PrivateAttr(default=(None, None))
+
+    def model_post_init(self, __context: Any) -> None:
+        self.compile()
+
+    def compile(self) -> None:
+        """Compiles JSONPath expressions of the transformer, so they are not parsed on every node run."""
+        self._compiled_path = (compile_jsonpath(self.path) or self.path) if self.path else self.path
+        self._compiled_selector = compile_selector(self.selector)
+        self._compiled_from = (self.path, dict(self.selector) if self.selector is not None else None)
+
+    def _ensure_compiled(self) -> None:
+        """Recompiles expressions if `path` or `selector` changed after compilation."""
+        if self._compiled_from != (self.path, self.selector):
+            self.compile()
+
+    @property
+    def compiled_path(self) -> JsonPath | str | None:
+        """Compiled `path`, or the source value if it is empty or not a valid JSONPath expression."""
+        self._ensure_compiled()
+        return self._compiled_path
+
+    @property
+    def compiled_selector(self) -> dict[str, JsonPath | str] | None:
+        """`selector` with compiled JSONPath expressions."""
+        self._ensure_compiled()
+        return self._compiled_selector
+
 
 class InputTransformer(Transformer):
     """Input transformer for nodes."""
@@ -104,6 +186,26 @@ class CachingConfig(BaseModel):
     enabled: bool = False
 
 
+class NodeRunState(BaseModel):
+    """
+    Per-run scratch state of a node.
+
+    Stored in the execution context instead of the node instance, so one node definition can serve
+    concurrent runs.
+
+    Attributes:
+        run_depends (list[dict]): Dependencies of the latest nested node run.
+    """
+    run_depends: list[dict] = []
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+_node_run_states: ContextVar[dict[int, NodeRunState]] = ContextVar("node_run_states")
+# Hashes of the inputs of node executions in progress, scoping the node checkpoints
+_node_input_hashes: ContextVar[dict[int, str]] = ContextVar("node_input_hashes")
+
+
 class NodeReadyToRun(BaseModel):
     """
     Represents a node ready to run with its input data and dependencies.
@@ -113,11 +215,13 @@ class NodeReadyToRun(BaseModel):
         is_ready (bool): Whether the node is ready to run.
         input_data (Any): Input data for the node.
         depends_result (dict[str, Any]): Results of dependent nodes.
+        ready_at (float | None): `time.perf_counter()` time when all dependencies of the node completed.
     """
     node: "Node"
     is_ready: bool
     input_data: Any = None
     depends_result: dict[str, Any] = {}
+    ready_at: float | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -180,9 +284,178 @@ class NodeOutputReferences:
         self.node = node
 
     def __getattr__(self, key: Any):
+        # Special attributes and `node` itself are looked up on unpickling before `node` is restored
+        if key == "node" or key.startswith("__"):
+            raise AttributeError(key)
         return NodeOutputReference(node=self.node, output_key=key)
 
 
+T = TypeVar("T")
+
+
+def run_steps(steps: Generator[float, None, T]) -> T:
+    """
+    Run the steps of a node run or execution to the end in the current thread, sleeping between them.
+
+    Args:
+        steps (Generator[float, None, T]): Steps yielding the seconds to wait before the next one.
+
+    Returns:
+        T: Value returned by the steps.
+    """
+    try:
+        while True:
+            time.sleep(next(steps))
+    except StopIteration as e:
+        return e.value
+
+
+class NodeExecutionAttempts:
+    """
+    Bookkeeping of the node execution attempts shared by the sync and async retry loops.
+
+    Checks the run deadline and the circuit breaker before each attempt, reports attempts to the execute
+    callbacks and the run profile, and decides whether the failed attempt is retried.
+
+    Args:
+        node (Node): The node to execute.
+        input_data (Any): Input data for the node.
+        config (RunnableConfig): Configuration for the execution.
+        **kwargs: Keyword arguments of the execution.
+
+    Attributes:
+        n_attempt (int): Maximum number of attempts.
+        attempt (int): Index of the current attempt.
+        timeout (float | None): Timeout of the current attempt in seconds.
+        kwargs (dict): Keyword arguments of the current attempt.
+        error (Exception | None): Error that stopped the latest attempt.
+    """
+
+    def __init__(self, node: "Node", input_data: Any, config: RunnableConfig, **kwargs):
+        self.node = node
+        self.input_data = input_data
+        self.config = config
+        # Executions outside of the node run are measured in a detached profile
+        self.run_profile = get_node_run_profile() or NodeRunProfile()
+        self.circuit_breaker = node._get_circuit_breaker()
+        self.retry_budget = node._get_retry_budget()
+        node._set_checkpoint_input(input_data, config)
+        if self.retry_budget:
+            self.retry_budget.record_request()
+
+        self.n_attempt = node.error_handling.max_retries + 1
+        self.attempt = -1
+        self.timeout = None
+        self.kwargs = kwargs
+        self.error = None
+        self._base_kwargs = kwargs
+        self._phase_start = None
+        self._measured_start = None
+
+    def _get_retry_state(self) -> dict[str, Any]:
+        return self.node._get_retry_state(self.attempt, self.circuit_breaker)
+
+    def start(self) -> bool:
+        """
+        Start the next attempt.
+
+        Returns:
+            bool: Whether the attempt can run. False if the run deadline passed or the circuit breaker is open.
+        """
+        node = self.node
+        self.attempt += 1
+        self.timeout = self.config.get_timeout(node.error_handling.timeout_seconds)
+        if self.timeout is not None and self.timeout <= 0:
+            self.error = TimeoutError(f"Node {node.name} - {node.id}: run deadline exceeded.")
+            return False
+        if self.circuit_breaker and not self.circuit_breaker.allow_request():
+            self.error = CircuitBreakerOpenError(
+                f"Node {node.name} - {node.id}: circuit breaker '{self.circuit_breaker.key}' is open."
+            )
+            logger.warning(str(self.error))
+            return False
+
+        self.kwargs = merge(self._base_kwargs, {"execution_run_id": uuid4()})
+        phase_start = time.perf_counter()
+        node.run_on_node_execute_start(
+            self.config.callbacks, self.input_data, **self.kwargs, **self._get_retry_state()
+        )
+        self._phase_start = self.run_profile.add(NodePhase.CALLBACKS, phase_start)
+        self._measured_start = self.run_profile.measured
+        return True
+
+    def finish(self) -> None:
+        """Record the execution time of the attempt."""
+        self._phase_start = self.run_profile.add_attempt(self._phase_start, self._measured_start)
+
+    def succeed(self, output: Any) -> Any:
+        """
+        Report the successful attempt.
+
+        Args:
+            output (Any): Output of the execution.
+
+        Returns:
+            Any: Output of the execution.
+        """
+        if self.circuit_breaker:
+            self.circuit_breaker.record_success()
+        self.node.run_on_node_execute_end(self.config.callbacks, output, **self.kwargs, **self._get_retry_state())
+        self.run_profile.add(NodePhase.CALLBACKS, self._phase_start)
+        return output
+
+    def fail(self, error: Exception) -> None:
+        """
+        Report the failed attempt.
+
+        Args:
+            error (Exception): Error of the execution.
+        """
+        node = self.node
+        self.error = error
+        if self.circuit_breaker:
+            self.circuit_breaker.record_failure()
+        node.run_on_node_execute_error(self.config.callbacks, error, **self.kwargs, **self._get_retry_state())
+        self.run_profile.add(NodePhase.CALLBACKS, self._phase_start)
+        # asyncio.TimeoutError is not the concurrent.futures one before Python 3.11
+        if isinstance(error, (TimeoutError, asyncio.TimeoutError)):
+            logger.warning(f"Node {node.name} - {node.id}: timeout.")
+        else:
+            logger.error(f"Node {node.name} - {node.id}: execution error: {error}")
+
+    def get_retry_delay(self) -> float | None:
+        """
+        Get the time to wait before retrying the failed attempt.
+
+        Returns:
+            float | None: Seconds to wait, or None if the attempt is the last one or the retry is not allowed.
+        """
+        if self.attempt >= self.n_attempt - 1:
+            return None
+        if (delay := self.node._get_retry_delay(self.attempt, self.config, self.retry_budget)) is not None:
+            logger.info(f"Node {self.node.name} - {self.node.id}: retrying in {delay} seconds.")
+        return delay
+
+    def record_retry_wait(self, phase_start: float) -> None:
+        """
+        Record the time waited before the retry.
+
+        Args:
+            phase_start (float): `time.perf_counter()` time when the wait started.
+        """
+        self.run_profile.add(NodePhase.RETRY_WAIT, phase_start)
+
+    def raise_error(self):
+        """
+        Raise the error that stopped the attempts.
+
+        Raises:
+            Exception: Error of the latest attempt.
+        """
+        logger.error(f"Node {self.node.name} - {self.node.id}: execution failed after {self.attempt + 1} attempts.")
+        raise self.error
+
+
 class Node(BaseModel, Runnable, ABC):
     """
     Abstract base class for all nodes in the workflow.
@@ -197,6 +470,8 @@ class Node(BaseModel, Runnable, ABC):
         output_transformer (OutputTransformer): Output data transformer.
         caching (CachingConfig): Caching configuration.
         depends (list[NodeDependency]): List of node dependencies.
+        priority (int): Scheduling priority within the flow. When the flow reaches its concurrency limits, ready
+            nodes with higher priority start first. Defaults to 0.
         metadata (NodeMetadata | None): Optional metadata for the node.
         is_postponed_component_init (bool): Whether component initialization is postponed.
         is_optimized_for_agents (bool): Whether to optimize output for agents. By default is set to False.
@@ -215,6 +490,7 @@ class Node(BaseModel, Runnable, ABC):
     approval: ApprovalConfig = Field(default_factory=ApprovalConfig)
 
     depends: list[NodeDependency] = []
+    priority: int = 0
     metadata: NodeMetadata | None = None
 
     is_postponed_component_init: bool = False
@@ -222,9 +498,20 @@ class Node(BaseModel, Runnable, ABC):
     is_files_allowed: bool = False
 
     _output_references: NodeOutputReferences = PrivateAttr()
+    _serialized: dict | None = PrivateAttr(default=None)
+    _serialized_ref: dict | None = PrivateAttr(default=None)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
     input_schema: ClassVar[type[BaseModel] | None] = None
+    run_state_cls: ClassVar[type[NodeRunState]] = NodeRunState
+    # Fields holding runtime components that `init_components` re-creates when they are empty
+    component_fields: ClassVar[set[str]] = {
+        "document_embedder",
+        "text_embedder",
+        "document_retriever",
+        "document_splitter",
+        "file_converter",
+    }
     callbacks: list[NodeCallbackHandler] = []
 
     def __init__(self, **kwargs):
@@ -234,11 +521,196 @@ class Node(BaseModel, Runnable, ABC):
 
         self._output_references = NodeOutputReferences(node=self)
 
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.reset_serialized()
+
     @computed_field
     @cached_property
     def type(self) -> str:
         return f"{self.__module__.rsplit('.', 1)[0]}.{self.__class__.__name__}"
 
+    @property
+    def serialized(self) -> dict:
+        """
+        Serialized view of the node passed to callbacks.
+
+        Computed once and shared by all callback events until a node field is assigned or the next run starts.
+        Callbacks must treat it as read-only.
+        """
+        if (serialized := self._serialized) is None:
+            serialized = self._serialized = self.to_dict()
+        return serialized
+
+    @property
+    def serialized_ref(self) -> dict:
+        """Lightweight serialized view of the node for callbacks that don't require the full node payload."""
+        if (serialized_ref := self._serialized_ref) is None:
+            serialized_ref = self._serialized_ref = {
+                "id": self.id,
+                "name": self.name,
+                "type": self.type,
+                "group": self.group,
+                "streaming": self.streaming.model_dump(),
+            }
+        return serialized_ref
+
+    def reset_serialized(self) -> None:
+        """Drops the cached serialized views of the node."""
+        self._serialized = None
+        self._serialized_ref = None
+
+    def get_callback_serialized(self, callback: NodeCallbackHandler) -> dict:
+        """
+        Returns the serialized view of the node for the callback.
+
+        Args:
+            callback (NodeCallbackHandler): Callback handler.
+
+        Returns:
+            dict: Full serialized node, or the lightweight view if the callback opted out of it.
+        """
+        if getattr(callback, "requires_serialized_node", True):
+            return self.serialized
+        return self.serialized_ref
+
+    def requires_stream_chunk(self, callbacks: list[BaseCallbackHandler]) -> bool:
+        """
+        Checks whether any callback needs full chunks of the stream events.
+
+        Args:
+            callbacks (list[BaseCallbackHandler]): Callback handlers of the run.
+
+        Returns:
+            bool: False if all callbacks handling stream events opted out of chunks and only use the delta text.
+        """
+        return any(
+            getattr(callback, "requires_stream_chunk", True)
+            and type(callback).on_node_execute_stream is not NodeCallbackHandler.on_node_execute_stream
+            for callback in callbacks + self.callbacks
+        )
+
+    @property
+    def run_state(self) -> NodeRunState:
+        """Run state of the node in the current execution context."""
+        if (run_state := _node_run_states.get({}).get(id(self))) is None:
+            run_state = self.reset_run_state()
+        return run_state
+
+    def init_run_state(self) -> NodeRunState:
+        """
+        Create a new run state. Override to initialize it from the node definition.
+
+        Returns:
+            NodeRunState: New run state.
+        """
+        return self.run_state_cls()
+
+    def reset_run_state(self) -> NodeRunState:
+        """
+        Reset the run state of the node in the current execution context.
+
+        Returns:
+            NodeRunState: New run state.
+        """
+        run_state = self.init_run_state()
+        _node_run_states.set(_node_run_states.get({}) | {id(self): run_state})
+        return run_state
+
+    def _set_checkpoint_input(self, input_data: Any, config: RunnableConfig | None) -> None:
+        """
+        Scopes the checkpoints of the node execution in the current context to its input.
+
+        The input is hashed only when the run has a checkpoint store. Checkpoints of the execution are skipped
+        if the input can't be serialized.
+        """
+        if not config or not config.checkpoint_store:
+            return
+
+        try:
+            input_hash = hashlib.sha256(format_value_json(input_data)).hexdigest()
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Node {self.name} - {self.id}: checkpoints are skipped, input is not serializable: {e}")
+            input_hash = None
+        _node_input_hashes.set(_node_input_hashes.get({}) | {id(self): input_hash})
+
+    def _get_checkpoint_input_hash(self) -> str | None:
+        return _node_input_hashes.get({}).get(id(self))
+
+    def _has_checkpoint_store(self, config: RunnableConfig | None) -> bool:
+        """Whether the node execution saves checkpoints: the run has a store and the execution input was hashed."""
+        if not config or not config.checkpoint_store:
+            return False
+        input_hashes = _node_input_hashes.get({})
+        return id(self) not in input_hashes or input_hashes[id(self)] is not None
+
+    def _get_checkpoint_key(self) -> str:
+        if (input_hash := self._get_checkpoint_input_hash()) is None:
+            return f"node:{self.id}"
+        return f"node:{self.id}:{input_hash}"
+
+    def load_checkpoint(self, config: RunnableConfig | None) -> Any | None:
+        """
+        Load the state of the last completed step of the node, e.g. an agent loop.
+
+        The checkpoint of the current run is used first, so retries continue from it, then the checkpoint of the run
+        to resume. Checkpoints are scoped to the input of the execution, so repeated and concurrent executions of
+        the node with other inputs do not continue from each other's state.
+
+        Args:
+            config (RunnableConfig | None): Configuration of the run.
+
+        Returns:
+            Any | None: Saved state, or None if the node has no checkpoint.
+        """
+        if not self._has_checkpoint_store(config):
+            return None
+
+        input_hash = self._get_checkpoint_input_hash()
+        for run_id in (config.run_id, config.resume_from):
+            if run_id and (checkpoint := config.checkpoint_store.load(run_id, self._get_checkpoint_key())) is not None:
+                if checkpoint.get("input_hash") != input_hash:
+                    logger.warning(f"Node {self.name} - {self.id}: checkpoint of run {run_id} is for other input.")
+                    continue
+                if checkpoint["state"] is not None:
+                    logger.info(f"Node {self.name} - {self.id}: resumed from checkpoint of run {run_id}.")
+                return checkpoint["state"]
+        return None
+
+    def save_checkpoint(self, config: RunnableConfig | None, state: Any) -> None:
+        """
+        Save the state of the last completed step of the node under the current run.
+
+        Args:
+            config (RunnableConfig | None): Configuration of the run.
+            state (Any): State to continue the node execution from.
+        """
+        if self._has_checkpoint_store(config):
+            config.checkpoint_store.save(
+                config.run_id,
+                self._get_checkpoint_key(),
+                {"state": state, "input_hash": self._get_checkpoint_input_hash()},
+            )
+
+    def clear_checkpoint(self, config: RunnableConfig | None) -> None:
+        """
+        Clear the checkpoint of the node once its execution completed.
+
+        Resumed runs keep an empty checkpoint instead, so later executions of the node in the run don't continue
+        from the checkpoint of the resumed run again.
+
+        Args:
+            config (RunnableConfig | None): Configuration of the run.
+        """
+        if not self._has_checkpoint_store(config):
+            return
+
+        if config.resume_from:
+            self.save_checkpoint(config, None)
+        else:
+            config.checkpoint_store.delete(config.run_id, self._get_checkpoint_key())
+
     @staticmethod
     def _validate_dependency_status(depend: NodeDependency, depends_result: dict[str, RunnableResult]):
         """
@@ -402,6 +874,25 @@ class Node(BaseModel, Runnable, ABC):
 
         return inputs
 
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Pickles the node definition without runtime components, e.g. to ship it to a worker process.
+
+        Components are re-created by `init_components` after unpickling, the node is marked for postponed
+        component initialization so parent nodes initialize it as well.
+
+        Returns:
+            dict[str, Any]: Pickled state of the node.
+        """
+        state = super().__getstate__()
+        if components := self.component_fields & self.model_fields.keys():
+            state["__dict__"] = state["__dict__"] | dict.fromkeys(components) | {"is_postponed_component_init": True}
+        state["__pydantic_private__"] = (state["__pydantic_private__"] or {}) | {
+            "_serialized": None,
+            "_serialized_ref": None,
+        }
+        return state
+
     def init_components(self, connection_manager: ConnectionManager | None = None):
         """
         Initialize node components.
@@ -424,8 +915,8 @@ class Node(BaseModel, Runnable, ABC):
         Returns:
             Any: Transformed data.
         """
-        output = jsonpath_filter(data, transformer.path, node_id)
-        output = jsonpath_mapper(output, transformer.selector, node_id)
+        output = jsonpath_filter(data, transformer.compiled_path, node_id)
+        output = jsonpath_mapper(output, transformer.compiled_selector, node_id)
         return output
 
     def transform_output(self, output_data: Any) -> Any:
@@ -599,6 +1090,157 @@ class Node(BaseModel, Runnable, ABC):
 
         return input_data
 
+    def _prepare_run(self, config: RunnableConfig = None, depends_result: dict = None, **kwargs):
+        """
+        Prepare configuration, run kwargs and dependency results for the node run.
+
+        Args:
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            depends_result (dict, optional): Results of dependent nodes. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            tuple[RunnableConfig, dict, dict]: Configuration, merged kwargs and dependency results.
+        """
+        config = ensure_config(config).start_deadline()
+        # Pick up nested changes of the node definition made since the previous run
+        self.reset_serialized()
+
+        run_id = uuid4()
+        merged_kwargs = merge(kwargs, {"run_id": run_id, "parent_run_id": kwargs.get("parent_run_id", run_id)})
+        if depends_result is None:
+            depends_result = {}
+
+        return config, merged_kwargs, depends_result
+
+    def _get_skip_result(
+        self,
+        error: NodeException,
+        input_data: Any,
+        depends_result: dict,
+        config: RunnableConfig,
+        run_profile: NodeRunProfile,
+        **kwargs,
+    ) -> RunnableResult:
+        """
+        Run skip callbacks and build the skip result.
+
+        Args:
+            error (NodeException): The exception that caused the skip.
+            input_data (Any): Input data for the node.
+            depends_result (dict): Results of dependent nodes.
+            config (RunnableConfig): Configuration for the run.
+            run_profile (NodeRunProfile): Profile of the run.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result with skip status.
+        """
+        transformed_input = input_data | {k: result.to_tracing_depend_dict() for k, result in depends_result.items()}
+        skip_data = {"failed_dependency": error.failed_depend.to_dict()}
+        time_start = time.perf_counter()
+        self.run_on_node_skip(
+            callbacks=config.callbacks,
+            skip_data=skip_data,
+            input_data=transformed_input,
+            run_profile=run_profile,
+            **kwargs,
+        )
+        run_profile.add(NodePhase.CALLBACKS, time_start)
+        logger.info(f"Node {self.name} - {self.id}: execution skipped.")
+        return RunnableResult(
+            status=RunnableStatus.SKIP,
+            input=transformed_input,
+            output=format_value(error, recoverable=error.recoverable),
+        )
+
+    def _get_success_result(
+        self,
+        output: Any,
+        from_cache: bool,
+        transformed_input: Any,
+        time_start: datetime,
+        config: RunnableConfig,
+        run_profile: NodeRunProfile,
+        **kwargs,
+    ) -> RunnableResult:
+        """
+        Transform the output, run end callbacks and build the success result.
+
+        Args:
+            output (Any): Output of the node execution.
+            from_cache (bool): Whether the output was taken from cache.
+            transformed_input (Any): Transformed input data of the node.
+            time_start (datetime): Time when the run started.
+            config (RunnableConfig): Configuration for the run.
+            run_profile (NodeRunProfile): Profile of the run.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result with success status.
+        """
+        kwargs["is_output_from_cache"] = from_cache
+        phase_start = time.perf_counter()
+        transformed_output = self.transform_output(output)
+        phase_start = run_profile.add(NodePhase.TRANSFORM_OUTPUT, phase_start)
+
+        self.run_on_node_end(config.callbacks, transformed_output, run_profile=run_profile, **kwargs)
+        run_profile.add(NodePhase.CALLBACKS, phase_start)
+
+        logger.info(
+            f"Node {self.name} - {self.id}: execution succeeded in "
+            f"{format_duration(time_start, datetime.now())}."
+        )
+        return RunnableResult(status=RunnableStatus.SUCCESS, input=transformed_input, output=transformed_output)
+
+    def _get_failure_result(
+        self,
+        error: Exception,
+        input_data: Any,
+        transformed_input: Any,
+        time_start: datetime,
+        config: RunnableConfig,
+        run_profile: NodeRunProfile,
+        **kwargs,
+    ) -> RunnableResult:
+        """
+        Run error callbacks and build the failure result.
+
+        Args:
+            error (Exception): The error that occurred.
+            input_data (Any): Input data for the node.
+            transformed_input (Any): Transformed input data of the node.
+            time_start (datetime): Time when the run started.
+            config (RunnableConfig): Configuration for the run.
+            run_profile (NodeRunProfile): Profile of the run.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result with failure status.
+        """
+        from fiboaitech.nodes.agents.exceptions import RecoverableAgentException
+
+        phase_start = time.perf_counter()
+        self.run_on_node_error(
+            callbacks=config.callbacks,
+            error=error,
+            input_data=transformed_input,
+            run_profile=run_profile,
+            **kwargs,
+        )
+        run_profile.add(NodePhase.CALLBACKS, phase_start)
+        logger.error(
+            f"Node {self.name} - {self.id}: execution failed in {error}"
+            f"{format_duration(time_start, datetime.now())}."
+        )
+
+        recoverable = isinstance(error, RecoverableAgentException)
+        return RunnableResult(
+            status=RunnableStatus.FAILURE,
+            input=input_data,
+            output=format_value(error, recoverable=recoverable),
+        )
+
     def run(
         self,
         input_data: Any,
@@ -609,6 +1251,9 @@ class Node(BaseModel, Runnable, ABC):
         """
         Run the node with given input data and configuration.
 
+        Timings of the run phases are recorded in a `NodeRunProfile` passed to the end, error and skip callbacks
+        as `run_profile`. Executors pass a profile with scheduling times in the `run_profile` keyword argument.
+
         Args:
             input_data (Any): Input data for the node.
             config (RunnableConfig, optional): Configuration for the run. Defaults to None.
@@ -618,76 +1263,161 @@ class Node(BaseModel, Runnable, ABC):
         Returns:
             RunnableResult: Result of the node execution.
         """
-        from fiboaitech.nodes.agents.exceptions import RecoverableAgentException
+        return run_steps(self.iter_run(input_data, config, depends_result, **kwargs))
 
+    def iter_run(
+        self,
+        input_data: Any,
+        config: RunnableConfig = None,
+        depends_result: dict = None,
+        **kwargs,
+    ) -> Generator[float, None, RunnableResult]:
+        """
+        Run the node in steps, pausing before each retry of the execution.
+
+        Yields the delay before the retry instead of sleeping, so executors can resume the run later without
+        holding a thread. All steps must run in the same context. Executions of cached nodes are computed once for
+        concurrent runs, so their retries wait in the computing thread.
+
+        Args:
+            input_data (Any): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            depends_result (dict, optional): Results of dependent nodes. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Yields:
+            float: Seconds to wait before resuming the run.
+
+        Returns:
+            RunnableResult: Result of the node execution.
+        """
+        run_profile = kwargs.pop("run_profile", None) or NodeRunProfile()
+        run_profile.start()
+        profile_token = set_node_run_profile(run_profile)
+        # Run states and checkpoint scopes set during the run are dropped when it ends
+        run_states_token = _node_run_states.set(_node_run_states.get({}))
+        input_hashes_token = _node_input_hashes.set(_node_input_hashes.get({}))
         logger.info(f"Node {self.name} - {self.id}: execution started.")
         transformed_input = input_data
         time_start = datetime.now()
+        config, merged_kwargs, depends_result = self._prepare_run(config, depends_result, **kwargs)
 
-        config = ensure_config(config)
+        try:
+            try:
+                phase_start = time.perf_counter()
+                self.validate_depends(depends_result)
+                phase_start = run_profile.add(NodePhase.VALIDATE_DEPENDS, phase_start)
+                input_data = self.get_approved_data_or_origin(input_data, config=config, **merged_kwargs)
+                run_profile.add(NodePhase.APPROVAL, phase_start)
+            except NodeException as e:
+                return self._get_skip_result(e, input_data, depends_result, config, run_profile, **merged_kwargs)
 
-        run_id = uuid4()
-        merged_kwargs = merge(kwargs, {"run_id": run_id, "parent_run_id": kwargs.get("parent_run_id", run_id)})
-        if depends_result is None:
-            depends_result = {}
+            phase_start = time.perf_counter()
+            transformed_input = self.transform_input(input_data=input_data, depends_result=depends_result)
+            phase_start = run_profile.add(NodePhase.TRANSFORM_INPUT, phase_start)
+            self.run_on_node_start(config.callbacks, transformed_input, **merged_kwargs)
+            phase_start = run_profile.add(NodePhase.CALLBACKS, phase_start)
+            validated_input = self.validate_input_schema(transformed_input, **kwargs)
+            phase_start = run_profile.add(NodePhase.VALIDATE_INPUT_SCHEMA, phase_start)
+
+            measured_start = run_profile.measured
+            if self.caching.enabled and config.cache:
+                cache = cache_wf_entity(entity_id=self.id, cache_enabled=True, cache_config=config.cache)
+                output, from_cache = cache(self.execute_with_retry)(validated_input, config, **merged_kwargs)
+            else:
+                output = yield from self.iter_execute_with_retry(validated_input, config, **merged_kwargs)
+                from_cache = False
+            run_profile.add_exclusive(NodePhase.CACHE, phase_start, measured_start)
+
+            return self._get_success_result(
+                output, from_cache, transformed_input, time_start, config, run_profile, **merged_kwargs
+            )
+        except Exception as e:
+            return self._get_failure_result(
+                e, input_data, transformed_input, time_start, config, run_profile, **merged_kwargs
+            )
+        finally:
+            run_profile.finish()
+            reset_node_run_profile(profile_token)
+            _node_run_states.reset(run_states_token)
+            _node_input_hashes.reset(input_hashes_token)
+
+    async def arun(
+        self,
+        input_data: Any,
+        config: RunnableConfig = None,
+        depends_result: dict = None,
+        **kwargs,
+    ) -> RunnableResult:
+        """
+        Asynchronously run the node with given input data and configuration.
+
+        Mirrors `run`: callbacks, retries, timeouts and caching behave the same way,
+        but the execution itself is awaited via `aexecute`.
+
+        Args:
+            input_data (Any): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            depends_result (dict, optional): Results of dependent nodes. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the node execution.
+        """
+        run_profile = kwargs.pop("run_profile", None) or NodeRunProfile()
+        run_profile.start()
+        profile_token = set_node_run_profile(run_profile)
+        # Run states and checkpoint scopes set during the run are dropped when it ends
+        run_states_token = _node_run_states.set(_node_run_states.get({}))
+        input_hashes_token = _node_input_hashes.set(_node_input_hashes.get({}))
+        logger.info(f"Node {self.name} - {self.id}: execution started.")
+        transformed_input = input_data
+        time_start = datetime.now()
+        config, merged_kwargs, depends_result = self._prepare_run(config, depends_result, **kwargs)
 
         try:
             try:
+                phase_start = time.perf_counter()
                 self.validate_depends(depends_result)
-                input_data = self.get_approved_data_or_origin(input_data, config=config, **merged_kwargs)
+                phase_start = run_profile.add(NodePhase.VALIDATE_DEPENDS, phase_start)
+                if self.approval.enabled:
+                    # Approval waits for human feedback, so keep it away from the event loop
+                    input_data = await asyncio.to_thread(
+                        self.get_approved_data_or_origin, input_data, config=config, **merged_kwargs
+                    )
+                    run_profile.add(NodePhase.APPROVAL, phase_start)
             except NodeException as e:
-                transformed_input = input_data | {
-                    k: result.to_tracing_depend_dict() for k, result in depends_result.items()
-                }
-                skip_data = {"failed_dependency": e.failed_depend.to_dict()}
-                self.run_on_node_skip(
-                    callbacks=config.callbacks,
-                    skip_data=skip_data,
-                    input_data=transformed_input,
-                    **merged_kwargs,
-                )
-                logger.info(f"Node {self.name} - {self.id}: execution skipped.")
-                return RunnableResult(
-                    status=RunnableStatus.SKIP,
-                    input=transformed_input,
-                    output=format_value(e, recoverable=e.recoverable),
-                )
+                return self._get_skip_result(e, input_data, depends_result, config, run_profile, **merged_kwargs)
 
+            phase_start = time.perf_counter()
             transformed_input = self.transform_input(input_data=input_data, depends_result=depends_result)
+            phase_start = run_profile.add(NodePhase.TRANSFORM_INPUT, phase_start)
             self.run_on_node_start(config.callbacks, transformed_input, **merged_kwargs)
+            phase_start = run_profile.add(NodePhase.CALLBACKS, phase_start)
+            validated_input = self.validate_input_schema(transformed_input, **kwargs)
+            phase_start = run_profile.add(NodePhase.VALIDATE_INPUT_SCHEMA, phase_start)
             cache = cache_wf_entity(
                 entity_id=self.id,
                 cache_enabled=self.caching.enabled,
                 cache_config=config.cache,
             )
 
-            output, from_cache = cache(self.execute_with_retry)(
-                self.validate_input_schema(transformed_input, **kwargs), config, **merged_kwargs
-            )
+            measured_start = run_profile.measured
+            output, from_cache = await cache(self.aexecute_with_retry)(validated_input, config, **merged_kwargs)
+            run_profile.add_exclusive(NodePhase.CACHE, phase_start, measured_start)
 
-            merged_kwargs["is_output_from_cache"] = from_cache
-            transformed_output = self.transform_output(output)
-
-            self.run_on_node_end(config.callbacks, transformed_output, **merged_kwargs)
-
-            logger.info(
-                f"Node {self.name} - {self.id}: execution succeeded in "
-                f"{format_duration(time_start, datetime.now())}."
+            return self._get_success_result(
+                output, from_cache, transformed_input, time_start, config, run_profile, **merged_kwargs
             )
-            return RunnableResult(status=RunnableStatus.SUCCESS, input=transformed_input, output=transformed_output)
         except Exception as e:
-            self.run_on_node_error(callbacks=config.callbacks, error=e, input_data=transformed_input, **merged_kwargs)
-            logger.error(
-                f"Node {self.name} - {self.id}: execution failed in {e}"
-                f"{format_duration(time_start, datetime.now())}."
-            )
-
-            recoverable = isinstance(e, RecoverableAgentException)
-            return RunnableResult(
-                status=RunnableStatus.FAILURE,
-                input=input_data,
-                output=format_value(e, recoverable=recoverable),
+            return self._get_failure_result(
+                e, input_data, transformed_input, time_start, config, run_profile, **merged_kwargs
             )
+        finally:
+            run_profile.finish()
+            reset_node_run_profile(profile_token)
+            _node_run_states.reset(run_states_token)
+            _node_input_hashes.reset(input_hashes_token)
 
     def execute_with_retry(self, input_data: dict[str, Any] | BaseModel, config: RunnableConfig = None, **kwargs):
         """
@@ -704,48 +1434,104 @@ class Node(BaseModel, Runnable, ABC):
         Raises:
             Exception: If all retry attempts fail.
         """
-        config = ensure_config(config)
+        return run_steps(self.iter_execute_with_retry(input_data, config, **kwargs))
+
+    def iter_execute_with_retry(
+        self, input_data: dict[str, Any] | BaseModel, config: RunnableConfig = None, **kwargs
+    ) -> Generator[float, None, Any]:
+        """
+        Execute the node with retry logic, yielding the delay before each retry instead of sleeping.
+
+        Args:
+            input_data (dict[str, Any]): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
 
-        error = None
-        n_attempt = self.error_handling.max_retries + 1
-        for attempt in range(n_attempt):
-            merged_kwargs = merge(kwargs, {"execution_run_id": uuid4()})
+        Yields:
+            float: Seconds to wait before the retry.
 
-            self.run_on_node_execute_start(config.callbacks, input_data, **merged_kwargs)
+        Returns:
+            Any: Result of the node execution.
 
+        Raises:
+            Exception: If all retry attempts fail.
+        """
+        config = ensure_config(config)
+        attempts = NodeExecutionAttempts(self, input_data, config, **kwargs)
+        while attempts.start():
             try:
-                output = self.execute_with_timeout(
-                    self.error_handling.timeout_seconds,
-                    input_data,
-                    config,
-                    **merged_kwargs,
-                )
-
-                self.run_on_node_execute_end(config.callbacks, output, **merged_kwargs)
-                return output
-            except TimeoutError as e:
-                error = e
-                self.run_on_node_execute_error(config.callbacks, error, **merged_kwargs)
-                logger.warning(f"Node {self.name} - {self.id}: timeout.")
+                try:
+                    output = self.execute_with_timeout(attempts.timeout, input_data, config, **attempts.kwargs)
+                finally:
+                    attempts.finish()
+                return attempts.succeed(output)
             except Exception as e:
-                error = e
-                self.run_on_node_execute_error(config.callbacks, error, **merged_kwargs)
-                logger.error(f"Node {self.name} - {self.id}: execution error: {e}")
-
-            # do not sleep after the last attempt
-            if attempt < n_attempt - 1:
-                time_to_sleep = self.error_handling.retry_interval_seconds * (
-                    self.error_handling.backoff_rate**attempt
-                )
-                logger.info(
-                    f"Node {self.name} - {self.id}: retrying in {time_to_sleep} seconds."
-                )
-                time.sleep(time_to_sleep)
+                attempts.fail(e)
 
-        logger.error(
-            f"Node {self.name} - {self.id}: execution failed after {n_attempt} attempts."
+            if (time_to_sleep := attempts.get_retry_delay()) is None:
+                break
+            phase_start = time.perf_counter()
+            yield time_to_sleep
+            attempts.record_retry_wait(phase_start)
+
+        attempts.raise_error()
+
+    def get_service_key(self) -> str:
+        """
+        Get the key of the service called by the node.
+
+        Nodes with the same key share the circuit breaker and the retry budget.
+
+        Returns:
+            str: Key of the service.
+        """
+        return self.id
+
+    def _get_circuit_breaker(self) -> CircuitBreaker | None:
+        """Returns the circuit breaker of the node service if it is configured."""
+        if (breaker_config := self.error_handling.circuit_breaker) is None:
+            return None
+        return get_circuit_breaker(
+            self.get_service_key(), breaker_config.failure_threshold, breaker_config.recovery_timeout_seconds
         )
-        raise error
+
+    def _get_retry_budget(self) -> RetryBudget | None:
+        """Returns the retry budget of the node service if it is configured."""
+        if (budget_config := self.error_handling.retry_budget) is None:
+            return None
+        return get_retry_budget(self.get_service_key(), budget_config.ratio, budget_config.min_retries)
+
+    @staticmethod
+    def _get_retry_state(attempt: int, circuit_breaker: CircuitBreaker | None) -> dict[str, Any]:
+        """Returns the retry attempt and the circuit breaker state reported to the execute callbacks."""
+        return {"attempt": attempt, "circuit_breaker_state": circuit_breaker.state if circuit_breaker else None}
+
+    def _get_retry_delay(
+        self, attempt: int, config: RunnableConfig, retry_budget: RetryBudget | None
+    ) -> float | None:
+        """
+        Get the time to wait before the retry.
+
+        Args:
+            attempt (int): Index of the failed attempt.
+            config (RunnableConfig): Configuration of the run.
+            retry_budget (RetryBudget | None): Retry budget of the node service.
+
+        Returns:
+            float | None: Seconds to wait, or None if the retry is not allowed by the run deadline or retry budget.
+        """
+        delay = self.error_handling.retry_interval_seconds * self.error_handling.backoff_rate**attempt
+        if self.error_handling.jitter:
+            delay = random.uniform(0, delay)  # nosec B311
+
+        remaining = config.get_remaining_seconds()
+        if remaining is not None and delay >= remaining:
+            logger.warning(f"Node {self.name} - {self.id}: no time left to retry before the run deadline.")
+            return None
+        if retry_budget and not retry_budget.try_acquire():
+            logger.warning(f"Node {self.name} - {self.id}: retry budget of '{retry_budget.key}' is exhausted.")
+            return None
+        return delay
 
     def execute_with_timeout(
         self,
@@ -769,15 +1555,79 @@ class Node(BaseModel, Runnable, ABC):
         Raises:
             Exception: If execution fails or times out.
         """
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(self.execute, input_data, config=config, **kwargs)
+        if timeout is None:
+            return self.execute(input_data, config=config, **kwargs)
+
+        # Isolate run state of the execution from other runs of the node
+        future = get_default_worker_pool().submit(copy_context().run, self.execute, input_data, config=config, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            # Drops the execution if it has not started yet. Running executions can not be interrupted,
+            # clients of the node get the run deadline as their request timeout to stop on their own.
+            future.cancel()
+            raise
+
+    async def aexecute_with_retry(
+        self, input_data: dict[str, Any] | BaseModel, config: RunnableConfig = None, **kwargs
+    ):
+        """
+        Asynchronously execute the node with retry logic.
 
+        Args:
+            input_data (dict[str, Any]): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Any: Result of the node execution.
+
+        Raises:
+            Exception: If all retry attempts fail.
+        """
+        config = ensure_config(config)
+        attempts = NodeExecutionAttempts(self, input_data, config, **kwargs)
+        while attempts.start():
             try:
-                result = future.result(timeout=timeout)
+                try:
+                    output = await self.aexecute_with_timeout(attempts.timeout, input_data, config, **attempts.kwargs)
+                finally:
+                    attempts.finish()
+                return attempts.succeed(output)
             except Exception as e:
-                raise e
+                attempts.fail(e)
+
+            if (time_to_sleep := attempts.get_retry_delay()) is None:
+                break
+            phase_start = time.perf_counter()
+            await asyncio.sleep(time_to_sleep)
+            attempts.record_retry_wait(phase_start)
+
+        attempts.raise_error()
+
+    async def aexecute_with_timeout(
+        self,
+        timeout: float | None,
+        input_data: dict[str, Any] | BaseModel,
+        config: RunnableConfig = None,
+        **kwargs,
+    ):
+        """
+        Asynchronously execute the node with a timeout.
+
+        Args:
+            timeout (float | None): Timeout duration in seconds.
+            input_data (dict[str, Any]): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the runnable.
+            **kwargs: Additional keyword arguments.
 
-            return result
+        Returns:
+            Any: Result of the execution.
+
+        Raises:
+            Exception: If execution fails or times out.
+        """
+        return await asyncio.wait_for(self.aexecute(input_data, config=config, **kwargs), timeout=timeout)
 
     def get_context_for_input_schema(self) -> dict:
         """Provides context for input schema that is required for proper validation."""
@@ -839,7 +1689,9 @@ class Node(BaseModel, Runnable, ABC):
 
         for callback in callbacks + self.callbacks:
             try:
-                callback.on_node_start(self.to_dict(), input_data, **kwargs)
+                dispatch_callback(
+                    callback, "on_node_start", self.get_callback_serialized(callback), input_data, **kwargs
+                )
             except Exception as e:
                 logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
 
@@ -859,7 +1711,9 @@ class Node(BaseModel, Runnable, ABC):
         """
         for callback in callbacks + self.callbacks:
             try:
-                callback.on_node_end(self.model_dump(), output_data, **kwargs)
+                dispatch_callback(
+                    callback, "on_node_end", self.get_callback_serialized(callback), output_data, **kwargs
+                )
             except Exception as e:
                 logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
 
@@ -879,7 +1733,7 @@ class Node(BaseModel, Runnable, ABC):
         """
         for callback in callbacks + self.callbacks:
             try:
-                callback.on_node_error(self.to_dict(), error, **kwargs)
+                dispatch_callback(callback, "on_node_error", self.get_callback_serialized(callback), error, **kwargs)
             except Exception as e:
                 logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
 
@@ -901,7 +1755,9 @@ class Node(BaseModel, Runnable, ABC):
         """
         for callback in callbacks + self.callbacks:
             try:
-                callback.on_node_skip(self.to_dict(), skip_data, input_data, **kwargs)
+                dispatch_callback(
+                    callback, "on_node_skip", self.get_callback_serialized(callback), skip_data, input_data, **kwargs
+                )
             except Exception as e:
                 logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
 
@@ -924,7 +1780,9 @@ class Node(BaseModel, Runnable, ABC):
 
         for callback in callbacks + self.callbacks:
             try:
-                callback.on_node_execute_start(self.to_dict(), input_data, **kwargs)
+                dispatch_callback(
+                    callback, "on_node_execute_start", self.get_callback_serialized(callback), input_data, **kwargs
+                )
             except Exception as e:
                 logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
 
@@ -944,7 +1802,9 @@ class Node(BaseModel, Runnable, ABC):
         """
         for callback in callbacks + self.callbacks:
             try:
-                callback.on_node_execute_end(self.to_dict(), output_data, **kwargs)
+                dispatch_callback(
+                    callback, "on_node_execute_end", self.get_callback_serialized(callback), output_data, **kwargs
+                )
             except Exception as e:
                 logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
 
@@ -964,7 +1824,9 @@ class Node(BaseModel, Runnable, ABC):
         """
         for callback in callbacks + self.callbacks:
             try:
-                callback.on_node_execute_error(self.model_dump(), error, **kwargs)
+                dispatch_callback(
+                    callback, "on_node_execute_error", self.get_callback_serialized(callback), error, **kwargs
+                )
             except Exception as e:
                 logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
 
@@ -982,7 +1844,7 @@ class Node(BaseModel, Runnable, ABC):
         """
         for callback in callbacks + self.callbacks:
             try:
-                callback.on_node_execute_run(self.to_dict(), **kwargs)
+                dispatch_callback(callback, "on_node_execute_run", self.get_callback_serialized(callback), **kwargs)
             except Exception as e:
                 logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
 
@@ -1000,11 +1862,16 @@ class Node(BaseModel, Runnable, ABC):
             chunk (dict[str, Any]): Chunk of streaming data.
             **kwargs: Additional keyword arguments.
         """
+        time_start = time.perf_counter()
         for callback in callbacks + self.callbacks:
             try:
-                callback.on_node_execute_stream(self.to_dict(), chunk, **kwargs)
+                dispatch_callback(
+                    callback, "on_node_execute_stream", self.get_callback_serialized(callback), chunk, **kwargs
+                )
             except Exception as e:
                 logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
+        if (run_profile := get_node_run_profile()) is not None:
+            run_profile.add(NodePhase.CALLBACKS, time_start)
 
     @abstractmethod
     def execute(self, input_data: dict[str, Any] | BaseModel, config: RunnableConfig = None, **kwargs) -> Any:
@@ -1020,6 +1887,22 @@ class Node(BaseModel, Runnable, ABC):
         """
         pass
 
+    async def aexecute(self, input_data: dict[str, Any] | BaseModel, config: RunnableConfig = None, **kwargs) -> Any:
+        """
+        Asynchronously execute the node with the given input.
+
+        Nodes without a native async implementation run `execute` in a worker thread.
+
+        Args:
+            input_data (dict[str, Any]): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the runnable.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Any: Result of the execution.
+        """
+        return await asyncio.to_thread(self.execute, input_data, config=config, **kwargs)
+
     def depends_on(self, nodes: Union["Node", list["Node"]]):
         """
         Add dependencies for this node. Accepts either a single node or a list of nodes.
@@ -1141,6 +2024,9 @@ class ConnectionNode(Node, ABC):
     connection: BaseConnection | None = None
     client: Any | None = None
 
+    _async_client: Any | None = PrivateAttr(default=None)
+    _connection_manager: ConnectionManager | None = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def validate_connection_client(self):
         """Validate that either connection or client is specified."""
@@ -1148,6 +2034,23 @@ class ConnectionNode(Node, ABC):
             raise ValueError("'connection' or 'client' should be specified")
         return self
 
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Pickles the node definition without clients. Clients are re-created from the connection, so the client
+        is kept only when the node has no connection.
+
+        Returns:
+            dict[str, Any]: Pickled state of the node.
+        """
+        state = super().__getstate__()
+        if self.connection is not None:
+            state["__dict__"] = state["__dict__"] | {"client": None, "is_postponed_component_init": True}
+        state["__pydantic_private__"] = (state["__pydantic_private__"] or {}) | {
+            "_async_client": None,
+            "_connection_manager": None,
+        }
+        return state
+
     def init_components(self, connection_manager: ConnectionManager | None = None):
         """
         Initialize components for the node.
@@ -1157,11 +2060,38 @@ class ConnectionNode(Node, ABC):
         """
         connection_manager = connection_manager or ConnectionManager()
         super().init_components(connection_manager)
+        self._connection_manager = connection_manager
         if self.client is None:
             self.client = connection_manager.get_connection_client(
                 connection=self.connection
             )
 
+    def get_service_key(self) -> str:
+        """
+        Get the key of the service called by the node. Nodes sharing a connection share the key.
+
+        Returns:
+            str: Key of the service.
+        """
+        if self.connection is None:
+            return super().get_service_key()
+        return f"{self.connection.type}:{self.connection.id}"
+
+    @property
+    def async_client(self) -> Any | None:
+        """
+        Asyncio compatible client of the connection. Initialized lazily on first access.
+
+        Returns:
+            Any | None: Async client instance or None if the connection does not support it.
+        """
+        if self._async_client is None and self.connection is not None and hasattr(self.connection, "connect_async"):
+            connection_manager = self._connection_manager or ConnectionManager()
+            self._async_client = connection_manager.get_connection_client(
+                connection=self.connection, init_type=ConnectionClientInitType.ASYNC
+            )
+        return self._async_client
+
 
 class VectorStoreNode(ConnectionNode, BaseVectorStoreParams, ABC):
     vector_store: Any | None = None
@@ -1195,6 +2125,18 @@ class VectorStoreNode(ConnectionNode, BaseVectorStoreParams, ABC):
 
         return vector_store
 
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Pickles the node definition without the vector store if it can be re-created from the connection.
+
+        Returns:
+            dict[str, Any]: Pickled state of the node.
+        """
+        state = super().__getstate__()
+        if self.connection is not None:
+            state["__dict__"] = state["__dict__"] | {"vector_store": None, "is_postponed_component_init": True}
+        return state
+
     def init_components(self, connection_manager: ConnectionManager | None = None):
         """
         Initialize components for the node.
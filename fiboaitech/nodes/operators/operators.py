@@ -1,3 +1,6 @@
+import asyncio
+from concurrent import futures
+from contextvars import copy_context
 from enum import Enum
 from typing import Any, ClassVar, Literal
 from uuid import uuid4
@@ -5,6 +8,7 @@ from uuid import uuid4
 from pydantic import BaseModel, ConfigDict, Field
 
 import fiboaitech.utils.jsonpath as jsonpath
+from fiboaitech.executors.worker_pool import get_default_worker_pool
 from fiboaitech.nodes import Behavior, Node, NodeGroup
 from fiboaitech.nodes.node import Transformer, ensure_config
 from fiboaitech.runnables import RunnableConfig, RunnableResult, RunnableStatus
@@ -203,12 +207,25 @@ class MapInputSchema(BaseModel):
 
 
 class Map(Node):
-    """Represents a map node in a flow."""
+    """Represents a map node in a flow.
+
+    Runs the node over each item of the input list and returns outputs in input order.
+
+    Attributes:
+        node (Node): Node to run for each item.
+        behavior (Behavior | None): Whether to raise on the first failed item or return failed outputs.
+        max_workers (int): Maximum number of items run concurrently on the shared worker pool. Items run one by one
+            in the current thread by default.
+        chunk_size (int | None): Number of items passed to the node at once as `{"input": [...]}`. Defaults to
+            passing every item separately.
+    """
 
     name: str | None = "Map"
     group: Literal[NodeGroup.OPERATORS] = NodeGroup.OPERATORS
     node: Node
     behavior: Behavior | None = Behavior.RETURN
+    max_workers: int = Field(default=1, ge=1)
+    chunk_size: int | None = Field(default=None, ge=1)
     input_schema: ClassVar[type[MapInputSchema]] = MapInputSchema
 
     @property
@@ -231,6 +248,42 @@ class Map(Node):
         data["node"] = self.node.to_dict(**kwargs)
         return data
 
+    def _get_items(self, input_data: list) -> list:
+        """
+        Splits the input list into node inputs.
+
+        Args:
+            input_data (list): Input list of the map node.
+
+        Returns:
+            list: Input of each node run, chunks of `chunk_size` items if it is set.
+        """
+        if self.chunk_size is None:
+            return input_data
+        return [
+            {"input": input_data[i: i + self.chunk_size]} for i in range(0, len(input_data), self.chunk_size)
+        ]
+
+    def _get_item_output(self, index: int, result: RunnableResult) -> Any:
+        """
+        Returns the output of the node run, raising on failure if the behavior is RAISE.
+
+        Args:
+            index (int): Iteration index of the run, starting from 1.
+            result (RunnableResult): Result of the node run.
+
+        Returns:
+            Any: Output of the node run.
+
+        Raises:
+            ValueError: If the node run failed and the behavior is RAISE.
+        """
+        if result.status != RunnableStatus.SUCCESS:
+            if self.behavior == Behavior.RAISE:
+                raise ValueError(f"Map node failed to execute: node under iteration index {index} has failed.")
+            logger.error(f"Node under iteration index {index} has failed.")
+        return result.output
+
     def execute(self, input_data: MapInputSchema, config: RunnableConfig = None, **kwargs):
         """
         Executes the map node.
@@ -246,22 +299,97 @@ class Map(Node):
         Raises:
             Exception: If the input is not a list or if any flow execution fails.
         """
-        input_data = input_data.input
+        items = self._get_items(input_data.input)
 
-        output = []
         run_id = kwargs.get("run_id", uuid4())
         config = ensure_config(config)
         merged_kwargs = {**kwargs, "parent_run_id": run_id}
 
         self.run_on_node_execute_run(config.callbacks, **kwargs)
 
-        for index, data in enumerate(input_data, start=1):
+        if self.max_workers > 1 and len(items) > 1:
+            return {"output": self._execute_concurrently(items, config, **merged_kwargs)}
+
+        output = []
+        for index, data in enumerate(items, start=1):
             result = self.node.run(data, config, **merged_kwargs)
-            if result.status != RunnableStatus.SUCCESS:
-                if self.behavior == Behavior.RAISE:
-                    raise ValueError(f"Map node failed to execute: node under iteration index {index} has failed.")
-                logger.error(f"Node under iteration index {index} has failed.")
-            output.append(result.output)
+            output.append(self._get_item_output(index, result))
+
+        return {"output": output}
+
+    def _execute_concurrently(self, items: list, config: RunnableConfig, **kwargs) -> list:
+        """
+        Runs the node over the items on the shared worker pool keeping at most `max_workers` runs in flight.
+
+        Items are submitted as runs complete, so on failure with the RAISE behavior queued runs are cancelled and
+        remaining items are not started. Runs already in progress are not awaited.
+        """
+        worker_pool = get_default_worker_pool()
+        output = [None] * len(items)
+        pending: dict[futures.Future, int] = {}
+        next_items = enumerate(items, start=1)
+
+        def submit_next():
+            for index, data in next_items:
+                # Each run gets its own context copy to isolate run state of concurrent runs of the node
+                future = worker_pool.submit(copy_context().run, self.node.run, data, config, **kwargs)
+                pending[future] = index
+                return
+
+        for _ in range(self.max_workers):
+            submit_next()
+
+        try:
+            while pending:
+                done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    output[index - 1] = self._get_item_output(index, future.result())
+                    submit_next()
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return output
+
+    async def aexecute(self, input_data: MapInputSchema, config: RunnableConfig = None, **kwargs):
+        """
+        Asynchronously executes the map node, running at most `max_workers` items concurrently.
+
+        Args:
+            input_data: The input data for the node.
+            config: The runnable configuration.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            A list of outputs from executing the flow on each input item.
+
+        Raises:
+            Exception: If the input is not a list or if any flow execution fails.
+        """
+        items = self._get_items(input_data.input)
+
+        run_id = kwargs.get("run_id", uuid4())
+        config = ensure_config(config)
+        merged_kwargs = {**kwargs, "parent_run_id": run_id}
+
+        self.run_on_node_execute_run(config.callbacks, **kwargs)
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def run_item(index: int, data: Any) -> tuple[int, RunnableResult]:
+            async with semaphore:
+                return index, await self.node.arun(data, config, **merged_kwargs)
+
+        output = [None] * len(items)
+        tasks = [asyncio.create_task(run_item(index, data)) for index, data in enumerate(items, start=1)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                index, result = await task
+                output[index - 1] = self._get_item_output(index, result)
+        finally:
+            for task in tasks:
+                task.cancel()
 
         return {"output": output}
 
@@ -52,7 +52,7 @@ class HttpApiCall(ConnectionNode):
         connection (HttpConnection | None): The connection based on sending http requests.A new connection
             is created if none is provided.
         success_codes(list[int]): The list of codes when request is successful.
-        timeout (float): The timeout in seconds.
+        timeout (float): The timeout in seconds. Bounded by the run deadline.
         data(dict[str,Any]): The data to send as body of request.
         headers(dict[str,Any]): The headers of request.
         payload_type (dict[str, Any]): Parameter to specify the type of payload data.
@@ -107,7 +107,7 @@ class HttpApiCall(ConnectionNode):
             url=url,
             headers=self.connection.headers | self.headers | headers,
             params=self.connection.params | self.params | params,
-            timeout=self.timeout,
+            timeout=config.get_timeout(self.timeout),
             **extras,
         )
 
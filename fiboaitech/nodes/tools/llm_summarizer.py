@@ -97,12 +97,6 @@ class SummarizerTool(Node):
         if self.llm.is_postponed_component_init:
             self.llm.init_components(connection_manager)
 
-    def reset_run_state(self):
-        """
-        Reset the intermediate steps (run_depends) of the node.
-        """
-        self._run_depends = []
-
     @property
     def to_dict_exclude_params(self) -> dict:
         """
@@ -149,7 +143,7 @@ class SummarizerTool(Node):
             config=config,
             **(kwargs | {"parent_run_id": kwargs.get("run_id")}),
         )
-        self._run_depends = [NodeDependency(node=self.llm).to_dict()]
+        self.run_state.run_depends = [NodeDependency(node=self.llm).to_dict()]
         if result.status != RunnableStatus.SUCCESS:
             raise ValueError("LLM execution failed")
         return result.output["content"]
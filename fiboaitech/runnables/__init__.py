@@ -1 +1,2 @@
 from .base import Runnable, RunnableConfig, RunnableResult, RunnableStatus
+from .batch import run_batch
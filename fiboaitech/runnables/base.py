@@ -1,3 +1,5 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
 from io import BytesIO
@@ -7,6 +9,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from fiboaitech.cache.config import CacheConfig
 from fiboaitech.callbacks import BaseCallbackHandler
+from fiboaitech.checkpoints.base import BaseCheckpointStore
 from fiboaitech.types.streaming import StreamingConfig
 from fiboaitech.utils import format_value, generate_uuid
 
@@ -23,6 +26,12 @@ class RunnableConfig(BaseModel):
         callbacks (list[BaseCallbackHandler]): List of callback handlers.
         cache (CacheConfig | None): Cache configuration.
         max_node_workers (int | None): Maximum number of node workers.
+        timeout_seconds (float | None): Time budget of the run in seconds, shared by all nodes of the run.
+        deadline (float | None): `time.monotonic()` time the run must finish by. Set from `timeout_seconds`
+            when the run starts.
+        checkpoint_store (BaseCheckpointStore | None): Store persisting completed steps of the run under `run_id`,
+            so each run must have a distinct run id.
+        resume_from (str | None): Id of a previous run to resume, skipping its completed steps.
     """
 
     run_id: str | None = Field(default_factory=generate_uuid)
@@ -30,9 +39,55 @@ class RunnableConfig(BaseModel):
     cache: CacheConfig | None = None
     max_node_workers: int | None = None
     nodes_override: dict[str, NodeRunnableConfig] = {}
+    timeout_seconds: float | None = Field(default=None, gt=0)
+    deadline: float | None = None
+    checkpoint_store: BaseCheckpointStore | None = None
+    resume_from: str | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    def start_deadline(self) -> "RunnableConfig":
+        """
+        Start the run deadline from the time budget.
+
+        Nested runs get the started configuration, so they share the deadline of the outermost run.
+
+        Returns:
+            RunnableConfig: Copy of the configuration with the deadline set, or the configuration itself if it has
+                no time budget or the deadline is already started.
+        """
+        if self.timeout_seconds is None or self.deadline is not None:
+            return self
+        return self.model_copy(update={"deadline": time.monotonic() + self.timeout_seconds})
+
+    def get_remaining_seconds(self) -> float | None:
+        """
+        Get the time left until the run deadline.
+
+        Returns:
+            float | None: Seconds left, 0 if the deadline has passed, or None if the run has no deadline.
+        """
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def get_timeout(self, timeout: float | None = None) -> float | None:
+        """
+        Get the timeout of an operation bounded by the run deadline.
+
+        Args:
+            timeout (float | None): Own timeout of the operation in seconds.
+
+        Returns:
+            float | None: The smaller of the timeout and the remaining time, or None if neither is set.
+        """
+        remaining = self.get_remaining_seconds()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
 
 class RunnableStatus(str, Enum):
     """
@@ -143,3 +198,21 @@ class Runnable(ABC):
             RunnableResult: The result of the execution.
         """
         pass
+
+    async def arun(
+        self, input_data: Any, config: RunnableConfig = None, **kwargs
+    ) -> RunnableResult:
+        """
+        Asynchronously run the Runnable object.
+
+        By default, runs the synchronous `run` in a worker thread.
+
+        Args:
+            input_data (Any): The input data for the execution.
+            config (RunnableConfig, optional): Configuration for the execution.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: The result of the execution.
+        """
+        return await asyncio.to_thread(self.run, input_data, config, **kwargs)
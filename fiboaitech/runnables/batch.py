@@ -0,0 +1,124 @@
+from collections.abc import Sized
+from concurrent import futures
+from contextvars import copy_context
+from typing import Any, Callable, Iterable, Iterator
+from uuid import uuid4
+
+from fiboaitech.callbacks.dispatch import dispatch_callback
+from fiboaitech.executors.worker_pool import get_default_worker_pool
+from fiboaitech.runnables.base import RunnableConfig, RunnableResult, RunnableStatus
+from fiboaitech.utils import format_value, generate_uuid
+from fiboaitech.utils.env import get_env_var
+from fiboaitech.utils.logger import logger
+
+BATCH_MAX_CONCURRENCY = int(get_env_var("FIBOAITECH_BATCH_MAX_CONCURRENCY", 8))
+
+
+def run_batch(
+    run: Callable[..., RunnableResult],
+    inputs: Iterable[Any],
+    serialized: dict[str, Any],
+    config: RunnableConfig | None = None,
+    max_concurrency: int | None = None,
+    **kwargs,
+) -> Iterator[tuple[int, RunnableResult]]:
+    """
+    Runs the runnable over many inputs concurrently and yields results as they complete.
+
+    At most `max_concurrency` runs are in flight, inputs are consumed lazily as runs complete, so generators of
+    inputs are not materialized. Runs are driven by the shared worker pool, which runs their nodes as nested tasks.
+    Each run gets its own copy of the configuration with a distinct `run_id`, so checkpoints and traces of the runs
+    do not collide. A failed run does not stop the batch. Progress and failures are reported to the
+    `on_batch_*` callbacks with the number of `completed` and `failed` runs and the `total` number of inputs, which
+    is None for inputs without a length.
+
+    Args:
+        run (Callable[..., RunnableResult]): Runs a single input, e.g. `Workflow.run`.
+        inputs (Iterable[Any]): Input data of the runs.
+        serialized (dict[str, Any]): Serialized runnable passed to the batch callbacks.
+        config (RunnableConfig, optional): Configuration shared by the runs.
+        max_concurrency (int, optional): Maximum number of concurrent runs. Defaults to BATCH_MAX_CONCURRENCY.
+        **kwargs: Additional keyword arguments of the runs.
+
+    Yields:
+        tuple[int, RunnableResult]: Index of the input and the result of its run, in completion order.
+
+    Raises:
+        ValueError: If `max_concurrency` is less than 1.
+    """
+    max_concurrency = max_concurrency or BATCH_MAX_CONCURRENCY
+    if max_concurrency < 1:
+        raise ValueError("Batch max_concurrency must be at least 1.")
+
+    callbacks = config.callbacks if config else []
+    batch_kwargs = {
+        "run_id": uuid4(),
+        "total": len(inputs) if isinstance(inputs, Sized) else None,
+        "max_concurrency": max_concurrency,
+    }
+    completed, failed = 0, 0
+
+    def run_item(input_data: Any) -> RunnableResult:
+        item_config = (config or RunnableConfig()).model_copy(update={"run_id": generate_uuid()})
+        try:
+            return run(input_data, item_config, **kwargs)
+        except Exception as e:
+            logger.error(f"Batch run failed: {e}")
+            return RunnableResult(status=RunnableStatus.FAILURE, input=input_data, output=format_value(e))
+
+    worker_pool = get_default_worker_pool()
+    pending: dict[futures.Future, int] = {}
+    next_inputs = enumerate(inputs)
+
+    def submit_next():
+        for index, input_data in next_inputs:
+            pending[worker_pool.submit(copy_context().run, run_item, input_data)] = index
+            return
+
+    for callback in callbacks:
+        dispatch_callback(callback, "on_batch_start", serialized, **batch_kwargs)
+
+    try:
+        for _ in range(max_concurrency):
+            submit_next()
+
+        while pending:
+            done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                result = future.result()
+                completed += 1
+                if result.status == RunnableStatus.SUCCESS:
+                    for callback in callbacks:
+                        dispatch_callback(
+                            callback,
+                            "on_batch_item_end",
+                            serialized,
+                            index,
+                            result,
+                            completed=completed,
+                            failed=failed,
+                            **batch_kwargs,
+                        )
+                else:
+                    failed += 1
+                    for callback in callbacks:
+                        dispatch_callback(
+                            callback,
+                            "on_batch_item_error",
+                            serialized,
+                            index,
+                            result,
+                            completed=completed,
+                            failed=failed,
+                            **batch_kwargs,
+                        )
+                submit_next()
+                yield index, result
+    finally:
+        # Stops queued runs if the consumer closes the generator early
+        for future in pending:
+            future.cancel()
+
+        for callback in callbacks:
+            dispatch_callback(callback, "on_batch_end", serialized, completed=completed, failed=failed, **batch_kwargs)
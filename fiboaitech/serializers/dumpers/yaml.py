@@ -125,7 +125,7 @@ class WorkflowYAMLDumper:
         """
         flows_data = {}
         for flow_id, flow in flows.items():
-            flow_data = flow.to_dict(exclude={"nodes", "executor", "connection_manager"})
+            flow_data = flow.to_dict(exclude={"nodes", "executor", "worker_pool", "connection_manager"})
             flow_data["nodes"] = [node.id for node in flow.nodes]
             flows_data[flow_id] = flow_data
 
@@ -2,7 +2,7 @@ from enum import Enum
 from functools import cached_property
 from queue import Queue
 from threading import Event
-from typing import Any
+from typing import Any, NamedTuple
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -66,6 +66,26 @@ class StreamingEventMessage(BaseModel):
         return self.model_dump_json(**kwargs)
 
 
+class StreamingFrame(NamedTuple):
+    """Frame of the streaming fast path, serialized to JSON once when it is built.
+
+    Attributes:
+        run_id (str | None): Run ID of the node, or of the workflow for the final frame.
+        entity_id (str): Entity ID.
+        event (str): Event name.
+        content (str | None): Coalesced delta text of the tokens, None for frames carrying data.
+        data (Any): Data of frames that aren't token deltas, e.g. the workflow output.
+        payload (str): JSON payload of the frame, ready to be written to the transport.
+    """
+
+    run_id: str | None
+    entity_id: str
+    event: str
+    content: str | None
+    data: Any
+    payload: str
+
+
 class StreamingConfig(BaseModel):
     """Configuration for streaming.
 
@@ -1,2 +1,2 @@
 from .duration import format_duration
-from .utils import JsonWorkflowEncoder, format_value, generate_uuid, merge, serialize
+from .utils import JsonWorkflowEncoder, format_value, format_value_json, generate_uuid, merge, serialize
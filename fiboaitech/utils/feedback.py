@@ -1,3 +1,4 @@
+from fiboaitech.callbacks.dispatch import dispatch_callback
 from fiboaitech.callbacks.streaming import StreamingEventMessage
 from fiboaitech.runnables import RunnableConfig
 from fiboaitech.types.feedback import FeedbackMethod
@@ -21,4 +22,4 @@ def send_message(
             print(event_message.data)
         case FeedbackMethod.STREAM:
             for callback in config.callbacks:
-                callback.on_node_execute_stream({}, event=event_message)
+                dispatch_callback(callback, "on_node_execute_stream", {}, event=event_message)
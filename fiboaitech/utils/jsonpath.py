@@ -1,6 +1,105 @@
+import re
+from functools import lru_cache
+from typing import Any
+
 from jsonpath_ng import parse
 from jsonpath_ng.exceptions import JsonPathParserError
 
+from fiboaitech.utils.env import get_env_var
+
+JSONPATH_CACHE_SIZE = int(get_env_var("FIBOAITECH_JSONPATH_CACHE_SIZE", 1024))
+
+_FIELD = r"[A-Za-z_][A-Za-z0-9_\-]*"
+_INDEX = r"\[-?\d+\]"
+SIMPLE_JSONPATH_PATTERN = re.compile(rf"(?:\$|{_FIELD}|{_INDEX})(?:\.{_FIELD}|{_INDEX})*")
+SIMPLE_JSONPATH_STEP_PATTERN = re.compile(rf"\.?({_FIELD})|\[(-?\d+)\]")
+# Words with a special meaning in the jsonpath-ng grammar
+JSONPATH_RESERVED_WORDS = {"where"}
+
+_NOT_SET = object()
+
+
+class JsonPath:
+    """
+    Compiled JSONPath expression.
+
+    Simple dotted and indexed paths, e.g. `$.output.documents[0].content`, are evaluated directly with the same
+    matching rules as jsonpath-ng. Other expressions are evaluated by the parsed jsonpath-ng expression.
+
+    Attributes:
+        path (str): Source JSONPath expression.
+    """
+
+    __slots__ = ("path", "_steps", "_expression")
+
+    def __init__(self, path: str):
+        self.path = path
+        self._steps = self._get_simple_steps(path)
+        self._expression = None if self._steps is not None else parse(path)
+
+    @staticmethod
+    def _get_simple_steps(path: str) -> list[str | int] | None:
+        """Splits a simple path into field and index steps. Returns None if the path requires jsonpath-ng."""
+        if not SIMPLE_JSONPATH_PATTERN.fullmatch(path):
+            return None
+
+        steps = []
+        for field, index in SIMPLE_JSONPATH_STEP_PATTERN.findall(path.removeprefix("$")):
+            if field in JSONPATH_RESERVED_WORDS:
+                return None
+            steps.append(field or int(index))
+        return steps
+
+    @property
+    def is_simple(self) -> bool:
+        """Whether the path is evaluated without jsonpath-ng."""
+        return self._steps is not None
+
+    def find(self, json: Any) -> list[Any]:
+        """
+        Find values matched by the path.
+
+        Args:
+            json (Any): Data to search.
+
+        Returns:
+            list[Any]: Matched values.
+        """
+        if self._steps is None:
+            return [match.value for match in self._expression.find(json)]
+
+        value = json
+        for step in self._steps:
+            if isinstance(step, str):
+                try:
+                    value = value.get(step, _NOT_SET)
+                except (TypeError, AttributeError):
+                    return []
+                if value is _NOT_SET:
+                    return []
+            elif value and len(value) > step:
+                value = value[step]
+            else:
+                return []
+        return [value]
+
+
+@lru_cache(maxsize=JSONPATH_CACHE_SIZE)
+def compile_jsonpath(path: str) -> JsonPath | None:
+    """
+    Compile the JSONPath expression. Results are kept in a bounded LRU cache.
+
+    Args:
+        path (str): JSONPath expression.
+
+    Returns:
+        JsonPath | None: Compiled expression, or None if the string is not a valid JSONPath expression.
+    """
+    try:
+        return JsonPath(path)
+    except JsonPathParserError:
+        return None
+
 
 def is_jsonpath(path: str) -> bool:
     """
@@ -12,11 +111,25 @@ def is_jsonpath(path: str) -> bool:
     Returns:
         bool: True if the string is a valid JSONPath expression, False otherwise.
     """
-    try:
-        parse(path)
-        return True
-    except JsonPathParserError:
-        return False
+    return compile_jsonpath(path) is not None
+
+
+def compile_selector(map: dict | None) -> dict | None:
+    """
+    Compile JSONPath expressions of the mapping configuration. Values that are not JSONPath expressions are kept
+    as is and mapped as constants.
+
+    Args:
+        map (dict | None): Mapping configuration.
+
+    Returns:
+        dict | None: Mapping configuration with compiled expressions.
+    """
+    if not isinstance(map, dict):
+        return map
+    return {
+        key: (compile_jsonpath(path) or path) if isinstance(path, str) else path for key, path in map.items()
+    }
 
 
 def mapper(json: dict | list, map: dict, node_id: str) -> dict:
@@ -25,7 +138,8 @@ def mapper(json: dict | list, map: dict, node_id: str) -> dict:
 
     Args:
         json (dict | list): The input JSON object or list to be mapped.
-        map (dict): A dictionary defining the mapping configuration.
+        map (dict): A dictionary defining the mapping configuration. Values are JSONPath expressions, compiled
+            expressions or constants.
         node_id (str): An identifier for the current node being processed.
 
     Returns:
@@ -46,30 +160,32 @@ def mapper(json: dict | list, map: dict, node_id: str) -> dict:
 
     new_json = {}
     for key, path in map.items():
-        if not is_jsonpath(path):
-            new_json[key] = path
-            continue
+        if not isinstance(path, JsonPath):
+            if (compiled_path := compile_jsonpath(path)) is None:
+                new_json[key] = path
+                continue
+            path = compiled_path
         try:
-            found = parse(path).find(json)
+            found = path.find(json)
             if not found:
                 new_json[key] = None
             elif len(found) == 1:
-                new_json[key] = found[0].value
+                new_json[key] = found[0]
             else:
-                new_json[key] = [v.value for v in found]
+                new_json[key] = found
         except Exception as e:
             raise ValueError(f"Error in jsonpath parsing of node {node_id}: {e}")
 
     return new_json
 
 
-def filter(json: dict, filter: str, node_id: str):
+def filter(json: dict, filter: str | JsonPath, node_id: str):
     """
     Filter a JSON object based on a JSONPath expression.
 
     Args:
         json (dict): The input JSON object to be filtered.
-        filter (str): A JSONPath expression used to filter the JSON object.
+        filter (str | JsonPath): A JSONPath expression or compiled expression used to filter the JSON object.
         node_id (str): An identifier for the current node being processed.
 
     Returns:
@@ -80,14 +196,14 @@ def filter(json: dict, filter: str, node_id: str):
     """
     if not filter:
         return json
-    if not is_jsonpath(filter):
+    if not isinstance(filter, JsonPath) and (filter := compile_jsonpath(filter)) is None:
         raise ValueError(f"Invalid filter of node {node_id}: filter must be a jsonpath")
 
     filtered_data = None
     try:
-        value = parse(filter).find(json)
+        value = filter.find(json)
         if value:
-            filtered_data = [v.value for v in value]
+            filtered_data = value
             if len(filtered_data) == 1:
                 filtered_data = filtered_data[0]
         else:
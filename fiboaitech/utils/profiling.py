@@ -0,0 +1,166 @@
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+class NodePhase(str, Enum):
+    """Phases of the node run measured by the node profile."""
+    VALIDATE_DEPENDS = "validate_depends"
+    APPROVAL = "approval"
+    TRANSFORM_INPUT = "transform_input"
+    VALIDATE_INPUT_SCHEMA = "validate_input_schema"
+    CACHE = "cache"
+    EXECUTE = "execute"
+    RETRY_WAIT = "retry_wait"
+    TRANSFORM_OUTPUT = "transform_output"
+    CALLBACKS = "callbacks"
+
+
+@dataclass(slots=True)
+class NodeRunProfile:
+    """
+    Monotonic timings of a single node run.
+
+    Timestamps are `time.perf_counter()` values. Phase timings are exclusive: time of callbacks fired while the
+    node executes is accounted to callbacks only.
+
+    Attributes:
+        ready_at (float | None): Time when all dependencies of the node completed.
+        submitted_at (float | None): Time when the node was submitted to the executor.
+        started_at (float | None): Time when the node run started.
+        ended_at (float | None): Time when the node run ended.
+        phases (dict[NodePhase, float]): Time spent in each phase in seconds.
+        attempts (list[float]): Duration of each execution attempt in seconds.
+        measured (float): Total time accounted to phases in seconds.
+    """
+    ready_at: float | None = None
+    submitted_at: float | None = None
+    started_at: float | None = None
+    ended_at: float | None = None
+    phases: dict[NodePhase, float] = field(default_factory=dict)
+    attempts: list[float] = field(default_factory=list)
+    measured: float = 0
+
+    def start(self) -> None:
+        """Marks the start of the node run."""
+        self.started_at = time.perf_counter()
+
+    def finish(self) -> None:
+        """Marks the end of the node run."""
+        self.ended_at = time.perf_counter()
+
+    def add(self, phase: NodePhase, time_start: float) -> float:
+        """
+        Accounts time elapsed since `time_start` to the phase.
+
+        Args:
+            phase (NodePhase): Measured phase.
+            time_start (float): Start time of the phase.
+
+        Returns:
+            float: Current time, the start of the next phase.
+        """
+        now = time.perf_counter()
+        elapsed = now - time_start
+        self.phases[phase] = self.phases.get(phase, 0) + elapsed
+        self.measured += elapsed
+        return now
+
+    def add_exclusive(self, phase: NodePhase, time_start: float, measured_start: float) -> float:
+        """
+        Accounts time elapsed since `time_start` to the phase, excluding phases measured meanwhile.
+
+        Args:
+            phase (NodePhase): Measured phase.
+            time_start (float): Start time of the phase.
+            measured_start (float): Value of `measured` at the start of the phase.
+
+        Returns:
+            float: Current time, the start of the next phase.
+        """
+        return self.add(phase, time_start + self.measured - measured_start)
+
+    def add_attempt(self, time_start: float, measured_start: float) -> float:
+        """
+        Records the execution attempt that started at `time_start`.
+
+        Args:
+            time_start (float): Start time of the attempt.
+            measured_start (float): Value of `measured` at the start of the attempt.
+
+        Returns:
+            float: Current time, the end of the attempt.
+        """
+        now = self.add_exclusive(NodePhase.EXECUTE, time_start, measured_start)
+        self.attempts.append(now - time_start)
+        return now
+
+    @property
+    def duration(self) -> float | None:
+        """Duration of the node run."""
+        if self.started_at is None or self.ended_at is None:
+            return None
+        return self.ended_at - self.started_at
+
+    @property
+    def scheduler_wait(self) -> float | None:
+        """Time between dependency completion and submission to the executor."""
+        if self.ready_at is None or self.submitted_at is None:
+            return None
+        return self.submitted_at - self.ready_at
+
+    @property
+    def queue_time(self) -> float | None:
+        """Time between submission to the executor and the start of the run."""
+        if self.submitted_at is None or self.started_at is None:
+            return None
+        return self.started_at - self.submitted_at
+
+    @property
+    def start_delay(self) -> float | None:
+        """Time between dependency completion and the start of the run."""
+        if self.ready_at is None or self.started_at is None:
+            return None
+        return self.started_at - self.ready_at
+
+    def to_dict(self) -> dict:
+        """Converts the profile to a dictionary of durations in seconds.
+
+        Returns:
+            dict: Phase timings, attempt durations and scheduling delays.
+        """
+        return {
+            "duration": self.duration,
+            "scheduler_wait": self.scheduler_wait,
+            "queue_time": self.queue_time,
+            "start_delay": self.start_delay,
+            "phases": {phase.value: seconds for phase, seconds in self.phases.items()},
+            "attempts": list(self.attempts),
+        }
+
+
+_node_run_profile: ContextVar[NodeRunProfile | None] = ContextVar("node_run_profile", default=None)
+
+
+def get_node_run_profile() -> NodeRunProfile | None:
+    """Returns the profile of the node run in the current execution context."""
+    return _node_run_profile.get()
+
+
+def set_node_run_profile(profile: NodeRunProfile) -> Token:
+    """
+    Sets the profile of the node run in the current execution context.
+
+    Args:
+        profile (NodeRunProfile): Profile of the node run.
+
+    Returns:
+        Token: Token to restore the previous profile with `reset_node_run_profile`.
+    """
+    return _node_run_profile.set(profile)
+
+
+def reset_node_run_profile(token: Token) -> None:
+    """Restores the node run profile that was current before `set_node_run_profile`."""
+    _node_run_profile.reset(token)
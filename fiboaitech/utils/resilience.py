@@ -0,0 +1,194 @@
+import threading
+import time
+from enum import Enum
+
+from fiboaitech.utils.logger import logger
+
+
+class CircuitBreakerState(str, Enum):
+    """
+    Enumeration of circuit breaker states.
+
+    Attributes:
+        CLOSED: Calls are allowed.
+        OPEN: Calls fail fast until the recovery timeout passes.
+        HALF_OPEN: A single trial call is allowed to check whether the service recovered.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreakerOpenError(Exception):
+    """Raised when a call is rejected because the circuit breaker of the service is open."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker shared by calls to the same service.
+
+    The breaker opens after `failure_threshold` consecutive failures and rejects calls for
+    `recovery_timeout_seconds`. Then a single trial call is allowed: its success closes the breaker,
+    its failure opens it again.
+
+    Args:
+        key (str): Key of the service, e.g. connection or model.
+        failure_threshold (int): Number of consecutive failures that opens the breaker.
+        recovery_timeout_seconds (float): Seconds to reject calls before a trial call.
+    """
+
+    def __init__(self, key: str, failure_threshold: int, recovery_timeout_seconds: float):
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout_seconds = recovery_timeout_seconds
+
+        self._state = CircuitBreakerState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_started_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        """Current state of the breaker."""
+        with self._lock:
+            if self._state == CircuitBreakerState.OPEN and self._is_recovery_timeout_passed():
+                return CircuitBreakerState.HALF_OPEN
+            return self._state
+
+    def _is_recovery_timeout_passed(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.recovery_timeout_seconds
+
+    def allow_request(self) -> bool:
+        """
+        Checks whether a call is allowed and reserves the trial call of a half-open breaker.
+
+        A trial call that has not reported its outcome within the recovery timeout, e.g. a cancelled one,
+        is replaced by a new trial call.
+
+        Returns:
+            bool: Whether the call is allowed.
+        """
+        with self._lock:
+            if self._state == CircuitBreakerState.CLOSED:
+                return True
+            if self._state == CircuitBreakerState.OPEN:
+                if not self._is_recovery_timeout_passed():
+                    return False
+                self._state = CircuitBreakerState.HALF_OPEN
+                self._trial_started_at = None
+            now = time.monotonic()
+            if self._trial_started_at is not None and now - self._trial_started_at < self.recovery_timeout_seconds:
+                return False
+            self._trial_started_at = now
+            return True
+
+    def record_success(self) -> None:
+        """Records a successful call and closes the breaker."""
+        with self._lock:
+            if self._state != CircuitBreakerState.CLOSED:
+                logger.info(f"Circuit breaker '{self.key}': closed.")
+            self._state = CircuitBreakerState.CLOSED
+            self._failures = 0
+            self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        """Records a failed call and opens the breaker if the failure threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._state == CircuitBreakerState.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != CircuitBreakerState.OPEN:
+                    logger.warning(f"Circuit breaker '{self.key}': opened after {self._failures} failures.")
+                self._state = CircuitBreakerState.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_started_at = None
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a share of calls to the same service.
+
+    Every call deposits `ratio` tokens and every retry withdraws one, so sustained retries add at most `ratio` extra
+    load. The bucket holds up to `min_retries` tokens and starts full, so services with few calls can still retry.
+
+    Args:
+        key (str): Key of the service, e.g. connection or model.
+        ratio (float): Allowed share of retries per call.
+        min_retries (int): Number of retries allowed regardless of the number of calls.
+    """
+
+    def __init__(self, key: str, ratio: float, min_retries: int):
+        self.key = key
+        self.ratio = ratio
+        self.min_retries = min_retries
+
+        self._tokens = float(min_retries)
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Number of retries left in the budget."""
+        with self._lock:
+            return self._tokens
+
+    def record_request(self) -> None:
+        """Records a call, depositing its share of retries."""
+        with self._lock:
+            self._tokens = min(self._tokens + self.ratio, max(self.min_retries, 1))
+
+    def try_acquire(self) -> bool:
+        """
+        Withdraws a retry from the budget.
+
+        Returns:
+            bool: Whether the retry is allowed.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+_retry_budgets: dict[str, RetryBudget] = {}
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker(key: str, failure_threshold: int, recovery_timeout_seconds: float) -> CircuitBreaker:
+    """
+    Returns the process-wide circuit breaker of the service, creating it on first use.
+
+    Args:
+        key (str): Key of the service, e.g. connection or model.
+        failure_threshold (int): Number of consecutive failures that opens a new breaker.
+        recovery_timeout_seconds (float): Seconds a new breaker rejects calls before a trial call.
+
+    Returns:
+        CircuitBreaker: Circuit breaker of the service.
+    """
+    if (breaker := _circuit_breakers.get(key)) is None:
+        with _registry_lock:
+            if (breaker := _circuit_breakers.get(key)) is None:
+                breaker = _circuit_breakers[key] = CircuitBreaker(key, failure_threshold, recovery_timeout_seconds)
+    return breaker
+
+
+def get_retry_budget(key: str, ratio: float, min_retries: int) -> RetryBudget:
+    """
+    Returns the process-wide retry budget of the service, creating it on first use.
+
+    Args:
+        key (str): Key of the service, e.g. connection or model.
+        ratio (float): Allowed share of retries per call of a new budget.
+        min_retries (int): Number of retries a new budget allows regardless of the number of calls.
+
+    Returns:
+        RetryBudget: Retry budget of the service.
+    """
+    if (budget := _retry_budgets.get(key)) is None:
+        with _registry_lock:
+            if (budget := _retry_budgets.get(key)) is None:
+                budget = _retry_budgets[key] = RetryBudget(key, ratio, min_retries)
+    return budget
@@ -1,13 +1,20 @@
 import base64
-from datetime import date, datetime
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
 from enum import Enum
 from io import BytesIO
 from json import JSONEncoder, loads
-from typing import Any
+from typing import Any, Callable
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, PydanticUserError, RootModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def generate_uuid() -> str:
     """
@@ -96,9 +103,88 @@ class JsonWorkflowEncoder(JSONEncoder):
         return JSONEncoder.default(self, obj)
 
 
+# Types formatted as is, `RootModel` returns values of these exact types and of enums unchanged
+FORMAT_VALUE_IDENTITY_TYPES = {str, int, float, bool, type(None), datetime, date, time, UUID, Decimal}
+
+# Maximum number of value types with cached formatters, formatters of other types are resolved per call
+VALUE_FORMATTERS_MAX_SIZE = 1024
+
+# Formatters of non-container values by exact value type
+_value_formatters: dict[type, Callable[..., Any]] = {}
+
+
+def _format_identity(value: Any, **kwargs) -> Any:
+    return value
+
+
+def _format_bytes_io(value: BytesIO, **kwargs) -> str:
+    return getattr(value, "name", None) or encode_bytes(value.getvalue())
+
+
+def _format_bytes(value: bytes, **kwargs) -> str:
+    return encode_bytes(value)
+
+
+def _format_result(value: Any, skip_format_types: set = None, force_format_types: set = None, **kwargs) -> dict:
+    return value.to_dict(skip_format_types=skip_format_types, force_format_types=force_format_types)
+
+
+def _format_model(value: BaseModel, **kwargs) -> dict:
+    return value.to_dict() if hasattr(value, "to_dict") else value.model_dump()
+
+
+def _format_exception(value: Exception, recoverable: bool = False, **kwargs) -> dict:
+    return {"content": f"{str(value)}", "error_type": type(value).__name__, "recoverable": bool(recoverable)}
+
+
+def _format_callable(value: Any, **kwargs) -> str:
+    return f"func: {getattr(value, '__name__', str(value))}"
+
+
+def _get_root_model_formatter(value_type: type) -> Callable[..., Any]:
+    """Returns formatter that dumps values with the `RootModel` of the type, or formats them as strings."""
+    try:
+        root_model = RootModel[value_type]
+    except PydanticUserError:
+        return lambda value, **kwargs: str(value)
+
+    def format_root_model(value: Any, **kwargs) -> Any:
+        try:
+            return root_model(value).model_dump()
+        except PydanticUserError:
+            return str(value)
+
+    return format_root_model
+
+
+def _get_value_formatter(value_type: type) -> Callable[..., Any]:
+    """Resolves the formatter of non-container values of the type, following the `format_value` rules."""
+    from fiboaitech.nodes.tools.python import PythonInputSchema
+    from fiboaitech.runnables import RunnableResult
+
+    if issubclass(value_type, BytesIO):
+        return _format_bytes_io
+    if issubclass(value_type, bytes):
+        return _format_bytes
+    if issubclass(value_type, (RunnableResult, PythonInputSchema)):
+        return _format_result
+    if issubclass(value_type, BaseModel):
+        return _format_model
+    if issubclass(value_type, Exception):
+        return _format_exception
+    if any("__call__" in vars(base) for base in value_type.__mro__):
+        return _format_callable
+    if value_type in FORMAT_VALUE_IDENTITY_TYPES or issubclass(value_type, Enum):
+        return _format_identity
+    return _get_root_model_formatter(value_type)
+
+
 def format_value(value: Any, skip_format_types: set = None, force_format_types: set = None, **kwargs) -> Any:
     """Format a value for serialization.
 
+    Formatters are resolved once per value type, up to VALUE_FORMATTERS_MAX_SIZE types, and dispatched by the
+    exact type of the value.
+
     Args:
         value (Any): The value to format.
         skip_format_types (set, optional): Types to skip formatting.
@@ -108,23 +194,14 @@ def format_value(value: Any, skip_format_types: set = None, force_format_types:
     Returns:
         Any: Formatted value.
     """
-    from fiboaitech.nodes.tools.python import PythonInputSchema
-    from fiboaitech.runnables import RunnableResult
-
-    if skip_format_types is None:
-        skip_format_types = set()
-    if force_format_types is None:
-        force_format_types = set()
-
-    if not isinstance(value, tuple(force_format_types)) and isinstance(
-        value, tuple(skip_format_types)
-    ):
+    if skip_format_types and (
+        not force_format_types or not isinstance(value, tuple(force_format_types))
+    ) and isinstance(value, tuple(skip_format_types)):
         return value
 
-    if isinstance(value, BytesIO):
-        return getattr(value, "name", None) or encode_bytes(value.getvalue())
-    if isinstance(value, bytes):
-        return encode_bytes(value)
+    value_type = type(value)
+    if value_type is str or value_type is int or value_type is float or value_type is bool or value is None:
+        return value
     if isinstance(value, dict):
         return {
             k: format_value(v, skip_format_types, force_format_types)
@@ -134,17 +211,76 @@ def format_value(value: Any, skip_format_types: set = None, force_format_types:
         return type(value)(
             format_value(v, skip_format_types, force_format_types) for v in value
         )
-    if isinstance(value, (RunnableResult, PythonInputSchema)):
-        return value.to_dict(skip_format_types=skip_format_types, force_format_types=force_format_types)
-    if isinstance(value, BaseModel):
-        return value.to_dict() if hasattr(value, "to_dict") else value.model_dump()
-    if isinstance(value, Exception):
-        recoverable = bool(kwargs.get("recoverable"))
-        return {"content": f"{str(value)}", "error_type": type(value).__name__, "recoverable": recoverable}
-    if callable(value):
-        return f"func: {getattr(value, '__name__', str(value))}"
 
-    try:
-        return RootModel[type(value)](value).model_dump()
-    except PydanticUserError:
+    if (formatter := _value_formatters.get(value_type)) is None:
+        formatter = _get_value_formatter(value_type)
+        # Bounded, so types created at runtime, e.g. dynamic models, do not grow the cache without limit
+        if len(_value_formatters) < VALUE_FORMATTERS_MAX_SIZE:
+            _value_formatters[value_type] = formatter
+    return formatter(
+        value,
+        skip_format_types=skip_format_types,
+        force_format_types=force_format_types,
+        recoverable=kwargs.get("recoverable"),
+    )
+
+
+def _json_default(value: Any) -> Any:
+    """Converts values that are not natively supported by JSON encoders."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
         return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if (formatted := format_value(value)) is not value:
+        return formatted
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _format_json_key(key: Any) -> Any:
+    """Converts a dict key to a key supported by the standard json module, like orjson `OPT_NON_STR_KEYS`."""
+    if key is None or isinstance(key, (str, int, float, bool)):
+        return key
+    if isinstance(key, Enum):
+        return _format_json_key(key.value)
+    if isinstance(key, (datetime, date, time)):
+        return key.isoformat()
+    return str(key)
+
+
+def _format_json_keys(value: Any) -> Any:
+    """Converts dict keys not supported by the standard json module in the value and its containers."""
+    if isinstance(value, dict):
+        return {_format_json_key(k): _format_json_keys(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_format_json_keys(v) for v in value]
+    return value
+
+
+def format_value_json(value: Any) -> bytes:
+    """Serialize a value to JSON bytes.
+
+    Values are written by orjson when it is installed, falling back to the standard json module, which is also
+    used for values orjson rejects, such as integers above 64 bits. Only values that the encoder does not support
+    natively are passed through `format_value`, so the value is not copied into an intermediate formatted
+    structure first. Non-string dict keys are converted to strings by both.
+
+    Args:
+        value (Any): The value to serialize.
+
+    Returns:
+        bytes: JSON representation of the formatted value.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(
+        _format_json_keys(value),
+        default=lambda v: _format_json_keys(_json_default(v)),
+        separators=(",", ":"),
+    ).encode()
@@ -1,13 +1,14 @@
 from datetime import datetime
 from os import PathLike
-from typing import IO, TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any, Iterable, Iterator
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from fiboaitech.callbacks.dispatch import dispatch_callback
 from fiboaitech.connections.managers import ConnectionManager
 from fiboaitech.flows import BaseFlow, Flow
-from fiboaitech.runnables import Runnable, RunnableConfig, RunnableResult, RunnableStatus
+from fiboaitech.runnables import Runnable, RunnableConfig, RunnableResult, RunnableStatus, run_batch
 from fiboaitech.utils import format_duration, generate_uuid, merge
 from fiboaitech.utils.logger import logger
 
@@ -157,22 +158,75 @@ class Workflow(BaseModel, Runnable):
         Returns:
             RunnableResult: Result of the workflow execution.
         """
+        config, merged_kwargs, time_start = self._start_run(input_data, config, **kwargs)
+        result = self.flow.run(input_data, config, **merge(merged_kwargs, {"parent_run_id": merged_kwargs["run_id"]}))
+        return self._finish_run(result, input_data, config, time_start, **merged_kwargs)
+
+    async def arun(
+        self, input_data: Any, config: RunnableConfig = None, **kwargs
+    ) -> RunnableResult:
+        """Asynchronously run the workflow with given input data and configuration.
+
+        Args:
+            input_data (Any): Input data for the workflow.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the workflow execution.
+        """
+        config, merged_kwargs, time_start = self._start_run(input_data, config, **kwargs)
+        result = await self.flow.arun(
+            input_data, config, **merge(merged_kwargs, {"parent_run_id": merged_kwargs["run_id"]})
+        )
+        return self._finish_run(result, input_data, config, time_start, **merged_kwargs)
+
+    def _start_run(
+        self, input_data: Any, config: RunnableConfig | None, **kwargs
+    ) -> tuple[RunnableConfig | None, dict, datetime]:
+        """Start the workflow run shared by `run` and `arun`.
+
+        Args:
+            input_data (Any): Input data for the workflow.
+            config (RunnableConfig | None): Configuration for the run.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            tuple[RunnableConfig | None, dict, datetime]: Configuration with the started deadline, keyword
+                arguments of the run and its start time.
+        """
         run_id = uuid4()
+        if config:
+            config = config.start_deadline()
         logger.info(f"Workflow {self.id}: execution started.")
 
         # update kwargs with run_id
         merged_kwargs = merge(kwargs, {"run_id": run_id, "wf_run_id": getattr(config, "run_id", None)})
         self.run_on_workflow_start(input_data, config, **merged_kwargs)
-        time_start = datetime.now()
+        return config, merged_kwargs, datetime.now()
 
-        result = self.flow.run(input_data, config, **merge(merged_kwargs, {"parent_run_id": run_id}))
+    def _finish_run(
+        self, result: RunnableResult, input_data: Any, config: RunnableConfig | None, time_start: datetime, **kwargs
+    ) -> RunnableResult:
+        """Report the flow result of the workflow run shared by `run` and `arun`.
+
+        Args:
+            result (RunnableResult): Result of the flow run.
+            input_data (Any): Input data for the workflow.
+            config (RunnableConfig | None): Configuration for the run.
+            time_start (datetime): Start time of the run.
+            **kwargs: Keyword arguments of the run.
+
+        Returns:
+            RunnableResult: Result of the workflow execution.
+        """
         if result.status == RunnableStatus.SUCCESS:
-            self.run_on_workflow_end(result.output, config, **merged_kwargs)
+            self.run_on_workflow_end(result.output, config, **kwargs)
             logger.info(
                 f"Workflow {self.id}: execution succeeded in {format_duration(time_start, datetime.now())}."
             )
         else:
-            self.run_on_workflow_error(result.output, config, **merged_kwargs)
+            self.run_on_workflow_error(result.output, config, **kwargs)
             logger.error(
                 f"Workflow {self.id}: execution failed in {format_duration(time_start, datetime.now())}."
             )
@@ -181,6 +235,30 @@ class Workflow(BaseModel, Runnable):
             status=result.status, input=input_data, output=result.output
         )
 
+    def run_batch(
+        self,
+        inputs: Iterable[Any],
+        config: RunnableConfig = None,
+        max_concurrency: int | None = None,
+        **kwargs,
+    ) -> Iterator[tuple[int, RunnableResult]]:
+        """Run the workflow over many inputs concurrently, sharing the initialized flow and connections.
+
+        A failed run does not stop the batch. Progress is reported to the `on_batch_*` callbacks.
+
+        Args:
+            inputs (Iterable[Any]): Input data of the runs.
+            config (RunnableConfig, optional): Configuration for the runs. Defaults to None.
+            max_concurrency (int, optional): Maximum number of concurrent runs. Defaults to BATCH_MAX_CONCURRENCY.
+            **kwargs: Additional keyword arguments.
+
+        Yields:
+            tuple[int, RunnableResult]: Index of the input and the result of its run, in completion order.
+        """
+        yield from run_batch(
+            self.run, inputs, self.model_dump(), config=config, max_concurrency=max_concurrency, **kwargs
+        )
+
     def run_on_workflow_start(self, input_data: Any, config: RunnableConfig = None, **kwargs: Any):
         """Run callbacks on workflow start.
 
@@ -191,7 +269,7 @@ class Workflow(BaseModel, Runnable):
         """
         if config and config.callbacks:
             for callback in config.callbacks:
-                callback.on_workflow_start(self.model_dump(), input_data, **kwargs)
+                dispatch_callback(callback, "on_workflow_start", self.model_dump(), input_data, **kwargs)
 
     def run_on_workflow_end(
         self, output: Any, config: RunnableConfig = None, **kwargs: Any
@@ -205,7 +283,7 @@ class Workflow(BaseModel, Runnable):
         """
         if config and config.callbacks:
             for callback in config.callbacks:
-                callback.on_workflow_end(self.model_dump(), output, **kwargs)
+                dispatch_callback(callback, "on_workflow_end", self.model_dump(), output, **kwargs)
 
     def run_on_workflow_error(
         self, error: BaseException, config: RunnableConfig = None, **kwargs: Any
@@ -219,4 +297,4 @@ class Workflow(BaseModel, Runnable):
         """
         if config and config.callbacks:
             for callback in config.callbacks:
-                callback.on_workflow_error(self.model_dump(), error, **kwargs)
+                dispatch_callback(callback, "on_workflow_error", self.model_dump(), error, **kwargs)
@@ -6,6 +6,7 @@ from litellm.utils import Delta
 
 from fiboaitech import connections, prompts
 from fiboaitech.cache.backends import RedisCache
+from fiboaitech.cache.utils import clear_cache_managers
 from fiboaitech.clients import BaseTracingClient
 from fiboaitech.nodes import llms
 from fiboaitech.types.document import Document
@@ -14,6 +15,7 @@ from fiboaitech.types.document import Document
 @pytest.fixture(autouse=True)
 def autouse_fixture(
     mock_llm_executor,
+    mock_llm_async_executor,
     mock_tracing_client,
     mock_redis_backend,
 ): ...
@@ -59,6 +61,26 @@ def mock_llm_executor(mocker, mock_llm_response_text):
     yield mock_llm
 
 
+@pytest.fixture
+def mock_llm_async_executor(mocker, mock_llm_response_text):
+    async def mock_acompletion_streaming_obj(mock_response):
+        for chunk in mock_response:
+            model_r = ModelResponse(stream=True)
+            model_r.choices[0].delta = Delta(**{"role": "assistant", "content": chunk})
+            yield model_r
+
+    async def response(stream: bool, *args, **kwargs):
+        if stream:
+            return mock_acompletion_streaming_obj(mock_response=mock_llm_response_text)
+
+        model_r = ModelResponse()
+        model_r["choices"][0]["message"]["content"] = mock_llm_response_text
+        return model_r
+
+    mock_llm = mocker.patch("fiboaitech.nodes.llms.base.BaseLLM._acompletion", side_effect=response)
+    yield mock_llm
+
+
 @pytest.fixture
 def mock_embedding_executor(mocker):
     def response(*args, **kwargs):
@@ -88,10 +110,13 @@ def mock_tracing_client(mocker):
 
 @pytest.fixture
 def mock_redis_backend(mocker, mock_redis):
+    # Pooled cache managers keep the backend of the test that created them
+    clear_cache_managers()
     yield mocker.patch(
         "fiboaitech.cache.backends.RedisCache.from_config",
         return_value=RedisCache(client=mock_redis),
     )
+    clear_cache_managers()
 
 
 @pytest.fixture()
@@ -1,5 +1,6 @@
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from unittest import mock
 from unittest.mock import ANY
@@ -342,7 +343,7 @@ def test_workflow_with_failed_flow(
     tracing = TracingCallbackHandler()
 
     error = ValueError("Error")
-    mocker.patch("fiboaitech.flows.flow.Flow._get_nodes_ready_to_run", side_effect=error)
+    mocker.patch("fiboaitech.flows.flow.FlowScheduler.run", side_effect=error)
     response = wf.run(
         input_data=input_data,
         config=RunnableConfig(callbacks=[tracing]),
@@ -415,3 +416,24 @@ def test_workflow_with_input_mappings(
 
     assert response == RunnableResult(status=RunnableStatus.SUCCESS, input=input_data, output=expected_output)
     assert json.dumps({"runs": [run.to_dict() for run in tracing.runs.values()]}, cls=JsonWorkflowEncoder)
+
+
+def test_workflow_concurrent_runs_are_isolated(
+    wf,
+    openai_node,
+    anthropic_node_with_dependency,
+    output_node,
+    mock_llm_response_text,
+    mock_llm_executor,
+):
+    inputs = [{"a": i} for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+        responses = list(executor.map(lambda input_data: wf.run(input_data=input_data), inputs))
+
+    for input_data, response in zip(inputs, responses):
+        assert response.status == RunnableStatus.SUCCESS
+        assert response.input == input_data
+        assert response.output[openai_node.id]["input"] == input_data
+        assert response.output[output_node.id]["status"] == RunnableStatus.SUCCESS.value
+    assert mock_llm_executor.call_count == len(inputs) * 2
@@ -0,0 +1,245 @@
+import asyncio
+import time
+import uuid
+from io import BytesIO
+from typing import Any, Literal
+
+import pytest
+
+from fiboaitech import Workflow, flows
+from fiboaitech.cache import RedisCacheConfig
+from fiboaitech.callbacks import TracingCallbackHandler
+from fiboaitech.callbacks.tracing import RunStatus
+from fiboaitech.nodes import CachingConfig, ErrorHandling, NodeGroup
+from fiboaitech.nodes.node import Node, NodeDependency
+from fiboaitech.nodes.utils import Output
+from fiboaitech.runnables import RunnableConfig, RunnableResult, RunnableStatus
+
+
+class AsyncSleepNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    sleep_seconds: float = 0
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        raise NotImplementedError("Sync execution is not expected")
+
+    async def aexecute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        await asyncio.sleep(self.sleep_seconds)
+        return {"slept": self.sleep_seconds}
+
+
+@pytest.fixture()
+def anthropic_node_with_dependency(openai_node, anthropic_node):
+    anthropic_node.depends = [NodeDependency(openai_node)]
+    return anthropic_node
+
+
+@pytest.fixture()
+def output_node(openai_node, anthropic_node_with_dependency):
+    return Output(depends=[NodeDependency(node=openai_node), NodeDependency(node=anthropic_node_with_dependency)])
+
+
+@pytest.fixture()
+def wf(openai_node, anthropic_node_with_dependency, output_node):
+    return Workflow(
+        id=str(uuid.uuid4()),
+        flow=flows.Flow(
+            nodes=[openai_node, anthropic_node_with_dependency, output_node],
+        ),
+        version="1",
+    )
+
+
+def test_workflow_arun_matches_run(
+    wf,
+    openai_node,
+    anthropic_node_with_dependency,
+    output_node,
+    mock_llm_executor,
+    mock_llm_async_executor,
+):
+    input_data = {"a": 1}
+    tracing = TracingCallbackHandler()
+
+    response = asyncio.run(wf.arun(input_data=input_data, config=RunnableConfig(callbacks=[tracing])))
+    sync_response = wf.run(input_data=input_data, config=RunnableConfig(callbacks=[]))
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response == sync_response
+    assert mock_llm_async_executor.call_count == 2
+    assert mock_llm_executor.call_count == 2
+    for call in mock_llm_async_executor.call_args_list:
+        # Sync client must not be passed to the async completion
+        assert call.kwargs.get("client") is not openai_node.client
+
+    tracing_runs = list(tracing.runs.values())
+    assert len(tracing_runs) == 5
+    wf_run, flow_run, *node_runs = tracing_runs
+    assert wf_run.status == RunStatus.SUCCEEDED
+    assert flow_run.parent_run_id == wf_run.id
+    assert {run.metadata["node"]["id"] for run in node_runs} == {
+        openai_node.id,
+        anthropic_node_with_dependency.id,
+        output_node.id,
+    }
+    for run in node_runs:
+        assert run.parent_run_id == flow_run.id
+        assert run.status == RunStatus.SUCCEEDED
+
+
+def test_workflow_arun_with_depend_fail(
+    wf,
+    openai_node,
+    anthropic_node_with_dependency,
+    output_node,
+    mock_llm_async_executor,
+):
+    mock_llm_async_executor.side_effect = ValueError("Error")
+
+    response = asyncio.run(wf.arun(input_data={"a": 1}))
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[openai_node.id]["status"] == RunnableStatus.FAILURE.value
+    assert response.output[anthropic_node_with_dependency.id]["status"] == RunnableStatus.SKIP.value
+    assert response.output[output_node.id]["status"] == RunnableStatus.SKIP.value
+    assert mock_llm_async_executor.call_count == 1
+
+
+def test_flow_arun_runs_independent_nodes_concurrently():
+    sleep_seconds = 0.2
+    nodes = [AsyncSleepNode(sleep_seconds=sleep_seconds) for _ in range(5)]
+    flow = flows.Flow(nodes=nodes)
+
+    time_start = time.perf_counter()
+    response = asyncio.run(flow.arun(input_data={}))
+    duration = time.perf_counter() - time_start
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert all(output["status"] == RunnableStatus.SUCCESS.value for output in response.output.values())
+    assert duration < sleep_seconds * len(nodes)
+
+
+def test_flow_arun_dispatches_dependant_without_waiting_for_siblings():
+    slow = AsyncSleepNode(sleep_seconds=0.3)
+    fast = AsyncSleepNode()
+    dependant = AsyncSleepNode(depends=[NodeDependency(fast)])
+    finished = {}
+
+    class FinishTracker(TracingCallbackHandler):
+        def on_node_end(self, serialized, output_data, **kwargs):
+            finished[serialized["id"]] = time.perf_counter()
+
+    flow = flows.Flow(nodes=[slow, fast, dependant])
+
+    response = asyncio.run(flow.arun(input_data={}, config=RunnableConfig(callbacks=[FinishTracker()])))
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert finished[dependant.id] < finished[slow.id]
+
+
+def test_flow_arun_respects_max_node_workers_by_group():
+    running = {NodeGroup.UTILS: 0, NodeGroup.TOOLS: 0}
+    max_running = dict(running)
+
+    class CountingNode(AsyncSleepNode):
+        group: NodeGroup = NodeGroup.UTILS
+
+        async def aexecute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+            running[self.group] += 1
+            max_running[self.group] = max(max_running[self.group], running[self.group])
+            await asyncio.sleep(0.02)
+            running[self.group] -= 1
+            return {}
+
+    nodes = [CountingNode() for _ in range(6)] + [CountingNode(group=NodeGroup.TOOLS) for _ in range(6)]
+    flow = flows.Flow(nodes=nodes, max_node_workers=8, max_node_workers_by_group={NodeGroup.TOOLS: 2})
+
+    response = asyncio.run(flow.arun(input_data={}))
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert max_running[NodeGroup.TOOLS] == 2
+    assert max_running[NodeGroup.UTILS] > 2
+
+
+def test_flow_arun_starts_higher_priority_first():
+    started = []
+
+    class OrderNode(AsyncSleepNode):
+        async def aexecute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+            started.append(self.id)
+            return {}
+
+    short = OrderNode(priority=1)
+    chain_start = OrderNode()
+    chain_end = OrderNode(depends=[NodeDependency(chain_start)])
+    flow = flows.Flow(nodes=[chain_start, chain_end, short], max_node_workers=1)
+
+    response = asyncio.run(flow.arun(input_data={}))
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert started == [short.id, chain_start.id, chain_end.id]
+
+
+def test_node_arun_timeout():
+    node = AsyncSleepNode(sleep_seconds=1, error_handling=ErrorHandling(timeout_seconds=0.01))
+
+    result = asyncio.run(node.arun(input_data={}))
+
+    assert result.status == RunnableStatus.FAILURE
+    assert result.output["error_type"] == TimeoutError.__name__
+
+
+def test_node_arun_timeout_is_retried(mocker):
+    node = AsyncSleepNode(
+        sleep_seconds=1, error_handling=ErrorHandling(timeout_seconds=0.01, max_retries=1, retry_interval_seconds=0)
+    )
+    wait_for = mocker.spy(asyncio, "wait_for")
+    logger_warning = mocker.patch("fiboaitech.nodes.node.logger.warning")
+
+    result = asyncio.run(node.arun(input_data={}))
+
+    assert result.status == RunnableStatus.FAILURE
+    assert wait_for.call_count == 2
+    warnings = [call.args[0] for call in logger_warning.call_args_list]
+    assert warnings.count(f"Node {node.name} - {node.id}: timeout.") == 2
+
+
+def test_node_arun_retry(openai_node, mock_llm_async_executor, mock_llm_response_text):
+    async_response = mock_llm_async_executor.side_effect
+    mock_llm_async_executor.side_effect = [ValueError("Error"), async_response(stream=False)]
+    openai_node.error_handling = ErrorHandling(max_retries=1, retry_interval_seconds=0)
+
+    result = asyncio.run(openai_node.arun(input_data={}))
+
+    assert result == RunnableResult(
+        status=RunnableStatus.SUCCESS, input={}, output={"content": mock_llm_response_text}
+    )
+    assert mock_llm_async_executor.call_count == 2
+
+
+def test_node_arun_streaming(openai_node, mock_llm_async_executor, mock_llm_response_text):
+    openai_node.streaming.enabled = True
+    chunks = []
+
+    class StreamCollector(TracingCallbackHandler):
+        def on_node_execute_stream(self, serialized, chunk=None, **kwargs):
+            chunks.append(chunk)
+
+    result = asyncio.run(openai_node.arun(input_data={}, config=RunnableConfig(callbacks=[StreamCollector()])))
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output == {"content": mock_llm_response_text}
+    assert len(chunks) == len(mock_llm_response_text)
+
+
+def test_node_arun_caching(openai_node, mock_llm_async_executor, mock_llm_response_text):
+    openai_node.caching = CachingConfig(enabled=True)
+    cache_config = RedisCacheConfig(host="redis-test-sv", port=6379, db=0, namespace="fiboaitech")
+    input_data = {"a": 1, "file": BytesIO(b"file content")}
+
+    result_1 = asyncio.run(openai_node.arun(input_data=input_data, config=RunnableConfig(cache=cache_config)))
+    result_2 = asyncio.run(openai_node.arun(input_data=input_data, config=RunnableConfig(cache=cache_config)))
+
+    assert result_1 == result_2
+    assert result_2.output == {"content": mock_llm_response_text}
+    assert mock_llm_async_executor.call_count == 1
@@ -0,0 +1,153 @@
+import threading
+import time
+import uuid
+from typing import Any, ClassVar, Literal
+
+import pytest
+
+from fiboaitech import Workflow, flows
+from fiboaitech.callbacks import BaseCallbackHandler
+from fiboaitech.nodes import NodeGroup
+from fiboaitech.nodes.node import Node
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+
+
+class ConcurrencyNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    lock: ClassVar[threading.Lock] = threading.Lock()
+    active: ClassVar[int] = 0
+    max_active: ClassVar[int] = 0
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        with self.lock:
+            ConcurrencyNode.active += 1
+            ConcurrencyNode.max_active = max(ConcurrencyNode.max_active, ConcurrencyNode.active)
+        try:
+            time.sleep(input_data.get("delay", 0))
+            return {"value": input_data["value"] * 2}
+        finally:
+            with self.lock:
+                ConcurrencyNode.active -= 1
+
+
+class BatchRecordingCallbackHandler(BaseCallbackHandler):
+    def __init__(self):
+        self.events = []
+
+    def on_flow_start(self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any):
+        if input_data.get("fail"):
+            raise ValueError(f"Item {input_data['value']} failed")
+
+    def on_batch_start(self, serialized: dict[str, Any], **kwargs: Any):
+        self.events.append(("start", kwargs))
+
+    def on_batch_item_end(self, serialized: dict[str, Any], index: int, result: Any, **kwargs: Any):
+        self.events.append(("item_end", index, kwargs))
+
+    def on_batch_item_error(self, serialized: dict[str, Any], index: int, result: Any, **kwargs: Any):
+        self.events.append(("item_error", index, kwargs))
+
+    def on_batch_end(self, serialized: dict[str, Any], **kwargs: Any):
+        self.events.append(("end", kwargs))
+
+
+@pytest.fixture(autouse=True)
+def reset_concurrency_node():
+    ConcurrencyNode.active = 0
+    ConcurrencyNode.max_active = 0
+
+
+def test_flow_run_batch_runs_inputs_concurrently():
+    node = ConcurrencyNode()
+    flow = flows.Flow(nodes=[node])
+    inputs = [{"value": i, "delay": 0.05} for i in range(9)]
+
+    results = dict(flow.run_batch(inputs, max_concurrency=3))
+
+    assert sorted(results) == list(range(9))
+    for index, result in results.items():
+        assert result.status == RunnableStatus.SUCCESS
+        assert result.input == inputs[index]
+        assert result.output[node.id]["output"] == {"value": index * 2}
+    assert ConcurrencyNode.max_active == 3
+
+
+def test_flow_run_batch_consumes_generator_inputs_lazily():
+    flow = flows.Flow(nodes=[ConcurrencyNode()])
+    consumed = []
+
+    def generate_inputs():
+        for i in range(6):
+            consumed.append(i)
+            yield {"value": i, "delay": 0.01}
+
+    batch = flow.run_batch(generate_inputs(), max_concurrency=2)
+    next(batch)
+
+    assert len(consumed) == 3
+    assert len(list(batch)) == 5
+    assert consumed == list(range(6))
+
+
+def test_flow_run_batch_failed_item_does_not_abort_batch():
+    flow = flows.Flow(nodes=[ConcurrencyNode()])
+    inputs = [{"value": i, "fail": i == 1} for i in range(4)]
+    callback = BatchRecordingCallbackHandler()
+
+    results = dict(flow.run_batch(inputs, config=RunnableConfig(callbacks=[callback]), max_concurrency=2))
+
+    assert [results[i].status for i in range(4)] == [
+        RunnableStatus.SUCCESS,
+        RunnableStatus.FAILURE,
+        RunnableStatus.SUCCESS,
+        RunnableStatus.SUCCESS,
+    ]
+    (start, *items, end) = callback.events
+    assert start == ("start", {"run_id": end[1]["run_id"], "total": 4, "max_concurrency": 2})
+    assert [event[0] for event in items].count("item_error") == 1
+    assert [event[1] for event in items if event[0] == "item_error"] == [1]
+    assert [event[2]["completed"] for event in items] == [1, 2, 3, 4]
+    assert end[1]["completed"] == 4
+    assert end[1]["failed"] == 1
+
+
+def test_workflow_run_batch_runs_workflow_per_input():
+    node = ConcurrencyNode()
+    wf = Workflow(id=str(uuid.uuid4()), flow=flows.Flow(nodes=[node]))
+    callback = BatchRecordingCallbackHandler()
+
+    results = dict(
+        wf.run_batch(({"value": i} for i in range(5)), config=RunnableConfig(callbacks=[callback]), max_concurrency=4)
+    )
+
+    assert {index: result.output[node.id]["output"]["value"] for index, result in results.items()} == {
+        i: i * 2 for i in range(5)
+    }
+    (start, *_, end) = callback.events
+    assert start == ("start", {"run_id": end[1]["run_id"], "total": None, "max_concurrency": 4})
+    assert end[1]["completed"] == 5
+    assert end[1]["failed"] == 0
+
+
+def test_workflow_run_batch_gives_each_run_own_run_id():
+    run_ids = []
+
+    class RunIdRecordingCallbackHandler(BaseCallbackHandler):
+        def on_workflow_start(self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any):
+            run_ids.append(kwargs["wf_run_id"])
+
+    wf = Workflow(id=str(uuid.uuid4()), flow=flows.Flow(nodes=[ConcurrencyNode()]))
+    config = RunnableConfig(callbacks=[RunIdRecordingCallbackHandler()])
+
+    results = dict(wf.run_batch([{"value": i} for i in range(4)], config=config, max_concurrency=2))
+
+    assert all(result.status == RunnableStatus.SUCCESS for result in results.values())
+    assert len(set(run_ids)) == 4
+    assert config.run_id not in run_ids
+
+
+def test_run_batch_rejects_invalid_max_concurrency():
+    flow = flows.Flow(nodes=[ConcurrencyNode()])
+
+    with pytest.raises(ValueError):
+        list(flow.run_batch([{"value": 1}], max_concurrency=-1))
@@ -0,0 +1,194 @@
+import asyncio
+import uuid
+from typing import Any, ClassVar, Literal
+
+import pytest
+from litellm import ModelResponse
+from pydantic import BaseModel
+
+from fiboaitech import Workflow, flows
+from fiboaitech.checkpoints import InMemoryCheckpointStore, SQLiteCheckpointStore
+from fiboaitech.nodes import NodeGroup
+from fiboaitech.nodes import node as node_module
+from fiboaitech.nodes.agents.react import ReActAgent
+from fiboaitech.nodes.node import Node, NodeDependency
+from fiboaitech.nodes.utils import Output
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+
+
+class CountingNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    fail: bool = False
+    executions: int = 0
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        self.executions += 1
+        if self.fail:
+            raise ValueError("Execution failed")
+        return {"content": f"{self.name} done"}
+
+    async def aexecute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        return self.execute(input_data, config, **kwargs)
+
+
+class CounterInputSchema(BaseModel):
+    value: int
+
+
+class CounterTool(Node):
+    group: Literal[NodeGroup.TOOLS] = NodeGroup.TOOLS
+    input_schema: ClassVar[type[CounterInputSchema]] = CounterInputSchema
+
+    def execute(self, input_data: CounterInputSchema, config: RunnableConfig = None, **kwargs):
+        return {"content": str(input_data.value)}
+
+
+class CheckpointingNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    loaded: list = []
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        self.loaded.append(self.load_checkpoint(config))
+        self.save_checkpoint(config, {"value": input_data["value"]})
+        if input_data.get("fail"):
+            raise ValueError("Execution failed")
+        return {}
+
+
+def get_diamond_flow(**kwargs) -> tuple[flows.Flow, list[CountingNode]]:
+    first = CountingNode(name="first")
+    left = CountingNode(name="left", depends=[NodeDependency(first)])
+    right = CountingNode(name="right", fail=True, depends=[NodeDependency(first)])
+    last = CountingNode(name="last", depends=[NodeDependency(left), NodeDependency(right)])
+    return flows.Flow(nodes=[first, left, right, last], **kwargs), [first, left, right, last]
+
+
+@pytest.mark.parametrize("max_node_workers", [None, 1])
+def test_flow_resume_skips_completed_nodes(tmp_path, max_node_workers):
+    flow, (first, left, right, last) = get_diamond_flow()
+    store = SQLiteCheckpointStore(tmp_path / "checkpoints.db")
+    config = RunnableConfig(checkpoint_store=store, max_node_workers=max_node_workers)
+
+    response = flow.run(input_data={}, config=config)
+
+    assert response.output[right.id]["status"] == RunnableStatus.FAILURE.value
+    assert response.output[last.id]["status"] == RunnableStatus.SKIP.value
+
+    right.fail = False
+    resume_config = RunnableConfig(checkpoint_store=store, max_node_workers=max_node_workers)
+    response = flow.run(input_data={}, config=resume_config, resume_from=config.run_id)
+
+    assert all(result["status"] == RunnableStatus.SUCCESS.value for result in response.output.values())
+    assert response.output[first.id]["output"] == {"content": "first done"}
+    assert [node.executions for node in (first, left, right, last)] == [1, 1, 2, 1]
+    assert set(store.load_all(resume_config.run_id)) == {f"flow:{flow.id}:node:{node.id}" for node in flow.nodes}
+
+
+def test_flow_arun_resume_skips_completed_nodes():
+    flow, (first, left, right, last) = get_diamond_flow()
+    store = InMemoryCheckpointStore()
+    config = RunnableConfig(checkpoint_store=store)
+
+    asyncio.run(flow.arun(input_data={}, config=config))
+    right.fail = False
+    resume_config = RunnableConfig(checkpoint_store=store, resume_from=config.run_id)
+    response = asyncio.run(flow.arun(input_data={}, config=resume_config))
+
+    assert response.output[last.id]["status"] == RunnableStatus.SUCCESS.value
+    assert [node.executions for node in (first, left, right, last)] == [1, 1, 2, 1]
+
+
+def test_workflow_resume_of_completed_run_executes_no_nodes():
+    flow, nodes = get_diamond_flow()
+    nodes[2].fail = False
+    wf = Workflow(id=str(uuid.uuid4()), flow=flow)
+    store = InMemoryCheckpointStore()
+    config = RunnableConfig(checkpoint_store=store)
+
+    wf.run(input_data={}, config=config)
+    response = wf.run(input_data={}, config=RunnableConfig(checkpoint_store=store), resume_from=config.run_id)
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[nodes[-1].id]["output"] == {"content": "last done"}
+    assert [node.executions for node in nodes] == [1, 1, 1, 1]
+
+
+def test_node_checkpoint_is_scoped_to_input():
+    node = CheckpointingNode()
+    config = RunnableConfig(checkpoint_store=InMemoryCheckpointStore())
+
+    assert node.run(input_data={"value": 1, "fail": True}, config=config).status == RunnableStatus.FAILURE
+    assert node.run(input_data={"value": 2}, config=config).status == RunnableStatus.SUCCESS
+    assert node.run(input_data={"value": 1, "fail": True}, config=config).status == RunnableStatus.FAILURE
+
+    # Execution with other input does not continue from the checkpoint, the same input does
+    assert node.loaded == [None, None, {"value": 1}]
+
+
+def test_node_input_is_hashed_only_with_checkpoint_store(mocker):
+    format_value_json = mocker.spy(node_module, "format_value_json")
+
+    result = Output().run(input_data={"x": 2**70})
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output == {"x": 2**70}
+    format_value_json.assert_not_called()
+
+
+def test_node_checkpoint_is_skipped_for_not_serializable_input():
+    node = CheckpointingNode(loaded=[])
+    store = InMemoryCheckpointStore()
+    config = RunnableConfig(checkpoint_store=store)
+    input_data = {"value": 1, "marker": object()}
+
+    result = node.run(input_data=input_data, config=config)
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert node.loaded == [None]
+    assert store.load_all(config.run_id) == {}
+
+
+def test_flow_resume_requires_checkpoint_store():
+    flow, _ = get_diamond_flow()
+
+    response = flow.run(input_data={}, resume_from="run-1")
+
+    assert response.status == RunnableStatus.FAILURE
+
+
+def test_react_agent_resume_continues_from_last_completed_loop(mocker, openai_node):
+    tool = CounterTool(name="counter", description="Counts calls.")
+    agent = ReActAgent(name="Agent", llm=openai_node, tools=[tool], max_loops=5)
+    responses = iter(
+        [
+            'Thought: count\nAction: counter\nAction Input: {"value": 1}',
+            'Thought: count\nAction: counter\nAction Input: {"value": 2}',
+            'Thought: count\nAction: counter\nAction Input: {"value": 2}',
+            "Thought: done\nAnswer: counted twice",
+        ]
+    )
+
+    def completion(*args, **kwargs):
+        response = ModelResponse()
+        response["choices"][0]["message"]["content"] = next(responses)
+        return response
+
+    llm_completion = mocker.patch("fiboaitech.nodes.llms.base.BaseLLM._completion", side_effect=completion)
+    mocker.patch.object(CounterTool, "execute", side_effect=[{"content": "1"}, ValueError("Tool failed")])
+    store = InMemoryCheckpointStore()
+    config = RunnableConfig(checkpoint_store=store)
+
+    result = agent.run(input_data={"input": "Count twice"}, config=config)
+
+    assert result.status == RunnableStatus.FAILURE
+    assert llm_completion.call_count == 2
+
+    mocker.patch.object(CounterTool, "execute", return_value={"content": "2"})
+    result = agent.run(
+        input_data={"input": "Count twice"}, config=RunnableConfig(checkpoint_store=store, resume_from=config.run_id)
+    )
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output["content"] == "counted twice"
+    assert llm_completion.call_count == 4
+    assert "Observation: 1" in llm_completion.call_args.kwargs["messages"][0]["content"]
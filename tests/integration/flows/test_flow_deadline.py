@@ -0,0 +1,104 @@
+import asyncio
+import time
+from typing import Any, Literal
+
+from fiboaitech import connections, flows
+from fiboaitech.nodes import ErrorHandling, NodeGroup
+from fiboaitech.nodes.node import Node, NodeDependency
+from fiboaitech.nodes.tools import HttpApiCall
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+
+
+class SleepNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    sleep_seconds: float = 0
+    fail: bool = False
+    executions: int = 0
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        self.executions += 1
+        time.sleep(self.sleep_seconds)
+        if self.fail:
+            raise ValueError("Execution failed")
+        return {"slept": self.sleep_seconds}
+
+    async def aexecute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        self.executions += 1
+        await asyncio.sleep(self.sleep_seconds)
+        return {"slept": self.sleep_seconds}
+
+
+def test_node_run_stops_at_run_deadline():
+    node = SleepNode(sleep_seconds=1)
+
+    time_start = time.perf_counter()
+    result = node.run(input_data={}, config=RunnableConfig(timeout_seconds=0.1))
+
+    assert time.perf_counter() - time_start < 0.5
+    assert result.status == RunnableStatus.FAILURE
+    assert result.output["error_type"] == TimeoutError.__name__
+
+
+def test_node_arun_stops_at_run_deadline():
+    node = SleepNode(sleep_seconds=1)
+
+    time_start = time.perf_counter()
+    result = asyncio.run(node.arun(input_data={}, config=RunnableConfig(timeout_seconds=0.1)))
+
+    assert time.perf_counter() - time_start < 0.5
+    assert result.status == RunnableStatus.FAILURE
+    assert result.output["error_type"] == TimeoutError.__name__
+
+
+def test_node_retries_do_not_exceed_run_deadline():
+    node = SleepNode(fail=True, error_handling=ErrorHandling(max_retries=5, retry_interval_seconds=1))
+
+    time_start = time.perf_counter()
+    result = node.run(input_data={}, config=RunnableConfig(timeout_seconds=0.5))
+
+    assert time.perf_counter() - time_start < 0.5
+    assert result.status == RunnableStatus.FAILURE
+    assert result.output["error_type"] == ValueError.__name__
+    assert node.executions == 1
+
+
+def test_flow_nodes_share_run_deadline():
+    first = SleepNode(sleep_seconds=0.15)
+    second = SleepNode(sleep_seconds=0.15, depends=[NodeDependency(first)])
+    flow = flows.Flow(nodes=[first, second])
+
+    response = flow.run(input_data={}, config=RunnableConfig(timeout_seconds=0.25))
+
+    assert response.output[first.id]["status"] == RunnableStatus.SUCCESS.value
+    assert response.output[second.id]["status"] == RunnableStatus.FAILURE.value
+    assert response.output[second.id]["output"]["error_type"] == TimeoutError.__name__
+
+
+def test_node_with_expired_deadline_is_not_executed():
+    node = SleepNode()
+    config = RunnableConfig(timeout_seconds=1).start_deadline()
+    config.deadline = time.monotonic() - 1
+
+    result = node.run(input_data={}, config=config)
+
+    assert result.status == RunnableStatus.FAILURE
+    assert result.output["error_type"] == TimeoutError.__name__
+    assert node.executions == 0
+
+
+def test_llm_request_timeout_is_bounded_by_run_deadline(openai_node, mock_llm_executor):
+    result = openai_node.run(input_data={}, config=RunnableConfig(timeout_seconds=5))
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert 0 < mock_llm_executor.call_args.kwargs["timeout"] <= 5
+
+
+def test_http_request_timeout_is_bounded_by_run_deadline(mocker):
+    url = "https://example.com/api"
+    node = HttpApiCall(connection=connections.Http(method=connections.HTTPMethod.GET, url=url), timeout=30)
+    request = mocker.patch.object(node.client, "request", return_value=mocker.Mock(status_code=200, content=b""))
+
+    result = node.run(input_data={}, config=RunnableConfig(timeout_seconds=5))
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert 0 < request.call_args.kwargs["timeout"] <= 5
@@ -0,0 +1,311 @@
+import threading
+import time
+from typing import Any, ClassVar, Literal
+from unittest import mock
+
+import pytest
+
+from fiboaitech import flows
+from fiboaitech.executors.pool import ThreadExecutor
+from fiboaitech.executors.worker_pool import WorkerPool, get_default_delayed_calls
+from fiboaitech.flows.scheduler import FlowScheduler
+from fiboaitech.nodes import ErrorHandling, NodeGroup
+from fiboaitech.nodes.node import Node, NodeDependency
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+
+
+class RecordingNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        return {}
+
+
+class LockStepThreadExecutor(ThreadExecutor):
+    dispatch_on_completion = False
+
+
+def test_flow_dispatches_dependant_without_waiting_for_siblings():
+    dependant_finished = threading.Event()
+
+    class SlowNode(RecordingNode):
+        def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+            return {"dependant_finished": dependant_finished.wait(timeout=5)}
+
+    class DependantNode(RecordingNode):
+        def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+            dependant_finished.set()
+            return {}
+
+    slow = SlowNode()
+    fast = RecordingNode()
+    dependant = DependantNode(depends=[NodeDependency(fast)])
+    flow = flows.Flow(nodes=[slow, fast, dependant])
+
+    response = flow.run(input_data={})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[slow.id]["output"] == {"dependant_finished": True}
+    assert response.output[dependant.id]["status"] == RunnableStatus.SUCCESS.value
+
+
+def test_flow_wide_and_deep_graph_results_match_lock_step_loop():
+    root = RecordingNode()
+    layer = [RecordingNode(depends=[NodeDependency(root)]) for _ in range(60)]
+    chain = [RecordingNode(depends=[NodeDependency(node) for node in layer])]
+    for _ in range(30):
+        chain.append(RecordingNode(depends=[NodeDependency(chain[-1])]))
+    nodes = [root, *layer, *chain]
+
+    response = flows.Flow(nodes=nodes).run(input_data={})
+    lock_step_response = flows.Flow(nodes=nodes, executor=LockStepThreadExecutor).run(input_data={})
+
+    for flow_response in (response, lock_step_response):
+        assert flow_response.status == RunnableStatus.SUCCESS
+        assert set(flow_response.output) == {node.id for node in nodes}
+        assert all(result["status"] == RunnableStatus.SUCCESS.value for result in flow_response.output.values())
+
+
+def test_flow_scheduler_respects_max_node_workers():
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    class CountingNode(RecordingNode):
+        def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return {}
+
+    flow = flows.Flow(nodes=[CountingNode() for _ in range(10)], max_node_workers=2)
+
+    response = flow.run(input_data={})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert max_running == 2
+
+
+def test_flow_dependant_of_failed_node_is_skipped():
+    class FailingNode(RecordingNode):
+        def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+            raise ValueError("Error")
+
+    failing = FailingNode()
+    dependant = RecordingNode(depends=[NodeDependency(failing)])
+    flow = flows.Flow(nodes=[failing, dependant])
+
+    response = flow.run(input_data={})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[failing.id]["status"] == RunnableStatus.FAILURE.value
+    assert response.output[dependant.id]["status"] == RunnableStatus.SKIP.value
+
+
+class OrderNode(RecordingNode):
+    started: ClassVar[list[str]] = []
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        self.started.append(self.id)
+        return {}
+
+
+@pytest.fixture()
+def started():
+    OrderNode.started.clear()
+    return OrderNode.started
+
+
+def test_flow_starts_critical_path_first(started):
+    short = OrderNode()
+    chain_start = OrderNode()
+    chain_end = OrderNode(depends=[NodeDependency(chain_start)])
+    flow = flows.Flow(nodes=[short, chain_start, chain_end], max_node_workers=1)
+
+    response = flow.run(input_data={})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert started == [chain_start.id, short.id, chain_end.id]
+
+
+def test_flow_starts_higher_priority_first(started):
+    short = OrderNode(priority=1)
+    chain_start = OrderNode()
+    chain_end = OrderNode(depends=[NodeDependency(chain_start)])
+    flow = flows.Flow(nodes=[short, chain_start, chain_end], max_node_workers=1)
+
+    response = flow.run(input_data={})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert started == [short.id, chain_start.id, chain_end.id]
+
+
+def test_flow_critical_path_uses_latency_history(started):
+
+    class SlowOrderNode(OrderNode):
+        def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+            time.sleep(0.05)
+            return super().execute(input_data, config, **kwargs)
+
+    slow = SlowOrderNode()
+    chain_start = OrderNode()
+    chain_end = OrderNode(depends=[NodeDependency(chain_start)])
+    flow = flows.Flow(nodes=[slow, chain_start, chain_end], max_node_workers=1)
+
+    flow.run(input_data={})
+    started.clear()
+    response = flow.run(input_data={})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert started[0] == slow.id
+
+
+def test_flow_scheduler_respects_max_node_workers_by_group():
+    running = {NodeGroup.UTILS: 0, NodeGroup.TOOLS: 0}
+    max_running = dict(running)
+    lock = threading.Lock()
+
+    class CountingNode(RecordingNode):
+        group: NodeGroup = NodeGroup.UTILS
+
+        def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+            with lock:
+                running[self.group] += 1
+                max_running[self.group] = max(max_running[self.group], running[self.group])
+            time.sleep(0.02)
+            with lock:
+                running[self.group] -= 1
+            return {}
+
+    nodes = [CountingNode() for _ in range(6)] + [CountingNode(group=NodeGroup.TOOLS) for _ in range(6)]
+    flow = flows.Flow(nodes=nodes, max_node_workers=8, max_node_workers_by_group={NodeGroup.TOOLS: 2})
+
+    response = flow.run(input_data={})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert max_running[NodeGroup.TOOLS] == 2
+    assert max_running[NodeGroup.UTILS] > 2
+
+
+def test_flow_with_dependency_cycle_is_rejected():
+    first = RecordingNode()
+    second = RecordingNode(depends=[NodeDependency(first)])
+    first.depends = [NodeDependency(second)]
+
+    with pytest.raises(ValueError, match="cycle"):
+        flows.Flow(nodes=[first, second])
+
+
+def test_flow_add_nodes_rejects_dependency_cycle():
+    first = RecordingNode()
+    second = RecordingNode(depends=[NodeDependency(first)])
+    first.depends = [NodeDependency(second)]
+    flow = flows.Flow()
+
+    with pytest.raises(ValueError, match="cycle"):
+        flow.add_nodes([first, second])
+    assert flow.nodes == []
+
+
+def test_node_run_state_does_not_outlive_run_in_worker_thread():
+    run_states = []
+
+    class StatefulNode(RecordingNode):
+        def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+            run_states.append(self.run_state)
+            self.run_state.run_depends = [{"run": len(run_states)}]
+            return {}
+
+    node = StatefulNode()
+    flow = flows.Flow(nodes=[node], executor=ThreadExecutor)
+
+    for _ in range(2):
+        assert flow.run(input_data={}).status == RunnableStatus.SUCCESS
+
+    assert run_states[0] is not run_states[1]
+    assert run_states[1].run_depends == [{"run": 2}]
+    assert node.run_state.run_depends == []
+
+
+def test_node_waiting_to_retry_releases_worker_thread():
+    events = []
+
+    class FlakyNode(RecordingNode):
+        def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+            events.append("flaky")
+            if events.count("flaky") == 1:
+                raise ValueError("Flaky failure")
+            return {}
+
+    class SiblingNode(RecordingNode):
+        def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+            events.append("sibling")
+            return {}
+
+    flaky = FlakyNode(priority=1, error_handling=ErrorHandling(max_retries=1, retry_interval_seconds=0.2))
+    sibling = SiblingNode()
+    worker_pool = WorkerPool(max_workers=1)
+    flow = flows.Flow(nodes=[flaky, sibling], worker_pool=worker_pool)
+
+    try:
+        response = flow.run(input_data={})
+    finally:
+        worker_pool.shutdown()
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[flaky.id]["status"] == RunnableStatus.SUCCESS.value
+    # The only worker runs the sibling while the flaky node waits to retry
+    assert events == ["flaky", "sibling", "flaky"]
+
+
+def test_node_retry_does_not_block_delayed_calls_on_saturated_pool():
+    release = threading.Event()
+    events = []
+
+    class FlakyNode(RecordingNode):
+        def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+            events.append("flaky")
+            if events.count("flaky") == 1:
+                raise ValueError("Flaky failure")
+            return {}
+
+    class BlockingNode(RecordingNode):
+        def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+            # Holds the only slot of the pool until a call due after the flaky node retry runs
+            get_default_delayed_calls().call_later(0.2, release.set)
+            return {"released": release.wait(timeout=5)}
+
+    flaky = FlakyNode(priority=1, error_handling=ErrorHandling(max_retries=1, retry_interval_seconds=0.05))
+    blocking = BlockingNode()
+    worker_pool = WorkerPool(max_workers=1, max_queue_size=0)
+    flow = flows.Flow(nodes=[flaky, blocking], worker_pool=worker_pool)
+
+    try:
+        response = flow.run(input_data={})
+    finally:
+        worker_pool.shutdown()
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[blocking.id]["output"] == {"released": True}
+    assert response.output[flaky.id]["status"] == RunnableStatus.SUCCESS.value
+
+
+def test_flow_shuts_down_executor_when_scheduler_fails():
+    shutdowns = []
+
+    class RecordingThreadExecutor(ThreadExecutor):
+        def shutdown(self, wait: bool = True):
+            shutdowns.append(wait)
+            super().shutdown(wait=wait)
+
+    flow = flows.Flow(nodes=[RecordingNode()], executor=RecordingThreadExecutor)
+
+    with mock.patch.object(FlowScheduler, "run", side_effect=RuntimeError("scheduler failed")):
+        response = flow.run(input_data={})
+
+    assert response.status == RunnableStatus.FAILURE
+    assert shutdowns == [True]
@@ -0,0 +1,47 @@
+from fiboaitech import Workflow
+from fiboaitech.callbacks import TracingCallbackHandler
+from fiboaitech.callbacks.tracing import RunStatus, RunType
+from fiboaitech.clients import BaseTracingClient, BatchTracingClient
+from fiboaitech.flows import Flow
+from fiboaitech.nodes.utils import Output
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+
+
+class RecordingTracingClient(BaseTracingClient):
+    def __init__(self):
+        self.runs = []
+
+    def trace(self, runs) -> None:
+        self.runs.extend(runs)
+
+
+def test_tracing_with_batch_client_exports_finished_runs_and_evicts_them():
+    client = RecordingTracingClient()
+    exporter = BatchTracingClient(client, max_batch_size=2, flush_interval=60)
+    tracing = TracingCallbackHandler(client=exporter)
+    first = Output()
+    second = Output().depends_on(first)
+    workflow = Workflow(flow=Flow(nodes=[first, second]))
+
+    for _ in range(3):
+        result = workflow.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[tracing]))
+        assert result.status == RunnableStatus.SUCCESS
+        assert tracing.runs == {}
+
+    assert exporter.flush(timeout=5)
+    assert len(client.runs) == 12
+    assert {run.status for run in client.runs} == {RunStatus.SUCCEEDED}
+    assert [run.type for run in client.runs[:4]] == [RunType.NODE, RunType.NODE, RunType.FLOW, RunType.WORKFLOW]
+    assert exporter.metrics.exported == 12
+    exporter.shutdown()
+
+
+def test_tracing_without_batch_client_keeps_runs():
+    client = RecordingTracingClient()
+    tracing = TracingCallbackHandler(client=client)
+    workflow = Workflow(flow=Flow(nodes=[Output()]))
+
+    workflow.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[tracing]))
+
+    assert len(tracing.runs) == 3
+    assert len(client.runs) == 3
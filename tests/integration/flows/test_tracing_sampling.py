@@ -0,0 +1,65 @@
+from fiboaitech import Workflow
+from fiboaitech.callbacks import TracingCallbackHandler
+from fiboaitech.callbacks.tracing import RunType, TracingPayloadBudget, TracingSampling
+from fiboaitech.clients import BaseTracingClient, BatchTracingClient
+from fiboaitech.flows import Flow
+from fiboaitech.nodes.utils import Output
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+
+
+class RecordingTracingClient(BaseTracingClient):
+    def __init__(self):
+        self.runs = []
+
+    def trace(self, runs) -> None:
+        self.runs.extend(runs)
+
+
+def get_workflow() -> Workflow:
+    first = Output()
+    return Workflow(flow=Flow(nodes=[first, Output().depends_on(first)]))
+
+
+def test_head_sampling_skips_recording_of_dropped_workflows():
+    workflow, other_workflow = get_workflow(), get_workflow()
+    tracing = TracingCallbackHandler(sampling=TracingSampling(head_rate=1, workflow_head_rates={workflow.id: 0}))
+
+    result = workflow.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[tracing]))
+    assert result.status == RunnableStatus.SUCCESS
+    assert tracing.runs == {}
+
+    other_workflow.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[tracing]))
+    assert len(tracing.runs) == 4
+    assert tracing._root_run_ids == {}
+    assert tracing._trace_run_ids == {}
+    assert tracing._dropped_root_run_ids == set()
+
+
+def test_tail_sampling_drops_whole_traces_and_keeps_slow_ones():
+    workflow = get_workflow()
+    client = RecordingTracingClient()
+    exporter = BatchTracingClient(client, flush_interval=60)
+    tracing = TracingCallbackHandler(client=exporter, sampling=TracingSampling(tail_rate=0))
+
+    workflow.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[tracing]))
+    assert exporter.flush(timeout=5)
+    assert client.runs == []
+    assert tracing.runs == {}
+
+    tracing.sampling.tail_latency_threshold_seconds = 0
+    workflow.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[tracing]))
+    assert exporter.flush(timeout=5)
+    assert sorted(run.type for run in client.runs) == [RunType.FLOW, RunType.NODE, RunType.NODE, RunType.WORKFLOW]
+    assert tracing.runs == {}
+    exporter.shutdown()
+
+
+def test_payload_budget_applies_to_run_inputs_and_outputs():
+    tracing = TracingCallbackHandler(payload_budget=TracingPayloadBudget(max_string_length=3))
+
+    get_workflow().run(input_data={"a": "abcdef"}, config=RunnableConfig(callbacks=[tracing]))
+
+    for run in tracing.runs.values():
+        assert run.input["a"] == "abc... [3 more characters]"
+        if run.type == RunType.NODE:
+            assert run.executions[0].input["a"] == "abc... [3 more characters]"
@@ -0,0 +1,134 @@
+import json
+
+import pytest
+from litellm import ModelResponse
+from litellm.types.utils import Delta
+
+from fiboaitech.callbacks import BaseCallbackHandler
+from fiboaitech.nodes.agents import SimpleAgent
+from fiboaitech.nodes.agents.react import ReActAgent
+from fiboaitech.nodes.types import InferenceMode
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+from fiboaitech.types.streaming import StreamingConfig, StreamingMode
+
+
+class StreamRecorder(BaseCallbackHandler):
+    def __init__(self, generated):
+        self.generated = generated
+        self.events = []
+
+    def on_node_execute_stream(self, serialized, chunk=None, **kwargs):
+        delta = chunk["choices"][0]["delta"]
+        self.events.append((serialized["id"], delta.get("step"), delta["content"], len(self.generated)))
+
+    def get_content(self, entity_id, step):
+        return "".join(
+            content
+            for event_entity_id, event_step, content, _ in self.events
+            if event_entity_id == entity_id and event_step == step
+        )
+
+
+@pytest.fixture
+def mock_llm_stream(mocker):
+    generated = []
+
+    def mock(output):
+        def completion(stream: bool, *args, **kwargs):
+            if not stream:
+                response = ModelResponse()
+                response["choices"][0]["message"]["content"] = output
+                return response
+
+            def chunks():
+                for token in [output[i:i + 3] for i in range(0, len(output), 3)]:
+                    generated.append(token)
+                    response = ModelResponse(stream=True)
+                    response.choices[0].delta = Delta(role="assistant", content=token)
+                    yield response
+
+            return chunks()
+
+        mocker.patch("fiboaitech.nodes.llms.base.BaseLLM._completion", side_effect=completion)
+        return generated
+
+    return mock
+
+
+@pytest.mark.parametrize(
+    "inference_mode, output, answer",
+    [
+        (InferenceMode.DEFAULT, "Thought: I know it.\nAnswer: The capital is Paris, of course.", None),
+        (
+            InferenceMode.XML,
+            "<output><thought>I know it.</thought><answer>\nThe capital is Paris, of course.\n</answer></output>",
+            None,
+        ),
+        (
+            InferenceMode.STRUCTURED_OUTPUT,
+            json.dumps({"thought": "I know it.", "action": "finish", "action_input": "The capital is \"Paris\"."}),
+            'The capital is "Paris".',
+        ),
+    ],
+)
+def test_react_agent_streams_answer_tokens(openai_node, mock_llm_stream, inference_mode, output, answer):
+    answer = answer or "The capital is Paris, of course."
+    generated = mock_llm_stream(output)
+    agent = ReActAgent(
+        name="Agent", llm=openai_node, inference_mode=inference_mode, streaming=StreamingConfig(enabled=True)
+    )
+    recorder = StreamRecorder(generated)
+
+    result = agent.run(
+        input_data={"input": "What is the capital of France?"}, config=RunnableConfig(callbacks=[recorder])
+    )
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output["content"] == answer
+    assert recorder.get_content(agent.id, "answer") == answer
+    answer_events = [event for event in recorder.events if event[0] == agent.id]
+    assert len(answer_events) > 1
+    # Answer tokens are streamed while the LLM is still generating
+    assert answer_events[0][3] < len(generated)
+    # The LLM node itself doesn't stream
+    assert all(event[0] == agent.id for event in recorder.events)
+
+
+def test_react_agent_streams_reasoning_tokens_in_all_mode(openai_node, mock_llm_stream):
+    output = "Thought: I know it.\nAnswer: Paris."
+    generated = mock_llm_stream(output)
+    agent = ReActAgent(
+        name="Agent", llm=openai_node, streaming=StreamingConfig(enabled=True, mode=StreamingMode.ALL)
+    )
+    recorder = StreamRecorder(generated)
+
+    agent.run(input_data={"input": "What is the capital of France?"}, config=RunnableConfig(callbacks=[recorder]))
+
+    assert recorder.get_content(agent.id, "reasoning_1") == output
+    assert recorder.get_content(agent.id, "answer") == "Paris."
+    assert recorder.events[0][3] == 1
+
+
+def test_react_agent_streams_answer_words_without_token_streaming(openai_node, mock_llm_stream):
+    mock_llm_stream("Thought: I know it.\nAnswer: The capital is Paris.")
+    agent = ReActAgent(name="Agent", llm=openai_node, streaming=StreamingConfig(enabled=True, by_tokens=False))
+    recorder = StreamRecorder([])
+
+    agent.run(input_data={"input": "What is the capital of France?"}, config=RunnableConfig(callbacks=[recorder]))
+
+    assert [event[2] for event in recorder.events] == ["The capital is Paris."]
+
+
+def test_simple_agent_streams_llm_tokens(openai_node, mock_llm_stream):
+    output = "The capital of France is Paris."
+    generated = mock_llm_stream(output)
+    agent = SimpleAgent(name="Agent", llm=openai_node, streaming=StreamingConfig(enabled=True))
+    recorder = StreamRecorder(generated)
+
+    result = agent.run(
+        input_data={"input": "What is the capital of France?"}, config=RunnableConfig(callbacks=[recorder])
+    )
+
+    assert result.output["content"] == output
+    assert recorder.get_content(agent.id, "answer") == output
+    assert recorder.events[0][3] == 1
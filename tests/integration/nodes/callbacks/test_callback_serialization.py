@@ -0,0 +1,76 @@
+from typing import Any
+
+from fiboaitech.callbacks import BaseCallbackHandler, TracingCallbackHandler
+from fiboaitech.nodes import llms
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+from fiboaitech.types.streaming import StreamingConfig
+
+
+class RecordingCallbackHandler(BaseCallbackHandler):
+
+    def __init__(self):
+        self.serialized = []
+
+    def on_node_start(self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any):
+        self.serialized.append(serialized)
+
+    def on_node_execute_stream(self, serialized: dict[str, Any], chunk: dict[str, Any] | None = None, **kwargs: Any):
+        self.serialized.append(serialized)
+
+    def on_node_end(self, serialized: dict[str, Any], output_data: dict[str, Any], **kwargs: Any):
+        self.serialized.append(serialized)
+
+
+class LightweightCallbackHandler(RecordingCallbackHandler):
+    requires_serialized_node = False
+
+
+def test_streaming_node_is_serialized_once_per_run(openai_node, mock_llm_response_text, mocker):
+    openai_node.streaming = StreamingConfig(enabled=True)
+    to_dict = mocker.spy(llms.OpenAI, "to_dict")
+    callback = RecordingCallbackHandler()
+    tracing = TracingCallbackHandler()
+
+    response = openai_node.run(input_data={}, config=RunnableConfig(callbacks=[callback, tracing]))
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert to_dict.call_count == 1
+    assert len(callback.serialized) == len(mock_llm_response_text) + 2
+    assert all(serialized is callback.serialized[0] for serialized in callback.serialized)
+    # Tracing sets formatted prompt messages on its own copy of the serialized node
+    [run] = tracing.runs.values()
+    assert run.metadata["node"]["prompt"]["messages"] != openai_node.prompt.model_dump()["messages"]
+    assert callback.serialized[0] == openai_node.to_dict()
+
+
+def test_node_serialization_is_refreshed_on_change(openai_node, mocker):
+    to_dict = mocker.spy(llms.OpenAI, "to_dict")
+    callback = RecordingCallbackHandler()
+    config = RunnableConfig(callbacks=[callback])
+
+    openai_node.run(input_data={}, config=config)
+    openai_node.name = "Renamed"
+    assert openai_node.serialized["name"] == "Renamed"
+    openai_node.run(input_data={}, config=config)
+
+    assert callback.serialized[0]["name"] == "OpenAI"
+    assert callback.serialized[-1]["name"] == "Renamed"
+    assert to_dict.call_count == 3
+
+
+def test_callback_without_serialized_node_skips_serialization(openai_node, mocker):
+    openai_node.streaming = StreamingConfig(enabled=True, event="llm")
+    to_dict = mocker.spy(llms.OpenAI, "to_dict")
+    callback = LightweightCallbackHandler()
+
+    response = openai_node.run(input_data={}, config=RunnableConfig(callbacks=[callback]))
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert to_dict.call_count == 0
+    assert callback.serialized[0] == {
+        "id": openai_node.id,
+        "name": openai_node.name,
+        "type": openai_node.type,
+        "group": openai_node.group,
+        "streaming": openai_node.streaming.model_dump(),
+    }
@@ -0,0 +1,145 @@
+import asyncio
+import time
+from typing import Any, Literal
+
+from pydantic import PrivateAttr
+
+from fiboaitech import flows
+from fiboaitech.callbacks import ProfilingCallbackHandler
+from fiboaitech.callbacks.tracing import RunStatus
+from fiboaitech.nodes import ErrorHandling, NodeGroup
+from fiboaitech.nodes.node import Node, NodeDependency
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+from fiboaitech.utils.profiling import NodePhase
+
+
+class SleepNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    seconds: float = 0.02
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        time.sleep(self.seconds)
+        return {}
+
+
+class FlakyNode(SleepNode):
+    failures: int = 1
+    _calls: int = PrivateAttr(default=0)
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        super().execute(input_data, config, **kwargs)
+        self._calls += 1
+        if self._calls <= self.failures:
+            raise ValueError("Flaky failure")
+        return {}
+
+
+def test_node_run_phases_are_profiled():
+    node = SleepNode(name="Sleep")
+    profiling = ProfilingCallbackHandler()
+
+    response = node.run(input_data={}, config=RunnableConfig(callbacks=[profiling]))
+
+    assert response.status == RunnableStatus.SUCCESS
+    [record] = profiling.records
+    profile = record.profile
+    assert record.node_id == node.id
+    assert record.status == RunStatus.SUCCEEDED
+    assert set(profile.phases) == set(NodePhase) - {NodePhase.RETRY_WAIT}
+    assert profile.phases[NodePhase.EXECUTE] >= node.seconds
+    assert len(profile.attempts) == 1
+    assert sum(profile.phases.values()) <= profile.duration
+    # Run was not submitted by an executor
+    assert profile.queue_time is None and profile.start_delay is None
+
+
+def test_node_retries_are_profiled():
+    node = FlakyNode(error_handling=ErrorHandling(max_retries=2, retry_interval_seconds=0.01))
+    profiling = ProfilingCallbackHandler()
+
+    response = node.run(input_data={}, config=RunnableConfig(callbacks=[profiling]))
+
+    assert response.status == RunnableStatus.SUCCESS
+    profile = profiling.records[0].profile
+    assert len(profile.attempts) == 2
+    assert all(attempt >= node.seconds for attempt in profile.attempts)
+    assert profile.phases[NodePhase.RETRY_WAIT] >= 0.01
+
+
+def test_node_failure_is_profiled():
+    node = FlakyNode(failures=5, error_handling=ErrorHandling(max_retries=1, retry_interval_seconds=0))
+    profiling = ProfilingCallbackHandler()
+
+    response = node.run(input_data={}, config=RunnableConfig(callbacks=[profiling]))
+
+    assert response.status == RunnableStatus.FAILURE
+    [record] = profiling.records
+    assert record.status == RunStatus.FAILED
+    assert len(record.profile.attempts) == 2
+    assert NodePhase.TRANSFORM_OUTPUT not in record.profile.phases
+
+
+def test_flow_run_summary():
+    first = SleepNode(name="First")
+    second = SleepNode(name="Second", seconds=0.05, depends=[NodeDependency(first)])
+    flow = flows.Flow(nodes=[first, second])
+    profiling = ProfilingCallbackHandler()
+
+    flow.run(input_data={}, config=RunnableConfig(callbacks=[profiling]))
+    response = flow.run(input_data={}, config=RunnableConfig(callbacks=[profiling]))
+
+    assert response.status == RunnableStatus.SUCCESS
+    run_id = profiling.records[-1].parent_run_id
+    records = profiling.get_records(run_id)
+    assert [record.node_id for record in records] == [first.id, second.id]
+    for record in records:
+        assert record.profile.scheduler_wait >= 0
+        assert record.profile.queue_time >= 0
+        assert record.profile.start_delay >= record.profile.queue_time
+    # Dependant becomes ready when its dependency completes
+    assert records[1].profile.ready_at >= records[0].profile.started_at + first.seconds
+
+    summary = profiling.get_summary(run_id)
+    assert [row["node_id"] for row in summary] == [second.id, first.id]
+    assert summary[0]["runs"] == 1
+    assert summary[0][NodePhase.EXECUTE.value] >= second.seconds
+    assert len(profiling.get_summary()) == 2
+    assert profiling.get_summary()[0]["runs"] == 2
+
+    table = profiling.format_summary(run_id).splitlines()
+    assert table[0].split()[:4] == ["node", "runs", "attempts", "duration"]
+    assert [line.split()[0] for line in table[1:]] == ["Second", "First"]
+
+
+def test_async_flow_run_is_profiled():
+    first = SleepNode()
+    second = SleepNode(depends=[NodeDependency(first)])
+    profiling = ProfilingCallbackHandler()
+
+    response = asyncio.run(
+        flows.Flow(nodes=[first, second]).arun(input_data={}, config=RunnableConfig(callbacks=[profiling]))
+    )
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert [record.node_id for record in profiling.records] == [first.id, second.id]
+    assert all(record.profile.queue_time >= 0 for record in profiling.records)
+
+
+def test_profiling_keeps_latest_runs():
+    first = SleepNode(seconds=0)
+    second = SleepNode(seconds=0, depends=[NodeDependency(first)])
+    flow = flows.Flow(nodes=[first, second])
+    profiling = ProfilingCallbackHandler(max_records=2)
+
+    for _ in range(3):
+        flow.run(input_data={}, config=RunnableConfig(callbacks=[profiling]))
+
+    assert len(profiling.records) == 2
+    assert len(profiling._parent_run_ids) <= 4
+    run_id = profiling.records[-1].parent_run_id
+    assert [record.node_id for record in profiling.get_records(run_id)] == [first.id, second.id]
+
+    profiling.clear()
+
+    assert not profiling.records
+    assert profiling.get_summary() == []
@@ -1,12 +1,19 @@
+import asyncio
 import json
+import threading
+import time
+from typing import Any, Literal
 
 import pytest
+from pydantic import PrivateAttr
 
 from fiboaitech import Workflow
 from fiboaitech.callbacks import TracingCallbackHandler
 from fiboaitech.connections import connections
 from fiboaitech.flows import Flow
+from fiboaitech.nodes import Behavior, NodeGroup
 from fiboaitech.nodes.llms import OpenAI
+from fiboaitech.nodes.node import Node
 from fiboaitech.nodes.operators import Map
 from fiboaitech.prompts import Message, Prompt
 from fiboaitech.runnables import RunnableConfig, RunnableResult, RunnableStatus
@@ -72,3 +79,91 @@ def test_workflow_with_map_node(inputs, outputs):
         output=expected_output,
     )
     assert json.dumps({"runs": [run.to_dict() for run in tracing.runs.values()]}, cls=JsonWorkflowEncoder)
+
+
+class RecordingNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _active: int = PrivateAttr(default=0)
+    _max_active: int = PrivateAttr(default=0)
+    _started: list = PrivateAttr(default_factory=list)
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        with self._lock:
+            self._started.append(input_data.get("value"))
+            self._active += 1
+            self._max_active = max(self._max_active, self._active)
+        try:
+            time.sleep(input_data.get("delay", 0))
+            if input_data.get("fail"):
+                raise ValueError("Item failed")
+            return {"value": input_data.get("value"), "input": input_data.get("input")}
+        finally:
+            with self._lock:
+                self._active -= 1
+
+
+def test_map_runs_items_concurrently_in_input_order():
+    node = RecordingNode()
+    map_node = Map(node=node, max_workers=3)
+    items = [{"value": i, "delay": 0.05 * (6 - i)} for i in range(6)]
+
+    response = map_node.run(input_data={"input": items})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert [output["value"] for output in response.output["output"]] == list(range(6))
+    assert node._max_active == 3
+
+
+def test_map_passes_chunks_to_node():
+    map_node = Map(node=RecordingNode(), max_workers=2, chunk_size=2)
+
+    response = map_node.run(input_data={"input": [1, 2, 3, 4, 5]})
+
+    assert [output["input"] for output in response.output["output"]] == [[1, 2], [3, 4], [5]]
+
+
+def test_map_returns_failed_item_outputs():
+    map_node = Map(node=RecordingNode(), max_workers=2)
+
+    response = map_node.run(input_data={"input": [{"value": 1}, {"value": 2, "fail": True}]})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output["output"][0] == {"value": 1, "input": None}
+    assert response.output["output"][1]["error_type"] == "ValueError"
+
+
+def test_map_raise_stops_remaining_items():
+    node = RecordingNode()
+    map_node = Map(node=node, max_workers=2, behavior=Behavior.RAISE)
+    items = [{"value": 0, "fail": True}] + [{"value": i, "delay": 0.05} for i in range(1, 20)]
+
+    response = map_node.run(input_data={"input": items})
+
+    assert response.status == RunnableStatus.FAILURE
+    assert "iteration index 1 has failed" in response.output["content"]
+    assert len(node._started) < len(items)
+
+
+def test_map_async_runs_items_concurrently_in_input_order():
+    node = RecordingNode()
+    map_node = Map(node=node, max_workers=3)
+    items = [{"value": i, "delay": 0.05 * (6 - i)} for i in range(6)]
+
+    response = asyncio.run(map_node.arun(input_data={"input": items}))
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert [output["value"] for output in response.output["output"]] == list(range(6))
+    assert node._max_active == 3
+
+
+def test_map_async_raise_cancels_remaining_items():
+    node = RecordingNode()
+    map_node = Map(node=node, max_workers=2, behavior=Behavior.RAISE)
+    items = [{"value": 0, "fail": True}] + [{"value": i, "delay": 0.05} for i in range(1, 20)]
+
+    response = asyncio.run(map_node.arun(input_data={"input": items}))
+
+    assert response.status == RunnableStatus.FAILURE
+    assert len(node._started) < len(items)
@@ -122,12 +122,20 @@ def get_orchestrator_workflow2(model: str, connection: connections.OpenAI, conte
         ),
     ],
 )
-def test_workflow_with_map_node(get_orchestrator_workflow, context_input, outputs, context_output):
+def test_workflow_with_map_node(mocker, get_orchestrator_workflow, context_input, outputs, context_output):
     model = "gpt-3.5-turbo"
     connection = connections.OpenAI(
         api_key="api_key",
     )
 
+    final_contexts = []
+    get_final_result = GraphOrchestrator.get_final_result
+
+    def get_final_result_with_context(self, *args, **kwargs):
+        final_contexts.append(self.run_state.context)
+        return get_final_result(self, *args, **kwargs)
+
+    mocker.patch.object(GraphOrchestrator, "get_final_result", get_final_result_with_context)
     wf_orchestrator = get_orchestrator_workflow(model, connection, context_input)
     input_data = {"input": ""}
     tracing = TracingCallbackHandler()
@@ -147,4 +155,6 @@ def test_workflow_with_map_node(get_orchestrator_workflow, context_input, output
     )
     assert json.dumps({"runs": [run.to_dict() for run in tracing.runs.values()]}, cls=JsonWorkflowEncoder)
 
-    assert wf_orchestrator.flow.nodes[0].context == context_output
+    assert final_contexts == [context_output]
+    # The final context belongs to the run, the orchestrator keeps the initial one
+    assert wf_orchestrator.flow.nodes[0].context == context_input
@@ -2,7 +2,9 @@ from io import BytesIO
 
 import pytest
 
-from fiboaitech.cache import RedisCacheConfig
+from fiboaitech.cache import InMemoryCacheConfig, RedisCacheConfig
+from fiboaitech.cache.managers import WorkflowCacheManager
+from fiboaitech.cache.utils import get_cache_manager
 from fiboaitech.callbacks import TracingCallbackHandler
 from fiboaitech.callbacks.tracing import RunType
 from fiboaitech.nodes import CachingConfig, NodeGroup
@@ -114,3 +116,16 @@ def test_node_caching(
         ):
             assert bool(run.metadata["is_output_from_cache"]) is is_output_from_cache
             assert len(mock_redis.keys(f"{cache_namespace}:{run.metadata['node']['id']}:*")) == node_redis_keys
+
+
+def test_node_caching_with_in_memory_backend(node_with_caching, mock_llm_executor):
+    cache_config = InMemoryCacheConfig(namespace="in-memory-test", max_entries=8)
+    config = RunnableConfig(cache=cache_config)
+
+    first_result = node_with_caching.run(input_data={"a": 1}, config=config)
+    second_result = node_with_caching.run(input_data={"a": 1}, config=config)
+
+    assert first_result == second_result
+    assert mock_llm_executor.call_count == 1
+    metrics = get_cache_manager(WorkflowCacheManager, cache_config).metrics
+    assert (metrics.hits, metrics.misses, metrics.sets) == (1, 1, 1)
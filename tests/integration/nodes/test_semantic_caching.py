@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from fiboaitech.cache.semantic import SemanticCache
+from fiboaitech.callbacks import BaseCallbackHandler, TracingCallbackHandler
+from fiboaitech.callbacks.tracing import RunType
+from fiboaitech.components.embedders.openai import OpenAIEmbedder
+from fiboaitech.connections import OpenAI as OpenAIConnection
+from fiboaitech.nodes import llms
+from fiboaitech.prompts import Message, Prompt
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+from fiboaitech.types.streaming import StreamingConfig
+
+KEYWORDS = ("LLM", "weather")
+
+
+@pytest.fixture
+def mock_keyword_embedding(mocker):
+    from litellm import EmbeddingResponse
+
+    def response(*args, **kwargs):
+        text = kwargs["input"][0]
+        embed_r = EmbeddingResponse()
+        embed_r["data"] = [{"embedding": [float(keyword in text) for keyword in KEYWORDS] + [0.1]}]
+        embed_r["model"] = kwargs.get("model")
+        embed_r["usage"] = {"prompt_tokens": 6, "completion_tokens": 0, "total_tokens": 6}
+        return embed_r
+
+    yield mocker.patch("fiboaitech.components.embedders.base.BaseEmbedder._embedding", side_effect=response)
+
+
+def get_llm(namespace: str = "default", model: str = "gpt-4o-mini", semantic_cache: SemanticCache | None = None):
+    return llms.OpenAI(
+        model=model,
+        connection=OpenAIConnection(api_key="test-api-key"),
+        prompt=Prompt(messages=[Message(content="{{question}}")]),
+        semantic_cache=semantic_cache
+        or SemanticCache(
+            embedder=OpenAIEmbedder(connection=OpenAIConnection(api_key="test-api-key")),
+            similarity_threshold=0.9,
+            namespace=namespace,
+        ),
+    )
+
+
+def get_semantic_cache_metadata(tracing: TracingCallbackHandler) -> dict:
+    return next(run.metadata["semantic_cache"] for run in tracing.runs.values() if run.type == RunType.NODE)
+
+
+def test_semantic_cache_reuses_completion_of_similar_prompt(
+    mock_llm_executor, mock_llm_response_text, mock_keyword_embedding
+):
+    llm = get_llm()
+
+    tracing = TracingCallbackHandler()
+    result = llm.run({"question": "What is an LLM?"}, config=RunnableConfig(callbacks=[tracing]))
+    assert result.output == {"content": mock_llm_response_text}
+    assert get_semantic_cache_metadata(tracing) == {"hit": False, "similarity": None, "namespace": "default"}
+
+    tracing = TracingCallbackHandler()
+    result = llm.run({"question": "Explain LLM briefly"}, config=RunnableConfig(callbacks=[tracing]))
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output == {"content": mock_llm_response_text}
+    assert get_semantic_cache_metadata(tracing)["hit"] is True
+    assert mock_llm_executor.call_count == 1
+
+    llm.run({"question": "What is the weather?"})
+    assert mock_llm_executor.call_count == 2
+    assert (llm.semantic_cache.hits, llm.semantic_cache.misses) == (1, 2)
+
+
+def test_semantic_cache_isolates_namespaces_and_models(mock_llm_executor, mock_keyword_embedding):
+    llm = get_llm(namespace="a")
+    llm.run({"question": "What is an LLM?"})
+
+    for other_llm in (
+        get_llm(namespace="b", semantic_cache=None),
+        get_llm(namespace="a", model="gpt-4o", semantic_cache=None),
+    ):
+        other_llm.semantic_cache.index = llm.semantic_cache.index
+        other_llm.run({"question": "What is an LLM?"})
+
+    assert mock_llm_executor.call_count == 3
+    llm.run({"question": "What is an LLM?"})
+    assert mock_llm_executor.call_count == 3
+
+
+def test_semantic_cache_respects_ttl(mock_llm_executor, mock_keyword_embedding):
+    llm = get_llm()
+    llm.semantic_cache.ttl = -1
+
+    llm.run({"question": "What is an LLM?"})
+    llm.run({"question": "What is an LLM?"})
+    assert mock_llm_executor.call_count == 2
+
+
+def test_semantic_cache_hit_streams_cached_content(mock_llm_executor, mock_llm_response_text, mock_keyword_embedding):
+    llm = get_llm()
+    llm.run({"question": "What is an LLM?"})
+    llm.streaming = StreamingConfig(enabled=True)
+
+    chunks = []
+
+    class ChunkCallback(BaseCallbackHandler):
+        def on_node_execute_stream(self, serialized, chunk=None, **kwargs):
+            chunks.append(chunk)
+
+    result = llm.run({"question": "What is an LLM?"}, config=RunnableConfig(callbacks=[ChunkCallback()]))
+
+    assert result.output == {"content": mock_llm_response_text}
+    assert [chunk["choices"][0]["delta"]["content"] for chunk in chunks] == [mock_llm_response_text]
+    assert mock_llm_executor.call_count == 1
+
+
+def test_semantic_cache_async(mock_llm_async_executor, mock_keyword_embedding):
+    llm = get_llm()
+    asyncio.run(llm.arun({"question": "What is an LLM?"}))
+    asyncio.run(llm.arun({"question": "Explain LLM"}))
+    assert mock_llm_async_executor.call_count == 1
+    assert llm.semantic_cache.hits == 1
+
+
+def test_semantic_cache_is_not_serialized(mock_keyword_embedding):
+    assert "semantic_cache" not in get_llm().to_dict()
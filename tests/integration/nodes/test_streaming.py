@@ -1,9 +1,12 @@
+import asyncio
+import json
 from collections import defaultdict
 
 import pytest
 
 from fiboaitech import Workflow, flows
-from fiboaitech.callbacks.streaming import StreamingIteratorCallbackHandler
+from fiboaitech.callbacks import BaseCallbackHandler
+from fiboaitech.callbacks.streaming import StreamingFrameCallbackHandler, StreamingIteratorCallbackHandler
 from fiboaitech.runnables import RunnableConfig, RunnableResult, RunnableStatus
 from fiboaitech.types.streaming import STREAMING_EVENT, StreamingConfig
 
@@ -61,3 +64,65 @@ def test_node_streaming(
         "".join([content for event, content in node_output]) == mock_llm_response_text
     )
     assert all(event == streaming_custom_event for event, content in node_output)
+
+
+def test_node_streaming_frames(
+    node_with_streaming,
+    streaming_custom_event,
+    mock_llm_response_text,
+    mock_llm_executor,
+):
+    streaming = StreamingFrameCallbackHandler(coalesce_interval=60, max_frame_size=4)
+    wf = Workflow(flow=flows.Flow(nodes=[node_with_streaming]))
+    response = wf.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[streaming]))
+
+    *token_frames, final_frame = list(streaming)
+    assert response.status == RunnableStatus.SUCCESS
+    assert all(frame.entity_id == node_with_streaming.id for frame in token_frames)
+    assert all(frame.event == streaming_custom_event for frame in token_frames)
+    assert [len(frame.content) for frame in token_frames] == [4, 4, 4, 3]
+    assert "".join(json.loads(frame.payload)["content"] for frame in token_frames) == mock_llm_response_text
+    assert final_frame.entity_id == wf.id
+    assert final_frame.data == response.output
+
+
+def test_node_streaming_frames_async_iteration(node_with_streaming, mock_llm_response_text, mock_llm_executor):
+    streaming = StreamingFrameCallbackHandler(coalesce_interval=60)
+    wf = Workflow(flow=flows.Flow(nodes=[node_with_streaming]))
+
+    async def consume():
+        run = asyncio.create_task(
+            asyncio.to_thread(wf.run, input_data={"a": 1}, config=RunnableConfig(callbacks=[streaming]))
+        )
+        frames = [frame async for frame in streaming]
+        await run
+        return frames
+
+    frames = asyncio.run(consume())
+
+    assert [frame.content for frame in frames[:-1]] == [mock_llm_response_text]
+    assert frames[-1].entity_id == wf.id
+
+
+class DeltaRecorder(BaseCallbackHandler):
+    requires_stream_chunk = False
+
+    def __init__(self):
+        self.events = []
+
+    def on_node_execute_stream(self, serialized, chunk=None, **kwargs):
+        self.events.append((chunk, kwargs.get("delta")))
+
+
+def test_node_streaming_skips_chunk_serialization(node_with_streaming, mock_llm_response_text, mock_llm_executor):
+    recorder = DeltaRecorder()
+    wf = Workflow(flow=flows.Flow(nodes=[node_with_streaming]))
+    wf.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[recorder]))
+
+    assert all(chunk is None for chunk, _ in recorder.events)
+    assert "".join(delta for _, delta in recorder.events) == mock_llm_response_text
+
+    recorder.events.clear()
+    wf.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[recorder, StreamingIteratorCallbackHandler()]))
+
+    assert all(chunk["choices"][0]["delta"]["content"] == delta for chunk, delta in recorder.events)
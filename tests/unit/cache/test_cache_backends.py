@@ -0,0 +1,138 @@
+import time
+
+import pytest
+
+from fiboaitech.cache import (
+    CacheEvictionPolicy,
+    InMemoryCacheConfig,
+    RedisCacheConfig,
+    SQLiteCacheConfig,
+    TieredCacheConfig,
+)
+from fiboaitech.cache.backends import InMemoryCache, SQLiteCache, TieredCache
+from fiboaitech.cache.managers import CacheManager
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("1", None, "3")
+    assert cache.evictions == 1
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_in_memory_cache_limits_total_size():
+    cache = InMemoryCache(max_entries=10, max_size_bytes=10)
+    cache.set("a", "x" * 4)
+    cache.set("b", "x" * 4)
+    cache.set("c", "x" * 4)
+
+    assert cache.get("a") is None
+    assert cache.size_bytes == 8
+    assert not cache.set("large", "x" * 11)
+    assert len(cache) == 2
+
+
+def test_in_memory_cache_expires_entries():
+    cache = InMemoryCache()
+    cache.set("a", "1", ttl=0.05)
+
+    assert cache.get("a") == "1"
+    time.sleep(0.05)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_in_memory_cache_tiny_lfu_keeps_frequent_entries():
+    cache = InMemoryCache(max_entries=2, eviction_policy=CacheEvictionPolicy.TINY_LFU)
+    cache.set("hot", "1")
+    cache.set("warm", "2")
+    for _ in range(5):
+        cache.get("hot")
+        cache.get("warm")
+
+    for i in range(10):
+        cache.set(f"one-off-{i}", "3")
+
+    assert cache.get("hot") == "1"
+    assert cache.get("warm") == "2"
+    assert cache.evictions == 0
+
+
+def test_sqlite_cache_survives_restart(tmp_path):
+    config = SQLiteCacheConfig(path=str(tmp_path / "cache.db"), max_entries=2)
+    cache = SQLiteCache.from_config(config)
+    cache.set("a", "1")
+    cache.set("b", "2", ttl=60)
+    cache.set("expired", "3", ttl=-1)
+
+    restarted = SQLiteCache.from_config(config)
+    assert (restarted.get("a"), restarted.get("b"), restarted.get("expired")) == ("1", "2", None)
+
+    restarted.get("a")
+    restarted.set("c", "4")
+    assert (restarted.get("a"), restarted.get("b"), restarted.get("c")) == ("1", None, "4")
+    assert restarted.evictions == 1
+
+
+def test_sqlite_cache_locks_are_exclusive_until_released(tmp_path):
+    cache = SQLiteCache.from_config(SQLiteCacheConfig(path=str(tmp_path / "cache.db")))
+
+    assert cache.acquire_lock("key:lock", "owner", ttl=60)
+    assert not cache.acquire_lock("key:lock", "other", ttl=60)
+    cache.release_lock("key:lock", "other")
+    assert not cache.acquire_lock("key:lock", "other", ttl=60)
+    cache.release_lock("key:lock", "owner")
+    assert cache.acquire_lock("key:lock", "other", ttl=60)
+
+
+def test_tiered_cache_serves_hot_keys_from_local_tier(mock_redis):
+    config = TieredCacheConfig(
+        remote=RedisCacheConfig(host="redis-test-sv", port=6379, db=0), local=InMemoryCacheConfig(max_entries=1)
+    )
+    cache_manager = CacheManager(config=config)
+    cache = cache_manager.cache
+    assert isinstance(cache, TieredCache)
+
+    cache_manager.set("a", {"value": 1})
+    cache.local.delete("a")
+
+    assert cache_manager.get("a") == {"value": 1}
+    assert cache_manager.get("a") == {"value": 1}
+    assert (cache.local_hits, cache.remote_hits) == (1, 1)
+
+    cache_manager.set("b", {"value": 2})
+    assert cache_manager.get("a") == {"value": 1}
+    assert cache_manager.metrics.evictions == 2
+    assert cache_manager.metrics.hit_rate == 1
+
+
+def test_tiered_cache_copies_remote_entries_with_default_ttl(mock_redis, mocker):
+    config = TieredCacheConfig(remote=RedisCacheConfig(host="redis-test-sv", port=6379, db=0), ttl=30)
+    cache_manager = CacheManager(config=config)
+    cache = cache_manager.cache
+    cache_manager.set("a", {"value": 1})
+    cache.local.delete("a")
+    local_set = mocker.spy(cache.local, "set")
+
+    assert cache_manager.get("a") == {"value": 1}
+    assert local_set.call_args.kwargs["ttl"] == 30
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        InMemoryCacheConfig(namespace="test"),
+        SQLiteCacheConfig(path=":memory:", namespace="test"),
+    ],
+)
+def test_cache_manager_get_or_set_with_local_backends(config):
+    cache_manager = CacheManager(config=config)
+
+    assert cache_manager.get_or_set("key", lambda: {"value": 1}) == ({"value": 1}, False)
+    assert cache_manager.get_or_set("key", lambda: {"value": 2}) == ({"value": 1}, True)
+    assert cache_manager.metrics.hit_rate == 0.5
@@ -0,0 +1,75 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fiboaitech.cache import CacheCodecType, CacheCompression, InMemoryCacheConfig
+from fiboaitech.cache.codecs import Base64Codec, BinaryCodec
+from fiboaitech.cache.managers import CacheManager
+
+LARGE_VALUE = '{"documents": [' + ", ".join(['{"embedding": [0.125, 0.25, 0.5]}'] * 100) + "]}"
+
+
+@pytest.mark.parametrize("compression", [CacheCompression.NONE, CacheCompression.ZLIB])
+@pytest.mark.parametrize("value", ["", "short", LARGE_VALUE])
+def test_binary_codec_round_trip(value, compression):
+    codec = BinaryCodec(compression=compression)
+    encoded = codec.encode(value)
+
+    assert isinstance(encoded, bytes)
+    assert encoded.startswith(BinaryCodec.MAGIC)
+    assert codec.decode(encoded) == value
+
+
+def test_binary_codec_compresses_large_values_only():
+    codec = BinaryCodec(compression=CacheCompression.ZLIB, min_compress_size=512)
+
+    assert len(codec.encode(LARGE_VALUE)) < len(LARGE_VALUE) / 5
+    assert codec.encode("short")[len(BinaryCodec.MAGIC) + 1] == BinaryCodec.COMPRESSION_IDS[CacheCompression.NONE]
+
+
+def test_binary_codec_reads_values_of_other_compressions_and_base64():
+    compressed = BinaryCodec(compression=CacheCompression.ZLIB).encode(LARGE_VALUE)
+    legacy = Base64Codec().encode(LARGE_VALUE)
+    codec = BinaryCodec(compression=CacheCompression.NONE)
+
+    assert codec.decode(compressed) == LARGE_VALUE
+    assert codec.decode(legacy) == LARGE_VALUE
+    assert codec.decode(legacy.encode()) == LARGE_VALUE
+
+
+def test_binary_codec_reuses_compressors_per_thread(mocker):
+    codec = BinaryCodec(compression=CacheCompression.ZLIB)
+    get_compressor = mocker.spy(BinaryCodec, "_get_compressor")
+
+    def round_trip(_):
+        for _ in range(3):
+            assert codec.decode(codec.encode(LARGE_VALUE)) == LARGE_VALUE
+        return codec._get_thread_compressor(CacheCompression.ZLIB)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(round_trip, range(2)))
+    round_trip(None)
+
+    # Created once per thread that used it, at most two pool threads and the main one
+    assert 2 <= get_compressor.call_count <= 3
+
+
+def test_binary_codec_rejects_newer_format_version():
+    encoded = bytearray(BinaryCodec().encode("value"))
+    encoded[len(BinaryCodec.MAGIC)] = BinaryCodec.VERSION + 1
+
+    with pytest.raises(ValueError):
+        BinaryCodec().decode(bytes(encoded))
+
+
+def test_cache_manager_reads_base64_entries_after_switching_to_binary_codec():
+    base64_manager = CacheManager(config=InMemoryCacheConfig(codec=CacheCodecType.BASE64))
+    base64_manager.set("key", {"value": 1})
+
+    binary_manager = CacheManager(config=InMemoryCacheConfig())
+    binary_manager.cache = base64_manager.cache
+
+    assert binary_manager.get("key") == {"value": 1}
+    binary_manager.set("key", {"value": 2})
+    assert isinstance(binary_manager.cache.get("key"), bytes)
+    assert binary_manager.get("key") == {"value": 2}
@@ -0,0 +1,212 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fiboaitech.cache import RedisCacheConfig
+from fiboaitech.cache.managers import CacheManager, WorkflowCacheManager
+from fiboaitech.cache.utils import cache_wf_entity, get_cache_manager
+from fiboaitech.runnables import RunnableConfig
+
+
+@pytest.fixture
+def cache_config():
+    return RedisCacheConfig(host="redis-test-sv", port=6379, db=0, namespace="test", lock_poll_interval=0.01)
+
+
+@pytest.fixture
+def cache_manager(cache_config):
+    return CacheManager(config=cache_config)
+
+
+def test_get_makes_single_round_trip(cache_manager, mocker):
+    cache_manager.set("key", {"value": 1})
+    get_spy = mocker.spy(cache_manager.cache, "get")
+
+    assert cache_manager.get("key") == {"value": 1}
+    assert cache_manager.get("missing") is None
+    assert get_spy.call_count == 2
+
+
+def test_get_or_set_computes_once(cache_manager):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"value": 1}
+
+    assert cache_manager.get_or_set("key", compute) == ({"value": 1}, False)
+    assert cache_manager.get_or_set("key", compute) == ({"value": 1}, True)
+    assert len(calls) == 1
+
+    metrics = cache_manager.metrics
+    assert (metrics.hits, metrics.misses, metrics.sets, metrics.waits) == (1, 1, 1, 0)
+    assert metrics.hit_rate == 0.5
+
+
+def test_get_or_set_deduplicates_concurrent_calls(cache_manager):
+    workers = 8
+    started = threading.Barrier(workers)
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return {"value": 1}
+
+    def call():
+        started.wait(5)
+        return cache_manager.get_or_set("key", compute)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(call) for _ in range(workers)]
+        while not calls:
+            time.sleep(0.01)
+        # Let the other callers join the in-flight computation
+        time.sleep(0.1)
+        release.set()
+        results = [future.result(5) for future in futures]
+
+    assert len(calls) == 1
+    assert sorted(from_cache for _, from_cache in results) == [False] + [True] * (workers - 1)
+    assert all(value == {"value": 1} for value, _ in results)
+    # Every caller gets its own copy of the value
+    assert len({id(value) for value, _ in results}) == workers
+    metrics = cache_manager.metrics
+    assert metrics.sets == 1
+    # Each call is one lookup: the leader misses, the callers joining its computation hit
+    assert (metrics.hits, metrics.misses) == (workers - 1, 1)
+
+
+def test_get_or_set_waiters_retry_after_failure(cache_manager):
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing_compute():
+        started.set()
+        release.wait(5)
+        raise ValueError("failed")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(cache_manager.get_or_set, "key", failing_compute)
+        started.wait(5)
+        waiter = executor.submit(cache_manager.get_or_set, "key", lambda: {"value": 2})
+        time.sleep(0.1)
+        release.set()
+
+        with pytest.raises(ValueError):
+            leader.result(5)
+        assert waiter.result(5) == ({"value": 2}, False)
+
+
+def test_get_or_set_waits_for_lock_of_other_process(cache_manager, mock_redis):
+    ns_key = cache_manager._get_key("key", namespace="test")
+    mock_redis.set(f"{ns_key}:lock", "other-process")
+
+    def set_value_from_other_process():
+        time.sleep(0.1)
+        cache_manager.set("key", {"value": 1})
+
+    calls = []
+    thread = threading.Thread(target=set_value_from_other_process)
+    thread.start()
+    value, from_cache = cache_manager.get_or_set("key", lambda: calls.append(1))
+    thread.join()
+
+    assert (value, from_cache) == ({"value": 1}, True)
+    assert not calls
+    metrics = cache_manager.metrics
+    # Polling the cache while waiting is counted as a single lookup
+    assert (metrics.hits, metrics.misses, metrics.waits) == (1, 0, 1)
+    assert metrics.wait_seconds > 0
+
+
+def test_get_or_set_wait_is_bounded_by_max_wait_seconds(cache_manager, mock_redis):
+    ns_key = cache_manager._get_key("key", namespace="test")
+    mock_redis.set(f"{ns_key}:lock", "other-process")
+
+    time_start = time.perf_counter()
+    value, from_cache = cache_manager.get_or_set("key", lambda: 1, max_wait_seconds=0.05)
+
+    assert (value, from_cache) == (1, False)
+    assert time.perf_counter() - time_start < cache_manager.lock_timeout
+    metrics = cache_manager.metrics
+    assert (metrics.hits, metrics.misses, metrics.waits) == (0, 1, 1)
+
+
+def test_get_or_set_rereads_cache_after_acquiring_lock(cache_manager, mocker):
+    read_payload = cache_manager._read_payload
+    reads = []
+
+    def set_value_after_first_read(ns_key):
+        reads.append(ns_key)
+        if len(reads) == 1:
+            payload = read_payload(ns_key)
+            # Another process caches the value between the miss and the lock
+            cache_manager.set("key", {"value": 1})
+            return payload
+        return read_payload(ns_key)
+
+    mocker.patch.object(cache_manager, "_read_payload", side_effect=set_value_after_first_read)
+    calls = []
+
+    value, from_cache = cache_manager.get_or_set("key", lambda: calls.append(1))
+
+    assert (value, from_cache) == ({"value": 1}, True)
+    assert not calls
+    assert len(reads) == 2
+    metrics = cache_manager.metrics
+    assert (metrics.hits, metrics.misses) == (1, 0)
+
+
+def test_get_or_set_releases_lock(cache_manager, mock_redis):
+    cache_manager.get_or_set("key", lambda: 1)
+
+    assert mock_redis.keys("*:lock") == []
+
+
+def test_get_or_set_without_single_flight(cache_config, mocker):
+    cache_manager = CacheManager(config=cache_config.model_copy(update={"single_flight": False}))
+    acquire_lock = mocker.spy(cache_manager.cache, "acquire_lock")
+
+    assert cache_manager.get_or_set("key", lambda: 1) == (1, False)
+    assert cache_manager.get_or_set("key", lambda: 2) == (1, True)
+    assert acquire_lock.call_count == 0
+
+
+def test_aget_or_set_deduplicates_concurrent_calls(cache_manager):
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return {"value": 1}
+
+    async def run():
+        return await asyncio.gather(*(cache_manager.aget_or_set("key", compute) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert sorted(from_cache for _, from_cache in results) == [False] + [True] * 4
+    assert all(value == {"value": 1} for value, _ in results)
+
+
+def test_get_cache_manager_is_pooled_by_config(cache_config):
+    cache_manager = get_cache_manager(WorkflowCacheManager, cache_config)
+
+    assert get_cache_manager(WorkflowCacheManager, cache_config.model_copy(update={"id": "other"})) is cache_manager
+    assert get_cache_manager(WorkflowCacheManager, cache_config.model_copy(update={"ttl": 10})) is not cache_manager
+    assert get_cache_manager(CacheManager, cache_config) is not cache_manager
+
+
+def test_cache_wf_entity_bounds_wait_by_run_deadline(cache_config, mocker):
+    get_or_set = mocker.patch.object(CacheManager, "get_or_set", return_value=(1, False))
+    config = RunnableConfig(timeout_seconds=10).start_deadline()
+    cache = cache_wf_entity(entity_id="node", cache_enabled=True, cache_config=cache_config)
+
+    assert cache(lambda input_data, config, **kwargs: 1)({"a": 1}, config) == (1, False)
+    assert 0 < get_or_set.call_args.kwargs["max_wait_seconds"] <= 10
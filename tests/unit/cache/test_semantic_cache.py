@@ -0,0 +1,53 @@
+import time
+
+from fiboaitech.cache.semantic import InMemorySemanticCacheIndex, VectorStoreSemanticCacheIndex
+from fiboaitech.types import Document
+
+
+def test_in_memory_index_returns_most_similar_entry_of_scope():
+    index = InMemorySemanticCacheIndex()
+    index.add("a", [1, 0], {"content": "x"})
+    index.add("a", [0, 1], {"content": "y"})
+    index.add("b", [1, 0.1], {"content": "z"})
+
+    match = index.search("a", [0.9, 0.1])
+    assert match.value == {"content": "x"}
+    assert 0.99 < match.similarity <= 1
+    assert index.search("c", [1, 0]) is None
+
+
+def test_in_memory_index_skips_expired_and_evicts_least_recently_used():
+    index = InMemorySemanticCacheIndex(max_entries=2)
+    index.add("a", [1, 0], {"content": "expired"}, ttl=0.05)
+    index.add("a", [0.8, 0.2], {"content": "fresh"})
+    time.sleep(0.05)
+
+    assert index.search("a", [1, 0]).value == {"content": "fresh"}
+
+    index.add("a", [0, 1], {"content": "new"})
+    assert len(index) == 2
+    assert index.search("a", [1, 0]).value == {"content": "fresh"}
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.documents = []
+
+    def write_documents(self, documents: list[Document]) -> int:
+        self.documents.extend(documents)
+        return len(documents)
+
+    def search_embeddings(self, query_embeddings, top_k, filters=None) -> list[list[Document]]:
+        value = filters["conditions"][0]["value"]
+        return [[doc for doc in self.documents if doc.metadata["semantic_cache_scope"] == value][:top_k]]
+
+
+def test_vector_store_index_matches_by_cosine_similarity():
+    index = VectorStoreSemanticCacheIndex(FakeVectorStore())
+    index.add("a", [1, 0], {"content": "x"})
+    index.add("a", [0, 1], {"content": "y"}, ttl=-1)
+    index.add("b", [0, 1], {"content": "z"})
+
+    match = index.search("a", [0, 1])
+    assert match.value == {"content": "x"}
+    assert abs(match.similarity) < 1e-6
@@ -0,0 +1,130 @@
+import threading
+import time
+import uuid
+
+import pytest
+
+from fiboaitech import Workflow
+from fiboaitech.callbacks import (
+    BaseCallbackHandler,
+    CallbackDispatcher,
+    CallbackDispatchMode,
+    CallbackOverflowPolicy,
+    dispatch_callback,
+    set_default_callback_dispatcher,
+)
+from fiboaitech.callbacks.base import get_run_id
+from fiboaitech.flows import Flow
+from fiboaitech.nodes.utils import Output
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+
+
+class SlowRemoteLogger(BaseCallbackHandler):
+    dispatch_mode = CallbackDispatchMode.ASYNC
+
+    def __init__(self, delay: float = 0, release: threading.Event | None = None):
+        self.delay = delay
+        self.release = release
+        self.events = []
+
+    def _log(self, event: str, kwargs: dict):
+        if self.release is not None:
+            self.release.wait(5)
+        time.sleep(self.delay)
+        self.events.append((event, get_run_id(kwargs)))
+
+    def on_node_start(self, serialized, input_data, **kwargs):
+        self._log("node_start", kwargs)
+
+    def on_node_execute_start(self, serialized, input_data, **kwargs):
+        self._log("node_execute_start", kwargs)
+
+    def on_node_end(self, serialized, output_data, **kwargs):
+        self._log("node_end", kwargs)
+
+
+class FailingHandler(BaseCallbackHandler):
+    def on_flow_start(self, serialized, input_data, **kwargs):
+        raise RuntimeError("callback failed")
+
+
+@pytest.fixture
+def dispatcher():
+    dispatcher = CallbackDispatcher(idle_timeout=0.1)
+    set_default_callback_dispatcher(dispatcher)
+    yield dispatcher
+    set_default_callback_dispatcher(None)
+
+
+def test_async_handler_runs_off_the_run_thread_in_order(dispatcher):
+    logger = SlowRemoteLogger(delay=0.2)
+    first = Output()
+    workflow = Workflow(flow=Flow(nodes=[first, Output().depends_on(first)]))
+
+    time_start = time.perf_counter()
+    result = workflow.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[logger]))
+    duration = time.perf_counter() - time_start
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert duration < 0.2 * 6
+    assert dispatcher.flush(timeout=5)
+    assert [event for event, _ in logger.events] == ["node_start", "node_execute_start", "node_end"] * 2
+    assert len({run_id for _, run_id in logger.events}) == 2
+
+    metrics = dispatcher.metrics["SlowRemoteLogger"]
+    assert metrics.events >= 6
+    assert (metrics.dropped, metrics.queued, metrics.failed) == (0, 0, 0)
+    assert metrics.handler_seconds >= 0.2 * 6 > metrics.dispatch_seconds
+
+
+@pytest.mark.parametrize(
+    ("overflow_policy", "expected_runs"),
+    [
+        (CallbackOverflowPolicy.DROP_NEW, ["0", "1", "2"]),
+        (CallbackOverflowPolicy.DROP_OLDEST, ["0", "3", "4"]),
+        (CallbackOverflowPolicy.BLOCK, ["0", "1", "2"]),
+    ],
+)
+def test_async_handler_overflow_policy(overflow_policy, expected_runs):
+    dispatcher = CallbackDispatcher(max_queue_size=2, overflow_policy=overflow_policy, block_timeout=0.01)
+    release = threading.Event()
+    logger = SlowRemoteLogger(release=release)
+
+    run_ids = [uuid.uuid4() for _ in range(5)]
+    dispatcher.dispatch(logger, "on_node_start", {}, {}, run_id=run_ids[0])
+    deadline = time.monotonic() + 5
+    while dispatcher.metrics["SlowRemoteLogger"].queued and time.monotonic() < deadline:
+        time.sleep(0.001)
+    for run_id in run_ids[1:]:
+        dispatcher.dispatch(logger, "on_node_start", {}, {}, run_id=run_id)
+
+    assert dispatcher.metrics["SlowRemoteLogger"].queued == 2
+    release.set()
+    assert dispatcher.flush(timeout=5)
+    assert [str(run_ids.index(run_id)) for _, run_id in logger.events] == expected_runs
+    assert dispatcher.metrics["SlowRemoteLogger"].dropped == 2
+
+
+def test_sync_handler_errors_propagate_and_are_measured(dispatcher):
+    dispatcher.measure_latency = True
+    handler = FailingHandler()
+
+    with pytest.raises(RuntimeError):
+        dispatch_callback(handler, "on_flow_start", {}, {})
+
+    metrics = dispatcher.metrics["FailingHandler"]
+    assert metrics.events == 1
+    assert metrics.dispatch_seconds == metrics.handler_seconds > 0
+
+
+def test_dispatch_latency_is_not_measured_by_default(mocker):
+    dispatcher = CallbackDispatcher()
+    handler = BaseCallbackHandler()
+    perf_counter = mocker.spy(time, "perf_counter")
+
+    for _ in range(3):
+        dispatcher.dispatch(handler, "on_flow_start", {}, {})
+
+    assert perf_counter.call_count == 0
+    metrics = dispatcher.metrics["BaseCallbackHandler"]
+    assert (metrics.events, metrics.dispatch_seconds, metrics.handler_seconds) == (3, 0, 0)
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+
+from fiboaitech.callbacks import CallbackOverflowPolicy, StreamingFrameCallbackHandler
+
+NODE_SERIALIZED = {"id": "node", "streaming": {"event": "tokens"}}
+WORKFLOW_SERIALIZED = {"id": "workflow"}
+
+
+def stream(handler, tokens, run_id):
+    for token in tokens:
+        handler.on_node_execute_stream(NODE_SERIALIZED, None, delta=token, run_id=run_id)
+
+
+def test_frames_coalesce_tokens_by_size():
+    handler = StreamingFrameCallbackHandler(coalesce_interval=60, max_frame_size=4)
+    run_id = uuid4()
+
+    stream(handler, list("mocked_response"), run_id)
+    handler.on_node_execute_end(NODE_SERIALIZED, {}, run_id=run_id)
+    handler.on_workflow_end(WORKFLOW_SERIALIZED, {"content": "mocked_response"}, run_id=uuid4())
+
+    *token_frames, final_frame = list(handler)
+    assert [frame.content for frame in token_frames] == ["mock", "ed_r", "espo", "nse"]
+    assert json.loads(token_frames[0].payload) == {
+        "run_id": str(run_id),
+        "entity_id": "node",
+        "event": "tokens",
+        "content": "mock",
+    }
+    assert final_frame.entity_id == "workflow"
+    assert final_frame.data == {"content": "mocked_response"}
+    assert handler.frames == 5
+    assert handler.dropped == 0
+
+
+def test_frames_keep_runs_separate():
+    handler = StreamingFrameCallbackHandler(coalesce_interval=60)
+    run_id_1, run_id_2 = uuid4(), uuid4()
+
+    stream(handler, ["a", "b"], run_id_1)
+    stream(handler, ["c"], run_id_2)
+    stream(handler, ["d"], run_id_1)
+    handler.on_workflow_error(WORKFLOW_SERIALIZED, ValueError("failed"), run_id=uuid4())
+
+    assert {frame.run_id: frame.content for frame in handler} == {str(run_id_1): "abd", str(run_id_2): "c"}
+
+
+def test_frames_without_delta_are_sent_after_pending_text():
+    handler = StreamingFrameCallbackHandler(coalesce_interval=60)
+    run_id = uuid4()
+
+    stream(handler, ["a"], run_id)
+    handler.on_node_execute_stream(NODE_SERIALIZED, {"status": "searching"}, run_id=run_id)
+    handler.on_workflow_error(WORKFLOW_SERIALIZED, ValueError("failed"), run_id=uuid4())
+
+    frames = list(handler)
+    assert [(frame.content, frame.data) for frame in frames] == [("a", None), (None, {"status": "searching"})]
+
+
+@pytest.mark.parametrize(
+    "overflow_policy, expected_contents",
+    [
+        (CallbackOverflowPolicy.BLOCK, ["b"]),
+        (CallbackOverflowPolicy.DROP_NEW, ["b"]),
+        (CallbackOverflowPolicy.DROP_OLDEST, [None]),
+    ],
+)
+def test_frames_queue_overflow(overflow_policy, expected_contents):
+    handler = StreamingFrameCallbackHandler(
+        max_queue_size=2, overflow_policy=overflow_policy, block_timeout=0.01, coalesce_interval=0
+    )
+
+    stream(handler, list("abcd"), uuid4())
+    handler.on_workflow_end(WORKFLOW_SERIALIZED, {"content": "abcd"}, run_id=uuid4())
+
+    # The end of the stream always fits, the oldest frame makes room for it
+    assert [frame.content for frame in handler] == expected_contents
+    assert handler.dropped == 4
+    assert handler.queue.empty()
+
+
+def test_frames_are_emitted_while_llm_stalls():
+    handler = StreamingFrameCallbackHandler(coalesce_interval=0.02)
+    run_id = uuid4()
+
+    stream(handler, ["a", "b"], run_id)
+    time_start = time.monotonic()
+    frame = handler.queue.get(timeout=1)
+
+    assert frame.content == "ab"
+    assert time.monotonic() - time_start < 0.5
+    assert handler.frames == 1
+
+
+def test_async_iteration_is_woken_up_by_producer_thread():
+    handler = StreamingFrameCallbackHandler(coalesce_interval=0)
+    run_id = uuid4()
+
+    def produce():
+        time.sleep(0.05)
+        stream(handler, ["a", "b"], run_id)
+        handler.on_workflow_error(WORKFLOW_SERIALIZED, ValueError("failed"), run_id=uuid4())
+
+    async def consume():
+        return [frame.content async for frame in handler]
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    contents = asyncio.run(consume())
+    producer.join()
+
+    assert contents == ["a", "b"]
+
+
+def test_cancelled_async_iteration_does_not_take_later_frames():
+    handler = StreamingFrameCallbackHandler(coalesce_interval=0)
+    threads = threading.active_count()
+
+    async def consume_with_timeout():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(handler.__aiter__().__anext__(), timeout=0.05)
+
+    asyncio.run(consume_with_timeout())
+    stream(handler, ["a"], uuid4())
+
+    assert threading.active_count() <= threads
+    assert handler.queue.get_nowait().content == "a"
+    assert handler._async_waiters == []
@@ -0,0 +1,73 @@
+import hashlib
+import json
+from datetime import datetime
+from io import BytesIO
+from uuid import uuid4
+
+from fiboaitech.callbacks.tracing import Run, RunType, TracingPayloadBudget
+from fiboaitech.types import Document
+from fiboaitech.utils import JsonWorkflowEncoder, format_value_json
+
+
+def test_payload_budget_truncates_strings_and_lists():
+    budget = TracingPayloadBudget(max_string_length=5, max_list_items=2)
+
+    assert budget.format({"text": "abcdefgh", "short": "abc", "items": [1, 2, 3, 4]}) == {
+        "text": "abcde... [3 more characters]",
+        "short": "abc",
+        "items": [1, 2, "... 2 more items"],
+    }
+
+
+def test_payload_budget_drops_embeddings_of_documents():
+    budget = TracingPayloadBudget()
+    documents = [Document(id="1", content="text", embedding=[0.1] * 1536)]
+
+    formatted = budget.format({"documents": documents, "embeddings": [[0.1, 0.2]] * 3})
+
+    assert formatted["documents"][0]["embedding"] == "[embedding of 1536 dimensions]"
+    assert formatted["documents"][0]["content"] == "text"
+    assert formatted["embeddings"] == "[3 embeddings of 2 dimensions]"
+    assert TracingPayloadBudget(drop_embeddings=False).format({"embedding": [0.5]}) == {"embedding": [0.5]}
+
+
+def test_payload_budget_references_large_binaries():
+    budget = TracingPayloadBudget(max_binary_size=4)
+    content = b"\x00\x01" * 10
+    file = BytesIO(content)
+    file.name = "file.bin"
+
+    formatted = budget.format({"file": file, "data": content, "small": b"ab"})
+
+    digest = hashlib.sha256(content).hexdigest()
+    assert formatted == {
+        "file": {"name": "file.bin", "sha256": digest, "size": 20},
+        "data": {"sha256": digest, "size": 20},
+        "small": "ab",
+    }
+    file.write(b"still writable")
+
+
+def test_run_to_json_keeps_big_ints_and_nan():
+    run = Run(
+        id=uuid4(),
+        name="node",
+        type=RunType.NODE,
+        trace_id=uuid4(),
+        source_id="node",
+        session_id="session",
+        start_time=datetime(2024, 5, 4),
+        parent_run_id=None,
+        input={"x": 2**70},
+        output={"score": float("nan")},
+    )
+
+    payload = run.to_json()
+
+    assert payload == json.dumps(run.to_dict(), cls=JsonWorkflowEncoder)
+    assert '"x": 1180591620717411303424' in payload
+    assert '"score": NaN' in payload
+
+
+def test_format_value_json_falls_back_for_big_ints():
+    assert json.loads(format_value_json({"x": 2**70})) == {"x": 2**70}
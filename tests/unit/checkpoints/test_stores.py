@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+from fakeredis import FakeRedis
+
+from fiboaitech.checkpoints import (
+    FileCheckpointStore,
+    InMemoryCheckpointStore,
+    RedisCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from fiboaitech.runnables import RunnableResult, RunnableStatus
+
+
+@pytest.fixture(params=["memory", "file", "sqlite", "redis"])
+def store(request, tmp_path):
+    match request.param:
+        case "memory":
+            return InMemoryCheckpointStore()
+        case "file":
+            return FileCheckpointStore(tmp_path / "checkpoints")
+        case "sqlite":
+            return SQLiteCheckpointStore(tmp_path / "checkpoints.db")
+        case "redis":
+            return RedisCheckpointStore(FakeRedis(), ttl=60)
+
+
+def test_store_saves_and_loads_states_by_run(store):
+    result = RunnableResult(status=RunnableStatus.SUCCESS, input={"a": 1}, output={"content": "done"})
+
+    assert store.save("run-1", "flow:f:node:a", result)
+    store.save("run-1", "flow:f:node:b/c", {"loop_num": 2})
+    store.save("run-1", "node:agent", [1, 2])
+    store.save("run-2", "flow:f:node:a", "other")
+
+    assert store.load("run-1", "flow:f:node:a") == result
+    assert store.load("run-1", "missing") is None
+    assert store.load_all("run-1", prefix="flow:f:node:") == {
+        "flow:f:node:a": result,
+        "flow:f:node:b/c": {"loop_num": 2},
+    }
+    assert store.load_all("run-2") == {"flow:f:node:a": "other"}
+
+
+def test_store_overwrites_and_deletes_states(store):
+    store.save("run-1", "a", 1)
+    store.save("run-1", "a", 2)
+    store.save("run-1", "b", 3)
+
+    assert store.load("run-1", "a") == 2
+
+    store.delete("run-1", "a")
+    assert store.load_all("run-1") == {"b": 3}
+
+    store.delete("run-1")
+    assert store.load_all("run-1") == {}
+
+
+def test_store_skips_not_serializable_state(store):
+    assert not store.save("run-1", "lock", threading.Lock())
+    assert store.load("run-1", "lock") is None
+
+
+def test_file_store_persists_across_instances(tmp_path):
+    FileCheckpointStore(tmp_path).save("run-1", "a", {"value": 1})
+
+    assert FileCheckpointStore(tmp_path).load_all("run-1") == {"a": {"value": 1}}
+    assert not list(tmp_path.rglob("*.tmp"))
@@ -0,0 +1,85 @@
+import threading
+import time
+
+import pytest
+
+from fiboaitech.clients import BaseTracingClient, BatchTracingClient, TraceDropPolicy
+
+
+class RecordingTracingClient(BaseTracingClient):
+    def __init__(self, release: threading.Event | None = None):
+        self.batches = []
+        self.release = release
+
+    def trace(self, runs) -> None:
+        if self.release is not None:
+            self.release.wait(5)
+        self.batches.append(list(runs))
+
+
+class FailingTracingClient(BaseTracingClient):
+    def trace(self, runs) -> None:
+        raise ConnectionError("unavailable")
+
+
+def test_batch_tracing_client_exports_full_batches_and_flushes_rest():
+    client = RecordingTracingClient()
+    exporter = BatchTracingClient(client, max_batch_size=2, flush_interval=60)
+
+    exporter.trace([1, 2, 3])
+    assert exporter.flush(timeout=5)
+
+    assert client.batches == [[1, 2], [3]]
+    metrics = exporter.metrics
+    assert (metrics.exported, metrics.batches, metrics.queued, metrics.dropped) == (3, 2, 0, 0)
+    exporter.shutdown()
+
+
+def test_batch_tracing_client_exports_partial_batch_after_interval():
+    client = RecordingTracingClient()
+    exporter = BatchTracingClient(client, max_batch_size=100, flush_interval=0.01)
+
+    exporter.trace([1])
+    exporter.shutdown(timeout=5)
+
+    assert client.batches == [[1]]
+
+
+@pytest.mark.parametrize(
+    ("drop_policy", "expected_exported"),
+    [
+        (TraceDropPolicy.DROP_NEW, [0, 1, 2]),
+        (TraceDropPolicy.DROP_OLDEST, [0, 3, 4]),
+        (TraceDropPolicy.BLOCK, [0, 1, 2]),
+    ],
+)
+def test_batch_tracing_client_applies_drop_policy_when_client_is_slow(drop_policy, expected_exported):
+    release = threading.Event()
+    client = RecordingTracingClient(release=release)
+    exporter = BatchTracingClient(
+        client, max_batch_size=1, max_queue_size=2, flush_interval=60, drop_policy=drop_policy, block_timeout=0.01
+    )
+
+    exporter.trace([0])
+    deadline = time.monotonic() + 5
+    while exporter.metrics.in_flight == 0 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    exporter.trace([1, 2, 3, 4])
+    assert exporter.metrics.queued == 2
+    assert exporter.metrics.dropped == 2
+
+    release.set()
+    exporter.shutdown(timeout=5)
+    assert [run for batch in client.batches for run in batch] == expected_exported
+
+
+def test_batch_tracing_client_counts_failed_runs_and_exports_directly_after_shutdown():
+    exporter = BatchTracingClient(FailingTracingClient(), flush_interval=60)
+    exporter.trace([1, 2])
+    exporter.shutdown(timeout=5)
+    assert exporter.metrics.failed == 2
+
+    client = RecordingTracingClient()
+    exporter.client = client
+    exporter.trace([3])
+    assert client.batches == [[3]]
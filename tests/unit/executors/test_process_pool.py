@@ -0,0 +1,136 @@
+import os
+import pickle
+import time
+from io import BytesIO
+from typing import Any, Literal
+
+import pytest
+
+from fiboaitech import connections, flows
+from fiboaitech.connections.managers import ConnectionManager
+from fiboaitech.executors import process_pool
+from fiboaitech.executors.pool import ProcessExecutor
+from fiboaitech.executors.process_pool import NodeProcessPool
+from fiboaitech.nodes import NodeGroup, llms
+from fiboaitech.nodes.node import Node, NodeDependency
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+
+WORKER_NODE_LOADS = 0
+
+
+class WorkerNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+
+    def init_components(self, connection_manager: ConnectionManager | None = None):
+        global WORKER_NODE_LOADS
+        super().init_components(connection_manager)
+        WORKER_NODE_LOADS += 1
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        file = input_data.get("file")
+        return {
+            "pid": os.getpid(),
+            "loads": WORKER_NODE_LOADS,
+            "file": (type(file).__name__, getattr(file, "name", None), file.getvalue()) if file else None,
+        }
+
+
+@pytest.fixture(scope="module")
+def node_process_pool():
+    pool = NodeProcessPool(max_workers=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_process_executor_registers_node_once(node_process_pool):
+    class PoolProcessExecutor(ProcessExecutor):
+        def __init__(self, max_workers: int | None = None):
+            super().__init__(max_workers=max_workers, process_pool=node_process_pool)
+
+    node = WorkerNode()
+    dependant = WorkerNode(depends=[NodeDependency(node)])
+    flow = flows.Flow(nodes=[node, dependant], executor=PoolProcessExecutor)
+
+    for _ in range(3):
+        response = flow.run(input_data={})
+
+        assert response.status == RunnableStatus.SUCCESS
+        outputs = [response.output[node_id]["output"] for node_id in (node.id, dependant.id)]
+        assert all(output["pid"] != os.getpid() for output in outputs)
+
+    # Both nodes are loaded into the single worker process once
+    assert response.output[dependant.id]["output"]["loads"] == 2
+
+
+def test_process_executor_passes_large_bytes_through_shared_memory(node_process_pool, mocker):
+    mocker.patch.object(process_pool, "SHARED_MEMORY_MIN_SIZE", 16)
+    shared_memory = mocker.spy(process_pool, "SharedMemory")
+    file = BytesIO(b"x" * 1024)
+    file.name = "file.txt"
+
+    result = node_process_pool.submit_node(WorkerNode(), input_data={"file": file}, depends_result={}).result()
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output["file"] == ("BytesIO", "file.txt", b"x" * 1024)
+    payload_segment = shared_memory.spy_return
+    # Segments are released by a done callback that may run right after the result is available
+    deadline = time.monotonic() + 5
+    while True:
+        try:
+            process_pool.SharedMemory(name=payload_segment.name).close()
+        except FileNotFoundError:
+            break
+        assert time.monotonic() < deadline, "Shared memory segment was not released"
+        time.sleep(0.01)
+
+
+def test_changed_node_definition_replaces_previous_one(node_process_pool, mocker):
+    mocker.patch.dict(process_pool._worker_nodes, clear=True)
+    node = WorkerNode(name="first")
+    first_key = node_process_pool.register_node(node)
+    first_segment, size = node_process_pool._segments_by_key[first_key]
+    first_segment_name = first_segment.name
+    process_pool._get_worker_node(first_key, first_segment_name, size)
+
+    node.name = "second"
+    second_key = node_process_pool.register_node(node)
+    second_segment, size = node_process_pool._segments_by_key[second_key]
+    process_pool._get_worker_node(second_key, second_segment.name, size)
+
+    assert first_key != second_key
+    assert first_key not in node_process_pool._segments_by_key
+    with pytest.raises(FileNotFoundError):
+        process_pool.SharedMemory(name=first_segment_name)
+    assert list(process_pool._worker_nodes) == [second_key]
+    assert process_pool._worker_nodes[second_key].name == "second"
+
+
+def test_changed_node_definition_is_kept_for_pending_runs(node_process_pool):
+    node = WorkerNode(name="first")
+    first_key = node_process_pool.register_node(node)
+    future = node_process_pool.submit_node(node, input_data={}, depends_result={})
+
+    node.name = "second"
+    node_process_pool.register_node(node)
+    result = future.result()
+
+    assert result.status == RunnableStatus.SUCCESS
+    # The replaced definition is released by a done callback that may run right after the result is available
+    deadline = time.monotonic() + 5
+    while first_key in node_process_pool._segments_by_key:
+        assert time.monotonic() < deadline, "Replaced node definition was not released"
+        time.sleep(0.01)
+
+
+def test_connection_node_is_pickled_without_client():
+    llm = llms.OpenAI(model="gpt-4o-mini", connection=connections.OpenAI(api_key="test-api-key"))
+    assert llm.client is not None
+
+    restored_llm = pickle.loads(pickle.dumps(llm))
+
+    assert restored_llm.client is None
+    assert restored_llm.is_postponed_component_init
+    restored_llm.init_components()
+    assert restored_llm.client is not None
+    assert restored_llm.id == llm.id
+    assert llm.client is not None
@@ -0,0 +1,125 @@
+import threading
+import time
+
+import pytest
+
+from fiboaitech import flows
+from fiboaitech.executors.worker_pool import DelayedCalls, WorkerPool, WorkerPoolSaturatedError
+from fiboaitech.nodes.node import NodeDependency
+from fiboaitech.nodes.utils import Input
+from fiboaitech.runnables import RunnableStatus
+
+
+@pytest.fixture()
+def worker_pool():
+    pool = WorkerPool(max_workers=2, max_queue_size=1, submit_timeout=0.05)
+    yield pool
+    pool.shutdown(wait=False)
+
+
+def test_worker_pool_backpressure_and_metrics(worker_pool):
+    release = threading.Event()
+    submitted = [worker_pool.submit(release.wait) for _ in range(3)]
+
+    with pytest.raises(WorkerPoolSaturatedError):
+        worker_pool.submit(release.wait)
+
+    metrics = worker_pool.metrics
+    assert metrics.active + metrics.queued == 3
+    assert metrics.saturation == 1
+    assert metrics.rejected == 1
+
+    release.set()
+    for future in submitted:
+        future.result(timeout=1)
+
+    metrics = worker_pool.metrics
+    assert metrics.active == metrics.queued == 0
+    assert metrics.submitted == metrics.completed == 3
+
+
+def test_worker_pool_nested_submit_does_not_deadlock(worker_pool):
+    all_workers_busy = threading.Barrier(2)
+
+    def parent():
+        all_workers_busy.wait(timeout=1)
+        return worker_pool.submit(lambda: "child").result(timeout=1)
+
+    parents = [worker_pool.submit(parent) for _ in range(2)]
+
+    assert [future.result(timeout=1) for future in parents] == ["child", "child"]
+    assert worker_pool.metrics.overflowed == 2
+
+
+def test_worker_pool_try_submit_does_not_block_when_full(worker_pool):
+    release = threading.Event()
+    submitted = [worker_pool.submit(release.wait) for _ in range(3)]
+
+    time_start = time.monotonic()
+    assert worker_pool.try_submit(release.wait) is None
+    assert time.monotonic() - time_start < worker_pool.submit_timeout
+
+    release.set()
+    for future in submitted:
+        future.result(timeout=1)
+    assert worker_pool.try_submit(lambda: "done").result(timeout=1) == "done"
+    assert worker_pool.metrics.rejected == 0
+
+
+def test_flow_dependants_do_not_overflow_worker_pool():
+    worker_pool = WorkerPool(max_workers=2, max_queue_size=64)
+    root = Input()
+    layer = [Input(depends=[NodeDependency(root)]) for _ in range(20)]
+    chain = [Input(depends=[NodeDependency(node) for node in layer])]
+    for _ in range(19):
+        chain.append(Input(depends=[NodeDependency(chain[-1])]))
+    flow = flows.Flow(nodes=[root, *layer, *chain], worker_pool=worker_pool)
+
+    try:
+        response = flow.run(input_data={"a": 1})
+    finally:
+        worker_pool.shutdown()
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert worker_pool.metrics.overflowed == 0
+
+
+def test_flow_runs_nodes_in_injected_worker_pool(worker_pool):
+    nodes = [Input() for _ in range(3)]
+    flow = flows.Flow(nodes=nodes, worker_pool=worker_pool)
+
+    response = flow.run(input_data={"a": 1})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert all(output["status"] == RunnableStatus.SUCCESS.value for output in response.output.values())
+    assert worker_pool.metrics.submitted == len(nodes)
+    assert "worker_pool" not in flow.to_dict()
+
+
+def test_node_timeout_does_not_wait_for_execution():
+    class SleepInput(Input):
+        def execute(self, input_data, config=None, **kwargs):
+            time.sleep(0.5)
+            return input_data
+
+    node = SleepInput()
+
+    time_start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        node.execute_with_timeout(0.05, {"a": 1})
+
+    assert time.perf_counter() - time_start < 0.5
+
+
+def test_delayed_calls_run_in_due_order():
+    delayed_calls = DelayedCalls()
+    calls = []
+    done = threading.Event()
+
+    delayed_calls.call_later(0.1, lambda: (calls.append("late"), done.set()))
+    delayed_calls.call_later(0.02, calls.append, "early")
+    time_start = time.monotonic()
+
+    assert done.wait(5)
+    assert calls == ["early", "late"]
+    assert time.monotonic() - time_start >= 0.09
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from fiboaitech.nodes.agents.streaming import AgentTokenStream, JsonAnswerStreamParser, MarkerAnswerStreamParser
+
+
+def feed(parser, text, token_size):
+    return [answer for i in range(0, len(text), token_size) if (answer := parser.feed(text[i:i + token_size]))]
+
+
+@pytest.mark.parametrize("token_size", [1, 2, 5, 100])
+def test_marker_parser_streams_text_after_marker(token_size):
+    text = "Thought: I know it.\nAnswer:  The capital is Paris.  \n"
+
+    assert "".join(feed(MarkerAnswerStreamParser(start="Answer:"), text, token_size)) == "The capital is Paris."
+
+
+@pytest.mark.parametrize("token_size", [1, 3, 7, 100])
+def test_marker_parser_stops_at_end_marker(token_size):
+    text = "<output><thought>ok</thought><answer>\n Use <b>bold</b> </ans text \n</answer></output>"
+    parser = MarkerAnswerStreamParser(start="<answer>", end="</answer>")
+
+    assert "".join(feed(parser, text, token_size)) == "Use <b>bold</b> </ans text"
+
+
+def test_marker_parser_streams_nothing_without_marker():
+    assert feed(MarkerAnswerStreamParser(start="Answer:"), "Thought: search\nAction: search", 1) == []
+
+
+@pytest.mark.parametrize("token_size", [1, 2, 4, 100])
+def test_json_parser_decodes_answer_of_final_output(token_size):
+    answer = 'Say "hi"\né \U0001F600'
+    text = json.dumps({"thought": 'not \\"action\\": \\"finish\\"', "action": "finish", "action_input": answer})
+    parser = JsonAnswerStreamParser(answer_field="action_input", condition_field="action", condition_value="finish")
+
+    assert "".join(feed(parser, text, token_size)) == answer
+
+
+def test_json_parser_returns_answer_generated_before_condition():
+    text = json.dumps({"action_input": "Paris", "action": "finish"})
+    parser = JsonAnswerStreamParser(answer_field="action_input", condition_field="action", condition_value="finish")
+
+    assert feed(parser, text, 1) == ["Paris"]
+
+
+def test_json_parser_ignores_tool_actions():
+    text = json.dumps({"thought": "search", "action": "search", "action_input": "capital of France"})
+    parser = JsonAnswerStreamParser(answer_field="action_input", condition_field="action", condition_value="finish")
+
+    assert feed(parser, text, 1) == []
+
+
+def test_token_stream_emits_step_and_answer():
+    events = []
+    token_stream = AgentTokenStream(
+        lambda content, step: events.append((step, content)),
+        step="reasoning",
+        answer_parser=MarkerAnswerStreamParser(start="Answer:"),
+    )
+
+    for token in ["Thought: ok\n", "Answer: ", "Paris"]:
+        token_stream(token)
+
+    assert events == [
+        ("reasoning", "Thought: ok\n"),
+        ("reasoning", "Answer: "),
+        ("reasoning", "Paris"),
+        ("answer", "Paris"),
+    ]
+    assert token_stream.streamed_step
+    assert token_stream.streamed_answer
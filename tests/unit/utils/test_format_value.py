@@ -0,0 +1,163 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from io import BytesIO
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel, RootModel
+
+from fiboaitech.runnables import RunnableResult, RunnableStatus
+from fiboaitech.utils import JsonWorkflowEncoder, format_value, format_value_json
+from fiboaitech.utils import utils
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+class Point(BaseModel):
+    x: int
+
+
+@dataclass
+class Pair:
+    left: int
+    right: str
+
+
+class Opaque:
+    def __str__(self):
+        return "opaque"
+
+
+class Handler:
+    def __call__(self):
+        pass
+
+
+def handle():
+    pass
+
+
+NOW = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+FILE = BytesIO(b"content")
+FILE.name = "file.txt"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("text", "text"),
+        (1, 1),
+        (1.5, 1.5),
+        (True, True),
+        (None, None),
+        (Color.RED, Color.RED),
+        (NOW, NOW),
+        (Decimal("1.10"), Decimal("1.10")),
+        (UUID(int=1), UUID(int=1)),
+        (b"bytes", "bytes"),
+        (b"\xff\xfe", "//4="),
+        (FILE, "file.txt"),
+        (BytesIO(b"data"), "data"),
+        (Point(x=1), {"x": 1}),
+        (Pair(left=1, right="a"), {"left": 1, "right": "a"}),
+        (Opaque(), "opaque"),
+        (ValueError("failed"), {"content": "failed", "error_type": "ValueError", "recoverable": False}),
+        (handle, "func: handle"),
+        (Point, "func: Point"),
+        ({"a": [1, (b"x", {2})], "b": {"c": Point(x=2)}}, {"a": [1, ("x", {2})], "b": {"c": {"x": 2}}}),
+        (
+            RunnableResult(status=RunnableStatus.SUCCESS, input={"file": b"x"}, output=ValueError("e")),
+            {
+                "status": "success",
+                "input": {"file": "x"},
+                "output": {"content": "e", "error_type": "ValueError", "recoverable": False},
+            },
+        ),
+    ],
+)
+def test_format_value(value, expected):
+    assert format_value(value) == expected
+    # Cached formatters return the same result on repeated calls
+    assert format_value(value) == expected
+
+
+def test_format_value_callable_instance():
+    assert format_value(Handler()).startswith("func: <")
+
+
+def test_format_value_recoverable_error():
+    assert format_value(ValueError("failed"), recoverable=True)["recoverable"] is True
+
+
+def test_format_value_skip_and_force_types():
+    value = {"file": FILE, "data": b"data"}
+
+    assert format_value(value, skip_format_types={BytesIO, bytes}) == value
+    assert format_value(value, skip_format_types={BytesIO, bytes}, force_format_types={bytes}) == {
+        "file": FILE,
+        "data": "data",
+    }
+
+
+def test_format_value_resolves_root_model_once(mocker):
+    class Custom(Pair):
+        pass
+
+    root_model = mocker.spy(utils, "_get_root_model_formatter")
+
+    for _ in range(3):
+        assert format_value(Custom(left=1, right="a")) == RootModel[Custom](Custom(left=1, right="a")).model_dump()
+
+    assert root_model.call_count == 1
+
+
+def test_format_value_json():
+    value = {
+        "color": Color.RED,
+        "time": NOW,
+        "id": UUID(int=1),
+        "file": FILE,
+        "items": (1, b"x", Point(x=1)),
+        "error": ValueError("e"),
+        1: None,
+    }
+
+    assert json.loads(format_value_json(value)) == json.loads(json.dumps(format_value(value), cls=JsonWorkflowEncoder))
+
+
+def test_format_value_json_without_orjson(mocker):
+    mocker.patch.object(utils, "orjson", None)
+
+    assert format_value_json({"data": b"x", "point": Point(x=1), "tags": {"a"}}) == (
+        b'{"data":"x","point":{"x":1},"tags":["a"]}'
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_format_value_json_converts_non_str_keys(mocker, use_orjson):
+    if not use_orjson:
+        mocker.patch.object(utils, "orjson", None)
+    value = {1: "int", Color.RED: "enum", UUID(int=1): "uuid", NOW: "time", "nested": [{2: Point(x=1)}]}
+
+    assert json.loads(format_value_json(value)) == {
+        "1": "int",
+        "red": "enum",
+        str(UUID(int=1)): "uuid",
+        NOW.isoformat(): "time",
+        "nested": [{"2": {"x": 1}}],
+    }
+
+
+def test_format_value_caches_bounded_number_of_types(mocker):
+    mocker.patch.dict(utils._value_formatters, clear=True)
+    mocker.patch.object(utils, "VALUE_FORMATTERS_MAX_SIZE", 2)
+
+    for model in [type(f"Model{i}", (Point,), {}) for i in range(4)]:
+        assert format_value(model(x=1)) == {"x": 1}
+
+    assert len(utils._value_formatters) == 2
@@ -0,0 +1,97 @@
+import pytest
+from jsonpath_ng import parse
+
+from fiboaitech.nodes.node import InputTransformer
+from fiboaitech.utils import jsonpath
+from fiboaitech.utils.jsonpath import compile_jsonpath
+
+DATA = {
+    "output": {
+        "content": "text",
+        "empty": None,
+        "documents": [{"content": "first", "meta-data": {"id": 1}}, {"content": "second"}],
+        "tags": [],
+        "count": 0,
+    },
+    "items": [[1, 2], [3]],
+    "text": "abc",
+}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "$",
+        "$.output",
+        "$.output.content",
+        "$.output.empty",
+        "$.output.missing",
+        "$.output.documents[0].content",
+        "$.output.documents[1].content",
+        "$.output.documents[5].content",
+        "$.output.documents[-1].content",
+        "$.output.documents[0].meta-data.id",
+        "$.output.tags[0]",
+        "$.output.count[0]",
+        "$.output.content.missing",
+        "$.items[0][1]",
+        "$.text[1]",
+        "output.documents[0]",
+        "output",
+    ],
+)
+def test_simple_jsonpath_matches_jsonpath_ng(path):
+    compiled_path = compile_jsonpath(path)
+
+    assert compiled_path.is_simple
+    assert compiled_path.find(DATA) == [match.value for match in parse(path).find(DATA)]
+
+
+@pytest.mark.parametrize("path", ["$.output.documents[*].content", "$..content", "$.output['content']"])
+def test_complex_jsonpath_uses_jsonpath_ng(path):
+    compiled_path = compile_jsonpath(path)
+
+    assert not compiled_path.is_simple
+    assert compiled_path.find(DATA) == [match.value for match in parse(path).find(DATA)]
+
+
+def test_reserved_word_is_not_jsonpath():
+    assert compile_jsonpath("$.where") is None
+
+
+def test_compile_jsonpath_is_cached(mocker):
+    compile_jsonpath.cache_clear()
+    parse_spy = mocker.spy(jsonpath, "parse")
+
+    for _ in range(3):
+        assert jsonpath.filter(DATA, "$.output.documents[*].content", "node") == ["first", "second"]
+        assert jsonpath.mapper(DATA, {"value": "$..meta-data.id", "constant": "not a path!"}, "node") == {
+            "value": 1,
+            "constant": "not a path!",
+        }
+
+    assert parse_spy.call_count == 3
+    assert compile_jsonpath.cache_info().currsize == 3
+
+
+def test_filter_with_invalid_path_raises():
+    with pytest.raises(ValueError, match="filter must be a jsonpath"):
+        jsonpath.filter(DATA, "not a path!", "node")
+
+
+def test_transformer_compiles_expressions_once(mocker):
+    transformer = InputTransformer(path="$.output", selector={"content": "$.documents[*].content", "name": "a b"})
+    parse_spy = mocker.spy(jsonpath, "parse")
+
+    for _ in range(3):
+        data = jsonpath.filter(DATA, transformer.compiled_path, "node")
+        assert jsonpath.mapper(data, transformer.compiled_selector, "node") == {
+            "content": ["first", "second"],
+            "name": "a b",
+        }
+    assert parse_spy.call_count == 0
+
+    transformer.selector["content"] = "$.content"
+    data = jsonpath.filter(DATA, transformer.compiled_path, "node")
+
+    assert jsonpath.mapper(data, transformer.compiled_selector, "node") == {"content": "text", "name": "a b"}
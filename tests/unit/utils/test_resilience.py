@@ -0,0 +1,137 @@
+import time
+import uuid
+from typing import Any, Literal
+
+from fiboaitech.callbacks import BaseCallbackHandler
+from fiboaitech.nodes import CircuitBreakerConfig, ErrorHandling, NodeGroup, RetryBudgetConfig
+from fiboaitech.nodes.node import Node
+from fiboaitech.runnables import RunnableConfig, RunnableStatus
+from fiboaitech.utils.resilience import CircuitBreaker, CircuitBreakerOpenError, CircuitBreakerState, RetryBudget
+
+
+class FailingNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    service: str = ""
+    failures: int = 0
+    executions: int = 0
+
+    def get_service_key(self) -> str:
+        return self.service or super().get_service_key()
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        self.executions += 1
+        if self.executions <= self.failures:
+            raise ValueError("Service is unavailable")
+        return {}
+
+
+class RetryStateRecorder(BaseCallbackHandler):
+    def __init__(self):
+        self.states = []
+
+    def on_node_execute_error(self, serialized: dict[str, Any], error: BaseException, **kwargs: Any):
+        self.states.append((kwargs["attempt"], kwargs["circuit_breaker_state"]))
+
+
+def test_circuit_breaker_opens_after_threshold_and_recovers_after_trial():
+    breaker = CircuitBreaker("service", failure_threshold=2, recovery_timeout_seconds=0.05)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreakerState.OPEN
+    assert not breaker.allow_request()
+
+    time.sleep(0.05)
+    assert breaker.state == CircuitBreakerState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreakerState.CLOSED
+    assert breaker.allow_request()
+
+
+def test_circuit_breaker_reopens_on_failed_trial():
+    breaker = CircuitBreaker("service", failure_threshold=1, recovery_timeout_seconds=0.05)
+    breaker.record_failure()
+    time.sleep(0.05)
+
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreakerState.OPEN
+    assert not breaker.allow_request()
+
+
+def test_retry_budget_limits_retries_to_share_of_requests():
+    budget = RetryBudget("service", ratio=0.25, min_retries=2)
+
+    assert budget.try_acquire()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+
+    for _ in range(4):
+        budget.record_request()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+
+
+def test_node_fails_fast_while_circuit_breaker_is_open():
+    service = str(uuid.uuid4())
+    error_handling = ErrorHandling(
+        circuit_breaker=CircuitBreakerConfig(failure_threshold=2, recovery_timeout_seconds=60)
+    )
+    failing = FailingNode(service=service, failures=2, error_handling=error_handling)
+    for _ in range(2):
+        assert failing.run(input_data={}).status == RunnableStatus.FAILURE
+
+    healthy = FailingNode(service=service, error_handling=error_handling)
+    result = healthy.run(input_data={})
+
+    assert result.status == RunnableStatus.FAILURE
+    assert result.output["error_type"] == CircuitBreakerOpenError.__name__
+    assert healthy.executions == 0
+
+
+def test_node_retries_stop_when_retry_budget_is_exhausted():
+    node = FailingNode(
+        failures=10,
+        error_handling=ErrorHandling(
+            max_retries=5, retry_interval_seconds=0, retry_budget=RetryBudgetConfig(ratio=0, min_retries=2)
+        ),
+    )
+
+    result = node.run(input_data={})
+
+    assert result.status == RunnableStatus.FAILURE
+    assert node.executions == 3
+
+
+def test_node_retry_jitter_waits_up_to_backoff():
+    node = FailingNode(error_handling=ErrorHandling(retry_interval_seconds=1, backoff_rate=2, jitter=True))
+    config = RunnableConfig()
+
+    delays = [node._get_retry_delay(2, config, None) for _ in range(50)]
+
+    assert all(0 <= delay <= 4 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_node_execute_callbacks_get_attempt_and_circuit_breaker_state():
+    recorder = RetryStateRecorder()
+    node = FailingNode(
+        service=str(uuid.uuid4()),
+        failures=2,
+        error_handling=ErrorHandling(
+            max_retries=2,
+            retry_interval_seconds=0,
+            circuit_breaker=CircuitBreakerConfig(failure_threshold=5),
+        ),
+    )
+
+    result = node.run(input_data={}, config=RunnableConfig(callbacks=[recorder]))
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert recorder.states == [(0, CircuitBreakerState.CLOSED), (1, CircuitBreakerState.CLOSED)]